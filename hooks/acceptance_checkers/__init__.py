@@ -4,6 +4,10 @@ Acceptance Checkers - acceptance-gate-hook 的模組化檢查器
 每個 checker 負責單一檢查職責，由 orchestrator (acceptance-gate-hook.py) 協調呼叫。
 """
 
+from acceptance_checkers.checker_pipeline import (
+    TicketStore,
+    VerdictCache,
+)
 from acceptance_checkers.ticket_parser import (
     extract_children_from_frontmatter,
     get_ticket_status,
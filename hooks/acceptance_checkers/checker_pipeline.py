@@ -0,0 +1,233 @@
+"""
+Checker Pipeline - acceptance-gate 的共用 ticket 讀取與 verdict 快取
+
+orchestrator（acceptance-gate-hook.py）在一次 complete 檢查中會讓多個 checker
+讀取同一批 ticket（children 遞迴走訪後代、sibling 掃描同 Wave），且重試
+complete 時（補完 acceptance / execution log 後再送一次）大多數 checker 的
+輸入並未改變。本模組提供兩項共用設施：
+
+- TicketStore：單次檢查內的 ticket 讀取記憶（ID -> 檔案路徑、路徑 -> frontmatter），
+  children 與 sibling checker 共用，同一檔案只讀取、解析一次
+- VerdictCache：純函式 checker 的結果快取，鍵為
+  (checker 名稱, checker 版本, 各輸入的內容雜湊)；ticket 內文與 frontmatter
+  以預先計算的雜湊代表，只改 body 時僅讀 frontmatter 的 checker 直接重用
+
+VerdictCache 只在 hook 執行期間（hook_context_scope 內，run_hook_safely 自動
+進入）啟用，結果寫入 `<project>/.claude/hook-logs/_cache/acceptance-verdicts.json`；
+停用條件同 hook_context（CLAUDE_HOOK_CONTEXT_CACHE=0 等）。checker 版本取自
+其模組檔案與共用依賴（ticket_parser、lib/hook_messages）的 (mtime_ns, size)，
+修改 checker 或訊息模板即自動失效；無法取得原始碼的 callable（如測試替身）
+一律直接執行、不快取。
+
+讀取工作區狀態的 checker（git status、error-patterns 目錄、schema 檔、
+同 Wave 其他 ticket）結果不只取決於本 ticket，不經 VerdictCache；自行寫
+stderr 的 checker（如 check_ana_has_spawned_tickets）快取命中時副作用不會
+重現，同樣不經 VerdictCache。
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# 加入 hooks 目錄（acceptance_checkers 的上層）
+_hooks_dir = Path(__file__).parent.parent
+_claude_dir = _hooks_dir.parent
+if str(_claude_dir) not in sys.path:
+    sys.path.insert(0, str(_claude_dir))
+if str(_hooks_dir) not in sys.path:
+    sys.path.insert(0, str(_hooks_dir))
+
+from lib import find_ticket_file, parse_ticket_frontmatter
+from lib.hook_context import CACHE_SUBDIR, is_enabled
+
+# 快取檔名與格式版本
+VERDICT_CACHE_FILENAME = "acceptance-verdicts.json"
+VERDICT_CACHE_VERSION = 1
+
+# 保留的 verdict 筆數上限（約 5 張 ticket 的完整 checker 結果）
+VERDICT_CACHE_MAX_ENTRIES = 64
+
+# 各 checker 共用的依賴模組（變動時所有 checker 版本一併改變）
+_SHARED_DEPENDENCIES = (
+    Path(__file__).parent / "ticket_parser.py",
+    _claude_dir / "lib" / "hook_messages.py",
+)
+
+
+def content_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class TicketStore:
+    """單次檢查內的 ticket 讀取記憶
+
+    檔案找不到時記憶 None；讀取 / 解析失敗時拋出例外且不記憶，由呼叫端
+    依既有語意處理（children checker 記為 read_error）。
+    """
+
+    def __init__(self, project_dir: Path, logger):
+        self.project_dir = project_dir
+        self.logger = logger
+        self._paths: Dict[str, Optional[Path]] = {}
+        self._frontmatters: Dict[Path, dict] = {}
+
+    def find(self, ticket_id: str) -> Optional[Path]:
+        if ticket_id not in self._paths:
+            self._paths[ticket_id] = find_ticket_file(ticket_id, self.project_dir, self.logger)
+        return self._paths[ticket_id]
+
+    def frontmatter(self, ticket_file: Path) -> dict:
+        cached = self._frontmatters.get(ticket_file)
+        if cached is None:
+            content = ticket_file.read_text(encoding="utf-8")
+            cached = parse_ticket_frontmatter(content, self.logger)
+            self._frontmatters[ticket_file] = cached
+        return cached
+
+    def remember(self, ticket_file: Path, frontmatter: dict) -> None:
+        """登記已由呼叫端解析的 ticket（如 orchestrator 的目標 ticket）"""
+        self._frontmatters[ticket_file] = frontmatter
+
+
+def _file_stamp(path: str) -> str:
+    stat = os.stat(path)
+    return "{}:{}".format(stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_dependency_stamp() -> str:
+    stamps = []
+    for path in _SHARED_DEPENDENCIES:
+        try:
+            stamps.append(_file_stamp(str(path)))
+        except OSError:
+            stamps.append("-")
+    return ",".join(stamps)
+
+
+def checker_version(fn: Callable) -> Optional[str]:
+    """checker 版本：模組名稱 + 模組檔案與共用依賴的 (mtime_ns, size)
+
+    無原始碼（內建函式、測試替身）時回傳 None。
+    """
+    try:
+        source = inspect.getsourcefile(inspect.unwrap(fn))
+        if not source:
+            return None
+        stamp = _file_stamp(source)
+    except (TypeError, ValueError, OSError):
+        return None
+    return "{}:{}:{}".format(fn.__module__, stamp, _shared_dependency_stamp())
+
+
+class VerdictCache:
+    """純函式 checker 的結果快取（hook 執行期間跨行程共用）
+
+    Args:
+        project_dir: 專案根目錄
+        content: 目標 ticket 完整內文
+        frontmatter: 目標 ticket 的 frontmatter（與 content 同源）
+        logger: 日誌物件
+    """
+
+    def __init__(self, project_dir: Path, content: str, frontmatter: dict, logger):
+        self.logger = logger
+        self._content = content
+        self._frontmatter = frontmatter
+        self._cache_file: Optional[Path] = None
+        self._entries: Dict[str, Any] = {}
+        self._dirty = False
+        if is_enabled():
+            self._cache_file = project_dir / CACHE_SUBDIR / VERDICT_CACHE_FILENAME
+            self._entries = self._load()
+            self._content_key = "content:" + content_digest(content)
+            self._frontmatter_key = "frontmatter:" + content_digest(
+                json.dumps(frontmatter, sort_keys=True, ensure_ascii=False, default=str)
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache_file is not None
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """執行 checker；輸入與版本未變時直接回傳上次結果"""
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        key = self._key(fn, args, kwargs)
+        if key is None:
+            return fn(*args, **kwargs)
+
+        entry = self._entries.get(key)
+        if isinstance(entry, dict) and "result" in entry:
+            self.logger.info("verdict 快取命中，略過 %s", fn.__name__)
+            result = entry["result"]
+            return tuple(result) if entry.get("tuple") else result
+
+        result = fn(*args, **kwargs)
+        try:
+            stored = json.loads(json.dumps(result, ensure_ascii=False))
+        except (TypeError, ValueError):
+            return result
+        self._entries.pop(key, None)
+        self._entries[key] = {"tuple": isinstance(result, tuple), "result": stored}
+        self._dirty = True
+        return result
+
+    def save(self) -> None:
+        """寫回快取檔（本次有新結果時）；寫入失敗不影響驗收流程"""
+        if not self.enabled or not self._dirty:
+            return
+        while len(self._entries) > VERDICT_CACHE_MAX_ENTRIES:
+            self._entries.pop(next(iter(self._entries)))
+        cache_file = self._cache_file
+        if not cache_file.parents[2].is_dir():
+            return
+        tmp_file = cache_file.with_name("{}.{}.tmp".format(cache_file.name, os.getpid()))
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(
+                json.dumps(
+                    {"version": VERDICT_CACHE_VERSION, "entries": self._entries},
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp_file.unlink()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self._cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != VERDICT_CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _key(self, fn: Callable, args: tuple, kwargs: dict) -> Optional[str]:
+        version = checker_version(fn)
+        if version is None:
+            return None
+        parts = [fn.__name__, version]
+        for value in list(args) + [kwargs[name] for name in sorted(kwargs)]:
+            if value is self._content:
+                parts.append(self._content_key)
+            elif value is self._frontmatter:
+                parts.append(self._frontmatter_key)
+            elif isinstance(value, (logging.Logger, logging.LoggerAdapter)):
+                continue
+            else:
+                parts.append(json.dumps(value, sort_keys=True, ensure_ascii=False, default=str))
+        parts.extend(sorted(kwargs))
+        return content_digest("\0".join(parts))
@@ -35,6 +35,7 @@ if str(_ticket_skill_dir) not in sys.path:
 from lib import find_ticket_file, parse_ticket_frontmatter
 from lib.hook_messages import GateMessages, format_message
 from acceptance_checkers.ticket_parser import extract_children_from_frontmatter
+from acceptance_checkers.checker_pipeline import TicketStore
 from ticket_system.constants import TERMINAL_STATUSES  # noqa: F401（re-export 供 ana_spawned_checker 向後相容引用）
 
 
@@ -102,6 +103,7 @@ def _collect_incomplete_descendants(
     project_dir: Path,
     logger,
     visited: Optional[Set[str]] = None,
+    store: Optional[TicketStore] = None,
 ) -> List[Tuple[str, str, str]]:
     """
     遞迴收集所有未完成的後代（子、孫…）。
@@ -117,12 +119,15 @@ def _collect_incomplete_descendants(
         project_dir: 專案根目錄
         logger: 日誌物件
         visited: 已訪問 ID 集合（防循環）
+        store: 共用的 ticket 讀取記憶（orchestrator 傳入，與其他 checker 共用）
 
     Returns:
         List[(id, title, status)] — 所有層級中未完成的 Ticket
     """
     if visited is None:
         visited = set()
+    if store is None:
+        store = TicketStore(project_dir, logger)
 
     incomplete: List[Tuple[str, str, str]] = []
 
@@ -132,7 +137,7 @@ def _collect_incomplete_descendants(
             continue
         visited.add(child_id)
 
-        child_file = find_ticket_file(child_id, project_dir, logger)
+        child_file = store.find(child_id)
 
         if not child_file:
             logger.warning(f"無法找到子任務檔案: {child_id}")
@@ -140,8 +145,7 @@ def _collect_incomplete_descendants(
             continue
 
         try:
-            content = child_file.read_text(encoding="utf-8")
-            frontmatter = parse_ticket_frontmatter(content, logger)
+            frontmatter = store.frontmatter(child_file)
             status = frontmatter.get("status", "unknown")
             title = frontmatter.get("title", "未知")
         except Exception as e:
@@ -161,7 +165,7 @@ def _collect_incomplete_descendants(
             )
             incomplete.extend(
                 _collect_incomplete_descendants(
-                    grand_children, project_dir, logger, visited
+                    grand_children, project_dir, logger, visited, store
                 )
             )
 
@@ -174,6 +178,7 @@ def check_children_completed_from_frontmatter(
     project_dir: Path,
     ticket_id: str,
     logger,
+    store: Optional[TicketStore] = None,
 ) -> Tuple[bool, Optional[str]]:
     """
     從 frontmatter 檢查子任務完成度（orchestrator 呼叫入口）。
@@ -191,6 +196,7 @@ def check_children_completed_from_frontmatter(
         project_dir: 專案根目錄
         ticket_id: Ticket ID
         logger: 日誌物件
+        store: 共用的 ticket 讀取記憶（可選，預設於本次呼叫內建立）
 
     Returns:
         tuple - (should_block, error_message)
@@ -205,7 +211,7 @@ def check_children_completed_from_frontmatter(
     logger.info(f"Ticket {ticket_id} 有 {len(children)} 個直接子任務（遞迴檢查後代）")
 
     incomplete = _collect_incomplete_descendants(
-        children, project_dir, logger, visited={ticket_id}
+        children, project_dir, logger, visited={ticket_id}, store=store
     )
 
     if incomplete:
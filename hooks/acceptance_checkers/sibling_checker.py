@@ -6,7 +6,7 @@ Sibling Checker - 同 Wave pending sibling tickets 檢查（場景 #9）
 
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 # 加入 hooks 目錄（acceptance_checkers 的上層）
 _hooks_dir = Path(__file__).parent.parent
@@ -19,12 +19,14 @@ from lib import (
     extract_version_from_ticket_id,
     extract_wave_from_ticket_id,
 )
+from acceptance_checkers.checker_pipeline import TicketStore
 
 
 def find_pending_sibling_tickets(
     ticket_id: str,
     project_dir: Path,
     logger,
+    store: Optional[TicketStore] = None,
 ) -> List[str]:
     """
     查詢同 Wave 中的 pending sibling tickets
@@ -39,6 +41,8 @@ def find_pending_sibling_tickets(
         ticket_id: 當前 Ticket ID (e.g., "0.1.0-W22-025")
         project_dir: 專案根目錄
         logger: 日誌物件
+        store: 共用的 ticket 讀取記憶（orchestrator 傳入，重用 children
+            checker 已解析的同 Wave 子任務）
 
     Returns:
         list - pending sibling ticket ID 清單
@@ -75,8 +79,11 @@ def find_pending_sibling_tickets(
                     logger.debug(f"不同 Wave: {file_ticket_id} (Wave {file_wave})")
                     continue
 
-                content = ticket_file.read_text(encoding="utf-8")
-                frontmatter = parse_ticket_frontmatter(content, logger)
+                if store is not None:
+                    frontmatter = store.frontmatter(ticket_file)
+                else:
+                    content = ticket_file.read_text(encoding="utf-8")
+                    frontmatter = parse_ticket_frontmatter(content, logger)
                 status = frontmatter.get("status", "unknown")
 
                 if status == "pending":
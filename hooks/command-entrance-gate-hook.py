@@ -80,6 +80,8 @@ from lib import (
     get_project_root,
     validate_ticket_has_decision_tree,
     find_ticket_files,
+    find_ticket_file,
+    find_active_in_progress_ticket,
     get_current_version_from_todolist,
     save_check_log,
     validate_hook_input,
@@ -696,6 +698,12 @@ def extract_ticket_id_from_prompt(prompt: Optional[str]) -> Optional[str]:
     return match.group(0) if match else None
 
 
+def _tickets_by_mtime(project_root: Path, logger) -> List[Path]:
+    """全部 Ticket 檔案，按修改時間排序（最新優先）"""
+    tickets = find_ticket_files(project_root, logger=logger)
+    return sorted(tickets, key=lambda p: p.stat().st_mtime, reverse=True)
+
+
 def get_latest_pending_ticket(
     logger, prompt: Optional[str] = None
 ) -> Optional[Tuple[str, str, str]]:
@@ -706,7 +714,9 @@ def get_latest_pending_ticket(
     避免無關 ticket（如剛遷移者）誤觸閘門。新觸發規則：
 
     1. prompt 顯式引用某 Ticket ID → 回傳該 Ticket（精準匹配）。
-    2. 存在 in_progress Ticket → 回傳（既有 gate 行為，沿用 mtime 最新者）。
+    2. 存在 in_progress Ticket → 回傳（既有 gate 行為）。經
+       find_active_in_progress_ticket 查詢：ticket CLI 的 in_progress 登錄檔
+       一致時不逐檔解析，同 session 認領者優先、否則 mtime 最新者。
     3. 否則（無 ticket-id 引用且無 in_progress）→ 回傳 None，
        不以 mtime-latest pending 盲選。
 
@@ -721,14 +731,10 @@ def get_latest_pending_ticket(
         tuple - (ticket_id, status, content) 或 None
     """
     project_root = get_project_root()
-    tickets = find_ticket_files(project_root, logger=logger)
-
-    # 按修改時間排序（最新優先）
-    sorted_tickets = sorted(tickets, key=lambda p: p.stat().st_mtime, reverse=True)
 
     # 向後相容：未提供 prompt 時沿用舊行為（mtime 最新 pending/in_progress）
     if prompt is None:
-        for ticket_file in sorted_tickets:
+        for ticket_file in _tickets_by_mtime(project_root, logger):
             ticket_id, status, content = extract_ticket_status(ticket_file, logger)
             if ticket_id and status in ["pending", "in_progress"]:
                 logger.info(f"找到待處理 Ticket（相容模式）: {ticket_id} (status={status})")
@@ -739,18 +745,21 @@ def get_latest_pending_ticket(
     # 規則 1：prompt 顯式引用 Ticket ID → 精準匹配
     referenced_id = extract_ticket_id_from_prompt(prompt)
     if referenced_id:
-        for ticket_file in sorted_tickets:
+        for ticket_file in _tickets_by_mtime(project_root, logger):
             ticket_id, status, content = extract_ticket_status(ticket_file, logger)
             if ticket_id == referenced_id and status in ["pending", "in_progress"]:
                 logger.info(f"prompt 顯式引用 Ticket: {ticket_id} (status={status})")
                 return ticket_id, status, content
 
     # 規則 2：存在 in_progress Ticket → 回傳（既有 gate 行為）
-    for ticket_file in sorted_tickets:
-        ticket_id, status, content = extract_ticket_status(ticket_file, logger)
-        if ticket_id and status == "in_progress":
-            logger.info(f"找到 in_progress Ticket 作閘門: {ticket_id}")
-            return ticket_id, status, content
+    active = find_active_in_progress_ticket(project_root, logger)
+    if active and active.get("id"):
+        ticket_file = find_ticket_file(str(active["id"]), project_root, logger)
+        if ticket_file is not None:
+            ticket_id, status, content = extract_ticket_status(ticket_file, logger)
+            if ticket_id and status == "in_progress":
+                logger.info(f"找到 in_progress Ticket 作閘門: {ticket_id}")
+                return ticket_id, status, content
 
     # 規則 3：無 ticket-id 引用且無 in_progress → 不盲選 pending
     logger.debug("無顯式 Ticket ID 引用且無 in_progress Ticket，跳過 pending 盲選")
@@ -38,6 +38,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    from lib import transcript_tail_reader as _tail_reader
+except ImportError:  # lib 不可用時退回全檔掃描
+    _tail_reader = None
+
 HOOK_DIR = Path(__file__).resolve().parent
 LOG_DIR = HOOK_DIR / "hook-logs"
 LOG_FILE = LOG_DIR / "context-depth-warning.log"
@@ -72,6 +79,17 @@ def read_last_cache_read(transcript_path: str) -> Optional[int]:
     if not path.is_file():
         return None
 
+    # 優先查 transcript 尾端索引的最近 assistant entry；近期皆無 usage 時
+    # 才全檔掃描（與原語意一致：取全檔最後一個有效值）
+    if _tail_reader is not None:
+        index = _tail_reader.get_transcript_index(transcript_path)
+        if index is not None:
+            recent = index.last_entries(_tail_reader.KIND_ASSISTANT, _tail_reader.RECENT_LIMIT)
+            for entry in reversed(recent):
+                value = _cache_read_of(entry)
+                if value is not None:
+                    return value
+
     last_value: Optional[int] = None
     try:
         with path.open(encoding="utf-8") as fh:
@@ -83,14 +101,8 @@ def read_last_cache_read(transcript_path: str) -> Optional[int]:
                     entry = json.loads(line)
                 except json.JSONDecodeError:
                     continue
-                message = entry.get("message") or entry
-                if message.get("role") != "assistant":
-                    continue
-                usage = message.get("usage")
-                if not isinstance(usage, dict):
-                    continue
-                value = usage.get("cache_read_input_tokens")
-                if isinstance(value, int):
+                value = _cache_read_of(entry)
+                if value is not None:
                     last_value = value
     except Exception as exc:  # noqa: BLE001
         log(f"讀 transcript 失敗: {exc}")
@@ -98,6 +110,18 @@ def read_last_cache_read(transcript_path: str) -> Optional[int]:
     return last_value
 
 
+def _cache_read_of(entry: dict) -> Optional[int]:
+    """assistant entry 的 message.usage.cache_read_input_tokens；非 assistant 或無值回 None。"""
+    message = entry.get("message") or entry
+    if message.get("role") != "assistant":
+        return None
+    usage = message.get("usage")
+    if not isinstance(usage, dict):
+        return None
+    value = usage.get("cache_read_input_tokens")
+    return value if isinstance(value, int) else None
+
+
 def tier_of(cache_read: int) -> int:
     """cache_read 對應的去重 tier。"""
     return cache_read // TIER_STEP
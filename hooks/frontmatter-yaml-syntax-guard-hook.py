@@ -70,8 +70,6 @@ except ImportError as e:
     print(f"[Hook Import Error] {Path(__file__).name}: {e}", file=sys.stderr)
     sys.exit(0)
 
-import yaml  # noqa: E402
-
 
 # ============================================================================
 # 常數
@@ -141,6 +139,9 @@ def check_frontmatter_yaml(content: str) -> "Optional[FrontmatterError]":
     block_start_offset = start_match.end() + leading_ws_len
     base_line = content[:block_start_offset].count("\n") + 1
 
+    # 延後 import：無 frontmatter 的檔案（多數 Write/Edit）不付 pyyaml 載入成本
+    import yaml
+
     try:
         result = yaml.safe_load(stripped_block)
     except yaml.YAMLError as e:
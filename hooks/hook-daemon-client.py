@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Hook Daemon Client Shim — hookd 的輕量轉送端
+
+用法（settings.json 以本 shim 包裹既有 hook 命令）：
+    $CLAUDE_PROJECT_DIR/.claude/hooks/hook-daemon-client.py <hook-script> [args...]
+
+行為：
+- hookd（.claude/lib/hook_daemon.py）在監聽：轉送 stdin、argv、cwd 與環境
+  變數，原樣寫回伺服器回傳的 stdout / stderr，並以其 exit code 結束
+- hookd 未啟動（socket 不存在 / 拒絕連線），或 socket 所在目錄 / socket
+  本身不屬於本使用者、目錄權限非 0700：直接 exec hook 腳本，走其 shebang，
+  行為與未包裹前完全相同（不把環境變數送給、也不信任來路不明的伺服器）
+- 已連線但伺服器中途斷線（例如 lib/ 變動觸發伺服器自行結束）：以已讀取
+  的 stdin 改用子行程執行 hook，確保該次呼叫仍有結果
+
+刻意只用 stdlib 且不 import lib 套件：lib/__init__ 會 eager import
+hook_io / hook_logging 等模組，正是 daemon 要省下的成本。socket 路徑與
+訊框格式為 lib/hook_daemon.py 的精簡複本，兩端一致性由
+lib/tests/test_hook_daemon.py 的 parity 測試守護。
+"""
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+
+# 與 lib/hook_daemon.py 的 SOCKET_PREFIX / FRAME_HEADER 一致
+SOCKET_PREFIX = "claude-hookd"
+FRAME_HEADER = struct.Struct(">I")
+
+# 連線逾時（秒）：只涵蓋 connect，hook 本身的逾時由 CC runtime 管控
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+EXIT_USAGE = 1
+
+
+def _claude_dir() -> str:
+    return os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def _runtime_dir() -> str:
+    """lib/hook_daemon.runtime_dir 的複本（公式見該函式 docstring）"""
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(base, "{}-{}".format(SOCKET_PREFIX, os.getuid()))
+
+
+def _socket_path() -> str:
+    """lib/hook_daemon.socket_path 的複本"""
+    digest = hashlib.sha1(_claude_dir().encode("utf-8")).hexdigest()[:12]
+    return os.path.join(_runtime_dir(), "{}-{}.sock".format(SOCKET_PREFIX, digest))
+
+
+def _is_trusted_socket(path: str) -> bool:
+    """socket 與其所在目錄皆屬本使用者，且目錄群組 / 其他人無任何權限"""
+    uid = os.getuid()
+    try:
+        dir_info = os.lstat(os.path.dirname(path))
+        sock_info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(dir_info.st_mode)
+        and dir_info.st_uid == uid
+        and stat.S_IMODE(dir_info.st_mode) & 0o077 == 0
+        and stat.S_ISSOCK(sock_info.st_mode)
+        and sock_info.st_uid == uid
+    )
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size > 0:
+        chunk = conn.recv(min(size, 65536))
+        if not chunk:
+            raise ConnectionError("hookd 連線提前關閉")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _connect():
+    """連線 hookd；不可用或未通過擁有者 / 權限檢查時回傳 None"""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = _socket_path()
+    if not _is_trusted_socket(path):
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(CONNECT_TIMEOUT_SECONDS)
+    try:
+        conn.connect(path)
+    except OSError:
+        conn.close()
+        return None
+    conn.settimeout(None)
+    return conn
+
+
+def _exec_hook(argv: list) -> None:
+    """回退：以今日的方式直接執行 hook 腳本（不返回）"""
+    if os.name == "posix":
+        os.execv(argv[0], argv)
+    sys.exit(subprocess.call([sys.executable] + argv))
+
+
+def _run_hook_subprocess(argv: list, stdin_bytes: bytes) -> int:
+    """回退：stdin 已被讀走時，以子行程執行 hook 並轉送其輸出"""
+    command = argv if os.name == "posix" else [sys.executable] + argv
+    result = subprocess.run(command, input=stdin_bytes, capture_output=True)
+    sys.stdout.buffer.write(result.stdout)
+    sys.stderr.buffer.write(result.stderr)
+    return result.returncode
+
+
+def main() -> int:
+    if len(sys.argv) < 2:
+        sys.stderr.write("用法: hook-daemon-client.py <hook-script> [args...]\n")
+        return EXIT_USAGE
+
+    argv = [os.path.abspath(sys.argv[1])] + sys.argv[2:]
+    conn = _connect()
+    if conn is None:
+        _exec_hook(argv)
+
+    stdin_bytes = sys.stdin.buffer.read()
+    request = {
+        "argv": argv,
+        "stdin": stdin_bytes.decode("utf-8", errors="replace"),
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+    try:
+        with conn:
+            body = json.dumps(request, ensure_ascii=False).encode("utf-8")
+            conn.sendall(FRAME_HEADER.pack(len(body)) + body)
+            (size,) = FRAME_HEADER.unpack(_recv_exact(conn, FRAME_HEADER.size))
+            response = json.loads(_recv_exact(conn, size).decode("utf-8"))
+    except (OSError, ValueError, ConnectionError):
+        return _run_hook_subprocess(argv, stdin_bytes)
+
+    sys.stdout.buffer.write(str(response.get("stdout", "")).encode("utf-8"))
+    sys.stderr.buffer.write(str(response.get("stderr", "")).encode("utf-8"))
+    return int(response.get("exit_code", 0))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
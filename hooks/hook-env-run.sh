@@ -0,0 +1,62 @@
+#!/bin/sh
+# hook-env-run.sh — 以預建共用環境（hooks/.venv）直接執行 hook
+#
+# 用法（settings.json 以本啟動器包裹既有 hook 命令）：
+#   $CLAUDE_PROJECT_DIR/.claude/hooks/hook-env-run.sh <hook-script> [args...]
+#
+# 環境可用時以 hooks/.venv 的直譯器執行 hook，略過 uv run --script 的環境
+# 解析。下列任一情況直接 exec hook 本身（走其 shebang，行為與未包裹前相同）：
+# - 環境未建置（直譯器或 stamp 不存在）
+# - pyproject.toml / uv.lock / hook 本身比 stamp 新（建置後有變動）
+# - hook 不在本 .claude 目錄下，或列於建置時產生的漂移清單
+#   （inline PEP 723 依賴與鎖定環境不相容）
+#
+# 刻意只用 sh 內建指令（參數展開、test、read），不 fork 任何外部程式。
+# 建置、漂移偵測與啟動時間比較見 .claude/lib/hook_env.py。
+#
+# Exit codes: hook 本身的 exit code；1 = 用法錯誤
+
+if [ $# -lt 1 ]; then
+    echo "用法: hook-env-run.sh <hook-script> [args...]" >&2
+    exit 1
+fi
+
+hook=$1
+
+case $0 in
+    */*) ;;
+    *) exec "$@" ;;
+esac
+
+# 檔名需與 lib/hook_env.py 的 ENV_DIRNAME / STAMP_FILENAME / FALLBACK_FILENAME 一致
+hooks_dir=${0%/*}
+claude_dir=${hooks_dir%/*}
+env_dir=$hooks_dir/.venv
+python=$env_dir/bin/python
+stamp=$env_dir/hook-env.json
+fallback=$env_dir/hook-env-fallback.txt
+
+if [ ! -x "$python" ] || [ ! -f "$stamp" ]; then
+    exec "$@"
+fi
+
+for source in "$hooks_dir/pyproject.toml" "$hooks_dir/uv.lock" "$hook"; do
+    if [ "$source" -nt "$stamp" ]; then
+        exec "$@"
+    fi
+done
+
+rel=${hook#"$claude_dir"/}
+if [ "$rel" = "$hook" ]; then
+    exec "$@"
+fi
+
+if [ -f "$fallback" ]; then
+    while IFS= read -r line; do
+        if [ "$line" = "$rel" ]; then
+            exec "$@"
+        fi
+    done < "$fallback"
+fi
+
+exec "$python" "$@"
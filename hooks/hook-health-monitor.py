@@ -11,7 +11,7 @@ Hook Health Monitor - Hook 系統健康狀態監控
 
 檢查內容：
 1. 動態解析 settings.json 中所有 SessionStart hooks
-2. 驗證每個 hook 的日誌目錄是否正常更新
+2. 驗證每個 hook 最近是否執行（優先採執行遙測，退回日誌目錄 mtime）
 3. 報告覆蓋全部 SessionStart hooks 的健康狀態
 
 Exit Code:
@@ -167,28 +167,46 @@ def resolve_hook_log_dir(
     return stem, primary, False
 
 
+def _telemetry_last_run(
+    hook_filename: str, last_seen: Dict[str, datetime]
+) -> Optional[datetime]:
+    """自執行遙測取 hook 最後執行時間（名稱解析同 resolve_hook_log_dir）"""
+    stem = Path(hook_filename).stem
+    if stem in last_seen:
+        return last_seen[stem]
+    if stem.endswith("-hook"):
+        return last_seen.get(stem[: -len("-hook")])
+    return None
+
+
 def _check_single_hook_log(
-    hook_filename: str, project_root: Path
+    hook_filename: str,
+    project_root: Path,
+    last_seen: Optional[Dict[str, datetime]] = None,
 ) -> Tuple[int, str, str]:
     """檢查單個 hook 的日誌狀態
 
+    優先採執行遙測記錄的最後執行時間；遙測無此 hook 時退回日誌目錄 mtime。
+
     Args:
         hook_filename: hook 檔案名稱
         project_root: 專案根目錄
+        last_seen: hook_health.last_seen() 結果（None 表示不查遙測）
 
     Returns:
         (severity, message, hook_filename)
     """
-    candidate, log_dir, found = resolve_hook_log_dir(hook_filename, project_root)
-
-    if not found:
-        msg = "[WARN] {} log dir not found".format(hook_filename)
-        return 2, msg, hook_filename
+    last_run = _telemetry_last_run(hook_filename, last_seen or {})
+    if last_run is None:
+        candidate, log_dir, found = resolve_hook_log_dir(hook_filename, project_root)
+        if not found:
+            msg = "[WARN] {} log dir not found".format(hook_filename)
+            return 2, msg, hook_filename
 
     try:
-        stat_info = log_dir.stat()
-        last_modified = datetime.fromtimestamp(stat_info.st_mtime)
-        hours_ago = (datetime.now() - last_modified).total_seconds() / 3600
+        if last_run is None:
+            last_run = datetime.fromtimestamp(log_dir.stat().st_mtime)
+        hours_ago = (datetime.now() - last_run).total_seconds() / 3600
 
         if hours_ago < WARNING_THRESHOLD_HOURS:
             severity, msg = 0, "[OK] {} (last update: {}h ago)".format(
@@ -228,9 +246,13 @@ def check_hook_logs(
     """
     results = []
     max_severity = 0
+    try:
+        last_seen = hook_health.last_seen(project_root / ".claude" / "hook-logs")
+    except Exception:  # noqa: BLE001 — 遙測讀取失敗退回日誌目錄 mtime
+        last_seen = {}
 
     for hook_filename in hook_filenames:
-        severity, msg, _ = _check_single_hook_log(hook_filename, project_root)
+        severity, msg, _ = _check_single_hook_log(hook_filename, project_root, last_seen)
         results.append((severity, msg, hook_filename))
         max_severity = max(max_severity, severity)
         # 持久化每個 hook 的檢查結果到日誌檔
@@ -20,6 +20,10 @@ SessionStart 觸發，讀取上一個完成 session 的 liveness 索引
 的理由：SessionStart 是新 session 的第一個事件，此時新 session 自己的
 liveness 檔案尚無實質資料（僅本 hook自身剛寫入的一筆），比對上一個完成
 session 才能反映有意義的覆蓋率。
+
+執行遙測啟用時 mark_hook_entry 不寫 liveness 索引，改由遙測彙總推導：
+本 hook 上次執行（上一個 session 的 SessionStart）之後有執行紀錄的 hook
+即視為已載入。遙測紀錄不含 session_id，並行 session 的紀錄會一併計入。
 """
 
 import json
@@ -35,8 +39,10 @@ from lib.hook_logging import (
     get_project_root,
     ENV_SESSION_ID,
     LIVENESS_SUBDIR,
+    TELEMETRY_SUBDIR,
 )
 from lib.hook_io import read_json_from_stdin
+from lib import hook_telemetry
 
 HOOK_NAME = "hook-liveness-summary"
 
@@ -116,6 +122,34 @@ def _invoked_hook_names(liveness_file: Path) -> set:
     return invoked
 
 
+def _invoked_since_previous_summary(root: Path):
+    """遙測彙總中，本 hook 上次執行之後有紀錄的 hook 名稱；無前次紀錄時回傳 None"""
+    rollup = hook_telemetry.load_rollup(root / ".claude" / "hook-logs" / TELEMETRY_SUBDIR)
+    hooks = rollup.get("hooks", {})
+    previous = hooks.get(HOOK_NAME, {}).get("last_ts")
+    if not previous:
+        return None
+    return {
+        name for name, info in hooks.items()
+        if info.get("last_ts", 0.0) >= previous
+    }
+
+
+def _invoked_in_previous_session(root: Path):
+    """回傳 (比對來源描述, 上一個 session 觸發過的 hook 名稱)；無可比對資料時為 (None, None)"""
+    if hook_telemetry.is_enabled():
+        invoked = _invoked_since_previous_summary(root)
+        if invoked is None:
+            return None, None
+        return "執行遙測（上次彙整以來）", invoked
+
+    current_session_id = os.environ.get(ENV_SESSION_ID, "").strip()
+    liveness_file = _most_recent_completed_liveness_file(root, current_session_id)
+    if liveness_file is None:
+        return None, None
+    return liveness_file.name, _invoked_hook_names(liveness_file)
+
+
 def main() -> int:
     logger = setup_hook_logging(HOOK_NAME)
     read_json_from_stdin(logger)  # SessionStart 常無 stdin，僅統一入口消費
@@ -132,9 +166,8 @@ def main() -> int:
     covered = _covered_by_run_hook_safely(root, registered)
     uncovered = registered - covered
 
-    current_session_id = os.environ.get(ENV_SESSION_ID, "").strip()
-    liveness_file = _most_recent_completed_liveness_file(root, current_session_id)
-    if liveness_file is None:
+    source, invoked = _invoked_in_previous_session(root)
+    if invoked is None:
         logger.info(
             "尚無可比對的 liveness 索引（首次啟用或前一 session 無任何 hook "
             "觸發），涵蓋 {} / 未涵蓋(無探針) {}".format(len(covered), len(uncovered))
@@ -143,14 +176,13 @@ def main() -> int:
             logger.info("未涵蓋（無 liveness 探針）: {}".format(sorted(uncovered)))
         return 0
 
-    invoked = _invoked_hook_names(liveness_file)
     loaded = covered & invoked
     never_triggered = covered - invoked
 
     logger.info(
         "Liveness 彙整（比對來源: {}）：已載入 {} / 涵蓋範圍 {} / "
         "未涵蓋(無探針) {}".format(
-            liveness_file.name, len(loaded), len(covered), len(uncovered)
+            source, len(loaded), len(covered), len(uncovered)
         )
     )
     if never_triggered:
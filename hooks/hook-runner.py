@@ -0,0 +1,29 @@
+#!/usr/bin/env -S uv run --quiet --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pyyaml"]
+# ///
+"""
+Hook Runner - 批次 Hook 派發入口
+
+settings.json 對每個 event+matcher 只註冊一次本腳本，由單一行程在行程內
+依序執行 .claude/config/hook-runner.yaml 所列的整組 hook 並合併輸出
+（deny-wins）。執行與合併語意見 .claude/lib/hook_runner.py。
+
+用法：
+    $CLAUDE_PROJECT_DIR/.claude/hooks/hook-runner.py PreToolUse Bash
+    $CLAUDE_PROJECT_DIR/.claude/hooks/hook-runner.py SessionStart
+
+可再以 hook-daemon-client.py 包裹，使整組 hook 在 hookd 預熱的子行程中執行。
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.hook_runner import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -74,6 +74,13 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    from lib import transcript_tail_reader as _tail_reader
+except ImportError:  # lib 不可用時退回全檔掃描
+    _tail_reader = None
+
 LOG_DIR = Path(__file__).resolve().parent / "hook-logs"
 LOG_FILE = LOG_DIR / "malformed-tool-call-detector.log"
 
@@ -151,11 +158,20 @@ def strip_code_regions(text: str) -> str:
 
 
 def last_assistant_text(transcript_path: str) -> str:
-    """從 transcript JSONL 取最後一則 assistant 訊息的純文字內容。"""
+    """從 transcript JSONL 取最後一則 assistant 訊息的純文字內容。
+
+    優先查 transcript 尾端索引（僅掃描上次之後新增的位元組）；索引不可用時
+    全檔掃描。
+    """
     path = Path(transcript_path)
     if not path.is_file():
         return ""
 
+    if _tail_reader is not None:
+        index = _tail_reader.get_transcript_index(transcript_path)
+        if index is not None:
+            return index.last_assistant_text() or ""
+
     last_text = ""
     try:
         with path.open(encoding="utf-8") as fh:
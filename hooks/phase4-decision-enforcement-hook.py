@@ -31,7 +31,6 @@ Pattern: PC-093
 """
 
 import re
-import shlex
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -50,9 +49,16 @@ from lib import (  # noqa: E402
     find_ticket_file,
     emit_hook_output,
 )
-from lib.git_command_parse import (  # noqa: E402
-    strip_heredoc_bodies,
-    normalize_newlines_to_separators,
+from lib.bash_command import parse_bash_command  # noqa: E402
+from lib.phrase_scanner import (  # noqa: E402
+    REGION_CONTEXT_BUNDLE,
+    REGION_FENCED_BLOCK,
+    REGION_FRONTMATTER,
+    REGION_RESOLVED_SPAWN_REQUEST,
+    REGION_SCHEMA_PLACEHOLDER,
+    compile_rules,
+    lines_in_region,
+    segment_markdown_regions,
 )
 from lib.ticket_id_pattern import BARE_START_BOUNDED_RE  # noqa: E402
 
@@ -79,11 +85,6 @@ TICKET_ID_PATTERN = BARE_START_BOUNDED_RE
 # 用途：PM 在 acceptance / Solution 引用規則名稱（如「禁止 Phase 5 再決定」）時豁免
 RULE_PATH_PATTERN = re.compile(r"\.claude/(?:rules|pm-rules)/")
 
-# 觸發命令偵測：語句內 token 需依序相鄰命中，見 extract_ticket_id_from_command
-# （原為對整條命令字串的 regex.search，heredoc/引號 payload 內文含觸發字樣
-# 會被誤判為真實呼叫，已改為 token 化後的相鄰比對，見「payload 誤判修正」段）
-_STATEMENT_SEPARATORS = frozenset({"&&", "||", ";", "|", "(", ")"})
-
 # 豁免 marker 解析（大小寫敏感，EX-N7）
 EXEMPT_MARKER = re.compile(
     r"<!--\s*PC-093-exempt\s*:\s*([^:]+?)\s*:\s*(.+?)\s*-->"
@@ -101,16 +102,16 @@ EXEMPT_MARKER_STRIP = re.compile(r"<!--\s*PC-093-exempt[^>]*-->")
 # 行級豁免（trim 後以 `- [ref]` 或 `[ref]` 開頭）— 採方向 A：簡單精準。
 REF_LINE_PATTERN = re.compile(r"^\s*-?\s*\[ref\]")
 
-# W10-130: Schema placeholder template 區塊起點。
+# 以下跳過區段的判定 regex 與單趟切分邏輯位於 lib/phrase_scanner.py
+# （segment_markdown_regions），phrase 掃描與 marker 蒐集共用同一份切分結果。
+#
+# W10-130: Schema placeholder template 區塊。
 # Ticket body schema 採 `<!-- Schema[<type>/<section>]: <note> -->` 標記。
 # 該區塊內的 `<!-- PC-093-exempt: cat:reason -->` 屬範例文字（template note 內
 # 示意 marker 格式），非實際豁免宣告。應整段跳過 phrase 掃描與 marker 蒐集。
-SCHEMA_PLACEHOLDER_START = re.compile(r"<!--\s*Schema\[[^\]]+\]\s*:")
 # 區塊邊界：下個 H2（## ）或 `---` 水平分隔符（trim 後完全相符）。
-SCHEMA_PLACEHOLDER_END_H2 = re.compile(r"^\s*##\s")
-SCHEMA_PLACEHOLDER_END_HR = re.compile(r"^\s*---\s*$")
-
-# W1-120: Context Bundle auto-extracted 區塊起點。
+#
+# W1-120: Context Bundle auto-extracted 區塊。
 # ticket-loader 抽取 source ticket 的 what / why 寫入 `## Context Bundle` 時，
 # 以 `<!-- auto-extracted: v1 | sources: ... -->` marker 標記為機器產生的結構化
 # 元資料（逐字引用 source ticket why / what）。該區塊與 frontmatter 同類——非
@@ -118,34 +119,17 @@ SCHEMA_PLACEHOLDER_END_HR = re.compile(r"^\s*---\s*$")
 # ticket history 引用，不應被誤判為本 ticket 延後決策（PC-142 case 5 同根因，
 # W1-092 frontmatter 修復的延伸）。
 # 錨定 marker 而非整個 section：人工撰寫的 Context Bundle（無 marker）仍應被攔截。
-# 區塊終點複用 SCHEMA_PLACEHOLDER_END_H2 / SCHEMA_PLACEHOLDER_END_HR。
-CONTEXT_BUNDLE_START = re.compile(r"<!--\s*auto-extracted\s*:")
-
+#
 # W11-018: Fenced code block 範例語境豁免
 # Markdown fenced code block 內的延後話術與 PC-093-exempt marker 屬「範例展示」，
 # 非實際延後決策或豁免宣告。整段跳過 phrase 掃描與 marker 蒐集。
-# 規則：採 CommonMark 0.31 fenced code block 子集
-# - 起始 fence: 行首 0-3 空格 indent + 3+ 連續 backtick 或 3+ 連續 tilde
-# - 結束 fence: 同字元 + 長度 >= 起始 + 行內僅尾部空白
-# - 未閉合 fence: 視為至檔尾（容錯）
-# - 不支援 indented fence（indent >= 4 空格 / Tab=4）與 nested fence
-FENCED_BLOCK_START_PATTERN = re.compile(
-    r"^(?P<indent> {0,3})(?P<fence>`{3,}|~{3,})(?P<info>.*)$"
-)
-FENCED_BLOCK_CLOSE_PATTERN = re.compile(
-    r"^(?P<indent> {0,3})(?P<fence>`{3,}|~{3,})\s*$"
-)
-
+#
 # 「## Spawn Requests」區段內已 resolved 條目的結構化欄位豁免。
 # 該區段全數由 add-spawn-request / resolve-spawn-request 兩個 CLI 指令
 # 產生，非使用者於 Phase 4 當下自由撰寫的決策 prose；一旦條目已
 # processed/dismissed，其中的階段字面是「建立當下的分析記錄」而非待辦，
 # 與 frontmatter / Context Bundle 既有豁免同精神。pending 條目維持掃描
 # （見 compute_resolved_spawn_request_lines docstring）。
-SPAWN_REQUESTS_SECTION_START = re.compile(r"^##\s+Spawn Requests\s*$")
-SPAWN_REQUEST_ENTRY_START = re.compile(r"^-\s+\*\*SR-\d+\*\*")
-SPAWN_REQUEST_STATUS_LINE = re.compile(r"^\s*-\s*status:\s*(processed|dismissed|pending)\b")
-RESOLVED_SPAWN_REQUEST_STATUSES = frozenset({"processed", "dismissed"})
 
 # 豁免 proximity（marker 同行或前 1 行生效）
 EXEMPT_PROXIMITY_LINES = 1
@@ -362,15 +346,7 @@ def compute_frontmatter_lines(lines: List[str]) -> set:
 
     邊界匹配限「行首僅有 `---` 三字元」避免內文 `---` 水平分隔符誤判結束。
     """
-    if not lines or lines[0].strip() != "---":
-        return set()
-    frontmatter_lines: set = {1}
-    for idx in range(2, len(lines) + 1):
-        frontmatter_lines.add(idx)
-        if lines[idx - 1].strip() == "---":
-            return frontmatter_lines
-    # 未閉合：視為無 frontmatter（容錯，避免整檔被跳過）
-    return set()
+    return lines_in_region(segment_markdown_regions(lines), REGION_FRONTMATTER)
 
 
 def compute_schema_placeholder_lines(lines: List[str]) -> set:
@@ -381,21 +357,7 @@ def compute_schema_placeholder_lines(lines: List[str]) -> set:
 
     回傳：所有屬於 placeholder 區塊的行號集合。phrase 掃描與 marker 蒐集均跳過。
     """
-    placeholder_lines: set = set()
-    in_block = False
-    for idx, raw in enumerate(lines, start=1):
-        if in_block:
-            if SCHEMA_PLACEHOLDER_END_H2.match(raw) or SCHEMA_PLACEHOLDER_END_HR.match(raw):
-                in_block = False
-                # 邊界行不屬 placeholder
-                continue
-            placeholder_lines.add(idx)
-            # 同一行可能再次出現 Schema 標記（連續 placeholder），仍視為 in_block
-            continue
-        if SCHEMA_PLACEHOLDER_START.search(raw):
-            in_block = True
-            placeholder_lines.add(idx)
-    return placeholder_lines
+    return lines_in_region(segment_markdown_regions(lines), REGION_SCHEMA_PLACEHOLDER)
 
 
 def compute_context_bundle_lines(lines: List[str]) -> set:
@@ -418,20 +380,7 @@ def compute_context_bundle_lines(lines: List[str]) -> set:
 
     回傳：所有屬於 auto-extracted 區塊的行號集合。phrase 掃描與 marker 蒐集均跳過。
     """
-    bundle_lines: set = set()
-    in_block = False
-    for idx, raw in enumerate(lines, start=1):
-        if in_block:
-            if SCHEMA_PLACEHOLDER_END_H2.match(raw) or SCHEMA_PLACEHOLDER_END_HR.match(raw):
-                in_block = False
-                # 邊界行不屬 bundle
-                continue
-            bundle_lines.add(idx)
-            continue
-        if CONTEXT_BUNDLE_START.search(raw):
-            in_block = True
-            bundle_lines.add(idx)
-    return bundle_lines
+    return lines_in_region(segment_markdown_regions(lines), REGION_CONTEXT_BUNDLE)
 
 
 def compute_fenced_block_lines(lines: List[str]) -> set:
@@ -446,57 +395,9 @@ def compute_fenced_block_lines(lines: List[str]) -> set:
     - FENCE-6: indent >= 4 空格不啟用（Tab 視為 4 空格）
     - FENCE-7: 不支援 nested fence；內層字元數 < 外層起始長度則視為內容
 
-    單次線性掃描 O(n)；in_block 期間先 add 後判 close（保 FENCE-4）。
+    實作見 lib/phrase_scanner.segment_markdown_regions（與其他區段同趟計算）。
     """
-    def _visual_indent(text: str) -> int:
-        """Tab 視為 4 空格（EDGE-8 / CommonMark）。"""
-        width = 0
-        for ch in text:
-            if ch == "\t":
-                width += 4
-            elif ch == " ":
-                width += 1
-            else:
-                break
-        return width
-
-    fenced_lines: set = set()
-    in_block = False
-    open_char: Optional[str] = None
-    open_len = 0
-
-    for idx, raw in enumerate(lines, start=1):
-        if not in_block:
-            # 先檢查 leading Tab / 大量空白（visual indent >= 4 不視為 fence）
-            # 取出 raw 開頭非空白前的部分，計算 visual width
-            leading = raw[: len(raw) - len(raw.lstrip(" \t"))]
-            if "\t" in leading and _visual_indent(leading) > 3:
-                continue
-            m = FENCED_BLOCK_START_PATTERN.match(raw)
-            if not m:
-                continue
-            # FENCE-6: indent ≤ 3 才視為 fence（regex 已限制 ≤ 3 純空格；Tab 已上方排除）
-            fence = m.group("fence")
-            info = m.group("info") or ""
-            # backtick fence 的 info string 不可含 backtick（CommonMark）
-            if fence[0] == "`" and "`" in info:
-                continue
-            in_block = True
-            open_char = fence[0]
-            open_len = len(fence)
-            fenced_lines.add(idx)
-        else:
-            # 已在區塊中：先加入再判 close（FENCE-4）
-            fenced_lines.add(idx)
-            cm = FENCED_BLOCK_CLOSE_PATTERN.match(raw)
-            if cm:
-                cfence = cm.group("fence")
-                if cfence[0] == open_char and len(cfence) >= open_len:
-                    in_block = False
-                    open_char = None
-                    open_len = 0
-    # FENCE-5: 未閉合 fence — 因迴圈內 in_block 期間每行已 add，自然涵蓋至檔尾
-    return fenced_lines
+    return lines_in_region(segment_markdown_regions(lines), REGION_FENCED_BLOCK)
 
 
 def compute_resolved_spawn_request_lines(lines: List[str]) -> set:
@@ -520,88 +421,53 @@ def compute_resolved_spawn_request_lines(lines: List[str]) -> set:
     frontmatter / Context Bundle auto-extracted 兩處既有豁免同一精神——
     結構化、機器可驗證來源的歷史記錄不應被當成使用者當下的延後決策。
     """
-    section_lines: set = set()
-    in_section = False
-    for idx, raw in enumerate(lines, start=1):
-        if in_section:
-            if SCHEMA_PLACEHOLDER_END_H2.match(raw) or SCHEMA_PLACEHOLDER_END_HR.match(raw):
-                break
-            section_lines.add(idx)
-            continue
-        if SPAWN_REQUESTS_SECTION_START.match(raw.rstrip()):
-            in_section = True
-
-    if not section_lines:
-        return set()
-
-    ordered = sorted(section_lines)
-    entry_starts = [i for i in ordered if SPAWN_REQUEST_ENTRY_START.match(lines[i - 1])]
-    if not entry_starts:
-        return set()
-
-    resolved_lines: set = set()
-    for pos, start in enumerate(entry_starts):
-        end = entry_starts[pos + 1] - 1 if pos + 1 < len(entry_starts) else ordered[-1]
-        entry_range = range(start, end + 1)
-        status: Optional[str] = None
-        for i in entry_range:
-            m = SPAWN_REQUEST_STATUS_LINE.match(lines[i - 1])
-            if m:
-                status = m.group(1)
-                break
-        if status in RESOLVED_SPAWN_REQUEST_STATUSES:
-            resolved_lines.update(entry_range)
-    return resolved_lines
+    return lines_in_region(segment_markdown_regions(lines), REGION_RESOLVED_SPAWN_REQUEST)
 
 
 def scan_lines_for_phrases(
     lines: List[str],
     table: List[PhraseRule],
+    regions: Optional[List[int]] = None,
 ) -> List[Hit]:
     """逐行掃描命中。
 
     - 掃前移除 EXEMPT_MARKER_STRIP 避 marker 內含 phrase 誤判。
     - 同行可多規則命中，不去重；豁免狀態由 F7 處理。
-    - W10-130: Schema placeholder template 區塊整段跳過。
+    - 跳過區段（frontmatter / Context Bundle auto-extracted / 已 resolved Spawn
+      Request / fenced code block / Schema placeholder）由 segment_markdown_regions
+      單趟切分；regions 可由呼叫端傳入以與 collect_exempt_markers 共用。
+    - 規則表經 lib/phrase_scanner.compile_rules 編譯（同表只編譯一次），每條規則
+      對全文各一趟找出候選行，只對候選行逐規則 finditer；結果與逐行逐規則相同。
     """
-    fenced_lines = compute_fenced_block_lines(lines)
-    placeholder_lines = compute_schema_placeholder_lines(lines)
-    frontmatter_lines = compute_frontmatter_lines(lines)
-    context_bundle_lines = compute_context_bundle_lines(lines)
-    resolved_spawn_lines = compute_resolved_spawn_request_lines(lines)
-    hits: List[Hit] = []
+    if regions is None:
+        regions = segment_markdown_regions(lines)
+    line_nos: List[int] = []
+    texts: List[str] = []
     for idx, raw in enumerate(lines, start=1):
-        # W1-092: Frontmatter (YAML 區塊) 跳過 (source ticket history 引用等結構化元資料)
-        if idx in frontmatter_lines:
-            continue
-        # W1-120: Context Bundle auto-extracted 區塊跳過（機器逐字引用 source ticket why/what）
-        if idx in context_bundle_lines:
-            continue
-        # 已 resolved 的 Spawn Request 條目跳過（CLI 產出結構化欄位，非
-        # 使用者當下延後決策，見 compute_resolved_spawn_request_lines）
-        if idx in resolved_spawn_lines:
-            continue
-        # W11-018: Fenced code block 範例語境豁免（行級 short-circuit，最先檢查）
-        if idx in fenced_lines:
-            continue
-        # W10-130: Schema placeholder template 區塊跳過（範例文字非實際內容）
-        if idx in placeholder_lines:
+        # W1-092 frontmatter / W1-120 Context Bundle auto-extracted / 已 resolved
+        # Spawn Request / W11-018 fenced code block / W10-130 Schema placeholder
+        # 區段整段跳過（見各 compute_*_lines docstring）
+        if regions[idx - 1]:
             continue
         # W10-127: Context Bundle 自動抽取的 [ref] 行豁免（行級 short-circuit）。
         # 這些行屬 source ticket 引用，非本 ticket 延後決策。
         if REF_LINE_PATTERN.match(raw):
             continue
-        stripped = EXEMPT_MARKER_STRIP.sub("", raw)
-        for rule in table:
-            for match in rule.pattern.finditer(stripped):
-                hits.append(
-                    Hit(
-                        line_no=idx,
-                        rule_id=rule.id,
-                        level=rule.level,
-                        text=match.group(),
-                    )
-                )
+        line_nos.append(idx)
+        texts.append(EXEMPT_MARKER_STRIP.sub("", raw) if "PC-093-exempt" in raw else raw)
+
+    scanner = compile_rules((rule.id, rule.pattern) for rule in table)
+    hits: List[Hit] = []
+    for line_index, rule_index, match in scanner.scan_lines(texts):
+        rule = table[rule_index]
+        hits.append(
+            Hit(
+                line_no=line_nos[line_index],
+                rule_id=rule.id,
+                level=rule.level,
+                text=match.group(),
+            )
+        )
     return hits
 
 
@@ -648,33 +514,23 @@ def validate_exempt_fields(marker: ExemptMarker) -> Tuple[bool, Optional[str]]:
 # F5: 掃全文蒐集 exempt markers
 # ============================================================================
 
-def collect_exempt_markers(lines: List[str]) -> List[ExemptRef]:
+def collect_exempt_markers(
+    lines: List[str],
+    regions: Optional[List[int]] = None,
+) -> List[ExemptRef]:
     """掃全文蒐集 marker 位置 + 解析結果。
 
     W10-130: Schema placeholder template 區塊內的 marker 屬範例文字（如
     `<!-- PC-093-exempt: cat:reason -->`），整段跳過避免誤判為 INVALID。
+    Frontmatter / Context Bundle auto-extracted / 已 resolved Spawn Request /
+    fenced code block 內的 marker 同樣不蒐集（非人工豁免宣告載體）。
+    regions 可由呼叫端傳入以與 scan_lines_for_phrases 共用同一份切分。
     """
-    fenced_lines = compute_fenced_block_lines(lines)
-    placeholder_lines = compute_schema_placeholder_lines(lines)
-    frontmatter_lines = compute_frontmatter_lines(lines)
-    context_bundle_lines = compute_context_bundle_lines(lines)
-    resolved_spawn_lines = compute_resolved_spawn_request_lines(lines)
+    if regions is None:
+        regions = segment_markdown_regions(lines)
     refs: List[ExemptRef] = []
     for idx, raw in enumerate(lines, start=1):
-        # W1-092: Frontmatter 內 marker 不蒐集（結構化元資料非豁免宣告載體）
-        if idx in frontmatter_lines:
-            continue
-        # W1-120: Context Bundle auto-extracted 區塊內 marker 不蒐集（機器引用非豁免宣告載體）
-        if idx in context_bundle_lines:
-            continue
-        # 已 resolved 的 Spawn Request 條目內 marker 不蒐集（同上，非人工
-        # 豁免宣告載體；該區塊此時亦不產生 hit，本就無需豁免）
-        if idx in resolved_spawn_lines:
-            continue
-        # W11-018: Fenced code block 範例語境豁免（範例 marker 不蒐集）
-        if idx in fenced_lines:
-            continue
-        if idx in placeholder_lines:
+        if regions[idx - 1]:
             continue
         marker = parse_exempt_marker(raw)
         if marker is None:
@@ -805,44 +661,20 @@ def detect_hook_self_reference(content: str) -> bool:
 # （shlex 不理解 heredoc 語法，若不先剝除，本體內文仍會被拆成獨立 token
 # 而誤判，見 ticket Problem Analysis 實測記錄）。
 #
-# 複用 `.claude/lib/git_command_parse.py` 的 `strip_heredoc_bodies` /
-# `normalize_newlines_to_separators` 兩個既有公開函式（皆為通用命令字串
-# 前處理，內部無 git 專屬邏輯）。不重用該模組的 `find_git_invocations`：
+# 語句切分改用 `.claude/lib/bash_command.py` 的共用解析模型（heredoc 剝離、
+# 換行正規化、shlex tokenize 與語句切分皆與 git_command_parse 相同），同一
+# 命令在同批次 Bash 守衛間只 tokenize 一次。不重用 `find_git_invocations`：
 # 其「識別一次呼叫」邏輯硬編寫死比對字面 `"git"`、承載前綴包裹穿透與
-# 全域選項消耗等 git 專屬知識，要讓它同時服務 `ticket` CLI 需要把 anchor
-# word 參數化並拆分 git 專屬邏輯，變更幅度接近重新設計該共用函式的職責
-# 邊界；本處只需要「ticket track complete/phase」4-5 個 token 的位置
-# 比對，維持在本 hook 內實作，不構成與既有三個 Bash git 守衛同型的
-# 「重複實作 payload 剝離」問題（真正容易重複、風險最高的 heredoc 剝離
-# 已重用，未重寫）。
+# 全域選項消耗等 git 專屬知識；本處只需要「ticket track complete/phase」
+# 4-5 個 token 的位置比對，維持在本 hook 內實作。
 
 def _tokenize_statements(command: str) -> Optional[List[List[str]]]:
-    """把命令字串剝除 heredoc 本體、換行正規化後，以 shlex 保留引號語意
-    tokenize，並依 shell 運算子切分為獨立語句清單。
+    """剝除 heredoc 本體、換行正規化後以 shlex 保留引號語意 tokenize，
+    依 shell 運算子切分為獨立語句清單。
 
     回傳 None 表示無法安全 tokenize（未閉合引號等）。
     """
-    stripped = strip_heredoc_bodies(command)
-    normalized = normalize_newlines_to_separators(stripped)
-    try:
-        lexer = shlex.shlex(normalized, posix=True, punctuation_chars=True)
-        lexer.whitespace_split = True
-        tokens = list(lexer)
-    except ValueError:
-        return None
-
-    statements: List[List[str]] = []
-    current: List[str] = []
-    for tok in tokens:
-        if tok in _STATEMENT_SEPARATORS:
-            if current:
-                statements.append(current)
-            current = []
-        else:
-            current.append(tok)
-    if current:
-        statements.append(current)
-    return statements
+    return parse_bash_command(command).statement_tokens()
 
 
 def extract_ticket_id_from_command(command: str) -> Tuple[Optional[str], Optional[str]]:
@@ -1074,8 +906,9 @@ def main() -> int:
 
     lines = content.split("\n")
     table = build_regex_table()
-    hits = scan_lines_for_phrases(lines, table)
-    markers = collect_exempt_markers(lines)
+    regions = segment_markdown_regions(lines)
+    hits = scan_lines_for_phrases(lines, table, regions)
+    markers = collect_exempt_markers(lines, regions)
     blocked, warned, info, exempted_hits = partition_hits(hits, markers)
 
     logger.info(
@@ -53,11 +53,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lib import setup_hook_logging, run_hook_safely, read_json_from_stdin
 
-try:
-    import yaml
-except ImportError:
-    yaml = None  # type: ignore
-
 # ============================================================================
 # 常數定義
 # ============================================================================
@@ -121,7 +116,10 @@ def parse_frontmatter(content: str) -> Optional[Dict[str, Any]]:
     parts = content.split("---", 2)
     if len(parts) < 3:
         return None
-    if yaml is None:
+    # 延後 import：多數 Write/Edit 不是 PROP-*.md，放行路徑不付 pyyaml 載入成本
+    try:
+        import yaml
+    except ImportError:
         return None
     try:
         data = yaml.safe_load(parts[1])
@@ -250,7 +248,9 @@ def check_tracking_yaml(content: str, logger) -> Tuple[bool, str]:
 
     規則 4：status=confirmed|approved 必須有非空 ticket_refs。
     """
-    if yaml is None:
+    try:
+        import yaml
+    except ImportError:
         logger.warning("PyYAML 不可用，跳過 tracking.yaml 檢查")
         return False, ""
     try:
@@ -37,11 +37,6 @@ sys.path.insert(0, str(Path(__file__).parent))
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib import setup_hook_logging, run_hook_safely, read_json_from_stdin, get_effort_level
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
-
 
 # ============================================================================
 # 常數
@@ -166,7 +161,10 @@ _FM_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
 def parse_ticket_md(path: Path) -> Optional[Dict]:
     """解析 ticket md frontmatter；失敗回 None。"""
-    if yaml is None:
+    # 延後 import：非 ticket 檔案的放行路徑不付 pyyaml 載入成本
+    try:
+        import yaml
+    except ImportError:
         return None
     try:
         text = path.read_text(encoding="utf-8")
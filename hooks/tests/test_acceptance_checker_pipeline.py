@@ -0,0 +1,181 @@
+"""
+Acceptance Checker Pipeline - 共用 ticket 讀取與 verdict 快取測試
+
+驗證：
+- TicketStore：children 與 sibling checker 共用時，同一子任務檔只解析一次
+- VerdictCache：scope 外直接執行；scope 內結果落地，下一「行程」輸入未變
+  直接重用（tuple 形狀保留），只改 body 時僅讀 frontmatter 的 checker 不重跑
+- 測試替身（無原始碼）不快取
+- orchestrator 於快取命中前後的驗收結果一致
+- 自行寫 stderr 的 ANA 後續 Ticket 警告不經快取，每次檢查都輸出
+"""
+
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+_hooks_dir = Path(__file__).parent.parent
+if str(_hooks_dir) not in sys.path:
+    sys.path.insert(0, str(_hooks_dir))
+
+from lib.hook_context import CACHE_SUBDIR, hook_context_scope
+from acceptance_checkers import checker_pipeline
+from acceptance_checkers.checker_pipeline import TicketStore, VerdictCache
+from acceptance_checkers.children_checker import check_children_completed_from_frontmatter
+from acceptance_checkers.sibling_checker import find_pending_sibling_tickets
+
+_calls = []
+
+
+def _frontmatter_checker(frontmatter, logger):
+    _calls.append("frontmatter")
+    return frontmatter.get("type", "") == "IMP", "fm"
+
+
+def _content_checker(content, logger, ticket_type=""):
+    _calls.append("content")
+    return ["line"] if "TODO" in content else []
+
+
+def _write_ticket(project_dir: Path, ticket_id: str, status: str, children=None) -> Path:
+    ticket_dir = project_dir / "docs" / "work-logs" / "v0.1.0" / "tickets"
+    ticket_dir.mkdir(parents=True, exist_ok=True)
+    children_line = "children: [{}]\n".format(", ".join(children)) if children else ""
+    path = ticket_dir / "{}.md".format(ticket_id)
+    path.write_text(
+        "---\nid: {}\ntitle: t\ntype: IMP\nstatus: {}\n{}---\n\n# Body\n".format(
+            ticket_id, status, children_line
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger("test-acceptance-checker-pipeline")
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    (tmp_path / ".claude").mkdir()
+    monkeypatch.delenv("CLAUDE_HOOK_CONTEXT_CACHE", raising=False)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+    _calls.clear()
+    return tmp_path
+
+
+class TestTicketStore:
+    def test_children_and_siblings_share_parses(self, project_dir, logger, monkeypatch):
+        parent = _write_ticket(project_dir, "0.1.0-W1-001", "in_progress", ["0.1.0-W1-002"])
+        _write_ticket(project_dir, "0.1.0-W1-002", "pending")
+        _write_ticket(project_dir, "0.1.0-W1-003", "pending")
+
+        parsed = []
+        original = checker_pipeline.parse_ticket_frontmatter
+
+        def counting(content, log=None):
+            parsed.append(content.split("\n")[1])
+            return original(content, log)
+
+        monkeypatch.setattr(checker_pipeline, "parse_ticket_frontmatter", counting)
+        store = TicketStore(project_dir, logger)
+        store.remember(parent, {"id": "0.1.0-W1-001", "children": "[0.1.0-W1-002]"})
+
+        should_block, _ = check_children_completed_from_frontmatter(
+            parent, {"children": "[0.1.0-W1-002]"}, project_dir, "0.1.0-W1-001", logger,
+            store=store,
+        )
+        siblings = find_pending_sibling_tickets("0.1.0-W1-001", project_dir, logger, store=store)
+
+        assert should_block is True
+        assert siblings == ["0.1.0-W1-002", "0.1.0-W1-003"]
+        assert sorted(parsed) == ["id: 0.1.0-W1-002", "id: 0.1.0-W1-003"]
+
+
+class TestVerdictCache:
+    def test_disabled_outside_scope(self, project_dir, logger):
+        cache = VerdictCache(project_dir, "body", {"type": "IMP"}, logger)
+        cache.call(_frontmatter_checker, {"type": "IMP"}, logger)
+        cache.call(_frontmatter_checker, {"type": "IMP"}, logger)
+        cache.save()
+        assert _calls == ["frontmatter", "frontmatter"]
+        assert not (project_dir / CACHE_SUBDIR / checker_pipeline.VERDICT_CACHE_FILENAME).exists()
+
+    def test_reused_across_processes(self, project_dir, logger):
+        frontmatter = {"type": "IMP"}
+        with hook_context_scope():
+            first = VerdictCache(project_dir, "TODO", frontmatter, logger)
+            assert first.call(_frontmatter_checker, frontmatter, logger) == (True, "fm")
+            assert first.call(_content_checker, "TODO", logger, ticket_type="IMP") == ["line"]
+            first.save()
+
+            second = VerdictCache(project_dir, "TODO", dict(frontmatter), logger)
+            assert second.call(_frontmatter_checker, second._frontmatter, logger) == (True, "fm")
+            assert second.call(_content_checker, second._content, logger, ticket_type="IMP") == ["line"]
+        assert _calls == ["frontmatter", "content"]
+
+    def test_body_change_reruns_only_content_checkers(self, project_dir, logger):
+        frontmatter = {"type": "IMP"}
+        with hook_context_scope():
+            first = VerdictCache(project_dir, "TODO", frontmatter, logger)
+            first.call(_frontmatter_checker, frontmatter, logger)
+            first.call(_content_checker, "TODO", logger)
+            first.save()
+
+            fixed = "done"
+            second = VerdictCache(project_dir, fixed, frontmatter, logger)
+            second.call(_frontmatter_checker, frontmatter, logger)
+            assert second.call(_content_checker, fixed, logger) == []
+        assert _calls == ["frontmatter", "content", "content"]
+
+    def test_mock_is_not_cached(self, project_dir, logger):
+        fake = MagicMock(return_value=(False, None))
+        with hook_context_scope():
+            cache = VerdictCache(project_dir, "body", {}, logger)
+            cache.call(fake, {}, logger)
+            cache.call(fake, {}, logger)
+        assert fake.call_count == 2
+
+
+def _load_gate_module():
+    hook_path = _hooks_dir.parent / "skills" / "ticket" / "hooks" / "acceptance-gate-hook.py"
+    spec = importlib.util.spec_from_file_location("acceptance_gate_hook_pipeline", hook_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_orchestrator_result_stable_with_cache(project_dir, logger):
+    _write_ticket(project_dir, "0.1.0-W1-001", "in_progress", ["0.1.0-W1-002"])
+    _write_ticket(project_dir, "0.1.0-W1-002", "completed")
+
+    module = _load_gate_module()
+
+    uncached = module.check_acceptance_status("0.1.0-W1-001", project_dir, logger)
+    with hook_context_scope():
+        first = module.check_acceptance_status("0.1.0-W1-001", project_dir, logger)
+        second = module.check_acceptance_status("0.1.0-W1-001", project_dir, logger)
+
+    assert (project_dir / CACHE_SUBDIR / checker_pipeline.VERDICT_CACHE_FILENAME).is_file()
+    assert uncached == first == second
+    assert uncached.should_block is False
+
+
+def test_ana_missing_children_warning_emitted_on_every_check(project_dir, logger, capsys):
+    ticket = _write_ticket(project_dir, "0.1.0-W1-001", "in_progress")
+    ticket.write_text(ticket.read_text(encoding="utf-8").replace("type: IMP", "type: ANA"),
+                      encoding="utf-8")
+    module = _load_gate_module()
+
+    with hook_context_scope():
+        module.check_acceptance_status("0.1.0-W1-001", project_dir, logger)
+        module.check_acceptance_status("0.1.0-W1-001", project_dir, logger)
+
+    warning = "WARNING: ANA Ticket 0.1.0-W1-001 缺少後續 Ticket"
+    assert capsys.readouterr().err.count(warning) == 2
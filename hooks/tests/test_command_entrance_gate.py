@@ -749,10 +749,13 @@ class TestW4027L2TriggerNarrowing:
         """存在 in_progress ticket → 即使 prompt 無 ticket-id 仍回傳（既有 gate 行為）"""
         hook_module = load_hook_module()
         logger = MagicMock()
-        in_prog = self._ticket(tmp_path, "0.20.0-W1-005.md", "in_progress")
+        tickets_dir = tmp_path / "docs" / "work-logs" / "v0.20.0" / "tickets"
+        tickets_dir.mkdir(parents=True)
+        self._ticket(tickets_dir, "0.20.0-W1-005.md", "in_progress")
 
         with patch.object(hook_module, 'get_project_root', return_value=tmp_path):
-            with patch.object(hook_module, 'find_ticket_files', return_value=[in_prog]):
+            # in_progress 查詢走 find_active_in_progress_ticket，不列舉全部 ticket
+            with patch.object(hook_module, 'find_ticket_files', side_effect=AssertionError):
                 result = hook_module.get_latest_pending_ticket(
                     logger, prompt="繼續實作功能"
                 )
@@ -95,6 +95,56 @@ class TestScanLogs:
         assert sum(stats["h1"]["per_day"].values()) == 3
 
 
+class TestScanLogsTelemetry:
+    """scan_logs prefers the telemetry rollup; legacy .log files only fill
+    days before telemetry coverage starts."""
+
+    @staticmethod
+    def _record(logs_root: Path, hook_name: str, dt: datetime, duration_s: float = 0.01):
+        from lib import hook_telemetry
+        hook_telemetry.record_invocation(
+            logs_root / hook_telemetry.TELEMETRY_SUBDIR, hook_name, duration_s, 0,
+            event="PreToolUse", now=dt.timestamp(),
+        )
+
+    def test_telemetry_counts_without_log_files(self, hook_logs_dir):
+        now = datetime.now().replace(minute=30, second=0, microsecond=0)
+        for i in range(3):
+            self._record(hook_logs_dir, "acceptance-gate", now - timedelta(minutes=i))
+
+        stats = hook_health.scan_logs(now - timedelta(hours=1), logs_root=hook_logs_dir)
+
+        assert stats == {
+            "acceptance-gate": {"total": 3, "per_day": {now.strftime("%Y-%m-%d"): 3}}
+        }
+
+    def test_legacy_logs_fill_days_before_coverage(self, hook_logs_dir):
+        now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        yesterday = now - timedelta(days=1)
+        for i in range(4):
+            _make_log(hook_logs_dir, "h1", yesterday, idx=i)
+        _make_log(hook_logs_dir, "h1", now, idx=9)
+        self._record(hook_logs_dir, "h1", now)
+        self._record(hook_logs_dir, "h1", now + timedelta(minutes=1))
+
+        stats = hook_health.scan_logs(now - timedelta(days=7), logs_root=hook_logs_dir)
+
+        assert stats["h1"]["per_day"] == {
+            yesterday.strftime("%Y-%m-%d"): 4,
+            now.strftime("%Y-%m-%d"): 2,
+        }
+        assert stats["h1"]["total"] == 6
+
+    def test_scan_latency_and_last_seen(self, hook_logs_dir):
+        now = datetime.now().replace(microsecond=0)
+        self._record(hook_logs_dir, "h1", now - timedelta(minutes=5), 0.010)
+        self._record(hook_logs_dir, "h1", now, 0.030)
+
+        latency = hook_health.scan_latency(now - timedelta(hours=1), logs_root=hook_logs_dir)
+        assert latency["h1"]["duration_ms_mean"] == pytest.approx(20.0)
+        assert hook_health.last_seen(hook_logs_dir)["h1"] == now
+
+
 # ---------------------------------------------------------------------------
 # classify_hook
 # ---------------------------------------------------------------------------
@@ -5,7 +5,8 @@ hook-liveness-summary-hook.py 測試
 
 驗證彙整入口正確區分「已載入 / 本 session 從未觸發 / 未涵蓋（無探針）」
 三類清單，且不誤把當前（剛啟動、尚無實質資料的）session 自己的檔案
-當作比對基準。
+當作比對基準；執行遙測啟用時改由遙測彙總推導「上一個 session」觸發過的
+hook。
 """
 
 import importlib.util
@@ -136,6 +137,7 @@ class TestMainEndToEnd:
             summary_hook, "get_project_root", lambda: tmp_path
         )
         monkeypatch.setenv(summary_hook.ENV_SESSION_ID, "current-session")
+        monkeypatch.setenv(summary_hook.hook_telemetry.ENV_TELEMETRY, "0")
         monkeypatch.setattr(
             "sys.stdin", __import__("io").StringIO("")
         )
@@ -161,3 +163,36 @@ class TestMainEndToEnd:
         exit_code = summary_hook.main()
 
         assert exit_code == 0
+
+
+class TestTelemetryDerivedLiveness:
+    def _record(self, root: Path, hook: str, ts: float):
+        summary_hook.hook_telemetry.record_invocation(
+            root / ".claude" / "hook-logs" / summary_hook.TELEMETRY_SUBDIR,
+            hook, 0.01, 0, now=ts,
+        )
+
+    def test_hooks_since_previous_summary_run(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(summary_hook.hook_telemetry.ENV_TELEMETRY, raising=False)
+        now = __import__("time").time()
+        self._record(tmp_path, "old-hook", now - 300)
+        self._record(tmp_path, summary_hook.HOOK_NAME, now - 200)
+        self._record(tmp_path, "loaded-hook", now - 100)
+
+        source, invoked = summary_hook._invoked_in_previous_session(tmp_path)
+
+        assert source is not None
+        assert invoked == {summary_hook.HOOK_NAME, "loaded-hook"}
+
+    def test_no_previous_summary_run(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(summary_hook.hook_telemetry.ENV_TELEMETRY, raising=False)
+        self._record(tmp_path, "loaded-hook", __import__("time").time())
+
+        assert summary_hook._invoked_in_previous_session(tmp_path) == (None, None)
+
+    def test_telemetry_dir_ignores_itself(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(summary_hook.hook_telemetry.ENV_TELEMETRY, raising=False)
+        self._record(tmp_path, "loaded-hook", __import__("time").time())
+
+        gitignore = tmp_path / ".claude" / "hook-logs" / summary_hook.TELEMETRY_SUBDIR / ".gitignore"
+        assert gitignore.read_text(encoding="utf-8") == "*\n"
@@ -7,6 +7,7 @@ Hook liveness 訊號測試
 - mark_hook_entry 寫入格式與 session_id 綁定
 - run_hook_safely 於 main_func 之前無條件呼叫 mark_hook_entry（含 main_func
   拋例外時仍已寫入的情形，用以觀察「已進入但崩於 main() 中」）
+- 執行遙測啟用時不寫 liveness 索引（改由遙測推導）
 - 迴歸釘子：delay=True 與 FILE_HANDLER_LEVEL=DEBUG 是「有檔即等於有呼叫」
   保證的實作前提，任何破壞此二者的改動必須紅燈
 """
@@ -21,8 +22,9 @@ from lib import hook_logging
 
 @pytest.fixture
 def liveness_dir(tmp_path, monkeypatch):
-    """隔離 liveness 索引到 tmp_path，並回傳其路徑"""
+    """隔離 liveness 索引到 tmp_path，並回傳其路徑（停用遙測以走 JSONL 路徑）"""
     monkeypatch.setattr(hook_logging, "get_project_root", lambda: tmp_path)
+    monkeypatch.setenv(hook_logging.hook_telemetry.ENV_TELEMETRY, "0")
     return tmp_path / ".claude" / "hook-logs" / hook_logging.LIVENESS_SUBDIR
 
 
@@ -76,6 +78,15 @@ class TestMarkHookEntry:
         assert hooks == {"hook-a", "hook-b"}
 
 
+    def test_skipped_when_telemetry_enabled(self, liveness_dir, monkeypatch):
+        monkeypatch.delenv(hook_logging.hook_telemetry.ENV_TELEMETRY)
+        monkeypatch.setenv(hook_logging.ENV_SESSION_ID, "telemetry-session")
+
+        hook_logging.mark_hook_entry("example-hook")
+
+        assert not liveness_dir.exists()
+
+
 class TestRunHookSafelyWritesLivenessBeforeMain:
     def test_liveness_entry_written_even_when_main_raises(
         self, liveness_dir, monkeypatch
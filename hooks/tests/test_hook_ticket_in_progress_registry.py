@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+find_active_in_progress_ticket 的 in_progress 登錄檔快速路徑測試。
+
+登錄檔由 ticket CLI 維護（skills/ticket/ticket_system/lib/in_progress_registry.py），
+hook 端只讀：
+- 登錄檔一致：單檔讀取即回傳，同 session 認領的票優先
+- 登錄為空且目錄 mtime 相符：直接回傳 None（不列舉、不解析票檔）
+- 登錄檔缺失 / 目錄 mtime 不符（CLI 以外新增票檔）/ 票檔 mtime 不符 /
+  票面已非 in_progress：回退全掃描
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import hook_ticket
+from lib.hook_ticket import find_active_in_progress_ticket
+
+
+def _write_ticket(work_logs: Path, ticket_id: str, status: str, mtime: float) -> Path:
+    path = work_logs / "v0.1.0" / "tickets" / "{}.md".format(ticket_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "---\nid: {}\nstatus: {}\n---\n\n# {}\n".format(ticket_id, status, ticket_id),
+        encoding="utf-8",
+    )
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _dir_stamps(work_logs: Path) -> dict:
+    """同 in_progress_registry.directory_stamps（hook 端只比對 mtime_ns）"""
+    stamps = {".": [work_logs.stat().st_mtime_ns, 0]}
+    for dirpath, _dirnames, _filenames in os.walk(work_logs):
+        directory = Path(dirpath)
+        relative = directory.relative_to(work_logs).as_posix()
+        if relative != "." and relative.startswith("v"):
+            stamps[relative] = [directory.stat().st_mtime_ns, 0]
+    return stamps
+
+
+def _write_registry(work_logs: Path, entries: dict) -> None:
+    registry = work_logs / hook_ticket.IN_PROGRESS_REGISTRY_RELPATH
+    registry.parent.mkdir(parents=True, exist_ok=True)
+    tickets = {}
+    for ticket_id, session in entries.items():
+        path = work_logs / "v0.1.0" / "tickets" / "{}.md".format(ticket_id)
+        tickets[ticket_id] = {
+            "path": path.relative_to(work_logs).as_posix(),
+            "session": session,
+            "since": None,
+            "mtime_ns": path.stat().st_mtime_ns,
+        }
+    registry.write_text(
+        json.dumps({
+            "version": hook_ticket.IN_PROGRESS_REGISTRY_VERSION,
+            "dirs": _dir_stamps(work_logs),
+            "tickets": tickets,
+        }),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def work_logs(tmp_path, monkeypatch):
+    monkeypatch.delenv("CLAUDE_CODE_SESSION_ID", raising=False)
+    path = tmp_path / "docs" / "work-logs"
+    path.mkdir(parents=True)
+    return path
+
+
+def _forbid_scan(monkeypatch):
+    """登錄檔一致時不列舉票檔，最多只解析選中的一張票"""
+    def fail(*args, **kwargs):
+        raise AssertionError("登錄檔一致時不應全掃描")
+
+    monkeypatch.setattr(hook_ticket, "_is_excluded_ticket_path", fail)
+    parsed = []
+    original = hook_ticket.parse_ticket_frontmatter
+
+    def parse_once(path, logger=None):
+        parsed.append(path)
+        if len(parsed) > 1:
+            raise AssertionError("登錄檔一致時不應全掃描")
+        return original(path, logger)
+
+    monkeypatch.setattr(hook_ticket, "parse_ticket_frontmatter", parse_once)
+
+
+class TestRegistryHit:
+    def test_returns_newest_without_scan(self, work_logs, monkeypatch):
+        _write_ticket(work_logs, "0.1.0-W1-001", "in_progress", 1000)
+        _write_ticket(work_logs, "0.1.0-W1-002", "in_progress", 2000)
+        _write_registry(work_logs, {"0.1.0-W1-001": None, "0.1.0-W1-002": None})
+        _forbid_scan(monkeypatch)
+
+        fm = find_active_in_progress_ticket(work_logs.parent.parent)
+        assert fm["id"] == "0.1.0-W1-002"
+
+    def test_prefers_current_session(self, work_logs, monkeypatch):
+        _write_ticket(work_logs, "0.1.0-W1-001", "in_progress", 1000)
+        _write_ticket(work_logs, "0.1.0-W1-002", "in_progress", 2000)
+        _write_registry(work_logs, {"0.1.0-W1-001": "sess-a", "0.1.0-W1-002": "sess-b"})
+        monkeypatch.setenv("CLAUDE_CODE_SESSION_ID", "sess-a")
+        _forbid_scan(monkeypatch)
+
+        fm = find_active_in_progress_ticket(work_logs.parent.parent)
+        assert fm["id"] == "0.1.0-W1-001"
+
+    def test_empty_registry_returns_none(self, work_logs, monkeypatch):
+        _write_ticket(work_logs, "0.1.0-W1-001", "pending", 1000)
+        _write_registry(work_logs, {})
+        _forbid_scan(monkeypatch)
+
+        assert find_active_in_progress_ticket(work_logs.parent.parent) is None
+
+
+class TestFallback:
+    def test_missing_registry_scans(self, work_logs):
+        _write_ticket(work_logs, "0.1.0-W1-001", "in_progress", 1000)
+        fm = find_active_in_progress_ticket(work_logs.parent.parent)
+        assert fm["id"] == "0.1.0-W1-001"
+
+    def test_stale_mtime_scans(self, work_logs):
+        _write_ticket(work_logs, "0.1.0-W1-001", "in_progress", 1000)
+        _write_registry(work_logs, {"0.1.0-W1-001": None})
+        # CLI 以外改動：票面轉 completed、另一張手動設為 in_progress
+        _write_ticket(work_logs, "0.1.0-W1-001", "completed", 3000)
+        _write_ticket(work_logs, "0.1.0-W1-002", "in_progress", 2000)
+
+        fm = find_active_in_progress_ticket(work_logs.parent.parent)
+        assert fm["id"] == "0.1.0-W1-002"
+
+    def test_ticket_added_out_of_band_scans(self, work_logs):
+        _write_ticket(work_logs, "0.1.0-W1-001", "pending", 1000)
+        _write_registry(work_logs, {})
+        # 未經 CLI 出現的新票檔（git pull / 手動建立），mtime 早於既有票
+        _write_ticket(work_logs, "0.1.0-W1-002", "in_progress", 500)
+
+        fm = find_active_in_progress_ticket(work_logs.parent.parent)
+        assert fm["id"] == "0.1.0-W1-002"
+
+    def test_tickets_dir_added_out_of_band_scans(self, work_logs):
+        _write_ticket(work_logs, "0.1.0-W1-001", "pending", 1000)
+        _write_registry(work_logs, {})
+        other = work_logs / "v0.2.0" / "tickets" / "0.2.0-W1-001.md"
+        other.parent.mkdir(parents=True)
+        other.write_text("---\nid: 0.2.0-W1-001\nstatus: in_progress\n---\n", encoding="utf-8")
+
+        fm = find_active_in_progress_ticket(work_logs.parent.parent)
+        assert fm["id"] == "0.2.0-W1-001"
+
+    def test_version_mismatch_scans(self, work_logs):
+        _write_ticket(work_logs, "0.1.0-W1-001", "in_progress", 1000)
+        registry = work_logs / hook_ticket.IN_PROGRESS_REGISTRY_RELPATH
+        registry.parent.mkdir(parents=True)
+        registry.write_text(json.dumps({"version": 0, "tickets": {}}), encoding="utf-8")
+
+        fm = find_active_in_progress_ticket(work_logs.parent.parent)
+        assert fm["id"] == "0.1.0-W1-001"
@@ -240,12 +240,16 @@ class TestFailSafeOnInvalidYaml:
         assert len(warnings) == 1
         assert "非 dict" in warnings[0].getMessage()
 
-    def test_non_yaml_error_exception_is_caught_and_returns_empty_dict(self, caplog):
+    def test_non_yaml_error_exception_is_caught_and_returns_empty_dict(self, caplog, monkeypatch):
         """F1：非 YAMLError 的例外（如深度巢狀 flow 觸發 RecursionError）亦須
         被 fail-safe 契約涵蓋，不得逸出中斷呼叫端（docstring 明文承諾）。"""
         logger = logging.getLogger("test-hook-ticket-fail-safe-recursion")
 
-        # 深度巢狀 flow-style 序列觸發 PyYAML 內部 RecursionError（非 YAMLError）
+        # 深度巢狀 flow-style 序列在純 Python SafeLoader 觸發 RecursionError
+        # （非 YAMLError）；libyaml C 載入器可正常解析，故固定使用純 Python
+        # 載入器以穩定重現
+        from lib import yaml_frontmatter
+        monkeypatch.setattr(yaml_frontmatter, "SAFE_LOADER", yaml.SafeLoader)
         depth = 5000
         content = "---\nk: " + "[" * depth + "]" * depth + "\n---\nbody\n"
 
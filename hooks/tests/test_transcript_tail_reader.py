@@ -174,3 +174,111 @@ def test_clear_cache(tmp_path, logger):
     assert len(ttr._OFFSET_CACHE) == 1
     ttr.clear_cache()
     assert len(ttr._OFFSET_CACHE) == 0
+
+
+# --- 持久化 sidecar 索引 ---
+
+def _spy_scan(monkeypatch):
+    starts = []
+    orig = ttr._scan_forward_from
+
+    def spy(path, start):
+        starts.append(start)
+        return orig(path, start)
+
+    monkeypatch.setattr(ttr, "_scan_forward_from", spy)
+    return starts
+
+
+def test_index_shared_across_processes(tmp_path, logger, monkeypatch):
+    p = tmp_path / "session.jsonl"
+    _write_jsonl(p, [{"message": {"role": "assistant", "content": "v1"}}])
+    assert ttr.read_last_assistant_text(str(p), logger) == "v1"
+    assert (tmp_path / ttr.INDEX_DIRNAME / "session.jsonl.json").is_file()
+
+    # 清除行程內快取 = 另一支 hook 行程：直接沿用 sidecar 索引，不掃描
+    ttr.clear_cache()
+    starts = _spy_scan(monkeypatch)
+    assert ttr.read_last_assistant_text(str(p), logger) == "v1"
+    assert starts == []
+
+
+def test_append_scans_only_new_bytes(tmp_path, logger, monkeypatch):
+    p = tmp_path / "session.jsonl"
+    _write_jsonl(p, [{"message": {"role": "assistant", "content": "old"}}])
+    ttr.read_last_assistant_text(str(p), logger)
+    old_size = p.stat().st_size
+
+    ttr.clear_cache()
+    starts = _spy_scan(monkeypatch)
+    _append_jsonl(p, [{"message": {"role": "user", "content": "q"}}])
+    os.utime(p, ns=(p.stat().st_atime_ns, p.stat().st_mtime_ns + 1_000_000))
+    assert ttr.read_last_assistant_text(str(p), logger) == "old"
+    assert starts == [old_size]
+
+
+def test_same_size_rewrite_rebuilds(tmp_path, logger, monkeypatch):
+    p = tmp_path / "session.jsonl"
+    _write_jsonl(p, [{"message": {"role": "assistant", "content": "aaaa"}}])
+    ttr.read_last_assistant_text(str(p), logger)
+
+    starts = _spy_scan(monkeypatch)
+    _write_jsonl(p, [{"message": {"role": "assistant", "content": "bbbb"}}])
+    os.utime(p, ns=(p.stat().st_atime_ns, p.stat().st_mtime_ns + 1_000_000))
+    assert ttr.read_last_assistant_text(str(p), logger) == "bbbb"
+    assert starts == [0]
+
+
+def test_partial_trailing_line_resumed(tmp_path, logger):
+    p = tmp_path / "session.jsonl"
+    done = json.dumps({"message": {"role": "assistant", "content": "done"}}) + "\n"
+    pending = json.dumps({"message": {"role": "assistant", "content": "pending"}})
+    p.write_text(done + pending[:20], encoding="utf-8")
+    assert ttr.read_last_assistant_text(str(p), logger) == "done"
+
+    with p.open("a", encoding="utf-8") as f:
+        f.write(pending[20:] + "\n")
+    os.utime(p, ns=(p.stat().st_atime_ns, p.stat().st_mtime_ns + 1_000_000))
+    assert ttr.read_last_assistant_text(str(p), logger) == "pending"
+
+
+def test_tool_calls_and_messages_since(tmp_path):
+    p = tmp_path / "session.jsonl"
+    _write_jsonl(p, [
+        {"message": {"role": "assistant", "content": [
+            {"type": "tool_use", "id": "t1", "name": "Read", "input": {"file_path": "a"}},
+            {"type": "tool_use", "id": "t2", "name": "Bash", "input": {"command": "ls"}},
+        ]}},
+        {"message": {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t2"}]}},
+    ])
+    index = ttr.get_transcript_index(str(p))
+    assert [c["id"] for c in index.last_tool_calls(5)] == ["t1", "t2"]
+    assert [c["name"] for c in index.last_tool_calls(1)] == ["Bash"]
+    assert index.last_assistant_text() is None
+    assert len(index.last_entries(ttr.KIND_USER, 3)) == 1
+
+    resume = index.indexed_offset
+    _append_jsonl(p, [{"message": {"role": "assistant", "content": "next"}}])
+    messages, next_offset = index.messages_since(resume)
+    assert [m["message"]["content"] for _, m in messages] == ["next"]
+    assert next_offset == p.stat().st_size
+
+
+def test_recent_limit_caps_index(tmp_path):
+    p = tmp_path / "session.jsonl"
+    _write_jsonl(p, [
+        {"message": {"role": "assistant", "content": f"m{i}"}}
+        for i in range(ttr.RECENT_LIMIT + 10)
+    ])
+    index = ttr.get_transcript_index(str(p))
+    entries = index.last_entries(ttr.KIND_ASSISTANT_TEXT, ttr.RECENT_LIMIT + 10)
+    assert len(entries) == ttr.RECENT_LIMIT
+    assert entries[-1]["message"]["content"] == f"m{ttr.RECENT_LIMIT + 9}"
+
+
+def test_env_disables_sidecar(tmp_path, logger, monkeypatch):
+    monkeypatch.setenv(ttr.ENV_TRANSCRIPT_INDEX, "0")
+    p = tmp_path / "session.jsonl"
+    _write_jsonl(p, [{"message": {"role": "assistant", "content": "x"}}])
+    assert ttr.read_last_assistant_text(str(p), logger) == "x"
+    assert not (tmp_path / ttr.INDEX_DIRNAME).exists()
@@ -8,75 +8,80 @@ Claude Hooks 共用程式庫
 - hook_logging: Hook 日誌系統
 - hook_io: Hook 輸入輸出處理
 
+`lib` 套件本身不 eager import 任何子模組：`from lib import X` 於首次存取時
+才載入 X 所屬的子模組（見 __getattr__），hook 只付出實際用到的模組成本。
+
 使用方式:
     from lib.git_utils import get_current_branch, run_git_command
     from lib.hook_logging import setup_hook_logging
     from lib.hook_io import read_hook_input, write_hook_output
 """
 
-from .hook_base import ensure_utf8_io, get_project_root
-
-from .git_utils import (
-    run_git_command,
-    get_current_branch,
-    get_worktree_list,
-    get_uncommitted_files,
-    FileStatus,
-    is_protected_branch,
-    is_allowed_branch,
-)
-
-from .hook_logging import (
-    setup_hook_logging,
-    save_check_log,
-    run_hook_safely,
-    get_hook_log_dir,
-    mark_hook_entry,
-    resolve_session_id,
-    LIVENESS_SUBDIR,
-    ENV_SESSION_ID,
-    UNKNOWN_SESSION_ID,
-)
-
-from .hook_io import (
-    read_hook_input,
-    read_json_from_stdin,
-    write_hook_output,
-    create_pretooluse_output,
-    create_posttooluse_output,
-    create_simple_output,
-    run_git,
-    get_effort_level,
-    extract_tool_input,
-    extract_tool_response,
-    is_handoff_recovery_mode,
-    clear_handoff_recovery_cache,
-    validate_hook_input,
-    validate_tool_input,
-    is_subagent_environment,
-    is_background_dispatch,
-    generate_hook_output,
-    emit_hook_output,
-    PM_ONLY_PREFIX,
-    get_claude_code_version,
-    supports_subagent_stop_additional_context,
-    build_subagent_stop_output,
-)
-
-from .config_loader import (
-    load_config,
-    load_agents_config,
-    load_quality_rules,
-    clear_config_cache,
-)
-
-# hook_ticket 為惰性載入（見下方 __getattr__），不在此處 eager import。
-# Why: hook_ticket 依賴 pyyaml，但多數消費端只需要 setup_hook_logging /
-# run_hook_safely 等與 ticket 解析無關的工具函式；eager import 會強迫所有
-# 非 uv-run shebang 的 hook 都需要 ambient pyyaml，即使它們從未呼叫任何
-# hook_ticket 函式。
-_HOOK_TICKET_NAMES = frozenset(
-    (
+import importlib
+
+# 所有公開符號皆為惰性載入（PEP 562，見下方 __getattr__），不在此處 eager
+# import。Why: `from lib.hook_logging import run_hook_safely` 會先執行本檔，
+# 原本的 eager import 讓每支 hook 冷啟動都付出 git_utils / hook_io /
+# config_loader（連帶 pyyaml）等全部模組的載入成本，即使 hook 只用到其中
+# 一兩個函式；hook_ticket 依賴 pyyaml，eager import 更會強迫所有非 uv-run
+# shebang 的 hook 都需要 ambient pyyaml。各 hook 實際的 import 成本可用
+# `python3 .claude/lib/import_audit.py` 量測（見該模組）。
+_LAZY_EXPORTS = {
+    "hook_base": (
+        "ensure_utf8_io",
+        "get_project_root",
+    ),
+    "git_utils": (
+        "run_git_command",
+        "get_current_branch",
+        "get_worktree_list",
+        "get_uncommitted_files",
+        "FileStatus",
+        "is_protected_branch",
+        "is_allowed_branch",
+    ),
+    "hook_logging": (
+        "setup_hook_logging",
+        "save_check_log",
+        "run_hook_safely",
+        "get_hook_log_dir",
+        "mark_hook_entry",
+        "resolve_session_id",
+        "LIVENESS_SUBDIR",
+        "ENV_SESSION_ID",
+        "UNKNOWN_SESSION_ID",
+    ),
+    "hook_io": (
+        "read_hook_input",
+        "read_json_from_stdin",
+        "write_hook_output",
+        "create_pretooluse_output",
+        "create_posttooluse_output",
+        "create_simple_output",
+        "run_git",
+        "get_effort_level",
+        "extract_tool_input",
+        "extract_tool_response",
+        "is_handoff_recovery_mode",
+        "clear_handoff_recovery_cache",
+        "validate_hook_input",
+        "validate_tool_input",
+        "is_subagent_environment",
+        "is_background_dispatch",
+        "generate_hook_output",
+        "emit_hook_output",
+        "PM_ONLY_PREFIX",
+        "get_claude_code_version",
+        "supports_subagent_stop_additional_context",
+        "build_subagent_stop_output",
+    ),
+    "config_loader": (
+        "load_config",
+        "load_agents_config",
+        "load_quality_rules",
+        "clear_config_cache",
+    ),
+    "hook_ticket": (
         "parse_ticket_frontmatter",
         "parse_ticket_date",
         "check_error_patterns_changed",
@@ -92,19 +97,42 @@ _HOOK_TICKET_NAMES = frozenset(
         "validate_ticket_has_decision_tree",
         "validate_ticket_unified",
         "find_active_in_progress_ticket",
-    )
-)
+    ),
+}
+
+_EXPORT_MODULES = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+# 向後相容：既有呼叫端以此集合判斷 hook_ticket 符號
+_HOOK_TICKET_NAMES = frozenset(_LAZY_EXPORTS["hook_ticket"])
 
 
 def __getattr__(name: str):
-    """PEP 562 模組級惰性屬性：首次存取 hook_ticket 符號時才 import。"""
-    if name in _HOOK_TICKET_NAMES:
-        from . import hook_ticket
+    """PEP 562 模組級惰性屬性
 
-        return getattr(hook_ticket, name)
+    - 公開符號：首次存取時 import 所屬子模組，並快取到套件命名空間
+    - 子模組名稱（如 `lib.hook_messages`）：未 import 過時以 import_module 載入
+    """
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+        globals()[name] = value
+        return value
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORT_MODULES))
+
+
 __all__ = [
     # hook_base
     "ensure_utf8_io",
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Bash 命令結構化模型（一次解析，多守衛共用）
+
+同一次 Bash 工具呼叫會觸發多支 PreToolUse 守衛（bare-commit / git-add-broad /
+protected-branch / phase4-decision-enforcement 等），各自對同一個
+`tool_input.command` 重做 heredoc 剝離、換行正規化、shlex tokenize 與語句
+切分；長 `-m` 訊息的 commit 命令單次 tokenize 即需數百微秒。本模組把解析
+結果整理為單一模型，並以命令字串內容為鍵共用：
+
+- 程序內：最近解析過的命令留在記憶中（同一守衛對同一命令多次查詢、常駐
+  daemon 模式下多支守衛同程序執行）
+- 跨行程：hook 執行期間（hook_context_scope 內，run_hook_safely 自動進入）
+  將 token 與 heredoc 寫入 `<worktree>/.claude/hook-logs/_cache/bash-command.json`，
+  以命令 sha256 為鍵，保留最近 BASH_CACHE_MAX_ENTRIES 筆；同批次其他守衛
+  行程直接讀取，不再 tokenize。短於 BASH_CACHE_MIN_LENGTH 的命令不落地
+  （讀檔成本高於重新 tokenize）。停用條件同 hook_context（CLAUDE_HOOK_CONTEXT_CACHE=0）。
+
+模型內容：
+- statements：依 `&&` / `||` / `;` / `|` / `(` / `)` 切出的語句（與
+  git_command_parse._split_statements 相同），各自記錄結尾分隔符
+- pipelines：以 `|` 串接的語句群組
+- redirections：語句中的重導向運算子與目標（fd 數字因 shlex 切分為獨立
+  token，仍留在 words 中；與 is_shell_redirection_token 的已知殘留一致）
+- heredocs：被剝離的 heredoc（界線字, 內文）
+- git_invocations：各語句的 git 呼叫（前綴包裹、全域選項與 -C 已解析）
+
+失敗語意同 git_command_parse：命令無法安全 tokenize 時 tokens 為 None，
+git_invocations 回傳 None，呼叫端須與空清單區分。
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from lib.git_command_parse import (
+    GitInvocation,
+    _STATEMENT_SEPARATORS,
+    _expand_subcommand_aliases,
+    _find_invocation_in_statement,
+    _tokenize,
+    normalize_newlines_to_separators,
+    split_heredoc_bodies,
+)
+from lib.hook_context import CACHE_SUBDIR, ensure_cache_dir, find_git_layout, is_enabled
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# 跨行程快取檔（與 git-context.json 同目錄）與格式版本
+BASH_CACHE_FILENAME = "bash-command.json"
+BASH_CACHE_VERSION = 1
+
+# 快取筆數上限（頂層命令 + 守衛自行切出的子 shell 範圍字串）
+BASH_CACHE_MAX_ENTRIES = 16
+
+# 落地門檻：讀快取檔約 50µs 固定成本，短命令直接 tokenize 較快
+BASH_CACHE_MIN_LENGTH = 256
+
+# 程序內記憶上限
+MEMO_MAX_ENTRIES = 32
+
+# 重導向運算子：僅由 < > & | 組成且含 < 或 >（`>`、`>>`、`2>&1` 的 `>&`、`&>` 等）
+_REDIRECTION_CHARS = frozenset("<>&|")
+
+_memo: "OrderedDict[str, BashCommand]" = OrderedDict()
+
+
+# ============================================================================
+# 資料結構
+# ============================================================================
+
+@dataclass(frozen=True)
+class Redirection:
+    operator: str
+    target: Optional[str]
+
+
+@dataclass(frozen=True)
+class Statement:
+    """單一語句
+
+    Attributes:
+        tokens: 語句的完整 token（與 _split_statements 輸出相同）
+        separator: 結束本語句的分隔符；命令結尾為 None
+    """
+
+    tokens: Tuple[str, ...]
+    separator: Optional[str]
+
+    @property
+    def redirections(self) -> List[Redirection]:
+        result: List[Redirection] = []
+        for idx, tok in enumerate(self.tokens):
+            if _is_redirection_operator(tok):
+                target = self.tokens[idx + 1] if idx + 1 < len(self.tokens) else None
+                result.append(Redirection(tok, target))
+        return result
+
+    @property
+    def words(self) -> List[str]:
+        """去除重導向運算子與其目標後的 token"""
+        words: List[str] = []
+        skip_next = False
+        for tok in self.tokens:
+            if skip_next:
+                skip_next = False
+                continue
+            if _is_redirection_operator(tok):
+                skip_next = True
+                continue
+            words.append(tok)
+        return words
+
+
+def _is_redirection_operator(token: str) -> bool:
+    return (
+        bool(token)
+        and set(token) <= _REDIRECTION_CHARS
+        and ("<" in token or ">" in token)
+    )
+
+
+class BashCommand:
+    """單一 Bash 命令字串的解析結果（不可變，跨守衛共用）"""
+
+    def __init__(self, source: str, tokens: Optional[List[str]],
+                 heredocs: List[Tuple[str, str]]):
+        self.source = source
+        self.tokens = tuple(tokens) if tokens is not None else None
+        self.heredocs = tuple((delimiter, body) for delimiter, body in heredocs)
+        self.statements = _split_with_separators(self.tokens) if self.tokens is not None else ()
+
+    @property
+    def parseable(self) -> bool:
+        return self.tokens is not None
+
+    def statement_tokens(self) -> Optional[List[List[str]]]:
+        """語句 token 清單（新 list，可自由修改）；無法解析時回傳 None"""
+        if self.tokens is None:
+            return None
+        return [list(statement.tokens) for statement in self.statements]
+
+    @property
+    def pipelines(self) -> List[List[Statement]]:
+        pipelines: List[List[Statement]] = []
+        current: List[Statement] = []
+        for statement in self.statements:
+            current.append(statement)
+            if statement.separator != "|":
+                pipelines.append(current)
+                current = []
+        if current:
+            pipelines.append(current)
+        return pipelines
+
+    def git_invocations(
+        self, subcommands: Optional[Iterable[str]] = None
+    ) -> Optional[List[GitInvocation]]:
+        """
+        各語句的 git 呼叫（語意同 git_command_parse.find_git_invocations）
+
+        Args:
+            subcommands: canonical 子命令集合（別名自動展開）；None 不限子命令
+
+        Returns:
+            None（無法解析）或 GitInvocation 清單（statement 為新 list）
+        """
+        if self.tokens is None:
+            return None
+        wanted = _expand_subcommand_aliases(subcommands) if subcommands is not None else None
+        invocations: List[GitInvocation] = []
+        for statement in self.statements:
+            inv = _find_invocation_in_statement(list(statement.tokens), wanted)
+            if inv is not None:
+                invocations.append(inv)
+        return invocations
+
+
+def _split_with_separators(tokens: Tuple[str, ...]) -> Tuple[Statement, ...]:
+    """同 _split_statements，另保留各語句的結尾分隔符"""
+    statements: List[Statement] = []
+    current: List[str] = []
+    for token in tokens:
+        if token in _STATEMENT_SEPARATORS:
+            if current:
+                statements.append(Statement(tuple(current), token))
+            current = []
+        else:
+            current.append(token)
+    if current:
+        statements.append(Statement(tuple(current), None))
+    return tuple(statements)
+
+
+# ============================================================================
+# 跨行程快取
+# ============================================================================
+
+def _digest(command: str) -> str:
+    return hashlib.sha256(command.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _cache_file() -> Optional[Path]:
+    """hook 執行期間的快取檔路徑；scope 外 / 停用 / 非 git repo 時為 None
+
+    鍵為命令內容、與 HEAD 無關，只需 worktree 位置，不取完整 git 快照。
+    """
+    if not is_enabled():
+        return None
+    try:
+        layout = find_git_layout(Path.cwd())
+    except OSError:
+        return None
+    if layout is None:
+        return None
+    return layout[0] / CACHE_SUBDIR / BASH_CACHE_FILENAME
+
+
+def _load_entries(cache_file: Path) -> dict:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != BASH_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_entries(cache_file: Path, entries: dict) -> None:
+    """原子寫入；worktree 無 .claude 目錄時不落地（同 hook_context）"""
+    if not cache_file.parents[2].is_dir():
+        return
+    tmp_file = cache_file.with_name("{}.{}.tmp".format(cache_file.name, os.getpid()))
+    try:
+        ensure_cache_dir(cache_file.parent)
+        tmp_file.write_text(
+            json.dumps({"version": BASH_CACHE_VERSION, "entries": entries}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # 快取僅為加速，寫入失敗不影響守衛
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+
+
+def _from_entry(command: str, entry) -> Optional[BashCommand]:
+    if not isinstance(entry, dict):
+        return None
+    tokens = entry.get("tokens")
+    heredocs = entry.get("heredocs")
+    if tokens is not None and not isinstance(tokens, list):
+        return None
+    if not isinstance(heredocs, list):
+        return None
+    return BashCommand(command, tokens, [tuple(h) for h in heredocs])
+
+
+def _parse(command: str) -> BashCommand:
+    stripped, heredocs = split_heredoc_bodies(command)
+    tokens = _tokenize(normalize_newlines_to_separators(stripped))
+    return BashCommand(command, tokens, heredocs)
+
+
+# ============================================================================
+# 公開 API
+# ============================================================================
+
+def parse_bash_command(command: str) -> BashCommand:
+    """
+    解析 Bash 命令字串（同一命令於程序內與同批次 hook 行程間只 tokenize 一次）
+
+    Args:
+        command: PreToolUse 收到的原始命令字串（`tool_input.command`）
+
+    Returns:
+        BashCommand
+    """
+    cached = _memo.get(command)
+    if cached is not None:
+        _memo.move_to_end(command)
+        return cached
+
+    cache_file = _cache_file() if len(command) >= BASH_CACHE_MIN_LENGTH else None
+    model: Optional[BashCommand] = None
+    if cache_file is not None:
+        digest = _digest(command)
+        entries = _load_entries(cache_file)
+        model = _from_entry(command, entries.get(digest))
+        if model is None:
+            model = _parse(command)
+            entries.pop(digest, None)
+            entries[digest] = {
+                "tokens": list(model.tokens) if model.tokens is not None else None,
+                "heredocs": [list(h) for h in model.heredocs],
+            }
+            while len(entries) > BASH_CACHE_MAX_ENTRIES:
+                entries.pop(next(iter(entries)))
+            _save_entries(cache_file, entries)
+    if model is None:
+        model = _parse(command)
+
+    _memo[command] = model
+    while len(_memo) > MEMO_MAX_ENTRIES:
+        _memo.popitem(last=False)
+    return model
+
+
+def clear_memo() -> None:
+    """清空程序內記憶（測試輔助）"""
+    _memo.clear()
@@ -33,8 +33,6 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import yaml
-
 
 # YAML 路徑：相對於 .claude/ 根目錄
 # 本模組位於 .claude/lib/framework_paths.py → 上溯 1 層至 .claude/
@@ -49,6 +47,9 @@ def _load_config() -> Dict[str, List[str]]:
     """
     if not _CONFIG_PATH.exists():
         return {}
+    # 延後 import：hook 於 import 階段不付 pyyaml 載入成本，首次分類時才載入
+    import yaml
+
     try:
         with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f) or {}
@@ -27,6 +27,13 @@ from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import yaml
 
+try:
+    from .yaml_frontmatter import load_yaml
+except ImportError:
+    # 以腳本直接執行（uv run lib/frontmatter_parser.py）時無 package context，
+    # 降級為同層絕對匯入（腳本所在目錄即 sys.path[0]）
+    from yaml_frontmatter import load_yaml  # type: ignore[no-redef]
+
 
 # ============================================================================
 # 資料結構定義
@@ -130,7 +137,7 @@ def parse_frontmatter(content: str) -> Dict[str, Any]:
             return {}
 
         try:
-            frontmatter_dict = yaml.safe_load(frontmatter_text)
+            frontmatter_dict = load_yaml(frontmatter_text)
             return frontmatter_dict or {}
         except yaml.YAMLError as e:
             raise ValueError(f"YAML 解析失敗: {e}")
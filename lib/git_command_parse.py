@@ -13,6 +13,7 @@ add、是否命中保護分支、是否為 index-discarding commit 等）不受
 
 主要功能:
 - strip_heredoc_bodies: 移除 heredoc 本體，含找不到收尾界線時的保底還原
+- split_heredoc_bodies: 同上，另回傳被剝離的 heredoc 界線字與內文
 - normalize_newlines_to_separators: 把不在引號內的換行轉為顯式語句分隔符
 - is_literal_pathspec_token: 判斷 token 是否為可靜態列舉的具體檔案路徑
 - is_shell_redirection_token: 判斷 token 是否為 shell 重導向符號
@@ -69,11 +70,20 @@ def strip_heredoc_bodies(command: str) -> str:
     偏向「不剝離」而非「過度剝離」：前者最壞情況是誤判未消除，後者最壞
     情況是把真實命令吞掉造成漏放。
     """
+    return split_heredoc_bodies(command)[0]
+
+
+def split_heredoc_bodies(command: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """同 strip_heredoc_bodies，另回傳被剝離的 heredoc（界線字, 內文）清單。
+
+    保底還原原文時回傳空清單（未剝離任何內容）。
+    """
     if "<<" not in command:
-        return command
+        return command, []
 
     lines = command.split("\n")
     result: List[str] = []
+    heredocs: List[Tuple[str, str]] = []
     i = 0
     while i < len(lines):
         line = lines[i]
@@ -86,11 +96,12 @@ def strip_heredoc_bodies(command: str) -> str:
                 j += 1
             if j >= len(lines):
                 # 找不到結束界線：無法安全判定範圍，還原原文（保底）
-                return command
+                return command, []
+            heredocs.append((delimiter, "\n".join(lines[i + 1:j])))
             i = j + 1  # 跳過內文與結束界線本身
             continue
         i += 1
-    return "\n".join(result)
+    return "\n".join(result), heredocs
 
 
 # ===== 換行正規化 =====
@@ -357,9 +368,12 @@ def _consume_global_options(
 
 
 def _find_invocation_in_statement(
-    statement: List[str], wanted_tokens: FrozenSet[str]
+    statement: List[str], wanted_tokens: Optional[FrozenSet[str]]
 ) -> Optional[GitInvocation]:
-    """在單一語句 token 清單中尋找第一個符合條件的 git 呼叫。"""
+    """在單一語句 token 清單中尋找第一個符合條件的 git 呼叫。
+
+    wanted_tokens 為 None 時不限子命令（供 bash_command 列出全部 git 呼叫）。
+    """
     idx = _skip_prefix_wrapper_count(statement)
     if idx >= len(statement) or statement[idx] != "git":
         return None
@@ -374,7 +388,7 @@ def _find_invocation_in_statement(
         return None
 
     subcommand_token = statement[idx]
-    if subcommand_token not in wanted_tokens:
+    if wanted_tokens is not None and subcommand_token not in wanted_tokens:
         return None
 
     return GitInvocation(
@@ -412,16 +426,8 @@ def find_git_invocations(
     if not command:
         return []
 
-    stripped = strip_heredoc_bodies(command)
-    normalized = normalize_newlines_to_separators(stripped)
-    tokens = _tokenize(normalized)
-    if tokens is None:
-        return None
+    # 解析結果由 bash_command 以命令字串為鍵共用（同一次工具呼叫的多支
+    # Bash 守衛只 tokenize 一次）；函式內 import：bash_command 依賴本模組
+    from lib.bash_command import parse_bash_command
 
-    wanted_tokens = _expand_subcommand_aliases(subcommands)
-    invocations: List[GitInvocation] = []
-    for statement in _split_statements(tokens):
-        inv = _find_invocation_in_statement(statement, wanted_tokens)
-        if inv is not None:
-            invocations.append(inv)
-    return invocations
+    return parse_bash_command(command).git_invocations(subcommands)
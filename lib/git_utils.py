@@ -13,6 +13,7 @@ Git 操作共用工具
 - get_uncommitted_files: 獲取未提交變更的結構化資訊（高階 API）
 - _get_uncommitted_status_lines: 獲取未提交變更狀態行（內部 API）
 - get_worktree_list: 獲取 worktree 列表
+- _run_git_command_shared: hook 執行期間經 hook_context 快照共用 git 輸出（內部 API）
 - is_protected_branch: 檢查是否為保護分支
 - is_allowed_branch: 檢查是否為允許編輯的分支
 """
@@ -25,6 +26,8 @@ from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 
+from lib.hook_context import get_git_context
+
 
 # ===== 分支配置常數 =====
 
@@ -185,10 +188,40 @@ def get_current_branch(cwd: Optional[str] = None) -> Optional[str]:
         if branch:
             print(f"Current branch: {branch}")
     """
+    context = get_git_context(cwd)
+    if context is not None:
+        return context.branch
+
     success, output = run_git_command(["branch", "--show-current"], cwd=cwd)
     return output if success and output else None
 
 
+def _run_git_command_shared(
+    args: list[str],
+    cwd: Optional[str] = None,
+    ttl: Optional[float] = None,
+) -> tuple[bool, str]:
+    """
+    執行 git 命令，hook 執行期間經由 hook_context 快照跨行程共用輸出
+
+    快照未啟用時等同 run_git_command。輸出格式不變，解析仍由各呼叫端負責。
+
+    Args:
+        args: git 命令參數列表（不含 'git'）
+        cwd: 執行目錄，預設為當前目錄
+        ttl: 輸出有效秒數；None 表示只隨 HEAD / index 指紋失效
+
+    Returns:
+        tuple[bool, str]: 同 run_git_command
+    """
+    context = get_git_context(cwd)
+    if context is None:
+        return run_git_command(args, cwd=cwd)
+    return context.command_output(
+        " ".join(args), lambda: run_git_command(args, cwd=cwd), ttl=ttl
+    )
+
+
 def find_target_repo(file_path: str) -> Optional[str]:
     """
     從檔案路徑往上搜尋所屬 git repo 根目錄
@@ -342,6 +375,9 @@ def _get_uncommitted_status_lines(cwd: Optional[str] = None) -> list[str]:
     每行格式為 git porcelain 格式（如 " M file.txt"、"?? new.txt"）。
     空輸出或 git 命令失敗時返回空列表。
 
+    刻意不經 hook_context 快照共用：Edit / Write 不觸動 index，快照指紋
+    無法察覺工作區變動，共用結果會讓編輯後的 hook 看到過期的 dirty files。
+
     注意：此函式為內部實作，建議改用 get_uncommitted_files() 高階 API。
 
     Args:
@@ -400,7 +436,7 @@ def get_worktree_list(
             if wt.get("branch")
         ]
     """
-    success, output = run_git_command(["worktree", "list", "--porcelain"], cwd=cwd)
+    success, output = _run_git_command_shared(["worktree", "list", "--porcelain"], cwd=cwd)
     if not success:
         return []
 
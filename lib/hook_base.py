@@ -15,6 +15,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from lib.hook_context import get_git_context
+
 # ============================================================================
 # 常數定義
 # ============================================================================
@@ -109,6 +111,15 @@ def _find_project_root() -> Path:
     Returns:
         Path: 專案根目錄路徑
     """
+    # 快照路徑：hook 執行期間（hook_context_scope 內）以檔案系統推導的
+    # git 情境取代優先級 1、3 的兩次 git subprocess，判據與下方等價
+    context = get_git_context()
+    if context is not None:
+        if context.is_linked_worktree:
+            return context.worktree_root
+        env_dir = os.getenv(ENV_PROJECT_DIR)
+        return Path(env_dir) if env_dir else context.worktree_root
+
     # 優先級 1：worktree 感知（優先於 CLAUDE_PROJECT_DIR）
     worktree_root = _linked_worktree_root()
     if worktree_root is not None:
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Hook 呼叫期 git 情境快照（跨行程共用）
+
+同一次工具呼叫會觸發數十支 hook，每支各自以 subprocess 執行
+`git rev-parse --git-dir --git-common-dir`、`rev-parse --show-toplevel`、
+`branch --show-current`、`worktree list --porcelain` 取得完全相同的專案
+根目錄 / 分支 / worktree 事實。本模組將這些事實彙整為一份快照，存於
+`<worktree>/.claude/hook-logs/_cache/git-context.json`，同一批 hook 行程
+共用。`_cache` 目錄建立時附帶內容為 `*` 的 .gitignore，未忽略 hook-logs
+的專案也不會把快取檔列為未追蹤檔案。
+
+快照內容：
+- worktree_root / git_dir / common_dir / is_linked_worktree：純檔案系統推導
+  （自 cwd 向上尋找 .git；.git 為檔案時依 `gitdir:` 指標與 commondir 判斷
+  linked worktree，與 hook_base._linked_worktree_root 的 git-native 判據等價）
+- branch / head_sha：讀取 HEAD 與 refs（含 packed-refs）
+- 命令輸出（worktree 列表）：git_utils 首次需要時執行既有命令並寫回快照；
+  解析仍由 git_utils 負責，本模組只保存原始輸出
+
+失效條件（指紋）：HEAD、index、logs/HEAD、packed-refs、當前分支 ref、
+worktrees/ 目錄與各 worktree HEAD 的 mtime_ns 任一變動即整份重建。命令輸出
+可另設 TTL。dirty files（`status --porcelain`）刻意不進快照：Edit / Write
+只改工作區檔案、不觸動 index，指紋察覺不到，任何共用窗口都會讓緊接在
+編輯後的 PostToolUse hook 看到過期結果。
+
+啟用範圍：僅在 hook_context_scope() 內生效（run_hook_safely 自動進入），
+直接呼叫 get_project_root / get_current_branch 等函式（CLI、單元測試）時
+行為不變。環境變數 CLAUDE_HOOK_CONTEXT_CACHE=0 可全域停用；設定 GIT_DIR /
+GIT_WORK_TREE 時 git 不以檔案系統位置決定 repo，快照亦自動停用。
+
+此模組為基礎層，僅依賴 stdlib（hook_base 依賴本模組）。
+"""
+
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# 停用開關（值為 CACHE_DISABLED_VALUES 之一時停用）
+ENV_CONTEXT_CACHE = "CLAUDE_HOOK_CONTEXT_CACHE"
+CACHE_DISABLED_VALUES = ("0", "false", "off", "no")
+
+# 設定後 git 不再依 cwd 尋找 repo，檔案系統推導不可信
+GIT_LOCATION_ENV_VARS = ("GIT_DIR", "GIT_WORK_TREE")
+
+# 快照檔位置（相對 worktree 根目錄；hook-logs 下底線開頭目錄不被 hook_health 掃描）
+CACHE_SUBDIR = Path(".claude") / "hook-logs" / "_cache"
+CACHE_FILENAME = "git-context.json"
+
+# 快取目錄自帶的忽略規則（同 ticket .index 目錄的做法）
+CACHE_GITIGNORE_CONTENT = "*\n"
+
+# 快照格式版本（欄位變動時遞增，舊檔自動視為失效）
+SNAPSHOT_VERSION = 1
+
+# .git 檔案（linked worktree / submodule）的指標前綴
+GITDIR_POINTER_PREFIX = "gitdir:"
+
+# HEAD 為 symbolic ref 時的前綴與分支命名空間
+SYMREF_PREFIX = "ref:"
+REFS_HEADS_PREFIX = "refs/heads/"
+
+# 指紋涵蓋的檔案：git_dir（worktree 私有）與 common_dir（共享）
+GIT_DIR_FINGERPRINT_FILES = ("HEAD", "index", "logs/HEAD")
+COMMON_DIR_FINGERPRINT_FILES = ("packed-refs", "worktrees")
+
+# 程序內 scope 深度與快照記憶（key: worktree_root 字串）
+_scope_depth = 0
+_memo: dict = {}
+
+
+# ============================================================================
+# 檔案系統推導
+# ============================================================================
+
+def _read_text(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _common_dir(git_dir: Path) -> Path:
+    """linked worktree 的 git_dir 內有 commondir 指向主 repo .git；否則即自身"""
+    pointer = _read_text(git_dir / "commondir")
+    if not pointer:
+        return git_dir
+    return (git_dir / pointer).resolve()
+
+
+def find_git_layout(start: Path) -> Optional[tuple]:
+    """自 start 向上尋找 .git，回傳 (worktree_root, git_dir, common_dir)
+
+    Args:
+        start: 起始目錄（通常為 cwd）
+
+    Returns:
+        tuple | None: 三個已 resolve 的 Path；不在 git repo 內或 .git 指標
+            損毀時回傳 None
+    """
+    current = start.resolve()
+    while True:
+        dot_git = current / ".git"
+        if dot_git.is_dir():
+            return current, dot_git, _common_dir(dot_git)
+        if dot_git.is_file():
+            pointer = _read_text(dot_git)
+            if not pointer or not pointer.startswith(GITDIR_POINTER_PREFIX):
+                return None
+            git_dir = (current / pointer[len(GITDIR_POINTER_PREFIX):].strip()).resolve()
+            if not git_dir.is_dir():
+                return None
+            return current, git_dir, _common_dir(git_dir)
+        parent = current.parent
+        if parent == current:
+            return None
+        current = parent
+
+
+def _resolve_ref(common_dir: Path, ref: str) -> Optional[str]:
+    """解析 ref 為 commit sha：先找 loose ref，再查 packed-refs；未誕生分支回傳 None"""
+    loose = _read_text(common_dir / ref)
+    if loose:
+        return loose
+    packed = _read_text(common_dir / "packed-refs")
+    if not packed:
+        return None
+    for line in packed.splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def _worktree_head_stamps(common_dir: Path) -> list:
+    """各 linked worktree 的 HEAD mtime（他處切換分支時 worktree 列表須失效）"""
+    worktrees_dir = common_dir / "worktrees"
+    try:
+        entries = sorted(worktrees_dir.iterdir())
+    except OSError:
+        return []
+    return [[entry.name, _mtime_ns(entry / "HEAD")] for entry in entries]
+
+
+def _fingerprint(git_dir: Path, common_dir: Path, head_ref: Optional[str]) -> list:
+    stamps: list = [str(git_dir)]
+    stamps.extend(_mtime_ns(git_dir / name) for name in GIT_DIR_FINGERPRINT_FILES)
+    stamps.extend(_mtime_ns(common_dir / name) for name in COMMON_DIR_FINGERPRINT_FILES)
+    if head_ref:
+        stamps.append(_mtime_ns(common_dir / head_ref))
+    stamps.append(_worktree_head_stamps(common_dir))
+    return stamps
+
+
+# ============================================================================
+# 快照
+# ============================================================================
+
+class GitContext:
+    """單一 worktree 的 git 情境快照
+
+    檔案系統推導的欄位於建立時即確定；命令輸出以 command_output() 惰性
+    填入並寫回快照檔，供同批次其他 hook 行程重用。
+    """
+
+    def __init__(self, worktree_root: Path, git_dir: Path, common_dir: Path,
+                 data: dict, cache_file: Path):
+        self.worktree_root = worktree_root
+        self.git_dir = git_dir
+        self.common_dir = common_dir
+        self._data = data
+        self._cache_file = cache_file
+
+    @property
+    def fingerprint(self) -> list:
+        return self._data["fingerprint"]
+
+    @property
+    def is_linked_worktree(self) -> bool:
+        return self.git_dir != self.common_dir
+
+    @property
+    def branch(self) -> Optional[str]:
+        """當前分支名稱；detached HEAD 時為 None（同 `git branch --show-current` 空輸出）"""
+        return self._data.get("branch") or None
+
+    @property
+    def head_sha(self) -> Optional[str]:
+        return self._data.get("head_sha")
+
+    def command_output(
+        self,
+        key: str,
+        compute: Callable[[], tuple],
+        ttl: Optional[float] = None,
+    ) -> tuple:
+        """取得快取的命令輸出，未命中或逾 ttl 秒時呼叫 compute 重算
+
+        Args:
+            key: 命令識別（呼叫端以 git 參數組成）
+            compute: 回傳 (success, output) 的函式（通常為 run_git_command）
+            ttl: 輸出有效秒數；None 表示只隨指紋失效
+
+        Returns:
+            tuple[bool, str]: 與 compute 相同；失敗結果不寫入快照
+        """
+        commands = self._data.setdefault("commands", {})
+        entry = commands.get(key)
+        now = time.time()
+        if entry is not None and (ttl is None or now - entry["captured_at"] <= ttl):
+            return True, entry["output"]
+
+        success, output = compute()
+        if success:
+            commands[key] = {"output": output, "captured_at": now}
+            _save_snapshot(self._cache_file, self._data)
+        return success, output
+
+
+def ensure_cache_dir(cache_dir: Path) -> None:
+    """建立快取目錄並寫入忽略全部內容的 .gitignore（失敗時拋出 OSError）"""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text(CACHE_GITIGNORE_CONTENT, encoding="utf-8")
+
+
+def _load_snapshot(cache_file: Path) -> Optional[dict]:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _save_snapshot(cache_file: Path, data: dict) -> None:
+    """原子寫入快照；worktree 無 .claude 目錄時不落地（僅程序內共用）"""
+    claude_dir = cache_file.parents[2]
+    if not claude_dir.is_dir():
+        return
+    tmp_file = cache_file.with_name("{}.{}.tmp".format(cache_file.name, os.getpid()))
+    try:
+        ensure_cache_dir(cache_file.parent)
+        tmp_file.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # 快照僅為加速，寫入失敗不影響 hook
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+
+
+def _build_snapshot(git_dir: Path, common_dir: Path, head_text: str,
+                    fingerprint: list) -> dict:
+    branch = ""
+    if head_text.startswith(SYMREF_PREFIX):
+        head_ref = head_text[len(SYMREF_PREFIX):].strip()
+        if head_ref.startswith(REFS_HEADS_PREFIX):
+            branch = head_ref[len(REFS_HEADS_PREFIX):]
+        head_sha = _resolve_ref(common_dir, head_ref)
+    else:
+        head_sha = head_text
+    return {
+        "version": SNAPSHOT_VERSION,
+        "fingerprint": fingerprint,
+        "branch": branch,
+        "head_sha": head_sha,
+        "created_at": time.time(),
+        "commands": {},
+    }
+
+
+# ============================================================================
+# 公開 API
+# ============================================================================
+
+@contextlib.contextmanager
+def hook_context_scope() -> Iterator[None]:
+    """啟用快照的範圍（可巢狀）；最外層結束時清除程序內記憶"""
+    global _scope_depth
+    _scope_depth += 1
+    try:
+        yield
+    finally:
+        _scope_depth -= 1
+        if _scope_depth == 0:
+            _memo.clear()
+
+
+def is_enabled() -> bool:
+    if _scope_depth <= 0:
+        return False
+    if os.environ.get(ENV_CONTEXT_CACHE, "").strip().lower() in CACHE_DISABLED_VALUES:
+        return False
+    return not any(os.environ.get(name) for name in GIT_LOCATION_ENV_VARS)
+
+
+def get_git_context(cwd: Optional[str] = None) -> Optional[GitContext]:
+    """取得 cwd 所在 worktree 的 git 情境快照
+
+    Args:
+        cwd: 起始目錄，預設為當前目錄
+
+    Returns:
+        GitContext | None: 未啟用（scope 外 / 停用）、不在 git repo 內或
+            HEAD 不可讀時回傳 None，呼叫端應回退到原本的 git 命令路徑
+    """
+    if not is_enabled():
+        return None
+    try:
+        layout = find_git_layout(Path(cwd) if cwd else Path.cwd())
+    except OSError:
+        return None
+    if layout is None:
+        return None
+    worktree_root, git_dir, common_dir = layout
+
+    head_text = _read_text(git_dir / "HEAD")
+    if not head_text:
+        return None
+    head_ref = None
+    if head_text.startswith(SYMREF_PREFIX):
+        head_ref = head_text[len(SYMREF_PREFIX):].strip()
+    fingerprint = _fingerprint(git_dir, common_dir, head_ref)
+
+    memo_key = str(worktree_root)
+    cached = _memo.get(memo_key)
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached
+
+    cache_file = worktree_root / CACHE_SUBDIR / CACHE_FILENAME
+    data = _load_snapshot(cache_file)
+    if (
+        data is None
+        or data.get("version") != SNAPSHOT_VERSION
+        or data.get("fingerprint") != fingerprint
+    ):
+        data = _build_snapshot(git_dir, common_dir, head_text, fingerprint)
+        _save_snapshot(cache_file, data)
+
+    context = GitContext(worktree_root, git_dir, common_dir, data, cache_file)
+    _memo[memo_key] = context
+    return context
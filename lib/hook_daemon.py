@@ -0,0 +1,669 @@
+#!/usr/bin/env -S uv run --quiet --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pyyaml"]
+# ///
+"""
+Hook 常駐伺服器（hookd）
+
+每次 Bash 工具呼叫會觸發 settings.json 註冊的 20 支 PreToolUse + 14 支
+PostToolUse Bash hook，每支都是冷啟動的 python3 行程，重複 import
+lib/hook_io、lib/hook_logging、lib/hook_base 與 PyYAML。本模組提供每個專案
+一個長駐伺服器（unix socket），預先載入 lib/ 與 PyYAML、預先編譯所有已
+註冊 hook 的 bytecode，搭配 `.claude/hooks/hook-daemon-client.py` 輕量
+shim 轉送 stdin JSON 並取回 stdout / stderr / exit code。
+
+執行模型（fork-per-request）：
+- 父行程只負責預熱與 accept，從不執行任何 hook，狀態恆保持乾淨
+- 每個請求 fork 一個子行程：子行程繼承已預熱的 sys.modules，套用請求端的
+  cwd / 環境變數 / argv，把 fd 0/1/2 導向暫存檔後以 `__name__ == "__main__"`
+  執行 hook 腳本，hook 自身的 `sys.exit(run_hook_safely(main, ...))` 入口
+  原封不動地套用既有頂層例外處理與 fail_closed 契約
+- 子行程結束即丟棄所有狀態：模組級快取、logging handler、sys.path 插入等
+  不會在請求之間洩漏，行為等同冷啟動行程
+
+回退語意：daemon 未啟動、socket 殘留但無人監聽、或伺服器中途斷線時，
+shim 一律回退為今日的子行程執行（直接 exec hook 腳本，走其 shebang），
+daemon 只是加速層，不是必要條件。
+
+失效偵測：伺服器記錄預熱時載入的 lib/*.py mtime；任一檔案變動時拒絕後續
+請求並自行結束（shim 收到斷線即回退），避免用舊版 lib 執行新版 hook。
+
+使用方式:
+    # 啟動（背景常駐，閒置 IDLE_TIMEOUT_SECONDS 後自行結束）
+    .claude/lib/hook_daemon.py start
+
+    # 查詢 / 停止
+    .claude/lib/hook_daemon.py status
+    .claude/lib/hook_daemon.py stop
+
+    # settings.json 以 shim 包裹既有 hook 命令（daemon 未啟動時行為不變）
+    "$CLAUDE_PROJECT_DIR/.claude/hooks/hook-daemon-client.py $CLAUDE_PROJECT_DIR/.claude/hooks/xxx-hook.py"
+
+平台限制：依賴 AF_UNIX 與 os.fork，僅 POSIX 可用；Windows 上 start 直接
+回報不支援，shim 亦恆走回退路徑。
+"""
+
+import argparse
+import builtins
+import hashlib
+import json
+import os
+import shlex
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import types
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 直接以腳本執行（start / serve）時，lib 套件本身尚不在 sys.path
+_CLAUDE_DIR = Path(__file__).resolve().parent.parent
+if str(_CLAUDE_DIR) not in sys.path:
+    sys.path.insert(0, str(_CLAUDE_DIR))
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# socket / pid 檔名前綴，同時是 runtime 目錄名稱前綴（見 runtime_dir）
+SOCKET_PREFIX = "claude-hookd"
+
+# runtime 目錄權限：僅擁有者可讀寫進入
+RUNTIME_DIR_MODE = 0o700
+
+# 閒置多久無請求即自行結束（秒）
+IDLE_TIMEOUT_SECONDS = 1800
+
+# 伺服器 accept 輪詢間隔（秒）：兼作 SIGTERM / 閒置 / lib 失效檢查的週期
+POLL_INTERVAL_SECONDS = 1.0
+
+# start 等待 socket 出現的上限（秒）
+START_WAIT_SECONDS = 5.0
+
+# 訊框格式：4 bytes big-endian 長度 + UTF-8 JSON 本體（shim 端同格式）
+FRAME_HEADER = struct.Struct(">I")
+
+# 單一訊框上限，防止異常請求耗盡記憶體
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+# 子行程執行上限（秒）：CC 逾時只會殺掉 shim，fork 出的子行程須自行收斂
+CHILD_MAX_SECONDS = 600
+
+# 預熱時 eager import 的第三方模組（hook 最常見的 inline 依賴）
+PRELOAD_THIRD_PARTY = ("yaml",)
+
+# 不可預載的 lib 檔案：本模組自身，以及以 script 模式撰寫、import 即執行
+# 主流程（讀 stdin、sys.exit）並改寫 sys.path 的檔案
+PRELOAD_EXCLUDED_LIB_MODULES = frozenset({"__init__", "hook_daemon", "markdown_formatter"})
+
+# settings.json 命令中代表專案根目錄的變數
+PROJECT_DIR_VARIABLE = "$CLAUDE_PROJECT_DIR"
+
+# shim 檔名：settings.json 以 shim 包裹時，真正的 hook 路徑是第二個 token
+CLIENT_SHIM_NAME = "hook-daemon-client.py"
+
+# 預建環境啟動器（見 lib/hook_env.py），包裹方式同 shim
+ENV_LAUNCHER_NAME = "hook-env-run.sh"
+
+# Exit code 常數（與 python 直譯器冷啟動語意一致）
+EXIT_OK = 0
+EXIT_ERROR = 1
+
+
+# ============================================================================
+# 路徑與訊框（shim 端 hook-daemon-client.py 有對應的精簡複本）
+# ============================================================================
+
+def runtime_dir() -> Path:
+    """回傳 socket / pid 檔所在的每使用者私有目錄。
+
+    位於 $XDG_RUNTIME_DIR（未設定時退回 $TMPDIR 或 /tmp）下的
+    `claude-hookd-<uid>/`：/tmp 人人可寫，socket 若直接放在其下，其他使用者
+    可搶先建立同名 socket，收下 shim 轉送的環境變數並偽造 hook 的 stdout /
+    exit code。目錄由 ensure_runtime_dir 以 0700 建立並驗證，shim 連線前
+    亦檢查擁有者與權限。
+
+    刻意不用 tempfile.gettempdir()：shim 為求啟動成本最低不 import tempfile，
+    兩端必須以相同公式算出同一路徑（見 test_hook_daemon 的 parity 測試）。
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return Path(base) / "{}-{}".format(SOCKET_PREFIX, os.getuid())
+
+
+def is_private_runtime_dir(path: Path) -> bool:
+    """目錄是否為本使用者擁有、非 symlink 且群組 / 其他人無任何權限"""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and stat.S_IMODE(info.st_mode) & 0o077 == 0
+    )
+
+
+def ensure_runtime_dir() -> Path:
+    """建立（若不存在）並驗證 runtime 目錄；不安全時拋出 PermissionError"""
+    path = runtime_dir()
+    try:
+        path.mkdir(mode=RUNTIME_DIR_MODE, parents=False)
+    except FileExistsError:
+        pass
+    if not is_private_runtime_dir(path):
+        raise PermissionError(
+            "runtime 目錄 {} 不是本使用者擁有的 0700 目錄，拒絕在其中建立 socket".format(path)
+        )
+    return path
+
+
+def socket_path(claude_dir: Path = _CLAUDE_DIR) -> Path:
+    """回傳指定 .claude 目錄對應的 socket 路徑。
+
+    以 .claude 目錄絕對路徑的雜湊區分專案（使用者由 runtime_dir 區分）；不放
+    在專案目錄內是因為 AF_UNIX 路徑長度上限（約 104-108 bytes）容易被深層
+    專案路徑超過。
+    """
+    digest = hashlib.sha1(str(claude_dir).encode("utf-8")).hexdigest()[:12]
+    return runtime_dir() / "{}-{}.sock".format(SOCKET_PREFIX, digest)
+
+
+def pid_path(claude_dir: Path = _CLAUDE_DIR) -> Path:
+    """回傳 pid 檔路徑（與 socket 同名、副檔名 .pid）"""
+    return socket_path(claude_dir).with_suffix(".pid")
+
+
+def send_frame(sock: socket.socket, payload: dict) -> None:
+    """以長度前綴訊框送出一個 JSON 物件"""
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    sock.sendall(FRAME_HEADER.pack(len(body)) + body)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining > 0:
+        chunk = sock.recv(min(remaining, 65536))
+        if not chunk:
+            raise ConnectionError("連線在訊框讀取完成前關閉")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_frame(sock: socket.socket) -> dict:
+    """讀取一個長度前綴訊框並解析為 JSON 物件
+
+    Raises:
+        ConnectionError: 連線提前關閉
+        ValueError: 訊框超過 MAX_FRAME_BYTES 或內容非 JSON 物件
+    """
+    (size,) = FRAME_HEADER.unpack(_recv_exact(sock, FRAME_HEADER.size))
+    if size > MAX_FRAME_BYTES:
+        raise ValueError("訊框過大: {} bytes".format(size))
+    payload = json.loads(_recv_exact(sock, size).decode("utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("訊框內容必須為 JSON 物件")
+    return payload
+
+
+# ============================================================================
+# hook 腳本載入與執行
+# ============================================================================
+
+# 已編譯 hook bytecode 快取：path -> (mtime_ns, code)
+_CODE_CACHE: Dict[str, Tuple[int, types.CodeType]] = {}
+
+
+def load_hook_code(script_path: Path) -> types.CodeType:
+    """讀取並編譯 hook 腳本，以 mtime_ns 判斷快取是否有效
+
+    Raises:
+        OSError: 檔案不存在或無法讀取
+        SyntaxError: 腳本語法錯誤
+    """
+    key = str(script_path)
+    mtime_ns = script_path.stat().st_mtime_ns
+    cached = _CODE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    source = script_path.read_bytes()
+    code = compile(source, key, "exec", dont_inherit=True)
+    _CODE_CACHE[key] = (mtime_ns, code)
+    return code
+
+
+def _exit_code_from(code: object) -> int:
+    """把 SystemExit.code 換算為行程 exit code（與直譯器語意一致）"""
+    if code is None:
+        return EXIT_OK
+    if isinstance(code, int):
+        return code
+    # sys.exit("訊息")：直譯器會把訊息印到 stderr 並以 1 結束
+    sys.stderr.write("{}\n".format(code))
+    return EXIT_ERROR
+
+
+def run_hook_script(script_path: Path) -> int:
+    """以 `__main__` 身份執行 hook 腳本並回傳 exit code
+
+    hook 的 `if __name__ == "__main__": sys.exit(run_hook_safely(main, ...))`
+    入口會照常執行，因此 run_hook_safely 的 liveness 訊號、日誌與
+    fail_closed 例外語意全數保留。頂層（run_hook_safely 之外）的未捕獲
+    例外比照直譯器行為：traceback 寫入 stderr，exit code 1。
+
+    呼叫端負責事先設定 sys.stdin / sys.stdout / sys.stderr 與 sys.argv。
+    """
+    # 以全新 __main__ 模組承載 hook 命名空間：dataclass / pickle 等依
+    # sys.modules["__main__"] 解析的機制才會看到 hook 自身而非伺服器
+    module = types.ModuleType("__main__")
+    module.__dict__.update(
+        __file__=str(script_path),
+        __builtins__=builtins,
+        __package__=None,
+        __spec__=None,
+        __cached__=None,
+    )
+    saved_main = sys.modules.get("__main__")
+    sys.modules["__main__"] = module
+    # 剖析模式的 import 時間自此起算（行程存活時間不代表本支 hook 的載入成本）
+    from lib import hook_profiler
+    hook_profiler.mark_load_start()
+    try:
+        code = load_hook_code(script_path)
+        exec(code, module.__dict__)
+    except SystemExit as exc:
+        return _exit_code_from(exc.code)
+    except KeyboardInterrupt:
+        raise
+    except BaseException:
+        traceback.print_exc()
+        return EXIT_ERROR
+    finally:
+        if saved_main is not None:
+            sys.modules["__main__"] = saved_main
+    return EXIT_OK
+
+
+def _read_all(fileobj) -> str:
+    fileobj.seek(0)
+    return fileobj.read().decode("utf-8", errors="replace")
+
+
+def execute_request(request: dict) -> dict:
+    """在（已 fork 的）子行程中執行單一 hook 請求
+
+    會永久改寫本行程的 cwd、環境變數、argv 與 fd 0/1/2，僅能在用後即棄的
+    子行程中呼叫。fd 層級導向（而非只換 sys.stdout）確保 hook 內部啟動的
+    子行程輸出同樣被收集。
+
+    Args:
+        request: {"argv": [hook_path, ...], "stdin": str, "cwd": str, "env": dict}
+
+    Returns:
+        dict: {"exit_code": int, "stdout": str, "stderr": str}
+    """
+    argv = [str(arg) for arg in request.get("argv") or []]
+    if not argv:
+        return {"exit_code": EXIT_ERROR, "stdout": "", "stderr": "hookd: 請求缺少 argv\n"}
+
+    env = request.get("env")
+    if isinstance(env, dict):
+        os.environ.clear()
+        os.environ.update({str(k): str(v) for k, v in env.items()})
+    cwd = request.get("cwd")
+    if cwd:
+        try:
+            os.chdir(cwd)
+        except OSError:
+            pass
+
+    stdin_file = tempfile.TemporaryFile()
+    stdin_file.write(str(request.get("stdin") or "").encode("utf-8"))
+    stdin_file.seek(0)
+    stdout_file = tempfile.TemporaryFile()
+    stderr_file = tempfile.TemporaryFile()
+    os.dup2(stdin_file.fileno(), 0)
+    os.dup2(stdout_file.fileno(), 1)
+    os.dup2(stderr_file.fileno(), 2)
+    sys.stdin = open(0, "r", encoding="utf-8", errors="replace", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", errors="replace", closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="replace", closefd=False)
+    sys.argv = argv
+
+    exit_code = run_hook_script(Path(argv[0]))
+
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+    return {
+        "exit_code": exit_code,
+        "stdout": _read_all(stdout_file),
+        "stderr": _read_all(stderr_file),
+    }
+
+
+# ============================================================================
+# 預熱
+# ============================================================================
+
+def registered_hook_scripts(settings_path: Path, project_dir: Path) -> List[Path]:
+    """從 settings.json 取出所有已註冊 hook 腳本的絕對路徑（去重、保序）
+
+    支援三種註冊形式：直接註冊 hook 腳本，或以 hook-daemon-client.py shim /
+    hook-env-run.sh 啟動器包裹（取包裹者之後的第一個參數）。非 .py 命令略過。
+    """
+    try:
+        settings = json.loads(settings_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+
+    scripts: List[Path] = []
+    seen = set()
+    for groups in (settings.get("hooks") or {}).values():
+        for group in groups or []:
+            for hook in group.get("hooks") or []:
+                script = _script_from_command(hook.get("command", ""), project_dir)
+                if script is not None and str(script) not in seen:
+                    seen.add(str(script))
+                    scripts.append(script)
+    return scripts
+
+
+def _script_from_command(command: str, project_dir: Path) -> Optional[Path]:
+    try:
+        tokens = shlex.split(command.replace(PROJECT_DIR_VARIABLE, str(project_dir)))
+    except ValueError:
+        return None
+    if tokens and tokens[0].endswith((CLIENT_SHIM_NAME, ENV_LAUNCHER_NAME)):
+        tokens = tokens[1:]
+    if not tokens or not tokens[0].endswith(".py"):
+        return None
+    return Path(tokens[0])
+
+
+def _lib_module_names(lib_dir: Path) -> List[str]:
+    return sorted(
+        p.stem for p in lib_dir.glob("*.py")
+        if p.stem.isidentifier() and p.stem not in PRELOAD_EXCLUDED_LIB_MODULES
+    )
+
+
+def warm_up(claude_dir: Path = _CLAUDE_DIR) -> Dict[str, int]:
+    """預先 import lib/ 全部模組與常見第三方依賴，並編譯所有已註冊 hook
+
+    只 import 函式庫模組、不執行任何 hook 的頂層程式碼：hook 頂層可能帶
+    副作用，且子行程 exec 時本就會執行一次。個別模組失敗（缺依賴等）僅
+    略過，不影響伺服器啟動。
+
+    Returns:
+        dict: {"modules": 成功預載模組數, "hooks": 成功預編譯 hook 數}
+    """
+    import importlib
+
+    loaded = 0
+    saved_path = list(sys.path)
+    for name in PRELOAD_THIRD_PARTY:
+        try:
+            importlib.import_module(name)
+            loaded += 1
+        except ImportError:
+            pass
+    for name in _lib_module_names(claude_dir / "lib"):
+        try:
+            importlib.import_module("lib.{}".format(name))
+            loaded += 1
+        except KeyboardInterrupt:
+            raise
+        except BaseException:
+            continue
+    # 預載不應改變子行程看到的模組搜尋路徑
+    sys.path[:] = saved_path
+
+    compiled = 0
+    for script in registered_hook_scripts(claude_dir / "settings.json", claude_dir.parent):
+        try:
+            load_hook_code(script)
+            compiled += 1
+        except (OSError, SyntaxError, ValueError):
+            continue
+    return {"modules": loaded, "hooks": compiled}
+
+
+def _lib_snapshot(claude_dir: Path) -> Dict[str, int]:
+    snapshot = {}
+    for path in (claude_dir / "lib").glob("*.py"):
+        try:
+            snapshot[str(path)] = path.stat().st_mtime_ns
+        except OSError:
+            continue
+    return snapshot
+
+
+# ============================================================================
+# 伺服器
+# ============================================================================
+
+class _HookRequestHandler(socketserver.BaseRequestHandler):
+    """單一連線處理：於 ForkingMixIn 產生的子行程中執行"""
+
+    def handle(self) -> None:
+        # 子行程不可沿用父行程的 SIGTERM 處理（只會設旗標而不結束）
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.alarm(CHILD_MAX_SECONDS)
+        try:
+            request = recv_frame(self.request)
+        except (ConnectionError, ValueError, OSError):
+            return
+        if request.get("control") == "ping":
+            send_frame(self.request, {
+                "pid": os.getppid(),
+                "started_at": self.server.started_at,
+                "warm": self.server.warm_stats,
+            })
+            return
+        try:
+            response = execute_request(request)
+        except Exception:
+            response = {
+                "exit_code": EXIT_ERROR,
+                "stdout": "",
+                "stderr": "hookd: 內部錯誤\n{}".format(traceback.format_exc()),
+            }
+        try:
+            send_frame(self.request, response)
+        except OSError:
+            pass
+
+
+class HookDaemonServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """fork-per-request 的 unix socket 伺服器"""
+
+    allow_reuse_address = False
+
+    def __init__(self, path: Path, claude_dir: Path = _CLAUDE_DIR):
+        self.claude_dir = claude_dir
+        self.started_at = time.time()
+        self.last_activity = time.monotonic()
+        self.stop_requested = False
+        self.stale = False
+        self.warm_stats: Dict[str, int] = {}
+        self._lib_mtimes = _lib_snapshot(claude_dir)
+        super().__init__(str(path), _HookRequestHandler)
+
+    def verify_request(self, request, client_address) -> bool:
+        """lib/ 變動後拒絕請求（shim 視為斷線並回退），並排程結束"""
+        self.last_activity = time.monotonic()
+        if _lib_snapshot(self.claude_dir) != self._lib_mtimes:
+            self.stale = True
+            self.stop_requested = True
+            return False
+        return True
+
+
+def serve(claude_dir: Path = _CLAUDE_DIR, idle_timeout: float = IDLE_TIMEOUT_SECONDS) -> int:
+    """前景執行伺服器直到閒置逾時、收到 SIGTERM 或 lib/ 變動"""
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        sys.stderr.write("hookd: 此平台不支援 AF_UNIX / fork\n")
+        return EXIT_ERROR
+
+    try:
+        ensure_runtime_dir()
+    except OSError as exc:
+        sys.stderr.write("hookd: {}\n".format(exc))
+        return EXIT_ERROR
+
+    sock = socket_path(claude_dir)
+    if _ping(sock) is not None:
+        sys.stderr.write("hookd: 已有伺服器在 {} 監聽\n".format(sock))
+        return EXIT_ERROR
+    try:
+        sock.unlink()
+    except FileNotFoundError:
+        pass
+
+    warm_stats = warm_up(claude_dir)
+    old_umask = os.umask(0o177)
+    try:
+        server = HookDaemonServer(sock, claude_dir)
+    finally:
+        os.umask(old_umask)
+    server.warm_stats = warm_stats
+    server.timeout = POLL_INTERVAL_SECONDS
+
+    def _request_stop(signum, frame):
+        server.stop_requested = True
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    pid_path(claude_dir).write_text(str(os.getpid()), encoding="utf-8")
+
+    try:
+        while not server.stop_requested:
+            server.handle_request()
+            server.service_actions()
+            if time.monotonic() - server.last_activity > idle_timeout:
+                break
+    finally:
+        server.server_close()
+        for path in (sock, pid_path(claude_dir)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    return EXIT_OK
+
+
+def _ping(sock: Path, timeout: float = 1.0) -> Optional[dict]:
+    """對 socket 送出 ping，無人監聽時回傳 None"""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(str(sock))
+            send_frame(conn, {"control": "ping"})
+            return recv_frame(conn)
+    except (OSError, ValueError, ConnectionError):
+        return None
+
+
+def start(claude_dir: Path = _CLAUDE_DIR) -> int:
+    """以背景行程啟動伺服器，等待 socket 可連線後返回"""
+    sock = socket_path(claude_dir)
+    if _ping(sock) is not None:
+        print("hookd 已在執行: {}".format(sock))
+        return EXIT_OK
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        sys.stderr.write("hookd: 此平台不支援 AF_UNIX / fork，hook 將維持子行程執行\n")
+        return EXIT_ERROR
+    try:
+        ensure_runtime_dir()
+    except OSError as exc:
+        sys.stderr.write("hookd: {}\n".format(exc))
+        return EXIT_ERROR
+
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "serve", "--claude-dir", str(claude_dir)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        cwd=str(claude_dir.parent),
+    )
+    deadline = time.monotonic() + START_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        if _ping(sock) is not None:
+            print("hookd 已啟動: {}".format(sock))
+            return EXIT_OK
+        time.sleep(0.05)
+    sys.stderr.write("hookd: 啟動逾時（{}s 內 socket 未就緒）\n".format(START_WAIT_SECONDS))
+    return EXIT_ERROR
+
+
+def stop(claude_dir: Path = _CLAUDE_DIR) -> int:
+    """以 SIGTERM 停止伺服器（pid 檔不存在視為未執行）"""
+    try:
+        pid = int(pid_path(claude_dir).read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        print("hookd 未執行")
+        return EXIT_OK
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pid_path(claude_dir).unlink(missing_ok=True)
+        print("hookd 未執行（清除殘留 pid 檔）")
+        return EXIT_OK
+    print("hookd 已送出停止訊號（pid={}）".format(pid))
+    return EXIT_OK
+
+
+def status(claude_dir: Path = _CLAUDE_DIR) -> int:
+    """回報伺服器狀態；未執行時 exit 1"""
+    info = _ping(socket_path(claude_dir))
+    if info is None:
+        print("hookd 未執行（hook 走子行程回退路徑）")
+        return EXIT_ERROR
+    print(json.dumps(info, ensure_ascii=False))
+    return EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行介面"""
+    parser = argparse.ArgumentParser(description="Hook 常駐伺服器（hookd）")
+    parser.add_argument("action", choices=("start", "stop", "status", "serve"))
+    parser.add_argument(
+        "--claude-dir",
+        type=Path,
+        default=_CLAUDE_DIR,
+        help="服務的 .claude 目錄（預設為本檔所在專案）",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=IDLE_TIMEOUT_SECONDS,
+        help="閒置多少秒後自行結束（僅 serve）",
+    )
+    args = parser.parse_args(argv)
+    claude_dir = args.claude_dir.resolve()
+
+    if args.action == "start":
+        return start(claude_dir)
+    if args.action == "stop":
+        return stop(claude_dir)
+    if args.action == "status":
+        return status(claude_dir)
+    return serve(claude_dir, idle_timeout=args.idle_timeout)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+"""
+Hook 共用預建環境（hooks env）
+
+背景：hooks/ 與 skills/*/hooks/ 下絕大多數 hook 以
+`#!/usr/bin/env -S uv run --quiet --script` 起頭並內嵌 PEP 723 依賴區塊
+（幾乎都只是 pyyaml）。每次 hook 觸發都先付一次 uv 的 script 環境解析
+（讀 inline metadata、比對快取環境），才輪到 Python 執行。本模組改為：
+
+- build：依 hooks/pyproject.toml + uv.lock 以 `uv sync --locked --no-dev`
+  建出單一鎖定環境 hooks/.venv，並寫入 stamp（hook-env.json）與漂移清單
+  （hook-env-fallback.txt）
+- 啟動器 hooks/hook-env-run.sh：環境可用時直接以 hooks/.venv 的直譯器執行
+  hook，略過 uv 解析；否則 exec hook 本身（走其 shebang，行為與今日相同）
+- check：漂移偵測——逐支比對 hook 的 inline PEP 723 metadata
+  （dependencies / requires-python）與鎖定環境實際提供的套件版本；不相容的
+  hook 列入漂移清單，啟動器對它們一律回退 shebang
+- bench：同一組 hook 在 shebang（uv run --script）與啟動器兩種模式下的
+  啟動時間比較
+
+啟動器的失效判斷只用 sh 內建指令：pyproject.toml / uv.lock / hook 本身
+比 stamp 新即回退，因此建置後任何依賴或 hook 變動都不會在舊環境上執行，
+重新 build 後才恢復加速。
+
+使用方式:
+    .claude/lib/hook_env.py build
+    .claude/lib/hook_env.py check [--format table|json]
+    .claude/lib/hook_env.py bench [--repeat N] [--limit N] [hook.py ...]
+
+    # settings.json 以啟動器包裹既有 hook 命令（環境未建置時行為不變）
+    "$CLAUDE_PROJECT_DIR/.claude/hooks/hook-env-run.sh $CLAUDE_PROJECT_DIR/.claude/hooks/xxx-hook.py"
+
+依賴比對只處理 PEP 440 的數字版本段與 ==、!=、<=、>=、<、>、~=、===
+（含 ==X.* 萬用字元）；環境標記只評估以 and 連接的 python_version /
+python_full_version 比較。無法判斷的 specifier 視為漂移、無法判斷的標記
+視為適用（皆偏向回退 shebang）。
+
+平台限制：啟動器為 POSIX sh，Windows 上請維持直接註冊 hook。
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# TOML 解析：試圖使用 tomllib（Python 3.11+），否則 fallback 到 tomli（同 pyproject_scanner）
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib  # type: ignore
+    except ImportError:
+        tomllib = None  # type: ignore
+
+# 直接以腳本執行時，lib 套件本身尚不在 sys.path
+_CLAUDE_DIR = Path(__file__).resolve().parent.parent
+if str(_CLAUDE_DIR) not in sys.path:
+    sys.path.insert(0, str(_CLAUDE_DIR))
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+HOOKS_DIRNAME = "hooks"
+PYPROJECT_FILENAME = "pyproject.toml"
+LOCK_FILENAME = "uv.lock"
+
+# 環境位於 hooks/.venv（uv 專案預設位置，已在 .gitignore）
+ENV_DIRNAME = ".venv"
+
+# 建置完成標記與漂移清單（皆位於環境目錄內；檔名需與 hook-env-run.sh 一致）
+STAMP_FILENAME = "hook-env.json"
+FALLBACK_FILENAME = "hook-env-fallback.txt"
+STAMP_FORMAT_VERSION = 1
+
+# 啟動器（與 lib/hook_daemon.ENV_LAUNCHER_NAME 一致）
+LAUNCHER_NAME = "hook-env-run.sh"
+
+# hook 腳本所在位置（相對 .claude/）
+HOOK_SCRIPT_GLOBS = ("hooks/*.py", "skills/*/hooks/*.py")
+
+# PEP 723 參考實作的區塊正規式
+PEP723_BLOCK_RE = re.compile(
+    r"(?m)^# /// (?P<type>[a-zA-Z0-9-]+)$\s(?P<content>(^#(| .*)$\s)+)^# ///$"
+)
+
+# PEP 508 需求：名稱 [extras] specifier ; marker
+REQUIREMENT_RE = re.compile(
+    r"^\s*(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*"
+    r"(?:\[[^\]]*\])?\s*(?P<spec>[^;]*?)\s*(?:;(?P<marker>.*))?$"
+)
+MARKER_CLAUSE_RE = re.compile(
+    r"""^\s*(?P<var>python_version|python_full_version)\s*"""
+    r"""(?P<op>===|~=|==|!=|<=|>=|<|>)\s*['"](?P<value>[^'"]+)['"]\s*$"""
+)
+SPECIFIER_RE = re.compile(r"^\s*(===|~=|==|!=|<=|>=|<|>)\s*(\S+)\s*$")
+VERSION_PREFIX_RE = re.compile(r"^v?(\d+(?:\.\d+)*)")
+
+# uv 建置與版本查詢逾時（秒）
+UV_SYNC_TIMEOUT_SECONDS = 300
+PYTHON_QUERY_TIMEOUT_SECONDS = 30
+
+# bench：單次執行逾時（秒）、預設重複次數與量測 hook 數上限
+BENCH_TIMEOUT_SECONDS = 60
+DEFAULT_BENCH_REPEAT = 5
+DEFAULT_BENCH_LIMIT = 10
+BENCH_STDIN = b"{}"
+
+FORMAT_TABLE = "table"
+FORMAT_JSON = "json"
+
+EXIT_OK = 0
+EXIT_DRIFT = 1
+EXIT_ERROR = 2
+
+
+class HookEnvError(Exception):
+    """建置 / 量測無法進行（uv 不存在、鎖檔過期、環境未建置等）"""
+
+
+@dataclass
+class HookDrift:
+    """單支 hook 的 inline metadata 與鎖定環境不相容之處"""
+
+    script: str
+    issues: List[str] = field(default_factory=list)
+
+
+@dataclass
+class HookStartup:
+    """單支 hook 在兩種模式下的啟動時間中位數（毫秒）"""
+
+    script: str
+    shebang_ms: float = 0.0
+    env_ms: float = 0.0
+    fallback: bool = False
+    error: str = ""
+
+
+Runner = Callable[..., subprocess.CompletedProcess]
+
+
+# ============================================================================
+# 路徑
+# ============================================================================
+
+def hooks_dir(claude_dir: Path = _CLAUDE_DIR) -> Path:
+    return claude_dir / HOOKS_DIRNAME
+
+
+def env_dir(claude_dir: Path = _CLAUDE_DIR) -> Path:
+    return hooks_dir(claude_dir) / ENV_DIRNAME
+
+
+def env_python(claude_dir: Path = _CLAUDE_DIR) -> Path:
+    if os.name == "nt":
+        return env_dir(claude_dir) / "Scripts" / "python.exe"
+    return env_dir(claude_dir) / "bin" / "python"
+
+
+def discover_hook_scripts(claude_dir: Path = _CLAUDE_DIR) -> List[Path]:
+    """hooks/*.py 與 skills/*/hooks/*.py（依相對路徑排序）"""
+    scripts = set()
+    for pattern in HOOK_SCRIPT_GLOBS:
+        scripts.update(p for p in claude_dir.glob(pattern) if p.is_file())
+    return sorted(scripts, key=lambda p: p.relative_to(claude_dir).as_posix())
+
+
+# ============================================================================
+# PEP 723 / PEP 508 / PEP 440（最小子集）
+# ============================================================================
+
+def read_script_metadata(text: str) -> Optional[Dict]:
+    """
+    解析 PEP 723 `# /// script` 區塊；無區塊回傳 None
+
+    Raises:
+        ValueError: 區塊重複或內容不是合法 TOML
+    """
+    blocks = [m for m in PEP723_BLOCK_RE.finditer(text) if m.group("type") == "script"]
+    if not blocks:
+        return None
+    if len(blocks) > 1:
+        raise ValueError("multiple script blocks")
+    content = "".join(
+        line[2:] if line.startswith("# ") else line[1:]
+        for line in blocks[0].group("content").splitlines(keepends=True)
+    )
+    if tomllib is None:
+        raise ValueError("tomllib unavailable")
+    try:
+        return tomllib.loads(content)
+    except tomllib.TOMLDecodeError as exc:
+        raise ValueError(str(exc)) from exc
+
+
+def normalize_name(name: str) -> str:
+    """PEP 503 名稱正規化"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def parse_requirement(requirement: str) -> Optional[Tuple[str, str, str]]:
+    """PEP 508 需求 → (正規化名稱, specifier, 環境標記)；無法解析回傳 None"""
+    match = REQUIREMENT_RE.match(requirement)
+    if not match:
+        return None
+    return (
+        normalize_name(match.group("name")),
+        match.group("spec").strip("() "),
+        (match.group("marker") or "").strip(),
+    )
+
+
+def _release(version: str) -> Optional[Tuple[int, ...]]:
+    match = VERSION_PREFIX_RE.match(version.strip())
+    if not match:
+        return None
+    return tuple(int(part) for part in match.group(1).split("."))
+
+
+def _padded(a: Tuple[int, ...], b: Tuple[int, ...]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    width = max(len(a), len(b))
+    return a + (0,) * (width - len(a)), b + (0,) * (width - len(b))
+
+
+def _clause_satisfied(op: str, target: str, version: str) -> Optional[bool]:
+    if op == "===":
+        return version == target
+    current = _release(version)
+    if current is None:
+        return None
+    if op in ("==", "!=") and target.endswith(".*"):
+        prefix = _release(target[:-2])
+        if prefix is None:
+            return None
+        matched = _padded(current, prefix)[0][:len(prefix)] == prefix
+        return matched if op == "==" else not matched
+    wanted = _release(target)
+    if wanted is None:
+        return None
+    if op == "~=":
+        if len(wanted) < 2:
+            return None
+        left, right = _padded(current, wanted)
+        return left >= right and current[:len(wanted) - 1] == wanted[:-1]
+    left, right = _padded(current, wanted)
+    return {
+        "==": left == right,
+        "!=": left != right,
+        "<=": left <= right,
+        ">=": left >= right,
+        "<": left < right,
+        ">": left > right,
+    }[op]
+
+
+def specifier_satisfied(specifier: str, version: str) -> Optional[bool]:
+    """逗號分隔的 specifier 是否涵蓋 version；無法判斷時回傳 None"""
+    if not specifier.strip():
+        return True
+    for clause in specifier.split(","):
+        match = SPECIFIER_RE.match(clause)
+        if not match:
+            return None
+        result = _clause_satisfied(match.group(1), match.group(2), version)
+        if result is not True:
+            return result
+    return True
+
+
+def marker_applies(marker: str, python_version: Optional[str]) -> bool:
+    """環境標記在 python_version 下是否成立；無法評估時視為成立"""
+    if not marker or not python_version:
+        return True
+    for clause in marker.split(" and "):
+        match = MARKER_CLAUSE_RE.match(clause.strip("() "))
+        if not match:
+            return True
+        value = python_version
+        if match.group("var") == "python_version":
+            value = ".".join(python_version.split(".")[:2])
+        result = _clause_satisfied(match.group("op"), match.group("value"), value)
+        if result is None:
+            return True
+        if not result:
+            return False
+    return True
+
+
+# ============================================================================
+# 鎖定環境內容
+# ============================================================================
+
+def _load_toml(path: Path) -> Dict:
+    if tomllib is None:
+        raise HookEnvError("需要 Python 3.11+（tomllib）或 tomli 才能解析 {}".format(path.name))
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except OSError as exc:
+        raise HookEnvError("無法讀取 {}: {}".format(path, exc)) from exc
+    except tomllib.TOMLDecodeError as exc:
+        raise HookEnvError("{} 格式錯誤: {}".format(path, exc)) from exc
+
+
+def locked_packages(lock_path: Path) -> Dict[str, str]:
+    """
+    uv.lock 中 `--no-dev` 建置會安裝的套件：正規化名稱 → 版本
+
+    自 virtual / editable 根專案的 dependencies 出發走訪依賴圖；只屬於
+    dev 群組的套件（pytest 等）不計入。
+    """
+    packages = {}
+    root = None
+    for package in _load_toml(lock_path).get("package", []):
+        name = normalize_name(package.get("name", ""))
+        packages[name] = package
+        source = package.get("source") or {}
+        if source.get("virtual") == "." or source.get("editable") == ".":
+            root = package
+    if root is None:
+        raise HookEnvError("{} 找不到根專案".format(lock_path))
+
+    result: Dict[str, str] = {}
+    pending = [normalize_name(d.get("name", "")) for d in root.get("dependencies", [])]
+    while pending:
+        name = pending.pop()
+        if name in result or name not in packages:
+            continue
+        package = packages[name]
+        result[name] = str(package.get("version", ""))
+        pending.extend(normalize_name(d.get("name", "")) for d in package.get("dependencies", []))
+    return result
+
+
+def check_script(script: Path, locked: Dict[str, str], python_version: Optional[str]) -> List[str]:
+    """單支 hook 的漂移項目；無 PEP 723 區塊（純 stdlib hook）回傳空列表"""
+    try:
+        metadata = read_script_metadata(script.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, ValueError) as exc:
+        return ["unreadable script metadata: {}".format(exc)]
+    if metadata is None:
+        return []
+
+    issues = []
+    requires_python = metadata.get("requires-python")
+    if requires_python and python_version:
+        if specifier_satisfied(str(requires_python), python_version) is not True:
+            issues.append("requires-python {} not satisfied by {}".format(requires_python, python_version))
+
+    for requirement in metadata.get("dependencies") or []:
+        parsed = parse_requirement(str(requirement))
+        if parsed is None:
+            issues.append("unparsable dependency: {}".format(requirement))
+            continue
+        name, spec, marker = parsed
+        if not marker_applies(marker, python_version):
+            continue
+        version = locked.get(name)
+        if version is None:
+            issues.append("missing from locked env: {}".format(requirement))
+        elif specifier_satisfied(spec, version) is not True:
+            issues.append("{} not satisfied by locked {}".format(requirement, version))
+    return issues
+
+
+def check_drift(
+    scripts: List[Path], locked: Dict[str, str], python_version: Optional[str]
+) -> List[HookDrift]:
+    """逐支比對；只回傳有漂移的 hook"""
+    drifts = []
+    for script in scripts:
+        issues = check_script(script, locked, python_version)
+        if issues:
+            drifts.append(HookDrift(script=str(script), issues=issues))
+    return drifts
+
+
+def read_stamp(claude_dir: Path = _CLAUDE_DIR) -> Optional[Dict]:
+    """讀取建置 stamp；未建置或格式不符回傳 None"""
+    try:
+        with open(env_dir(claude_dir) / STAMP_FILENAME, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != STAMP_FORMAT_VERSION:
+        return None
+    return data
+
+
+# ============================================================================
+# build
+# ============================================================================
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp_path = path.with_name("{}.{}.tmp".format(path.name, os.getpid()))
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def build_env(claude_dir: Path = _CLAUDE_DIR, runner: Runner = subprocess.run) -> Dict:
+    """
+    建置鎖定環境並寫入漂移清單與 stamp（stamp 最後寫入，作為完成標記）
+
+    Returns:
+        stamp 內容（含 python 版本、套件清單與漂移 hook）
+
+    Raises:
+        HookEnvError: uv 不存在、uv sync 失敗（含鎖檔與 pyproject 不一致）
+    """
+    uv = shutil.which("uv")
+    if uv is None:
+        raise HookEnvError("找不到 uv（hook 環境以 uv sync 建置）")
+
+    directory = hooks_dir(claude_dir)
+    env = dict(os.environ, UV_PROJECT_ENVIRONMENT=str(env_dir(claude_dir)))
+    try:
+        result = runner(
+            [uv, "sync", "--locked", "--no-dev", "--quiet", "--project", str(directory)],
+            capture_output=True, text=True, timeout=UV_SYNC_TIMEOUT_SECONDS, env=env,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        raise HookEnvError("uv sync 執行失敗: {}".format(exc)) from exc
+    if result.returncode != 0:
+        lines = [line for line in (result.stderr or "").splitlines() if line.strip()]
+        raise HookEnvError("uv sync 失敗: {}".format(lines[-1] if lines else result.returncode))
+
+    python = env_python(claude_dir)
+    try:
+        query = runner(
+            [str(python), "-c", "import platform; print(platform.python_version())"],
+            capture_output=True, text=True, timeout=PYTHON_QUERY_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        raise HookEnvError("無法執行環境直譯器 {}: {}".format(python, exc)) from exc
+    python_version = query.stdout.strip() if query.returncode == 0 else None
+
+    locked = locked_packages(directory / LOCK_FILENAME)
+    drifts = check_drift(discover_hook_scripts(claude_dir), locked, python_version)
+    fallback = sorted(Path(d.script).relative_to(claude_dir).as_posix() for d in drifts)
+
+    stamp = {
+        "version": STAMP_FORMAT_VERSION,
+        "python": python_version,
+        "packages": locked,
+        "fallback": fallback,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    target = env_dir(claude_dir)
+    _write_atomic(target / FALLBACK_FILENAME, "".join(line + "\n" for line in fallback))
+    _write_atomic(target / STAMP_FILENAME, json.dumps(stamp, ensure_ascii=False, indent=2) + "\n")
+    return stamp
+
+
+# ============================================================================
+# bench
+# ============================================================================
+
+def _time_run(command: List[str], env: Dict[str, str], runner: Runner) -> float:
+    start = time.perf_counter()
+    runner(command, input=BENCH_STDIN, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+           timeout=BENCH_TIMEOUT_SECONDS, env=env, cwd=env.get("CLAUDE_PROJECT_DIR"))
+    return (time.perf_counter() - start) * 1000.0
+
+
+def bench_script(
+    script: Path,
+    launcher: Path,
+    fallback: List[str],
+    claude_dir: Path = _CLAUDE_DIR,
+    repeat: int = DEFAULT_BENCH_REPEAT,
+    runner: Runner = subprocess.run,
+) -> HookStartup:
+    """
+    以 `{}` 為 stdin 交錯執行兩種模式各 repeat 次，取中位數
+
+    每種模式先跑一次不計時的暖身（uv 快取、磁碟快取）。hook 對空輸入的
+    exit code 不影響量測；兩種模式執行同一支 hook，差值即啟動成本差。
+    """
+    startup = HookStartup(script=str(script))
+    try:
+        startup.fallback = script.resolve().relative_to(claude_dir.resolve()).as_posix() in fallback
+    except ValueError:
+        startup.fallback = True
+    env = dict(os.environ, CLAUDE_PROJECT_DIR=str(claude_dir.parent))
+    modes = ([str(script)], [str(launcher), str(script)])
+    samples: Tuple[List[float], List[float]] = ([], [])
+    try:
+        for command in modes:
+            _time_run(command, env, runner)
+        for _ in range(max(1, repeat)):
+            for command, bucket in zip(modes, samples):
+                bucket.append(_time_run(command, env, runner))
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        startup.error = str(exc)
+        return startup
+    startup.shebang_ms = round(statistics.median(samples[0]), 1)
+    startup.env_ms = round(statistics.median(samples[1]), 1)
+    return startup
+
+
+def render_bench(results: List[HookStartup], repeat: int) -> str:
+    lines = ["=== Hook startup: uv run --script vs {} (median of {}) ===".format(LAUNCHER_NAME, repeat), ""]
+    if not results:
+        lines.append("(沒有可量測的 hook)")
+        return "\n".join(lines)
+    width = max(len(Path(r.script).name) for r in results)
+    for r in results:
+        name = Path(r.script).name
+        if r.error:
+            lines.append("  {:<{w}}  {:>9}  {}".format(name, "ERROR", r.error, w=width))
+            continue
+        ratio = r.shebang_ms / r.env_ms if r.env_ms else 0.0
+        lines.append("  {:<{w}}  {:>8.1f}ms  {:>8.1f}ms  x{:.1f}{}".format(
+            name, r.shebang_ms, r.env_ms, ratio, "  (fallback)" if r.fallback else "", w=width,
+        ))
+    measured = [r for r in results if not r.error]
+    if measured:
+        lines.append("")
+        lines.append("  {} hook(s): shebang mean {:.1f}ms, env mean {:.1f}ms".format(
+            len(measured),
+            statistics.mean(r.shebang_ms for r in measured),
+            statistics.mean(r.env_ms for r in measured),
+        ))
+    return "\n".join(lines)
+
+
+def render_drift(drifts: List[HookDrift], claude_dir: Path) -> str:
+    lines = ["=== Hook inline metadata vs locked env ===", ""]
+    if not drifts:
+        lines.append("  no drift")
+        return "\n".join(lines)
+    for drift in drifts:
+        lines.append("  {}".format(Path(drift.script).relative_to(claude_dir).as_posix()))
+        lines.extend("    - {}".format(issue) for issue in drift.issues)
+    lines.append("")
+    lines.append("  {} hook(s) drift; {} falls back to their shebang for these".format(
+        len(drifts), LAUNCHER_NAME,
+    ))
+    return "\n".join(lines)
+
+
+# ============================================================================
+# 入口
+# ============================================================================
+
+def _cmd_build(args: argparse.Namespace) -> int:
+    stamp = build_env(args.claude_dir)
+    print("hook env built: {} (python {}, {} package(s))".format(
+        env_dir(args.claude_dir), stamp["python"], len(stamp["packages"]),
+    ))
+    if stamp["fallback"]:
+        print("{} hook(s) drift from the locked env and keep using uv run --script:".format(
+            len(stamp["fallback"])))
+        for script in stamp["fallback"]:
+            print("  {}".format(script))
+        print("run `hook_env.py check` for details")
+    return EXIT_OK
+
+
+def _cmd_check(args: argparse.Namespace) -> int:
+    locked = locked_packages(hooks_dir(args.claude_dir) / LOCK_FILENAME)
+    stamp = read_stamp(args.claude_dir)
+    python_version = (stamp or {}).get("python") or platform.python_version()
+    drifts = check_drift(discover_hook_scripts(args.claude_dir), locked, python_version)
+    if args.format == FORMAT_JSON:
+        print(json.dumps([asdict(d) for d in drifts], ensure_ascii=False, indent=2))
+    else:
+        print(render_drift(drifts, args.claude_dir))
+    return EXIT_DRIFT if drifts else EXIT_OK
+
+
+def _cmd_bench(args: argparse.Namespace) -> int:
+    stamp = read_stamp(args.claude_dir)
+    if stamp is None:
+        raise HookEnvError("hook 環境尚未建置，請先執行 build")
+    if args.hooks:
+        scripts = [Path(h).resolve() for h in args.hooks]
+    else:
+        from lib.hook_daemon import registered_hook_scripts
+
+        scripts = registered_hook_scripts(args.claude_dir / "settings.json", args.claude_dir.parent)
+        scripts = [s for s in scripts if s.is_file()][:args.limit]
+    launcher = hooks_dir(args.claude_dir) / LAUNCHER_NAME
+    results = [
+        bench_script(script, launcher, stamp.get("fallback", []), args.claude_dir, args.repeat)
+        for script in scripts
+    ]
+    if args.format == FORMAT_JSON:
+        print(json.dumps([asdict(r) for r in results], ensure_ascii=False, indent=2))
+    else:
+        print(render_bench(results, args.repeat))
+    return EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行介面：0 = 成功 / 無漂移，1 = 有漂移，2 = 無法執行"""
+    parser = argparse.ArgumentParser(description="Hook 共用預建環境（uv.lock → hooks/.venv）")
+    parser.add_argument("--claude-dir", type=Path, default=_CLAUDE_DIR, help=argparse.SUPPRESS)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("build", help="以 uv sync --locked 建置 hooks/.venv 並寫入漂移清單")
+
+    check = sub.add_parser("check", help="比對 hook inline PEP 723 metadata 與鎖定環境")
+    check.add_argument("--format", choices=(FORMAT_TABLE, FORMAT_JSON), default=FORMAT_TABLE)
+
+    bench = sub.add_parser("bench", help="比較 uv run --script 與啟動器的 hook 啟動時間")
+    bench.add_argument("hooks", nargs="*", help="要量測的 hook（預設為 settings.json 已註冊者）")
+    bench.add_argument("--repeat", type=int, default=DEFAULT_BENCH_REPEAT)
+    bench.add_argument("--limit", type=int, default=DEFAULT_BENCH_LIMIT)
+    bench.add_argument("--format", choices=(FORMAT_TABLE, FORMAT_JSON), default=FORMAT_TABLE)
+
+    args = parser.parse_args(argv)
+    handlers = {"build": _cmd_build, "check": _cmd_check, "bench": _cmd_bench}
+    try:
+        return handlers[args.command](args)
+    except HookEnvError as exc:
+        print("hook env: {}".format(exc), file=sys.stderr)
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,11 +5,16 @@ relative-baseline evaluation for hook trigger frequencies.
 
 Design principles:
 - Pure stdlib (pathlib + datetime), Python 3.9 compatible
+- Frequency source: the append-only telemetry store written by
+  run_hook_safely (lib/hook_telemetry.py, hook-logs/_telemetry/). The
+  legacy per-invocation .log walk is only used for days before telemetry
+  coverage starts (transition period) or when no telemetry exists
 - 2-class coarse classification (high_freq_ok / low_freq_expected)
 - Relative baseline (recent vs 7-day avg * N), N=2 default / N=3 for high_freq
 - Bootstrap fallback: absolute lower bound 100/day when no history
 - No side effects (file writes / subprocess / ticket creation) — caller
-  decides observability surface (stderr / CLI / hook)
+  decides observability surface (stderr / CLI / hook). Exceptions: store
+  retention pruning and the explicit set_profiling() toggle
 
 Consumed by:
 - .claude/hooks/hook-health-monitor.py (SessionStart hook, W13-017)
@@ -24,6 +29,15 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    from .hook_profiler import PROFILE_SUBDIR, iter_profiles, prune, set_enabled, summarize_profiles
+    from .hook_telemetry import TELEMETRY_SUBDIR, load_rollup, summarize
+except ImportError:
+    # Loaded as a bare top-level module (`.claude/lib` on sys.path) — see
+    # the same fallback in pm_registry.
+    from hook_profiler import PROFILE_SUBDIR, iter_profiles, prune, set_enabled, summarize_profiles  # type: ignore[no-redef]
+    from hook_telemetry import TELEMETRY_SUBDIR, load_rollup, summarize  # type: ignore[no-redef]
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -74,10 +88,15 @@ class Verdict:
 # ---------------------------------------------------------------------------
 
 def scan_logs(since: datetime, logs_root: Optional[Path] = None) -> Dict[str, Dict]:
-    """Aggregate hook-logs/ stats since the given timestamp.
+    """Aggregate hook run counts since the given timestamp.
+
+    Reads the telemetry rollup (hour granularity: the hour containing
+    ``since`` is included). Days before the first telemetry record come
+    from the legacy .log walk; on the first telemetry day the larger of the
+    two counts is used, since that day is only partially covered.
 
     Args:
-        since: Only files with mtime >= since are counted.
+        since: Only runs at or after since are counted.
         logs_root: Override .claude/hook-logs/ root (testing).
 
     Returns:
@@ -87,10 +106,88 @@ def scan_logs(since: datetime, logs_root: Optional[Path] = None) -> Dict[str, Di
         # Default: <repo>/.claude/hook-logs (lib lives at .claude/lib/)
         logs_root = Path(__file__).resolve().parents[1] / "hook-logs"
 
-    stats: Dict[str, Dict] = {}
     if not logs_root.exists():
-        return stats
+        return {}
+
+    rollup = load_rollup(logs_root / TELEMETRY_SUBDIR)
+    if rollup["first_ts"] is None:
+        return _scan_log_files(since, logs_root)
+
+    coverage_day = datetime.fromtimestamp(rollup["first_ts"]).strftime("%Y-%m-%d")
+    merged: Dict[str, Dict[str, int]] = {
+        hook: dict(entry["per_day"]) for hook, entry in summarize(rollup, since).items()
+    }
+    if since.strftime("%Y-%m-%d") <= coverage_day:
+        for hook, entry in _scan_log_files(since, logs_root).items():
+            per_day = merged.setdefault(hook, {})
+            for day_str, count in entry["per_day"].items():
+                if day_str < coverage_day:
+                    per_day[day_str] = count
+                elif day_str == coverage_day:
+                    per_day[day_str] = max(per_day.get(day_str, 0), count)
+
+    return {
+        hook: {"total": sum(per_day.values()), "per_day": per_day}
+        for hook, per_day in merged.items()
+        if per_day
+    }
+
+
+def scan_latency(since: datetime, logs_root: Optional[Path] = None) -> Dict[str, Dict]:
+    """Per-hook run count, error/block counts and latency from telemetry.
+
+    Returns:
+        dict mapping hook_name -> {"total", "per_day", "errors", "blocks",
+        "duration_ms_mean", "duration_ms_max"}; empty without telemetry.
+    """
+    if logs_root is None:
+        logs_root = Path(__file__).resolve().parents[1] / "hook-logs"
+    return summarize(load_rollup(logs_root / TELEMETRY_SUBDIR), since)
+
+
+def scan_profiles(
+    since: datetime,
+    logs_root: Optional[Path] = None,
+    budgets: Optional[Dict] = None,
+) -> Dict[str, Dict]:
+    """Latency percentiles and budget verdicts from profiling-mode records.
+
+    Profiling records (hook-logs/_profile/) only exist while profiling mode
+    is on; see lib/hook_profiler.py. Segments past retention are pruned.
+
+    Returns:
+        {"hooks": {hook: stats}, "chains": {"<event>/<matcher>": stats}} —
+        see hook_profiler.summarize_profiles; both empty without records.
+    """
+    if logs_root is None:
+        logs_root = Path(__file__).resolve().parents[1] / "hook-logs"
+    profile_dir = logs_root / PROFILE_SUBDIR
+    prune(profile_dir)
+    return summarize_profiles(iter_profiles(profile_dir, since), budgets)
+
+
+def set_profiling(enabled: bool, logs_root: Optional[Path] = None) -> None:
+    """Turn profiling mode on/off for hooks launched without the env var."""
+    if logs_root is None:
+        logs_root = Path(__file__).resolve().parents[1] / "hook-logs"
+    set_enabled(logs_root / PROFILE_SUBDIR, enabled)
 
+
+def last_seen(logs_root: Optional[Path] = None) -> Dict[str, datetime]:
+    """Last telemetry-recorded run time per hook (empty without telemetry)."""
+    if logs_root is None:
+        logs_root = Path(__file__).resolve().parents[1] / "hook-logs"
+    rollup = load_rollup(logs_root / TELEMETRY_SUBDIR)
+    return {
+        hook: datetime.fromtimestamp(info["last_ts"])
+        for hook, info in rollup["hooks"].items()
+        if info.get("last_ts")
+    }
+
+
+def _scan_log_files(since: datetime, logs_root: Path) -> Dict[str, Dict]:
+    """Legacy source: count per-invocation .log files by mtime."""
+    stats: Dict[str, Dict] = {}
     since_ts = since.timestamp()
 
     for hook_dir in sorted(logs_root.iterdir()):
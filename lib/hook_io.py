@@ -28,10 +28,31 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from lib.hook_base import get_project_root
+from lib.hook_telemetry import (
+    DECISION_ASK,
+    DECISION_BLOCK,
+    DECISION_DENY,
+    note_hook_event,
+    set_hook_decision,
+)
 
 
 _VALID_EFFORT_LEVELS = ("low", "medium", "high")
 
+# 以 JSON 表達、exit code 仍為 0 的決策 -> 執行遙測決策（allow 由 exit code 推導）
+_TELEMETRY_DECISIONS = {
+    "ask": DECISION_ASK,
+    "deny": DECISION_DENY,
+    "block": DECISION_BLOCK,
+}
+
+
+def _note_output_decision(decision: Optional[str]) -> None:
+    """輸出帶 ask / deny / block 決策時記入執行遙測（exit 0 無法表達）"""
+    recorded = _TELEMETRY_DECISIONS.get(decision or "")
+    if recorded:
+        set_hook_decision(recorded)
+
 
 def read_hook_input() -> dict:
     """
@@ -46,7 +67,9 @@ def read_hook_input() -> dict:
         tool_input = input_data.get("tool_input", {})
     """
     try:
-        return json.load(sys.stdin)
+        input_data = json.load(sys.stdin)
+        note_hook_event(input_data)
+        return input_data
     except json.JSONDecodeError:
         return {}
     except Exception:
@@ -78,8 +101,10 @@ def read_json_from_stdin(logger: logging.Logger) -> Optional[dict]:
         if not input_text:
             return None
 
-        # 解析 JSON
-        return json.loads(input_text)
+        # 解析 JSON（hook_event_name 一併記入執行遙測）
+        input_data = json.loads(input_text)
+        note_hook_event(input_data)
+        return input_data
 
     except json.JSONDecodeError as e:
         logger.info("JSON 解析跳過（stdin 含控制字元）: {}".format(e))
@@ -101,6 +126,10 @@ def write_hook_output(output: dict, ensure_ascii: bool = False, indent: int = 2)
     Example:
         write_hook_output({"decision": "allow", "reason": "OK"})
     """
+    hook_specific = output.get("hookSpecificOutput")
+    if isinstance(hook_specific, dict):
+        _note_output_decision(hook_specific.get("permissionDecision"))
+    _note_output_decision(output.get("decision"))
     print(json.dumps(output, ensure_ascii=ensure_ascii, indent=indent))
 
 
@@ -132,6 +161,7 @@ def create_pretooluse_output(
         )
         write_hook_output(output)
     """
+    _note_output_decision(decision)
     output: dict[str, Any] = {
         "hookSpecificOutput": {
             "hookEventName": "PreToolUse",
@@ -176,6 +206,7 @@ def create_posttooluse_output(
         )
         write_hook_output(output)
     """
+    _note_output_decision(decision)
     output: dict[str, Any] = {
         "decision": decision,
         "reason": reason,
@@ -205,6 +236,7 @@ def create_simple_output(decision: str, reason: str = "") -> dict:
         output = create_simple_output("approve")
         write_hook_output(output)
     """
+    _note_output_decision(decision)
     output = {"decision": decision}
     if reason:
         output["reason"] = reason
@@ -723,6 +755,7 @@ def generate_hook_output(
         output["hookSpecificOutput"]["additionalContext"] = additional_context
 
     if permission_decision:
+        _note_output_decision(permission_decision)
         output["hookSpecificOutput"]["permissionDecision"] = permission_decision
 
     if permission_decision_reason:
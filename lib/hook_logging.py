@@ -28,6 +28,8 @@ from pathlib import Path
 from typing import Callable, Optional
 
 from lib.hook_base import get_project_root, ENV_PROJECT_DIR, CLAUDE_MD_SEARCH_DEPTH  # re-export for backward compatibility
+from lib.hook_context import hook_context_scope
+from lib import hook_profiler, hook_telemetry
 
 # ============================================================================
 # 常數定義
@@ -36,6 +38,9 @@ from lib.hook_base import get_project_root, ENV_PROJECT_DIR, CLAUDE_MD_SEARCH_DE
 # 時間戳格式（無冒號，避免 Windows 路徑問題）
 TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
 
+# 執行遙測啟用時改為每日一檔（觸發次數由遙測記錄，不需逐次建檔）
+DAILY_LOG_DATE_FORMAT = "%Y%m%d"
+
 # 預設 hook 名稱（空字串 fallback）
 DEFAULT_HOOK_NAME = "unknown-hook"
 
@@ -66,6 +71,9 @@ CLEANUP_INTERVAL_SECONDS = 300
 # Liveness 索引子目錄：hook 已載入/未載入的正向訊號（見 mark_hook_entry）
 LIVENESS_SUBDIR = "_liveness"
 
+# 執行遙測子目錄：每次執行的耗時 / exit code / 決策（見 lib/hook_telemetry.py）
+TELEMETRY_SUBDIR = hook_telemetry.TELEMETRY_SUBDIR
+
 # CC runtime 曝露的 session id 環境變數，與 stdin session_id 一致
 # （見 hook-architect-technical-reference.md）。取用此 env var 可在 stdin
 # 讀取之前即取得 session_id，免除「先記進入、取得 session_id 後補綁」的
@@ -224,11 +232,18 @@ def _setup_logger_handlers(logger: logging.Logger, log_base_dir: Path,
 
     採用 lazy file creation 策略：只在實際寫入日誌時才建立檔案，
     避免產生空日誌檔案。使用 FileHandler 的 delay=True 參數。
+
+    執行遙測啟用時（hook_telemetry.is_enabled），觸發次數 / 耗時 / 決策已由
+    遙測記錄，日誌改為附加至每日一檔 {hook_name}-{YYYYMMDD}.log，不再每次
+    執行各建一檔；遙測停用時維持逐次檔，供 hook_health 的 .log 計數使用。
     """
     _maybe_cleanup(log_base_dir, pattern="*.log")
 
     # 配置 FileHandler（使用 delay=True 實現 lazy file creation）
-    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+    if hook_telemetry.is_enabled():
+        timestamp = datetime.now().strftime(DAILY_LOG_DATE_FORMAT)
+    else:
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
     log_file_path = log_base_dir / "{}-{}.log".format(sanitized_name, timestamp)
 
     try:
@@ -275,7 +290,8 @@ def setup_hook_logging(hook_name: str) -> logging.Logger:
 
     功能：
     - 建立日誌目錄 .claude/hook-logs/{hook_name}/
-    - 建立日誌檔案 {hook_name}-{YYYYMMDD-HHMMSS}.log
+    - 建立日誌檔案 {hook_name}-{YYYYMMDD}.log（執行遙測啟用時，每日附加）
+      或 {hook_name}-{YYYYMMDD-HHMMSS}.log（CLAUDE_HOOK_TELEMETRY=0，逐次一檔）
     - 配置 FileHandler + StreamHandler
 
     Args:
@@ -405,6 +421,55 @@ def resolve_session_id(input_data: Optional[dict] = None) -> str:
     return os.environ.get(ENV_SESSION_ID, "")
 
 
+def _telemetry_dir() -> Path:
+    """回傳執行遙測目錄（.claude/hook-logs/_telemetry/）"""
+    return get_project_root() / ".claude" / "hook-logs" / TELEMETRY_SUBDIR
+
+
+def _record_telemetry(hook_name: str, started: float, exit_code: int,
+                      decision: Optional[str] = None) -> None:
+    """寫入一筆執行遙測；任何失敗皆不影響 hook 結果"""
+    try:
+        hook_telemetry.record_invocation(
+            _telemetry_dir(),
+            _sanitize_hook_name(hook_name),
+            time.perf_counter() - started,
+            exit_code,
+            decision=decision,
+        )
+    except Exception:
+        pass
+
+
+def _begin_profile() -> Optional[dict]:
+    """剖析模式開啟時回傳量測起點（見 lib/hook_profiler.py），否則 None"""
+    try:
+        return hook_profiler.begin_invocation(_profile_dir())
+    except Exception:
+        return None
+
+
+def _profile_dir() -> Path:
+    """回傳剖析明細目錄（.claude/hook-logs/_profile/）"""
+    return get_project_root() / ".claude" / "hook-logs" / hook_profiler.PROFILE_SUBDIR
+
+
+def _record_profile(profile: Optional[dict], hook_name: str, exit_code: int) -> None:
+    """寫入一筆剖析明細；未開啟（profile 為 None）或任何失敗皆不影響 hook 結果"""
+    if profile is None:
+        return
+    try:
+        hook_profiler.finish_invocation(
+            profile,
+            _profile_dir(),
+            _sanitize_hook_name(hook_name),
+            exit_code,
+            hook_telemetry.current_invocation(),
+        )
+    except Exception:
+        pass
+
+
 def mark_hook_entry(hook_name: str, logger: Optional[logging.Logger] = None) -> None:
     """寫入 hook liveness 進入訊號
 
@@ -415,6 +480,11 @@ def mark_hook_entry(hook_name: str, logger: Optional[logging.Logger] = None) ->
     CLAUDE_CODE_SESSION_ID 環境變數，於 stdin 讀取之前即可取得，故單次
     寫入即完成綁定，不需「先記進入、取得 session_id 後補綁」的兩階段設計。
 
+    執行遙測啟用時（hook_telemetry.is_enabled）不寫入：run_hook_safely 於
+    main_func 結束（含例外與 sys.exit）時已寫入一筆遙測紀錄，hook-liveness-
+    summary 改由遙測彙總推導「已載入」清單，每次進入再多寫一筆 JSONL 只是
+    重複的 I/O。差別僅在 hook 被強制終止（逾時被殺）時不留紀錄。
+
     已知殘留缺口：本函式由 run_hook_safely 呼叫，時序上晚於 hook 檔案自身
     的 module-level import（stdlib 之外的相依）。若 hook 在自身 import
     階段崩潰（而非 lib 本身），run_hook_safely 從未被呼叫，本函式也不會
@@ -426,6 +496,8 @@ def mark_hook_entry(hook_name: str, logger: Optional[logging.Logger] = None) ->
                    彙整入口以此值與 settings.json 註冊表比對）
         logger: 可選 Logger，寫入失敗時額外記錄 warning（雙通道：亦寫 stderr）
     """
+    if hook_telemetry.is_enabled():
+        return
     entry = {
         "hook": hook_name,
         "session_id": _current_session_id(),
@@ -455,7 +527,10 @@ def run_hook_safely(
     - 呼叫 setup_hook_logging 獲取 logger
     - 執行 main_func，捕獲 Exception（非 SystemExit/KeyboardInterrupt）
     - 異常時記錄完整 traceback 到日誌檔，返回 EXIT_ERROR 或 EXIT_DENY（依 fail_closed）
-    - 記錄執行時間到日誌
+    - 記錄執行時間到日誌，並寫入一筆執行遙測（hook / 事件 / 耗時 / exit code /
+      決策，見 lib/hook_telemetry.py；main_func 內 sys.exit 同樣記錄後再拋出）
+    - 剖析模式開啟時另寫一筆延遲明細（import / main 時間、子行程數，
+      見 lib/hook_profiler.py）
 
     Args:
         main_func: Hook 主入口函式，必須返回 int
@@ -475,31 +550,47 @@ def run_hook_safely(
         exit 1 在 CLI 中可能觸發 "hook error" 顯示（IMP-049 已知 CLI bug），
         但這是 CLI 層問題，不應在 Hook 層繞過。異常記錄到日誌檔即可。
     """
-    logger = setup_hook_logging(hook_name)
-    mark_hook_entry(hook_name, logger)
-    start_time = time.time()
+    # hook_context_scope：本次執行期間 get_project_root / get_current_branch
+    # 等改讀跨行程共用的 git 情境快照（見 lib/hook_context.py）
+    with hook_context_scope():
+        started = time.perf_counter()
+        hook_telemetry.begin_invocation()
+        profile = _begin_profile()
+        logger = setup_hook_logging(hook_name)
+        mark_hook_entry(hook_name, logger)
+        start_time = time.time()
 
-    try:
-        exit_code = main_func()
-        # 驗證返回值是整數
-        if not isinstance(exit_code, int):
-            try:
-                exit_code = int(exit_code)
-            except (ValueError, TypeError):
-                exit_code = 0
-
-        # 記錄執行時間
-        elapsed_time = time.time() - start_time
-        logger.debug("Hook execution time: {:.2f}s".format(elapsed_time))
-        return exit_code
-    except (KeyboardInterrupt, SystemExit):
-        raise
-    except Exception:
-        elapsed_time = time.time() - start_time
-        tb_str = traceback.format_exc()
-        logger.debug("Hook execution time before failure: {:.2f}s".format(elapsed_time))
-        _log_exception(logger, hook_name, tb_str)
-        return EXIT_DENY if fail_closed else EXIT_ERROR
+        try:
+            exit_code = main_func()
+            # 驗證返回值是整數
+            if not isinstance(exit_code, int):
+                try:
+                    exit_code = int(exit_code)
+                except (ValueError, TypeError):
+                    exit_code = 0
+
+            # 記錄執行時間
+            elapsed_time = time.time() - start_time
+            logger.debug("Hook execution time: {:.2f}s".format(elapsed_time))
+            _record_telemetry(hook_name, started, exit_code)
+            _record_profile(profile, hook_name, exit_code)
+            return exit_code
+        except KeyboardInterrupt:
+            raise
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else EXIT_ERROR)
+            _record_telemetry(hook_name, started, code)
+            _record_profile(profile, hook_name, code)
+            raise
+        except Exception:
+            elapsed_time = time.time() - start_time
+            tb_str = traceback.format_exc()
+            logger.debug("Hook execution time before failure: {:.2f}s".format(elapsed_time))
+            _log_exception(logger, hook_name, tb_str)
+            exit_code = EXIT_DENY if fail_closed else EXIT_ERROR
+            _record_telemetry(hook_name, started, exit_code, hook_telemetry.DECISION_EXCEPTION)
+            _record_profile(profile, hook_name, exit_code)
+            return exit_code
 
 
 def get_hook_log_dir(hook_name: str) -> Path:
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Hook 延遲剖析與預算檢查（profiling mode）
+
+背景：hook_telemetry 只記錄 run_hook_safely 內的耗時，看不到 hook 冷啟動的
+import 成本，也無法回答「PreToolUse/Bash 這一整條鏈讓每次工具呼叫多等多久」。
+本模組在剖析模式開啟時，由 run_hook_safely 為每次執行額外寫入一筆明細：
+
+- start / end：hook 開始載入與結束的 epoch 秒
+- import_ms：載入至進入 run_hook_safely 的時間（獨立行程為行程存活時間，
+  取自 /proc/self/stat，解析度為 clock tick；hook-runner / daemon 行程內
+  執行則自 run_hook_script 呼叫 mark_load_start() 起算）
+- main_ms：run_hook_safely 內（含 logging 設定與 main_func）的時間
+- subprocesses：執行期間啟動的子行程數（sys.addaudithook 計數）
+- chain：event+matcher 鏈鍵，格式同 hook-runner 群組鍵 "<event>/<matcher>"；
+  hook-runner 以 CLAUDE_HOOK_CHAIN 傳入群組鍵，獨立執行時以 stdin 的
+  tool_name 作 matcher
+
+開啟方式（任一）：
+- 環境變數 CLAUDE_HOOK_PROFILE=1（=0 強制關閉，優先於旗標檔）
+- `ticket track hook-health --profile on`（建立 _profile/enabled 旗標檔，
+  CC runtime 啟動的 hook 不必改環境變數即生效）
+
+儲存位置：.claude/hook-logs/_profile/profile-YYYYMMDD.jsonl（每次一行，
+O_APPEND 單次寫入）。未開啟時每次 hook 僅多一次環境變數讀取與一次 stat。
+
+彙總（summarize_profiles）：每支 hook 與每條鏈的 p50 / p95 / p99，並與
+.claude/config/hook-budget.yaml 的預算比較，p95（可設定）超出即標記。
+同一次觸發的判定：有 tool_use_id 以其分組，否則同 session + 同鏈且開始
+時間相距 CHAIN_WINDOW_S 內視為同一次；鏈耗時為該次 max(end) - min(start)
+（CC runtime 對同一鏈的 hook 平行執行，牆鐘時間才是使用者實際等待時間）。
+"""
+
+import json
+import math
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+PROFILE_SUBDIR = "_profile"
+SEGMENT_PREFIX = "profile-"
+SEGMENT_SUFFIX = ".jsonl"
+SEGMENT_DATE_FORMAT = "%Y%m%d"
+ENABLED_FLAG_FILENAME = "enabled"
+
+# 剖析明細保留天數（明細量大，短於遙測彙總的 14 天）
+RETENTION_DAYS = 7
+
+ENV_PROFILE = "CLAUDE_HOOK_PROFILE"
+ENV_CHAIN = "CLAUDE_HOOK_CHAIN"
+_ENABLED_VALUES = frozenset({"1", "true", "on", "yes"})
+_DISABLED_VALUES = frozenset({"0", "false", "off", "no"})
+
+# 無 tool_use_id 的事件：同 session + 同鏈、開始時間相距此秒數內視為同一次觸發
+CHAIN_WINDOW_S = 2.0
+
+# 計入子行程數的 audit 事件（os.posix_spawn 會與 subprocess.Popen 重複計數，不列入）
+SUBPROCESS_AUDIT_EVENTS = frozenset({"subprocess.Popen", "os.system", "os.fork"})
+
+# 預算設定（.claude/config/hook-budget.yaml）與缺設定時的預設值
+BUDGET_CONFIG_NAME = "hook-budget"
+DEFAULT_BUDGETS: Dict[str, Any] = {
+    "percentile": "p95",
+    "hook_ms": 200.0,
+    "chain_ms": 1000.0,
+    "hooks": {},
+    "chains": {},
+}
+PERCENTILES = (("p50", 50), ("p95", 95), ("p99", 99))
+
+# 行程層級狀態：行程內載入起點（mark_load_start）與子行程計數
+_state: Dict[str, Any] = {"load_started": None, "subprocesses": 0, "audit_installed": False}
+_process_started: Dict[str, Optional[float]] = {}
+
+
+class ProfileRecord(NamedTuple):
+    hook: str
+    chain: str
+    event: str
+    session: str
+    tool_use_id: str
+    start: float
+    end: float
+    import_ms: float
+    main_ms: float
+    subprocesses: int
+    exit_code: int
+
+    @property
+    def total_ms(self) -> float:
+        return self.import_ms + self.main_ms
+
+
+# ============================================================================
+# 開關
+# ============================================================================
+
+def is_enabled(profile_dir: Path) -> bool:
+    """環境變數優先；未設定時看 _profile/enabled 旗標檔"""
+    value = os.environ.get(ENV_PROFILE, "").strip().lower()
+    if value in _ENABLED_VALUES:
+        return True
+    if value in _DISABLED_VALUES:
+        return False
+    return (profile_dir / ENABLED_FLAG_FILENAME).exists()
+
+
+def set_enabled(profile_dir: Path, enabled: bool) -> None:
+    """建立 / 移除旗標檔（track hook-health --profile on|off）"""
+    flag = profile_dir / ENABLED_FLAG_FILENAME
+    if enabled:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        flag.touch()
+    elif flag.exists():
+        flag.unlink()
+
+
+# ============================================================================
+# 量測
+# ============================================================================
+
+def _audit(event: str, args: Any) -> None:
+    if event in SUBPROCESS_AUDIT_EVENTS:
+        _state["subprocesses"] += 1
+
+
+def _install_audit_hook() -> None:
+    # audit hook 裝上即無法移除，故只在剖析模式首次使用時安裝
+    if not _state["audit_installed"]:
+        sys.addaudithook(_audit)
+        _state["audit_installed"] = True
+
+
+def _process_start_time() -> Optional[float]:
+    """本行程啟動的 epoch 秒（Linux /proc；其他平台回傳 None）"""
+    if "value" not in _process_started:
+        value = None
+        try:
+            with open("/proc/self/stat", "r") as f:
+                stat = f.read()
+            with open("/proc/uptime", "r") as f:
+                uptime = float(f.read().split()[0])
+            # comm 欄位可含空白，從最後一個 ")" 之後切；starttime 為第 22 欄
+            start_ticks = int(stat[stat.rindex(")") + 2:].split()[19])
+            age = uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+            value = time.time() - max(age, 0.0)
+        except (OSError, ValueError, IndexError, AttributeError):
+            pass
+        _process_started["value"] = value
+    return _process_started["value"]
+
+
+def mark_load_start() -> None:
+    """行程內執行 hook（hook-runner / daemon）時標記載入起點"""
+    _state["load_started"] = time.time()
+
+
+def begin_invocation(profile_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    run_hook_safely 進入時呼叫；未開啟剖析模式回傳 None
+
+    Returns:
+        dict: 交給 finish_invocation 的量測起點
+    """
+    load_started, _state["load_started"] = _state["load_started"], None
+    if not is_enabled(profile_dir):
+        return None
+    _install_audit_hook()
+    now = time.time()
+    if load_started is None:
+        load_started = _process_start_time()
+    if load_started is None or load_started > now:
+        # 無法取得行程起點：以 CPU 時間近似 import 成本（下界）
+        load_started = now - time.process_time()
+    return {
+        "start": load_started,
+        "main_start": now,
+        "perf": time.perf_counter(),
+        "subprocesses": _state["subprocesses"],
+    }
+
+
+def _chain_key(event: str, tool_name: Optional[str]) -> str:
+    chain = os.environ.get(ENV_CHAIN)
+    if chain:
+        return chain
+    return "{}/{}".format(event, tool_name) if tool_name else event
+
+
+def _segment_name(day: datetime) -> str:
+    return "{}{}{}".format(SEGMENT_PREFIX, day.strftime(SEGMENT_DATE_FORMAT), SEGMENT_SUFFIX)
+
+
+def finish_invocation(
+    token: Optional[Dict[str, Any]],
+    profile_dir: Path,
+    hook: str,
+    exit_code: int,
+    invocation: Optional[Dict[str, Optional[str]]] = None,
+) -> None:
+    """
+    寫入一筆剖析明細；token 為 None（未開啟）時不做事，I/O 失敗吞掉
+
+    Args:
+        invocation: hook stdin 欄位（hook_telemetry.current_invocation()）
+    """
+    if token is None:
+        return
+    main_ms = (time.perf_counter() - token["perf"]) * 1000.0
+    invocation = invocation or {}
+    event = invocation.get("event") or ""
+    entry = {
+        "hook": hook,
+        "chain": _chain_key(event, invocation.get("tool_name")),
+        "event": event,
+        "session": invocation.get("session_id") or "",
+        "tool_use_id": invocation.get("tool_use_id") or "",
+        "start": round(token["start"], 4),
+        "end": round(token["main_start"] + main_ms / 1000.0, 4),
+        "import_ms": round((token["main_start"] - token["start"]) * 1000.0, 2),
+        "main_ms": round(main_ms, 2),
+        "subprocesses": _state["subprocesses"] - token["subprocesses"],
+        "exit_code": exit_code,
+    }
+    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    segment = profile_dir / _segment_name(datetime.fromtimestamp(entry["start"]))
+    try:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(segment), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+# ============================================================================
+# 讀取
+# ============================================================================
+
+def _segment_day(path: Path) -> Optional[datetime]:
+    stem = path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+    try:
+        return datetime.strptime(stem, SEGMENT_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def _segments(profile_dir: Path) -> List[Path]:
+    try:
+        return sorted(profile_dir.glob("{}*{}".format(SEGMENT_PREFIX, SEGMENT_SUFFIX)))
+    except OSError:
+        return []
+
+
+def _to_record(entry: Dict[str, Any]) -> ProfileRecord:
+    return ProfileRecord(
+        hook=str(entry["hook"]),
+        chain=str(entry.get("chain") or entry.get("event") or ""),
+        event=str(entry.get("event") or ""),
+        session=str(entry.get("session") or ""),
+        tool_use_id=str(entry.get("tool_use_id") or ""),
+        start=float(entry["start"]),
+        end=float(entry["end"]),
+        import_ms=float(entry.get("import_ms") or 0.0),
+        main_ms=float(entry.get("main_ms") or 0.0),
+        subprocesses=int(entry.get("subprocesses") or 0),
+        exit_code=int(entry.get("exit_code") or 0),
+    )
+
+
+def iter_profiles(profile_dir: Path, since: Optional[datetime] = None) -> Iterator[ProfileRecord]:
+    """依時間順序讀出剖析明細（since 之前的 segment 整檔略過；壞行略過）"""
+    since_ts = since.timestamp() if since is not None else None
+    since_day = since.replace(hour=0, minute=0, second=0, microsecond=0) if since else None
+    for segment in _segments(profile_dir):
+        day = _segment_day(segment)
+        if since_day is not None and day is not None and day < since_day:
+            continue
+        try:
+            with open(segment, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = _to_record(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    if since_ts is None or record.start >= since_ts:
+                        yield record
+        except OSError:
+            continue
+
+
+def prune(profile_dir: Path, now: Optional[datetime] = None) -> None:
+    """刪除超過 RETENTION_DAYS 的 segment"""
+    now = now or datetime.now()
+    cutoff = (now - timedelta(days=RETENTION_DAYS)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    for segment in _segments(profile_dir):
+        day = _segment_day(segment)
+        if day is not None and day < cutoff:
+            try:
+                segment.unlink()
+            except OSError:
+                pass
+
+
+# ============================================================================
+# 彙總
+# ============================================================================
+
+def percentile(values: List[float], q: float) -> float:
+    """最近秩（nearest-rank）百分位數；values 須已排序且非空"""
+    rank = max(1, int(math.ceil(q / 100.0 * len(values))))
+    return values[min(rank, len(values)) - 1]
+
+
+def _percentiles(values: Iterable[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {name: round(percentile(ordered, q), 2) for name, q in PERCENTILES}
+
+
+def load_budgets(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    讀取預算設定（缺檔或格式錯誤時用 DEFAULT_BUDGETS）
+
+    設定格式（.claude/config/hook-budget.yaml）：
+        percentile: p95          # 與預算比較的百分位（p50 / p95 / p99）
+        hook_ms: 200             # 單支 hook 預設預算（import + main）
+        chain_ms: 1000           # 單條 event+matcher 鏈預設預算（牆鐘）
+        hooks: {<hook>: <ms>}    # 個別覆寫
+        chains: {<event>/<matcher>: <ms>}
+    """
+    if config is None:
+        # 延遲 import：config_loader 連帶載入 pyyaml，run_hook_safely 熱路徑用不到
+        try:
+            from .config_loader import load_config
+        except ImportError:
+            # 以頂層模組載入（`.claude/lib` 在 sys.path）— 同 pm_registry 的退回方式
+            from config_loader import load_config  # type: ignore[no-redef]
+        try:
+            config = load_config(BUDGET_CONFIG_NAME)
+        except (FileNotFoundError, ValueError):
+            config = {}
+    budgets = dict(DEFAULT_BUDGETS)
+    for key, value in (config or {}).items():
+        if key in budgets and value is not None:
+            budgets[key] = value
+    if budgets["percentile"] not in dict(PERCENTILES):
+        budgets["percentile"] = DEFAULT_BUDGETS["percentile"]
+    return budgets
+
+
+def group_chain_runs(records: Iterable[ProfileRecord]) -> List[List[ProfileRecord]]:
+    """把明細分成「同一次鏈觸發」的群組（分組規則見模組說明）"""
+    runs: List[List[ProfileRecord]] = []
+    by_tool_use: Dict[tuple, List[ProfileRecord]] = {}
+    open_runs: Dict[tuple, List[ProfileRecord]] = {}
+    for record in sorted(records, key=lambda r: r.start):
+        if record.tool_use_id:
+            key = (record.session, record.chain, record.tool_use_id)
+            run = by_tool_use.get(key)
+            if run is None:
+                run = by_tool_use[key] = []
+                runs.append(run)
+            run.append(record)
+            continue
+        key = (record.session, record.chain)
+        run = open_runs.get(key)
+        if run is None or record.start - run[0].start > CHAIN_WINDOW_S:
+            run = open_runs[key] = []
+            runs.append(run)
+        run.append(record)
+    return runs
+
+
+def summarize_profiles(
+    records: Iterable[ProfileRecord],
+    budgets: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    每支 hook 與每條鏈的延遲分佈與預算判定
+
+    Returns:
+        {"hooks": {hook: stats}, "chains": {chain: stats}}；stats 含 count、
+        p50/p95/p99（ms）、budget_ms、over_budget；hook 另含 import / main 的
+        p50 與平均子行程數，鏈另含組成 hook 清單
+    """
+    budgets = budgets if budgets is not None else load_budgets()
+    metric = budgets["percentile"]
+    records = list(records)
+
+    by_hook: Dict[str, List[ProfileRecord]] = {}
+    for record in records:
+        by_hook.setdefault(record.hook, []).append(record)
+
+    hooks: Dict[str, Dict[str, Any]] = {}
+    for hook, items in sorted(by_hook.items()):
+        stats: Dict[str, Any] = {"count": len(items)}
+        stats.update(_percentiles(r.total_ms for r in items))
+        stats["import_ms_p50"] = _percentiles(r.import_ms for r in items)["p50"]
+        stats["main_ms_p50"] = _percentiles(r.main_ms for r in items)["p50"]
+        stats["subprocesses_mean"] = round(sum(r.subprocesses for r in items) / len(items), 2)
+        stats["budget_ms"] = float((budgets["hooks"] or {}).get(hook, budgets["hook_ms"]))
+        stats["over_budget"] = stats[metric] > stats["budget_ms"]
+        hooks[hook] = stats
+
+    by_chain: Dict[str, List[List[ProfileRecord]]] = {}
+    for run in group_chain_runs(records):
+        by_chain.setdefault(run[0].chain, []).append(run)
+
+    chains: Dict[str, Dict[str, Any]] = {}
+    for chain, runs in sorted(by_chain.items()):
+        stats = {"count": len(runs)}
+        stats.update(_percentiles(
+            (max(r.end for r in run) - min(r.start for r in run)) * 1000.0 for run in runs
+        ))
+        stats["hooks"] = sorted({r.hook for run in runs for r in run})
+        stats["budget_ms"] = float((budgets["chains"] or {}).get(chain, budgets["chain_ms"]))
+        stats["over_budget"] = stats[metric] > stats["budget_ms"]
+        chains[chain] = stats
+
+    return {"hooks": hooks, "chains": chains}
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+批次 Hook 派發器（hook-runner）
+
+settings.json 對同一 event+matcher 註冊數十支 hook（PreToolUse/Bash 21 支、
+SessionStart 40 支），每支各自冷啟動直譯器、各自重跑 get_project_root()
+的 git 子行程。本模組讓 settings.json 只需對每個 event+matcher 註冊一次
+`.claude/hooks/hook-runner.py <event> [matcher]`，由單一行程依
+`.claude/config/hook-runner.yaml` 的群組清單逐支在行程內執行 hook、餵入
+同一份 stdin，最後合併各 hook 的輸出為 CC runtime 可直接消費的單一結果。
+
+單支 hook 的執行契約（與子行程執行等價）：
+- 以 `__main__` 身份執行腳本（沿用 lib.hook_daemon.run_hook_script），
+  hook 自身的 `sys.exit(run_hook_safely(main, ..., fail_closed=...))`
+  入口照常運作：main() 內的例外依各 hook 的 fail_closed 決定 exit 1 或 2
+- 逾時：以 SIGALRM 在 hook 內拋出 HookTimeoutError（Exception 子類別），
+  因此落在 run_hook_safely 之內的逾時同樣依 fail_closed 轉為 exit 1/2；
+  落在 hook 頂層（import 階段）的逾時比照頂層例外，exit 1（放行）
+- 隔離：每支 hook 各自的 stdin / stdout / stderr / argv / sys.path /
+  環境變數 / cwd 在執行後還原，一支 hook 的例外或逾時不影響下一支
+
+輸出合併（見 merge_results）：
+- 任一 hook exit 2：整體 exit 2，stderr 為所有阻擋 hook 的 stderr（deny-wins）
+- 否則合併各 hook 的 JSON 輸出：permissionDecision 依 deny > ask > allow
+  取最嚴格者、`decision: "block"` 與 `continue: false` 任一即生效，
+  additionalContext / systemMessage / reason 依註冊順序串接
+- 非 JSON 的純文字 stdout：SessionStart / UserPromptSubmit 併入
+  additionalContext（CC 對這兩個事件會把純文字 stdout 當作 context），
+  其餘事件改寫到 stderr（CC 對其純文字 stdout 僅在 transcript 模式顯示）
+
+平台限制：逾時依賴 SIGALRM（POSIX 主執行緒）；不可用時不強制逾時，
+由 settings.json 對 runner 本身設定的 timeout 兜底。
+"""
+
+import io
+import json
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from lib.hook_daemon import run_hook_script
+from lib.hook_profiler import ENV_CHAIN
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# 群組設定檔名稱（.claude/config/hook-runner.yaml）
+RUNNER_CONFIG_NAME = "hook-runner"
+
+# 未設定 timeout_ms 時的單支 hook 逾時（毫秒，與 CC runtime 預設一致）
+DEFAULT_HOOK_TIMEOUT_MS = 60000
+
+# permissionDecision 嚴格度：數字越大越嚴格，合併時取最大者
+DECISION_PRECEDENCE = {"allow": 0, "ask": 1, "deny": 2}
+
+# 純文字 stdout 會被 CC 當作 context 注入的事件
+PLAIN_STDOUT_CONTEXT_EVENTS = frozenset({"SessionStart", "UserPromptSubmit"})
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_DENY = 2
+
+_CLAUDE_DIR = Path(__file__).resolve().parent.parent
+
+
+class HookTimeoutError(Exception):
+    """單支 hook 超過 timeout_ms（刻意繼承 Exception，交由 run_hook_safely 處理）"""
+
+
+# ============================================================================
+# 資料結構
+# ============================================================================
+
+@dataclass
+class HookSpec:
+    """群組內單支 hook 的設定"""
+    script: Path
+    timeout_ms: int = DEFAULT_HOOK_TIMEOUT_MS
+
+    @property
+    def name(self) -> str:
+        return self.script.stem
+
+
+@dataclass
+class HookRunResult:
+    """單支 hook 的執行結果"""
+    name: str
+    exit_code: int
+    stdout: str = ""
+    stderr: str = ""
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+
+@dataclass
+class MergedOutput:
+    """整個群組合併後的輸出"""
+    exit_code: int
+    stdout: str = ""
+    stderr: str = ""
+    results: List[HookRunResult] = field(default_factory=list)
+
+
+# ============================================================================
+# 群組設定
+# ============================================================================
+
+def group_key(event: str, matcher: Optional[str] = None) -> str:
+    """組出群組鍵：有 matcher 為 "<event>/<matcher>"，否則為 "<event>" """
+    return "{}/{}".format(event, matcher) if matcher else event
+
+
+def _load_runner_config(claude_dir: Path) -> dict:
+    """讀取 runner 自身所在 .claude/ 的群組設定
+
+    刻意不用 config_loader.load_config：後者依 CLAUDE_PROJECT_DIR 定位，
+    而群組內的腳本路徑是相對於 runner 所在的 .claude/ 解析，兩者必須同源。
+    """
+    import yaml
+
+    path = claude_dir / "config" / "{}.yaml".format(RUNNER_CONFIG_NAME)
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def load_group(
+    event: str,
+    matcher: Optional[str] = None,
+    config: Optional[dict] = None,
+    claude_dir: Path = _CLAUDE_DIR,
+) -> List[HookSpec]:
+    """讀取指定 event+matcher 的 hook 清單
+
+    群組設定格式（腳本路徑相對於 .claude/）：
+        groups:
+          PreToolUse/Bash:
+            - script: hooks/bare-commit-guard-hook.py
+            - script: hooks/phase4-decision-enforcement-hook.py
+              timeout_ms: 5000
+
+    Args:
+        config: 已解析的設定（測試注入）；None 時讀取 claude_dir/config/hook-runner.yaml
+
+    Raises:
+        KeyError: 設定中沒有該群組
+    """
+    if config is None:
+        config = _load_runner_config(claude_dir)
+    groups = config.get("groups") or {}
+    key = group_key(event, matcher)
+    if key not in groups:
+        raise KeyError("hook-runner 設定沒有群組: {}".format(key))
+
+    specs = []
+    for entry in groups[key] or []:
+        if isinstance(entry, str):
+            entry = {"script": entry}
+        specs.append(HookSpec(
+            script=claude_dir / entry["script"],
+            timeout_ms=int(entry.get("timeout_ms") or DEFAULT_HOOK_TIMEOUT_MS),
+        ))
+    return specs
+
+
+# ============================================================================
+# 單支 hook 執行
+# ============================================================================
+
+def _timeout_supported() -> bool:
+    import threading
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+def _raise_timeout(signum, frame):
+    raise HookTimeoutError("hook 執行逾時")
+
+
+def run_one(spec: HookSpec, raw_input: str) -> HookRunResult:
+    """在本行程內執行單支 hook，執行後還原所有行程層級狀態"""
+    saved = {
+        "stdin": sys.stdin,
+        "stdout": sys.stdout,
+        "stderr": sys.stderr,
+        "argv": sys.argv,
+        "path": list(sys.path),
+        "environ": dict(os.environ),
+        "cwd": os.getcwd(),
+    }
+    out, err = io.StringIO(), io.StringIO()
+    sys.stdin = io.StringIO(raw_input)
+    sys.stdout, sys.stderr = out, err
+    sys.argv = [str(spec.script)]
+
+    use_timer = _timeout_supported()
+    previous_handler = None
+    if use_timer:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, spec.timeout_ms / 1000.0)
+
+    start = time.monotonic()
+    timed_out = False
+    try:
+        exit_code = run_hook_script(spec.script)
+    except HookTimeoutError:
+        # 極端時序：逾時恰好落在 run_hook_script 的例外處理之外
+        exit_code = EXIT_ERROR
+    finally:
+        if use_timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        elapsed = time.monotonic() - start
+        timed_out = use_timer and elapsed >= spec.timeout_ms / 1000.0
+        sys.stdin, sys.stdout, sys.stderr = saved["stdin"], saved["stdout"], saved["stderr"]
+        sys.argv = saved["argv"]
+        sys.path[:] = saved["path"]
+        if dict(os.environ) != saved["environ"]:
+            os.environ.clear()
+            os.environ.update(saved["environ"])
+        try:
+            os.chdir(saved["cwd"])
+        except OSError:
+            pass
+
+    return HookRunResult(
+        name=spec.name,
+        exit_code=exit_code,
+        stdout=out.getvalue(),
+        stderr=err.getvalue(),
+        elapsed=elapsed,
+        timed_out=timed_out,
+    )
+
+
+# ============================================================================
+# 輸出合併
+# ============================================================================
+
+def _parse_json_output(stdout: str) -> Optional[dict]:
+    text = stdout.strip()
+    if not text.startswith("{"):
+        return None
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _join(parts: List[str]) -> str:
+    return "\n\n".join(p for p in parts if p)
+
+
+def merge_results(event: str, results: List[HookRunResult]) -> MergedOutput:
+    """把群組內各 hook 的結果合併為單一 CC hook 輸出（deny-wins）"""
+    blocking = [r for r in results if r.exit_code == EXIT_DENY]
+    if blocking:
+        return MergedOutput(
+            exit_code=EXIT_DENY,
+            stderr=_join([r.stderr.rstrip("\n") for r in blocking]) + "\n",
+            results=results,
+        )
+
+    stderr_parts: List[str] = []
+    plain_parts: List[str] = []
+    outputs: List[dict] = []
+    for r in results:
+        if r.timed_out:
+            stderr_parts.append("[hook-runner] {} 逾時（{:.1f}s）".format(r.name, r.elapsed))
+        if r.stderr.strip():
+            stderr_parts.append(r.stderr.rstrip("\n"))
+        parsed = _parse_json_output(r.stdout)
+        if parsed is not None:
+            outputs.append(parsed)
+        elif r.stdout.strip():
+            plain_parts.append(r.stdout.rstrip("\n"))
+
+    if plain_parts and event not in PLAIN_STDOUT_CONTEXT_EVENTS:
+        stderr_parts.extend(plain_parts)
+        plain_parts = []
+
+    if not outputs:
+        stdout = _join(plain_parts)
+        return MergedOutput(
+            exit_code=EXIT_OK,
+            stdout=stdout + "\n" if stdout else "",
+            stderr=_join(stderr_parts) + "\n" if stderr_parts else "",
+            results=results,
+        )
+
+    merged: Dict = {}
+    specific: Dict = {}
+    decision, decision_reasons = None, []
+    contexts, system_messages, block_reasons, stop_reasons = [], [], [], []
+    suppress = True
+    for output in outputs:
+        hso = output.get("hookSpecificOutput") or {}
+        candidate = hso.get("permissionDecision")
+        if candidate in DECISION_PRECEDENCE:
+            reason = hso.get("permissionDecisionReason") or ""
+            if decision is None or DECISION_PRECEDENCE[candidate] > DECISION_PRECEDENCE[decision]:
+                decision, decision_reasons = candidate, [reason]
+            elif candidate == decision:
+                decision_reasons.append(reason)
+        for key, value in hso.items():
+            if key not in ("hookEventName", "permissionDecision",
+                           "permissionDecisionReason", "additionalContext"):
+                specific.setdefault(key, value)
+        contexts.append(hso.get("additionalContext") or "")
+        system_messages.append(output.get("systemMessage") or "")
+        if output.get("decision") == "block":
+            block_reasons.append(output.get("reason") or "")
+        if output.get("continue") is False:
+            stop_reasons.append(output.get("stopReason") or "")
+        suppress = suppress and bool(output.get("suppressOutput"))
+
+    contexts.extend(plain_parts)
+    if decision is not None:
+        specific["permissionDecision"] = decision
+        specific["permissionDecisionReason"] = _join(decision_reasons)
+    if _join(contexts):
+        specific["additionalContext"] = _join(contexts)
+    if specific:
+        merged["hookSpecificOutput"] = dict({"hookEventName": event}, **specific)
+    if block_reasons:
+        merged["decision"] = "block"
+        merged["reason"] = _join(block_reasons)
+    if stop_reasons:
+        merged["continue"] = False
+        merged["stopReason"] = _join(stop_reasons)
+    if _join(system_messages):
+        merged["systemMessage"] = _join(system_messages)
+    if suppress:
+        merged["suppressOutput"] = True
+
+    return MergedOutput(
+        exit_code=EXIT_OK,
+        stdout=json.dumps(merged, ensure_ascii=False) + "\n",
+        stderr=_join(stderr_parts) + "\n" if stderr_parts else "",
+        results=results,
+    )
+
+
+def run_group(event: str, specs: List[HookSpec], raw_input: str) -> MergedOutput:
+    """依序在本行程內執行群組內所有 hook，回傳合併結果"""
+    return merge_results(event, [run_one(spec, raw_input) for spec in specs])
+
+
+# ============================================================================
+# 入口
+# ============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """hook-runner 入口：`hook-runner.py <event> [matcher]`"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        sys.stderr.write("用法: hook-runner.py <event> [matcher]\n")
+        return EXIT_ERROR
+    event = argv[0]
+    matcher = argv[1] if len(argv) > 1 else None
+
+    try:
+        specs = load_group(event, matcher)
+    except (KeyError, FileNotFoundError, ValueError) as e:
+        sys.stderr.write("[hook-runner] {}\n".format(e))
+        return EXIT_ERROR
+
+    raw_input = sys.stdin.read()
+    # 剖析模式以群組鍵歸屬 event+matcher 鏈（run_one 會把環境變數還原為此狀態）
+    os.environ[ENV_CHAIN] = group_key(event, matcher)
+    merged = run_group(event, specs, raw_input)
+    if merged.stdout:
+        sys.stdout.write(merged.stdout)
+    if merged.stderr:
+        sys.stderr.write(merged.stderr)
+    return merged.exit_code
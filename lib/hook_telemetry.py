@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Hook 執行遙測（append-only 二進位紀錄 + 增量彙總）
+
+背景：hook_health.scan_logs 以 setup_hook_logging 產生的逐次 .log 檔計算觸發
+頻率，每次掃描須 iterdir + stat hook-logs/ 下數萬個檔案，且 .log 檔只能回答
+「有沒有跑」，無法回答耗時、exit code 與決策。本模組由 run_hook_safely 於每次
+hook 執行結束時寫入一筆結構化紀錄，讀取端只需讀彙總檔與其後新增的紀錄。
+遙測啟用時 setup_hook_logging 改寫每日一個 .log 檔，不再逐次建檔。
+
+儲存位置：.claude/hook-logs/_telemetry/（底線開頭，scan_logs 的目錄巡覽自動略過；
+建立時附帶內容為 `*` 的 .gitignore，遙測檔不會出現在專案的未追蹤清單）
+- telemetry-v1-YYYYMMDD.bin：每日一個 segment（依本地日期輪替），超過
+  RETENTION_DAYS 的 segment 於彙總時刪除
+- rollup.json：依小時彙總的 (count, 耗時總和/最大值, error, block) 與各 hook
+  最後執行時間、事件分佈；記錄各 segment 已彙總的 byte offset
+
+紀錄格式（little-endian）：
+    RECORD_HEADER = <H d I h B B B>
+        總長度 | epoch 秒 | 耗時 µs | exit code | 決策 | hook 名長度 | 事件名長度
+    後接 hook 名與事件名（UTF-8）
+
+寫入：O_APPEND 單次 os.write，整筆紀錄於同一次系統呼叫寫入（不需鎖）。
+讀取：load_rollup() 從各 segment 已彙總 offset 續讀（O(新紀錄)），不完整的尾端
+紀錄（寫入中）留待下次。彙總檔以暫存檔 + os.replace 原子替換。
+
+環境變數 CLAUDE_HOOK_TELEMETRY=0 停用寫入。所有 I/O 失敗皆吞掉，遙測不可影響
+hook 本身。
+"""
+
+import contextlib
+import json
+import os
+import struct
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+TELEMETRY_SUBDIR = "_telemetry"
+SEGMENT_PREFIX = "telemetry-v1-"
+SEGMENT_SUFFIX = ".bin"
+SEGMENT_DATE_FORMAT = "%Y%m%d"
+ROLLUP_FILENAME = "rollup.json"
+ROLLUP_FORMAT_VERSION = 1
+
+# 遙測目錄自帶的忽略規則
+TELEMETRY_GITIGNORE_CONTENT = "*\n"
+
+# 小時桶 key 格式（本地時間，與 scan_logs 以 datetime.fromtimestamp 分日一致）
+HOUR_KEY_FORMAT = "%Y%m%d%H"
+
+# segment 與彙總保留天數（hook_health 基線為 7 天，保留兩倍）
+RETENTION_DAYS = 14
+
+ENV_TELEMETRY = "CLAUDE_HOOK_TELEMETRY"
+_DISABLED_VALUES = frozenset({"0", "false", "off", "no"})
+
+RECORD_HEADER = struct.Struct("<HdIhBBB")
+
+# 欄位上限（超出截斷，確保單筆紀錄長度可由 uint16 表示）
+MAX_NAME_BYTES = 255
+MAX_DURATION_US = 0xFFFFFFFF
+
+# 決策代碼（索引即二進位值）
+DECISION_ALLOW = "allow"          # exit 0
+DECISION_BLOCK = "block"          # exit 2（PreToolUse 等事件的 DENY / 阻擋）
+DECISION_ERROR = "error"          # 其他非 0 exit code
+DECISION_EXCEPTION = "exception"  # main_func 拋出未處理例外
+DECISION_ASK = "ask"              # hook 以 JSON 輸出 permissionDecision=ask
+DECISION_DENY = "deny"            # hook 以 JSON 輸出 permissionDecision=deny
+DECISIONS = (
+    DECISION_ALLOW, DECISION_BLOCK, DECISION_ERROR,
+    DECISION_EXCEPTION, DECISION_ASK, DECISION_DENY,
+)
+_DECISION_CODES = {name: code for code, name in enumerate(DECISIONS)}
+
+# 小時桶欄位順序
+BUCKET_FIELDS = ("count", "duration_ms_sum", "duration_ms_max", "errors", "blocks")
+
+# 目前 hook 執行的事件名與自報決策（run_hook_safely 每次執行前重設）
+_current: Dict[str, Optional[str]] = {
+    "event": None, "decision": None, "tool_name": None, "tool_use_id": None, "session_id": None,
+}
+
+
+class TelemetryRecord(NamedTuple):
+    ts: float
+    hook: str
+    event: str
+    duration_ms: float
+    exit_code: int
+    decision: str
+
+
+# ============================================================================
+# 寫入端
+# ============================================================================
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_TELEMETRY, "").strip().lower() not in _DISABLED_VALUES
+
+
+def begin_invocation() -> None:
+    """重設目前執行的事件名與決策（run_hook_safely 於 main_func 前呼叫）"""
+    for key in _current:
+        _current[key] = None
+
+
+def note_hook_event(input_data: Any) -> None:
+    """
+    自 hook stdin JSON 記下 hook_event_name（hook_io 讀取 stdin 時呼叫）
+
+    tool_name / tool_use_id / session_id 一併記下，供 lib/hook_profiler.py
+    歸屬 event+matcher 鏈與同次觸發的分組。
+    """
+    if isinstance(input_data, dict):
+        event = input_data.get("hook_event_name")
+        if isinstance(event, str):
+            _current["event"] = event
+        for key in ("tool_name", "tool_use_id", "session_id"):
+            value = input_data.get(key)
+            if isinstance(value, str):
+                _current[key] = value
+
+
+def current_invocation() -> Dict[str, Optional[str]]:
+    """回傳目前執行已記下的 stdin 欄位與決策（副本）"""
+    return dict(_current)
+
+
+def set_hook_decision(decision: str) -> None:
+    """
+    hook 自報決策（以 JSON 輸出 ask / deny 等、exit code 無法表達的情形）
+
+    hook_io 的輸出建構函式（create_pretooluse_output / generate_hook_output /
+    write_hook_output 等）遇 ask / deny / block 時自動呼叫。未呼叫時由 exit
+    code 推導（0=allow、2=block、其他=error）。
+    """
+    if decision in _DECISION_CODES:
+        _current["decision"] = decision
+
+
+def decision_for_exit_code(exit_code: int) -> str:
+    if exit_code == 0:
+        return DECISION_ALLOW
+    if exit_code == 2:
+        return DECISION_BLOCK
+    return DECISION_ERROR
+
+
+def _segment_name(day: datetime) -> str:
+    return "{}{}{}".format(SEGMENT_PREFIX, day.strftime(SEGMENT_DATE_FORMAT), SEGMENT_SUFFIX)
+
+
+def _encode_name(value: str) -> bytes:
+    return value.encode("utf-8")[:MAX_NAME_BYTES].decode("utf-8", "ignore").encode("utf-8")
+
+
+def encode_record(hook: str, event: str, duration_s: float, exit_code: int,
+                  decision: str, ts: float) -> bytes:
+    hook_bytes = _encode_name(hook)
+    event_bytes = _encode_name(event)
+    duration_us = min(MAX_DURATION_US, max(0, int(duration_s * 1_000_000)))
+    exit_code = max(-32768, min(32767, int(exit_code)))
+    size = RECORD_HEADER.size + len(hook_bytes) + len(event_bytes)
+    header = RECORD_HEADER.pack(
+        size, ts, duration_us, exit_code, _DECISION_CODES.get(decision, 0),
+        len(hook_bytes), len(event_bytes),
+    )
+    return header + hook_bytes + event_bytes
+
+
+def _ensure_telemetry_dir(telemetry_dir: Path) -> None:
+    """建立遙測目錄；僅在本次實際建立時寫入 .gitignore（已存在時不多做 stat）"""
+    try:
+        telemetry_dir.mkdir(parents=True)
+    except FileExistsError:
+        return
+    (telemetry_dir / ".gitignore").write_text(TELEMETRY_GITIGNORE_CONTENT, encoding="utf-8")
+
+
+def record_invocation(
+    telemetry_dir: Path,
+    hook: str,
+    duration_s: float,
+    exit_code: int,
+    decision: Optional[str] = None,
+    event: Optional[str] = None,
+    now: Optional[float] = None,
+) -> None:
+    """
+    附加一筆 hook 執行紀錄
+
+    Args:
+        telemetry_dir: .claude/hook-logs/_telemetry
+        hook: hook 名稱（與 hook-logs/ 子目錄同名，即淨化後名稱）
+        duration_s: 執行耗時（秒）
+        exit_code: hook 回傳的 exit code
+        decision: 決策；None 時取 hook 自報值，再退回依 exit code 推導
+        event: 事件名；None 時取 stdin 的 hook_event_name（未讀取則為空字串）
+        now: epoch 秒（測試注入）
+    """
+    if not is_enabled():
+        return
+    ts = time.time() if now is None else now
+    decision = decision or _current["decision"] or decision_for_exit_code(exit_code)
+    event = event if event is not None else (_current["event"] or "")
+    payload = encode_record(hook, event, duration_s, exit_code, decision, ts)
+    segment = telemetry_dir / _segment_name(datetime.fromtimestamp(ts))
+    try:
+        _ensure_telemetry_dir(telemetry_dir)
+        fd = os.open(str(segment), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+# ============================================================================
+# 讀取端
+# ============================================================================
+
+def _decode_records(data: bytes, start: int = 0) -> Tuple[List[TelemetryRecord], int]:
+    """解碼 data[start:] 中完整的紀錄；回傳 (紀錄, 已解碼至的 offset)"""
+    records: List[TelemetryRecord] = []
+    offset = start
+    header_size = RECORD_HEADER.size
+    end = len(data)
+    while offset + header_size <= end:
+        size, ts, duration_us, exit_code, decision, hook_len, event_len = (
+            RECORD_HEADER.unpack_from(data, offset)
+        )
+        if size != header_size + hook_len + event_len:
+            # 格式不符（損毀）：停止解碼，避免錯位讀出垃圾紀錄
+            break
+        if offset + size > end:
+            break
+        name_start = offset + header_size
+        hook = data[name_start:name_start + hook_len].decode("utf-8", "replace")
+        event = data[name_start + hook_len:offset + size].decode("utf-8", "replace")
+        records.append(TelemetryRecord(
+            ts=ts,
+            hook=hook,
+            event=event,
+            duration_ms=duration_us / 1000.0,
+            exit_code=exit_code,
+            decision=DECISIONS[decision] if decision < len(DECISIONS) else DECISION_ERROR,
+        ))
+        offset += size
+    return records, offset
+
+
+def _segments(telemetry_dir: Path) -> List[Path]:
+    try:
+        return sorted(
+            path for path in telemetry_dir.iterdir()
+            if path.name.startswith(SEGMENT_PREFIX) and path.name.endswith(SEGMENT_SUFFIX)
+        )
+    except OSError:
+        return []
+
+
+def _segment_day(path: Path) -> Optional[datetime]:
+    stamp = path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+    try:
+        return datetime.strptime(stamp, SEGMENT_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def _read_from(path: Path, offset: int) -> bytes:
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return f.read()
+    except OSError:
+        return b""
+
+
+def iter_records(telemetry_dir: Path, since: Optional[datetime] = None) -> Iterator[TelemetryRecord]:
+    """逐筆讀取原始紀錄（供百分位數等彙總檔無法回答的查詢）"""
+    since_ts = since.timestamp() if since is not None else None
+    since_day = since.replace(hour=0, minute=0, second=0, microsecond=0) if since else None
+    for segment in _segments(telemetry_dir):
+        day = _segment_day(segment)
+        if since_day is not None and day is not None and day < since_day:
+            continue
+        records, _ = _decode_records(_read_from(segment, 0))
+        for record in records:
+            if since_ts is None or record.ts >= since_ts:
+                yield record
+
+
+def _empty_rollup() -> Dict[str, Any]:
+    return {
+        "version": ROLLUP_FORMAT_VERSION,
+        "first_ts": None,
+        "segments": {},
+        "hours": {},
+        "hooks": {},
+    }
+
+
+def _load_rollup_file(rollup_path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(rollup_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return _empty_rollup()
+    if not isinstance(data, dict) or data.get("version") != ROLLUP_FORMAT_VERSION:
+        return _empty_rollup()
+    return data
+
+
+def _fold(rollup: Dict[str, Any], records: List[TelemetryRecord]) -> None:
+    hours = rollup["hours"]
+    hooks = rollup["hooks"]
+    for record in records:
+        if rollup["first_ts"] is None or record.ts < rollup["first_ts"]:
+            rollup["first_ts"] = record.ts
+        hour_key = datetime.fromtimestamp(record.ts).strftime(HOUR_KEY_FORMAT)
+        bucket = hours.setdefault(hour_key, {}).setdefault(record.hook, [0, 0.0, 0.0, 0, 0])
+        bucket[0] += 1
+        bucket[1] = round(bucket[1] + record.duration_ms, 3)
+        bucket[2] = max(bucket[2], record.duration_ms)
+        if record.decision in (DECISION_ERROR, DECISION_EXCEPTION):
+            bucket[3] += 1
+        elif record.decision in (DECISION_BLOCK, DECISION_DENY):
+            bucket[4] += 1
+
+        info = hooks.setdefault(record.hook, {"last_ts": 0.0, "events": {}})
+        info["last_ts"] = max(info["last_ts"], record.ts)
+        if record.event:
+            info["events"][record.event] = info["events"].get(record.event, 0) + 1
+
+
+def _save_rollup(rollup_path: Path, rollup: Dict[str, Any]) -> None:
+    tmp_path = rollup_path.with_name("{}.{}.tmp".format(rollup_path.name, os.getpid()))
+    try:
+        tmp_path.write_text(json.dumps(rollup, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, rollup_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
+def load_rollup(telemetry_dir: Path, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    讀取彙總並納入各 segment 新增的紀錄（增量，O(新紀錄)）
+
+    同時刪除超過 RETENTION_DAYS 的 segment 與小時桶。
+
+    Returns:
+        dict: {"first_ts", "segments", "hours": {YYYYMMDDHH: {hook: [BUCKET_FIELDS...]}},
+               "hooks": {hook: {"last_ts", "events"}}}；無遙測資料時 first_ts 為 None
+    """
+    rollup_path = telemetry_dir / ROLLUP_FILENAME
+    rollup = _load_rollup_file(rollup_path)
+    segments = _segments(telemetry_dir)
+    if not segments and not rollup["segments"]:
+        return rollup
+
+    now = now or datetime.now()
+    cutoff_day = (now - timedelta(days=RETENTION_DAYS)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    changed = False
+    offsets = rollup["segments"]
+    present = set()
+    for segment in segments:
+        day = _segment_day(segment)
+        if day is not None and day < cutoff_day:
+            with contextlib.suppress(OSError):
+                segment.unlink()
+            continue
+        present.add(segment.name)
+        start = offsets.get(segment.name, 0)
+        try:
+            if segment.stat().st_size <= start:
+                continue
+        except OSError:
+            continue
+        data = _read_from(segment, start)
+        records, consumed = _decode_records(data)
+        if consumed:
+            _fold(rollup, records)
+            offsets[segment.name] = start + consumed
+            changed = True
+
+    for name in set(offsets) - present:
+        del offsets[name]
+        changed = True
+    cutoff_key = cutoff_day.strftime(HOUR_KEY_FORMAT)
+    for hour_key in [key for key in rollup["hours"] if key < cutoff_key]:
+        del rollup["hours"][hour_key]
+        changed = True
+
+    if changed:
+        _save_rollup(rollup_path, rollup)
+    return rollup
+
+
+def summarize(rollup: Dict[str, Any], since: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    依 hook 彙總小時桶（since 以小時為粒度，含 since 所在小時）
+
+    Returns:
+        dict: hook -> {"total", "per_day": {YYYY-MM-DD: n}, "errors", "blocks",
+                       "duration_ms_mean", "duration_ms_max"}
+    """
+    since_key = since.strftime(HOUR_KEY_FORMAT) if since is not None else ""
+    result: Dict[str, Dict[str, Any]] = {}
+    for hour_key, by_hook in rollup.get("hours", {}).items():
+        if hour_key < since_key:
+            continue
+        day_str = "{}-{}-{}".format(hour_key[:4], hour_key[4:6], hour_key[6:8])
+        for hook, bucket in by_hook.items():
+            count, duration_sum, duration_max, errors, blocks = bucket
+            entry = result.setdefault(hook, {
+                "total": 0, "per_day": {}, "errors": 0, "blocks": 0,
+                "duration_ms_sum": 0.0, "duration_ms_max": 0.0,
+            })
+            entry["total"] += count
+            entry["per_day"][day_str] = entry["per_day"].get(day_str, 0) + count
+            entry["errors"] += errors
+            entry["blocks"] += blocks
+            entry["duration_ms_sum"] += duration_sum
+            entry["duration_ms_max"] = max(entry["duration_ms_max"], duration_max)
+    for entry in result.values():
+        duration_sum = entry.pop("duration_ms_sum")
+        entry["duration_ms_mean"] = duration_sum / entry["total"] if entry["total"] else 0.0
+    return result
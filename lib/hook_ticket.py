@@ -18,14 +18,14 @@ Hook Ticket 操作模組
 - validate_ticket_has_decision_tree(ticket_content, logger)
 """
 
+import json
 import logging
+import os
 import re
 from datetime import date, datetime
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
-import yaml
-
 from .hook_base import get_project_root
 
 # ============================================================================
@@ -105,7 +105,8 @@ def parse_ticket_frontmatter(
 ) -> dict:
     """統一的 YAML frontmatter 解析（支援 str 和 Path 輸入）
 
-    改用 `yaml.safe_load` 解析 frontmatter 本體，取代舊有手寫逐行 parser。
+    以 `yaml.safe_load` 語意解析 frontmatter 本體（經 yaml_frontmatter 共用
+    服務加速），取代舊有手寫逐行 parser。
     舊 parser 對 pyyaml 折行輸出（`yaml.dump` 預設 width=80）與 flow-style
     空容器（`{}`/`[]`）等語法無法正確還原，公開契約與 fail-safe 語意詳見
     下方。
@@ -137,11 +138,16 @@ def parse_ticket_frontmatter(
     if not frontmatter_text:
         return {}
 
-    # 步驟 3：以 yaml.safe_load 解析。fail-safe 語意：解析失敗（語法錯誤）
+    # 步驟 3：以 yaml_frontmatter.load_yaml 解析（結果同 yaml.safe_load，
+    # 扁平 frontmatter 走快速路徑）。fail-safe 語意：解析失敗（語法錯誤）
     # 或頂層結果非 dict（如純量、list）皆視為解析失敗，回空 dict + warning，
     # 不拋例外中斷呼叫端（既有公開契約，供 hook 安全呼叫）。
+    # 延後 import：yaml_frontmatter 連帶載入 pyyaml（約 20ms），只 import
+    # hook_ticket 而放行路徑不解析 ticket 的 hook 不付此成本
     try:
-        result = yaml.safe_load(frontmatter_text)
+        from .yaml_frontmatter import load_yaml
+
+        result = load_yaml(frontmatter_text)
     except Exception as e:
         if logger:
             logger.warning("解析 frontmatter 失敗: {}".format(e))
@@ -866,6 +872,14 @@ def validate_ticket_unified(
 # Ticket md 掃描的排除路徑片段（archive / backup 目錄統一排除）
 _EXCLUDED_PATH_SEGMENTS = ("archive", "archived", "backup", "backups")
 
+# ticket CLI 維護的 in_progress 登錄檔（相對 docs/work-logs）。路徑與格式版本
+# 需與 skills/ticket/ticket_system/lib/in_progress_registry.py 一致
+IN_PROGRESS_REGISTRY_RELPATH = Path(".index") / "in-progress.json"
+IN_PROGRESS_REGISTRY_VERSION = 3
+_TICKET_GLOB = "v*/**/tickets/*.md"
+# 與 hook_logging.ENV_SESSION_ID 一致（不 import hook_logging，維持本模組輕量）
+_ENV_SESSION_ID = "CLAUDE_CODE_SESSION_ID"
+
 
 def _is_excluded_ticket_path(path: Path) -> bool:
     """判斷 ticket md 路徑是否落在 archive/backup 目錄。
@@ -879,6 +893,84 @@ def _is_excluded_ticket_path(path: Path) -> bool:
     return False
 
 
+def _registry_dirs_match(work_logs_dir: Path, dirs: object) -> bool:
+    """登錄的各目錄 mtime_ns 是否仍與現況相同（只 stat 登錄的目錄）。
+
+    dirs 由 in_progress_registry.directory_stamps 產生：{相對路徑: [mtime_ns, .md 檔數]}，
+    涵蓋 work_logs 根目錄與 v* 之下全部目錄；新增 / 刪除 / 改名票檔或新建
+    目錄都會改變其中之一。
+    """
+    if not isinstance(dirs, dict) or "." not in dirs:
+        return False
+    for relative, stamp in dirs.items():
+        if not isinstance(stamp, list) or not stamp:
+            return False
+        try:
+            if (work_logs_dir / relative).stat().st_mtime_ns != stamp[0]:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _read_in_progress_registry(
+    work_logs_dir: Path,
+    logger: Optional[logging.Logger] = None,
+) -> Tuple[bool, Optional[dict]]:
+    """以 ticket CLI 的 in_progress 登錄檔找出進行中 ticket（不列舉票檔）。
+
+    成本為讀一個 JSON、stat 登錄的目錄與 in_progress 票檔、解析選中的一張票，
+    與票檔總數無關。
+
+    登錄項依「同 session 認領優先、再依 mtime 由新到舊」排序後取第一筆。
+    下列情況視為不一致，回傳 (False, None) 交由呼叫端回退全掃描：
+    - 登錄檔不存在 / 無法解析 / 版本不符
+    - 任一登錄目錄的 mtime 與登錄時不同：新增 / 刪除 / 改名票檔、git pull
+      等 CLI 以外的改動
+    - 任一登錄票檔不存在，或 mtime 與登錄時不同（CLI 以外的改動）
+    - 選中的票 frontmatter 已非 in_progress 或 id 不符
+
+    Returns:
+        (是否可信, frontmatter dict 或 None)；可信且登錄為空時為 (True, None)
+    """
+    try:
+        with open(work_logs_dir / IN_PROGRESS_REGISTRY_RELPATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(data, dict) or data.get("version") != IN_PROGRESS_REGISTRY_VERSION:
+        return False, None
+    tickets = data.get("tickets")
+    if not isinstance(tickets, dict):
+        return False, None
+    if not _registry_dirs_match(work_logs_dir, data.get("dirs")):
+        return False, None
+
+    session = os.environ.get(_ENV_SESSION_ID, "").strip()
+    entries = []
+    for ticket_id, entry in tickets.items():
+        if not isinstance(entry, dict) or not isinstance(entry.get("path"), str):
+            return False, None
+        path = work_logs_dir / entry["path"]
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return False, None
+        if mtime_ns != entry.get("mtime_ns"):
+            return False, None
+        owned = bool(session) and entry.get("session") == session
+        entries.append((owned, mtime_ns, ticket_id, path))
+
+    if not entries:
+        return True, None
+
+    _owned, _mtime, ticket_id, path = max(entries, key=lambda e: (e[0], e[1]))
+    fm = parse_ticket_frontmatter(path, logger)
+    if not fm or fm.get("status") != "in_progress" or str(fm.get("id")) != ticket_id:
+        return False, None
+    return True, fm
+
+
 def find_active_in_progress_ticket(
     project_root: Optional[Path] = None,
     logger: Optional[logging.Logger] = None,
@@ -888,6 +980,9 @@ def find_active_in_progress_ticket(
     W11-021 統一入口：
     - process-skip-guard / commit-handoff / file-ownership-guard 共用此函式
     - 使用 hook_utils.get_project_root（支援 worktree / CLAUDE_PROJECT_DIR）
+    - 先讀 ticket CLI 維護的 in_progress 登錄檔（docs/work-logs/.index/
+      in-progress.json，單檔讀取 + 登錄目錄與 in_progress 票檔的 stat，不列舉
+      票檔），同 session 認領的票優先；登錄檔缺失或與現況不一致時回退下列全掃描
     - glob pattern 限定 docs/work-logs/v*/**/tickets/*.md 並排除 archive/backup
     - 依 mtime 由新到舊排序，遇第一個 in_progress 立即返回（hot path 命中第一個 << 100ms）
 
@@ -913,10 +1008,18 @@ def find_active_in_progress_ticket(
             logger.debug("work-logs 目錄不存在: {}".format(work_logs_dir))
         return None
 
+    trusted, fm = _read_in_progress_registry(work_logs_dir, logger)
+    if trusted:
+        if logger:
+            logger.debug("in_progress 登錄檔命中: {}".format(fm.get("id") if fm else None))
+        return fm
+    if logger:
+        logger.debug("in_progress 登錄檔缺失或不一致，回退全掃描")
+
     try:
         # glob 限定 docs/work-logs/v*/**/tickets/*.md（thyme 視角：排除非版本目錄）
         candidates = [
-            p for p in work_logs_dir.glob("v*/**/tickets/*.md")
+            p for p in work_logs_dir.glob(_TICKET_GLOB)
             if not _is_excluded_ticket_path(p)
         ]
         # 依 mtime 由新到舊排序，命中第一個 in_progress 即返回
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Hook import 成本稽核（python -X importtime）
+
+背景：hook 每次觸發都是冷啟動的直譯器，頂層 import 的成本在每次工具呼叫都
+重付一次；放行路徑（絕大多數觸發）用不到的 pyyaml、子行程工具、訊息目錄
+若在頂層 import，就是純粹的啟動延遲。本模組對 settings.json 註冊的每支
+hook 以 `python -X importtime` 只執行其模組頂層（runpy.run_path 以非
+`__main__` 名稱載入，`if __name__ == "__main__"` 區塊不執行、不讀 stdin），
+解析 importtime 輸出，回報每支 hook 的累計 import 成本與最重的頂層模組。
+
+量測口徑：
+- 先以空腳本跑一次同樣的載入器作為基線，基線已載入的模組（直譯器啟動、
+  runpy 本身）不計入 hook 成本
+- hook 成本 = 非基線的頂層（depth 0）import 項目 cumulative 總和；
+  巢狀 import 已含在其父項目的 cumulative 內
+- --repeat N 取 N 次中總成本最低的一次（降低磁碟快取與排程雜訊）
+
+執行：python3 .claude/lib/import_audit.py [--settings PATH] [--project-dir DIR]
+      [--top N] [--repeat N] [--budget-ms MS] [--format table|json]
+
+lib 套件本身為惰性載入（見 lib/__init__.py），稽核結果中的 lib.* 項目即
+hook 實際用到的模組。
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+# 直接以腳本執行時，lib 套件本身尚不在 sys.path
+_CLAUDE_DIR = Path(__file__).resolve().parent.parent
+if str(_CLAUDE_DIR) not in sys.path:
+    sys.path.insert(0, str(_CLAUDE_DIR))
+
+from lib.hook_daemon import registered_hook_scripts  # noqa: E402
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# 只執行模組頂層的載入器：以非 __main__ 名稱 run_path，hook 主流程不會執行
+LOADER_CODE = (
+    "import runpy, sys; path = sys.argv[1]; sys.argv = [path]; "
+    "runpy.run_path(path, run_name='__import_audit__')"
+)
+IMPORTTIME_PREFIX = "import time:"
+
+# 單支 hook 載入逾時（秒）
+AUDIT_TIMEOUT_SECONDS = 30
+
+DEFAULT_TOP = 3
+DEFAULT_BUDGET_MS = 50.0
+
+FORMAT_TABLE = "table"
+FORMAT_JSON = "json"
+
+
+class ImportEntry(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class HookImportCost:
+    """單支 hook 的 import 成本（error 非空時其餘欄位無意義）"""
+
+    script: str
+    import_ms: float = 0.0
+    module_count: int = 0
+    top: List[Dict[str, float]] = field(default_factory=list)
+    over_budget: bool = False
+    error: str = ""
+
+
+# ============================================================================
+# importtime 解析
+# ============================================================================
+
+def parse_importtime(stderr: str) -> List[ImportEntry]:
+    """
+    解析 `-X importtime` 的 stderr
+
+    行格式：`import time: <self us> | <cumulative us> | <縮排><模組名>`，
+    縮排每層兩個空白。表頭與非 importtime 行略過。
+    """
+    entries: List[ImportEntry] = []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        parts = line[len(IMPORTTIME_PREFIX):].split("|", 2)
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # 表頭：self [us] | cumulative | imported package
+        raw_name = parts[2][1:] if parts[2].startswith(" ") else parts[2]
+        name = raw_name.lstrip(" ")
+        entries.append(ImportEntry(name, self_us, cumulative_us, (len(raw_name) - len(name)) // 2))
+    return entries
+
+
+def _run_importtime(script: Path, python: str, env: Dict[str, str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [python, "-X", "importtime", "-c", LOADER_CODE, str(script)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=AUDIT_TIMEOUT_SECONDS,
+        env=env,
+        cwd=env.get("CLAUDE_PROJECT_DIR") or str(script.parent),
+    )
+
+
+def baseline_modules(python: str = sys.executable, env: Optional[Dict[str, str]] = None) -> frozenset:
+    """以空腳本跑載入器，回傳直譯器啟動 + 載入器本身已載入的模組名"""
+    with tempfile.TemporaryDirectory() as tmp:
+        empty = Path(tmp) / "empty.py"
+        empty.write_text("", encoding="utf-8")
+        result = _run_importtime(empty, python, env or dict(os.environ))
+    return frozenset(entry.name for entry in parse_importtime(result.stderr))
+
+
+def audit_script(
+    script: Path,
+    baseline: frozenset,
+    *,
+    python: str = sys.executable,
+    env: Optional[Dict[str, str]] = None,
+    repeat: int = 1,
+    top: int = DEFAULT_TOP,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+) -> HookImportCost:
+    """量測單支 hook 模組頂層的 import 成本"""
+    cost = HookImportCost(script=str(script))
+    if not script.is_file():
+        cost.error = "script not found"
+        return cost
+
+    best: Optional[List[ImportEntry]] = None
+    for _ in range(max(1, repeat)):
+        try:
+            result = _run_importtime(script, python, env or dict(os.environ))
+        except subprocess.TimeoutExpired:
+            cost.error = "timeout after {}s".format(AUDIT_TIMEOUT_SECONDS)
+            return cost
+        if result.returncode != 0:
+            lines = [line for line in result.stderr.splitlines()
+                     if line and not line.startswith(IMPORTTIME_PREFIX)]
+            cost.error = lines[-1] if lines else "exit {}".format(result.returncode)
+            return cost
+        own = [e for e in parse_importtime(result.stderr) if e.name not in baseline]
+        if best is None or _top_level_us(own) < _top_level_us(best):
+            best = own
+
+    top_level = sorted((e for e in best or [] if e.depth == 0),
+                       key=lambda e: e.cumulative_us, reverse=True)
+    cost.import_ms = round(_top_level_us(best or []) / 1000.0, 2)
+    cost.module_count = len(best or [])
+    cost.top = [{"module": e.name, "ms": round(e.cumulative_us / 1000.0, 2)} for e in top_level[:top]]
+    cost.over_budget = cost.import_ms > budget_ms
+    return cost
+
+
+def _top_level_us(entries: List[ImportEntry]) -> int:
+    return sum(e.cumulative_us for e in entries if e.depth == 0)
+
+
+def audit_hooks(
+    scripts: List[Path],
+    *,
+    python: str = sys.executable,
+    project_dir: Optional[Path] = None,
+    repeat: int = 1,
+    top: int = DEFAULT_TOP,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+) -> List[HookImportCost]:
+    """逐支量測（刻意循序：平行執行會互相干擾量測），依成本由高到低排序"""
+    env = dict(os.environ)
+    if project_dir is not None:
+        env["CLAUDE_PROJECT_DIR"] = str(project_dir)
+    baseline = baseline_modules(python, env)
+    costs = [
+        audit_script(script, baseline, python=python, env=env, repeat=repeat,
+                     top=top, budget_ms=budget_ms)
+        for script in scripts
+    ]
+    return sorted(costs, key=lambda c: (bool(c.error), -c.import_ms))
+
+
+# ============================================================================
+# 渲染
+# ============================================================================
+
+def render_table(costs: List[HookImportCost], budget_ms: float) -> str:
+    lines = ["=== Hook import cost (python -X importtime, budget {:.0f}ms) ===".format(budget_ms), ""]
+    if not costs:
+        lines.append("(settings.json 未註冊任何 .py hook)")
+        return "\n".join(lines)
+
+    width = max(len(Path(c.script).name) for c in costs)
+    for c in costs:
+        name = Path(c.script).name
+        if c.error:
+            lines.append("  {:<{w}}  {:>9}  {}".format(name, "ERROR", c.error, w=width))
+            continue
+        heaviest = ", ".join("{} {:.1f}".format(t["module"], t["ms"]) for t in c.top)
+        lines.append("  {:<{w}}  {:>7.1f}ms  {}{}".format(
+            name, c.import_ms, heaviest, "  OVER" if c.over_budget else "", w=width,
+        ))
+
+    measured = [c for c in costs if not c.error]
+    over = [c for c in measured if c.over_budget]
+    lines.append("")
+    lines.append("  {} hook(s) measured, total {:.1f}ms, {} over budget".format(
+        len(measured), sum(c.import_ms for c in measured), len(over),
+    ))
+    return "\n".join(lines)
+
+
+# ============================================================================
+# 入口
+# ============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行介面：0 = 全數在預算內，1 = 有 hook 超出預算或載入失敗"""
+    parser = argparse.ArgumentParser(description="Hook import 成本稽核（python -X importtime）")
+    parser.add_argument("--settings", type=Path, default=_CLAUDE_DIR / "settings.json",
+                        help="hook 註冊來源（預設為本檔所在 .claude/settings.json）")
+    parser.add_argument("--project-dir", type=Path, default=_CLAUDE_DIR.parent,
+                        help="展開 $CLAUDE_PROJECT_DIR 的專案根目錄")
+    parser.add_argument("--python", default=sys.executable, help="量測用直譯器")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="每支 hook 列出的最重頂層模組數")
+    parser.add_argument("--repeat", type=int, default=1, help="每支 hook 量測次數（取最低）")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="單支 hook import 預算（毫秒）")
+    parser.add_argument("--format", choices=[FORMAT_TABLE, FORMAT_JSON], default=FORMAT_TABLE)
+    args = parser.parse_args(argv)
+
+    project_dir = args.project_dir.resolve()
+    scripts = registered_hook_scripts(args.settings, project_dir)
+    costs = audit_hooks(scripts, python=args.python, project_dir=project_dir,
+                        repeat=args.repeat, top=args.top, budget_ms=args.budget_ms)
+
+    if args.format == FORMAT_JSON:
+        print(json.dumps([asdict(c) for c in costs], ensure_ascii=False, indent=2))
+    else:
+        print(render_table(costs, args.budget_ms))
+    return 1 if any(c.error or c.over_budget for c in costs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+多規則片語掃描引擎
+
+ticket 內文 lint 類 hook（phase4-decision-enforcement 等）原本各自以「逐行 ×
+逐規則 × finditer」掃描，且在掃描前以多趟獨立迴圈分別計算各種跳過區段
+（frontmatter、fenced code block、Schema placeholder、Context Bundle、已
+resolved Spawn Request）。本模組把兩件事收斂為共用引擎：
+
+- compile_rules：編譯 hook 的規則表，同一規則表（以 (key, pattern, flags)
+  序列為鍵）只編譯一次。scan_lines 以每條規則對全文各一趟 search 找出候選
+  行，只對候選行逐規則 finditer；結果（順序、重疊、每規則的非重疊語意）
+  與逐行 × 逐規則 finditer 完全相同，無命中的行不再逐一呼叫 regex。
+- segment_markdown_regions：單趟掃描計算每行所屬的區段位元遮罩，取代多趟
+  compute_*_lines；各區段判定規則與原 hook 實作逐條一致。
+
+主要功能:
+- ScanRule / compile_rules / CompiledRules
+- segment_markdown_regions 與 REGION_* 區段旗標
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+# ============================================================================
+# 規則表編譯
+# ============================================================================
+
+@dataclass(frozen=True)
+class ScanRule:
+    """單條掃描規則（key 供呼叫端對應回原規則物件）"""
+    key: str
+    pattern: str
+    flags: int = 0
+
+
+RuleLike = Union[ScanRule, Tuple[str, Union[str, "re.Pattern[str]"]]]
+
+
+def _as_scan_rule(rule: RuleLike) -> ScanRule:
+    if isinstance(rule, ScanRule):
+        return rule
+    key, pattern = rule
+    if isinstance(pattern, re.Pattern):
+        return ScanRule(key, pattern.pattern, pattern.flags)
+    return ScanRule(key, pattern)
+
+
+def _has_position_assertion(pattern: str) -> bool:
+    """
+    規則是否含「看行外內容」的零寬斷言（^ $ \\A \\Z \\b \\B 與 lookaround）
+
+    字元類別內的 `^` / `$` 與跳脫字元不算；VERBOSE 註解內的符號會被保守
+    視為斷言（只影響是否走全文候選，不影響結果）。
+    """
+    i, length, in_class = 0, len(pattern), False
+    while i < length:
+        ch = pattern[i]
+        if ch == "\\":
+            if not in_class and pattern[i + 1:i + 2] in ("b", "B", "A", "Z"):
+                return True
+            i += 2
+            continue
+        if in_class:
+            if ch == "]":
+                in_class = False
+            i += 1
+            continue
+        if ch == "[":
+            in_class = True
+            i += 1
+            if pattern[i:i + 1] == "^":
+                i += 1
+            if pattern[i:i + 1] == "]":
+                i += 1
+            continue
+        if ch in "^$" or pattern.startswith(("(?=", "(?!", "(?<=", "(?<!"), i):
+            return True
+        i += 1
+    return False
+
+
+class CompiledRules:
+    """
+    已編譯規則表
+
+    scan_lines 先以每條規則對「全部行以換行相接」的全文各做一趟 search
+    找出候選行，再只對候選行逐規則 finditer，結果與逐行 × 逐規則
+    finditer 完全相同：
+
+    - 規則不含零寬位置斷言時，某行內的成功比對路徑在全文中同樣成立，
+      故「行內有命中」⇒「全文自該行起點（或更早）搜尋必有命中」；每次
+      命中後從命中起始行的下一行繼續搜尋，每一個有命中的行都會成為候選
+    - 含位置斷言的規則（行首 / 行尾 / 字邊界 / lookaround 在全文中會看到
+      相鄰行）不做全文候選，整表退回逐行逐規則
+
+    CPython re 對單一規則保有字面前綴 / 字元集快速掃描，合併成一個大
+    alternation 反而失去此最佳化（實測全文一趟 alternation 慢於逐規則
+    全文各一趟），故不合併。
+    """
+
+    def __init__(self, rules: Tuple[ScanRule, ...]):
+        self.rules = rules
+        self.patterns = tuple(re.compile(rule.pattern, rule.flags) for rule in rules)
+        self.line_local = not any(_has_position_assertion(rule.pattern) for rule in rules)
+
+    def _candidates(self, lines: Sequence[str]) -> Dict[int, List[int]]:
+        """候選行 index → 可能命中的規則 index（依規則表順序）"""
+        if not self.line_local:
+            every = list(range(len(self.patterns)))
+            return {index: every for index in range(len(lines))}
+
+        text = "\n".join(lines)
+        starts = []
+        offset = 0
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+
+        candidates: Dict[int, List[int]] = {}
+        for rule_index, pattern in enumerate(self.patterns):
+            pos = 0
+            while True:
+                match = pattern.search(text, pos)
+                if match is None:
+                    break
+                line_index = bisect_right(starts, match.start()) - 1
+                candidates.setdefault(line_index, []).append(rule_index)
+                if line_index + 1 >= len(starts):
+                    break
+                pos = starts[line_index + 1]
+        return candidates
+
+    def scan_lines(self, lines: Sequence[str]) -> Iterator[Tuple[int, int, "re.Match[str]"]]:
+        """
+        依「行 → 規則表順序 → 行內位置」產出 (行 index, 規則 index, match)
+
+        等同 `for i, line in enumerate(lines): for r in rules: r.finditer(line)`。
+        """
+        candidates = self._candidates(lines)
+        for line_index in sorted(candidates):
+            line = lines[line_index]
+            for rule_index in candidates[line_index]:
+                for match in self.patterns[rule_index].finditer(line):
+                    yield line_index, rule_index, match
+
+
+@lru_cache(maxsize=32)
+def _compile_cached(rules: Tuple[ScanRule, ...]) -> CompiledRules:
+    return CompiledRules(rules)
+
+
+def compile_rules(rules: Iterable[RuleLike]) -> CompiledRules:
+    """
+    編譯規則表（同一規則序列只編譯一次）
+
+    Args:
+        rules: ScanRule，或 (key, pattern) 二元組；pattern 可為字串或已編譯
+            的 re.Pattern（沿用其 flags）
+
+    Returns:
+        CompiledRules
+    """
+    return _compile_cached(tuple(_as_scan_rule(rule) for rule in rules))
+
+
+# ============================================================================
+# Markdown 區段切分
+# ============================================================================
+
+# 區段旗標（同一行可同時屬多個區段，以位元 OR 表示）
+REGION_FRONTMATTER = 1
+REGION_FENCED_BLOCK = 2
+REGION_SCHEMA_PLACEHOLDER = 4
+REGION_CONTEXT_BUNDLE = 8
+REGION_RESOLVED_SPAWN_REQUEST = 16
+
+# Schema placeholder template 區塊起點：`<!-- Schema[<type>/<section>]: <note> -->`。
+# 區塊內的 PC-093-exempt 等 marker 屬範例文字，非實際宣告。
+SCHEMA_PLACEHOLDER_START = re.compile(r"<!--\s*Schema\[[^\]]+\]\s*:")
+# 區塊邊界：下個 H2（## ）或 `---` 水平分隔符（trim 後完全相符）。
+# `### ` 第三字元為 `#`，不匹配 `^\s*##\s`，不會被誤判為邊界。
+SCHEMA_PLACEHOLDER_END_H2 = re.compile(r"^\s*##\s")
+SCHEMA_PLACEHOLDER_END_HR = re.compile(r"^\s*---\s*$")
+
+# Context Bundle auto-extracted 區塊起點（ticket-loader 逐字引用 source ticket
+# why / what 的機器產生區塊）。錨定 marker 而非整個 section：人工撰寫的
+# Context Bundle（無 marker）不屬此區段。終點同 Schema placeholder。
+CONTEXT_BUNDLE_START = re.compile(r"<!--\s*auto-extracted\s*:")
+
+# Fenced code block（CommonMark 0.31 子集）：
+# - 起始 fence: 行首 0-3 空格 indent + 3+ 連續 backtick 或 3+ 連續 tilde
+# - 結束 fence: 同字元 + 長度 >= 起始 + 行內僅尾部空白
+# - 未閉合 fence: 視為至檔尾（容錯）
+# - 不支援 indented fence（indent >= 4 空格 / Tab=4）與 nested fence
+FENCED_BLOCK_START_PATTERN = re.compile(
+    r"^(?P<indent> {0,3})(?P<fence>`{3,}|~{3,})(?P<info>.*)$"
+)
+FENCED_BLOCK_CLOSE_PATTERN = re.compile(
+    r"^(?P<indent> {0,3})(?P<fence>`{3,}|~{3,})\s*$"
+)
+
+# 「## Spawn Requests」區段（add-spawn-request / resolve-spawn-request 產生）：
+# 以 `- **SR-N**` 界定條目，條目內第一個 `- status:` 決定是否已 resolved。
+SPAWN_REQUESTS_SECTION_START = re.compile(r"^##\s+Spawn Requests\s*$")
+SPAWN_REQUEST_ENTRY_START = re.compile(r"^-\s+\*\*SR-\d+\*\*")
+SPAWN_REQUEST_STATUS_LINE = re.compile(r"^\s*-\s*status:\s*(processed|dismissed|pending)\b")
+RESOLVED_SPAWN_REQUEST_STATUSES = frozenset({"processed", "dismissed"})
+
+_FENCE_PREFIXES = ("```", "~~~")
+
+
+def _visual_indent(text: str) -> int:
+    """Tab 視為 4 空格（CommonMark）。"""
+    width = 0
+    for ch in text:
+        if ch == "\t":
+            width += 4
+        elif ch == " ":
+            width += 1
+        else:
+            break
+    return width
+
+
+def _is_section_boundary(raw: str) -> bool:
+    return bool(SCHEMA_PLACEHOLDER_END_H2.match(raw) or SCHEMA_PLACEHOLDER_END_HR.match(raw))
+
+
+def segment_markdown_regions(lines: List[str]) -> List[int]:
+    """
+    單趟計算每行的區段位元遮罩（index 0 = 第 1 行）
+
+    各區段規則：
+    - REGION_FRONTMATTER：第一行 trim 後為 `---` 起，至下一個 trim 後為 `---`
+      的行（含起訖行）；未閉合視為無 frontmatter
+    - REGION_FENCED_BLOCK：fenced code block（含 fence 自身行，未閉合至檔尾）
+    - REGION_SCHEMA_PLACEHOLDER / REGION_CONTEXT_BUNDLE：起點 marker 行起，
+      至下個 H2 或 `---`（不含邊界行；邊界行本身不再判斷起點）
+    - REGION_RESOLVED_SPAWN_REQUEST：第一個「## Spawn Requests」區段中
+      status 為 processed / dismissed 的條目（含 SR 標題行至下一條目前）
+
+    四種區段各自獨立判定（例如 fenced block 內的 Schema marker 仍會開啟
+    placeholder 區段），與原本分趟計算的結果相同。
+    """
+    masks = [0] * len(lines)
+
+    frontmatter_open = bool(lines) and lines[0].strip() == "---"
+    frontmatter_end = 0
+
+    fence_char: Optional[str] = None
+    fence_len = 0
+
+    in_placeholder = False
+    in_bundle = False
+
+    spawn_state = 0  # 0 = 尚未進入區段、1 = 區段內、2 = 區段已結束
+    entry_start = -1
+    entry_status: Optional[str] = None
+    last_section_line = -1
+
+    def close_entry(end: int) -> None:
+        if entry_start >= 0 and entry_status in RESOLVED_SPAWN_REQUEST_STATUSES:
+            for i in range(entry_start, end + 1):
+                masks[i] |= REGION_RESOLVED_SPAWN_REQUEST
+
+    for i, raw in enumerate(lines):
+        mask = 0
+
+        if frontmatter_open and i > 0 and raw.strip() == "---":
+            frontmatter_open = False
+            frontmatter_end = i + 1
+
+        # 各起點 / fence regex 的必要字面條件先行過濾，一般內文行只做字串判斷
+        body = raw.lstrip(" \t")
+        maybe_fence = body[:3] in _FENCE_PREFIXES
+        if fence_char is None:
+            leading = raw[: len(raw) - len(body)]
+            if maybe_fence and not ("\t" in leading and _visual_indent(leading) > 3):
+                m = FENCED_BLOCK_START_PATTERN.match(raw)
+                if m:
+                    fence = m.group("fence")
+                    info = m.group("info") or ""
+                    if not (fence[0] == "`" and "`" in info):
+                        fence_char = fence[0]
+                        fence_len = len(fence)
+                        mask |= REGION_FENCED_BLOCK
+        else:
+            mask |= REGION_FENCED_BLOCK
+            cm = FENCED_BLOCK_CLOSE_PATTERN.match(raw) if maybe_fence else None
+            if cm:
+                cfence = cm.group("fence")
+                if cfence[0] == fence_char and len(cfence) >= fence_len:
+                    fence_char = None
+                    fence_len = 0
+
+        boundary = None
+        if in_placeholder or in_bundle or spawn_state == 1:
+            boundary = _is_section_boundary(raw)
+        has_comment = "<!--" in raw
+
+        if in_placeholder:
+            if boundary:
+                in_placeholder = False
+            else:
+                mask |= REGION_SCHEMA_PLACEHOLDER
+        elif has_comment and SCHEMA_PLACEHOLDER_START.search(raw):
+            in_placeholder = True
+            mask |= REGION_SCHEMA_PLACEHOLDER
+
+        if in_bundle:
+            if boundary:
+                in_bundle = False
+            else:
+                mask |= REGION_CONTEXT_BUNDLE
+        elif has_comment and CONTEXT_BUNDLE_START.search(raw):
+            in_bundle = True
+            mask |= REGION_CONTEXT_BUNDLE
+
+        if spawn_state == 1:
+            if boundary:
+                close_entry(last_section_line)
+                spawn_state = 2
+            else:
+                last_section_line = i
+                if SPAWN_REQUEST_ENTRY_START.match(raw):
+                    close_entry(i - 1)
+                    entry_start = i
+                    entry_status = None
+                elif entry_start >= 0 and entry_status is None:
+                    sm = SPAWN_REQUEST_STATUS_LINE.match(raw)
+                    if sm:
+                        entry_status = sm.group(1)
+        elif spawn_state == 0 and raw.startswith("##") and SPAWN_REQUESTS_SECTION_START.match(raw.rstrip()):
+            spawn_state = 1
+
+        masks[i] |= mask
+
+    if spawn_state == 1:
+        close_entry(last_section_line)
+
+    for i in range(frontmatter_end):
+        masks[i] |= REGION_FRONTMATTER
+
+    return masks
+
+
+def lines_in_region(masks: List[int], region: int) -> set:
+    """遮罩中屬於指定區段的 1-based 行號集合"""
+    return {i for i, mask in enumerate(masks, start=1) if mask & region}
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+yaml_frontmatter 效能基準
+
+生成 1,000 張形狀接近實際 Ticket 的 frontmatter（扁平純量 + 區塊清單為主，
+少量含巢狀 mapping / 折行字串以涵蓋退回路徑），逐張比較：
+
+- yaml.safe_load（原實作，純 Python SafeLoader）
+- yaml_frontmatter.safe_load（libyaml C 載入器）
+- yaml_frontmatter.load_yaml（扁平快速路徑 → C 載入器）
+
+執行：python3 .claude/lib/tests/bench_yaml_frontmatter.py [--tickets N] [--repeat R]
+
+本檔不以 test_ 開頭，pytest 不會收集；test_yaml_frontmatter.py 共用
+generate_corpus() 驗證三者結果一致。
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import yaml_frontmatter
+
+STATUSES = ("pending", "in_progress", "completed", "blocked")
+TYPES = ("IMP", "ANA", "DOC", "TST", "REF")
+WORDS = ("hook", "ticket", "解析", "效能", "frontmatter", "worktree", "index", "快取", "CLI", "驗收")
+
+
+def _ticket_frontmatter(seq: int, rng: random.Random) -> str:
+    ticket_id = f"0.31.0-W{seq % 9 + 1}-{seq:03d}"
+    data = {
+        "id": ticket_id,
+        "title": " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))),
+        "type": rng.choice(TYPES),
+        "status": rng.choice(STATUSES),
+        "version": "0.31.0",
+        "wave": rng.randint(1, 9),
+        "priority": f"P{rng.randint(0, 3)}",
+        "created": date(2026, 1, 1) + timedelta(days=seq % 300),
+        "updated": date(2026, 1, 1) + timedelta(days=seq % 300 + 1),
+        "assigned": rng.random() < 0.7,
+        "who": {"current": "thyme-python-developer"} if seq % 10 == 0 else "parsley",
+        "parent_id": f"0.31.0-W1-{seq // 10:03d}" if seq % 3 else None,
+        "children": [f"{ticket_id}.{i}" for i in range(rng.randint(0, 3))],
+        "blockedBy": [],
+        "where": {"layer": "lib", "files": [f"lib/module_{seq}.py"]} if seq % 7 == 0 else None,
+        "acceptance": [
+            f"[{'x' if rng.random() < 0.5 else ' '}] 驗收條件 {i}" for i in range(rng.randint(1, 5))
+        ],
+        "files": [f"lib/{rng.choice(WORDS)}_{i}.py" for i in range(rng.randint(0, 4))],
+        "decision_tree_path": {"entry_point": "第一層", "final_decision": "執行"} if seq % 5 == 0 else None,
+    }
+    if seq % 11 == 0:
+        data["why"] = "長描述欄位 " * 20
+    return yaml.dump(data, allow_unicode=True, sort_keys=False)
+
+
+def generate_corpus(count: int = 1000, seed: int = 31) -> List[str]:
+    """生成 count 張 frontmatter YAML 文字（不含 --- 邊界線）"""
+    rng = random.Random(seed)
+    return [_ticket_frontmatter(seq, rng) for seq in range(1, count + 1)]
+
+
+def _per_ticket_us(parse: Callable[[str], object], corpus: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            parse(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(corpus) * 1e6
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--tickets", type=int, default=1000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    corpus = generate_corpus(args.tickets)
+    flat = sum(1 for text in corpus if _is_flat(text))
+    print(f"corpus: {len(corpus)} tickets（快速路徑適用 {flat}），libyaml: {yaml_frontmatter.HAS_LIBYAML}")
+
+    baseline = _per_ticket_us(yaml.safe_load, corpus, args.repeat)
+    print(f"{'yaml.safe_load':<28}{baseline:>10.1f} us/ticket")
+    for label, parse in (
+        ("yaml_frontmatter.safe_load", yaml_frontmatter.safe_load),
+        ("yaml_frontmatter.load_yaml", yaml_frontmatter.load_yaml),
+    ):
+        elapsed = _per_ticket_us(parse, corpus, args.repeat)
+        print(f"{label:<28}{elapsed:>10.1f} us/ticket  ({baseline / elapsed:.1f}x)")
+    return 0
+
+
+def _is_flat(text: str) -> bool:
+    try:
+        yaml_frontmatter._load_flat(text)
+    except Exception:
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(main())
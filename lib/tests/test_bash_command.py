@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+bash_command（一次解析、多守衛共用的 Bash 命令模型）測試
+
+驗證項目：
+1. 語句、分隔符、pipeline、重導向、heredoc 欄位
+2. 語句切分與 git_command_parse 原處理流程（strip -> normalize -> tokenize
+   -> _split_statements）一致；無法解析時 git_invocations 回傳 None
+3. 程序內記憶：同一命令只 tokenize 一次，回傳 list 互不影響
+4. hook_context_scope 內寫入共用快取檔，其他「行程」（清除程序內記憶）
+   直接重用；scope 外不落地
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import bash_command
+from lib.bash_command import Redirection, parse_bash_command
+from lib.git_command_parse import (
+    _split_statements,
+    _tokenize,
+    find_git_invocations,
+    normalize_newlines_to_separators,
+    strip_heredoc_bodies,
+)
+from lib.hook_context import CACHE_SUBDIR, hook_context_scope
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    bash_command.clear_memo()
+    yield
+    bash_command.clear_memo()
+
+
+@pytest.fixture
+def count_tokenize(monkeypatch):
+    calls = []
+    original = bash_command._tokenize
+
+    def counting(command):
+        calls.append(command)
+        return original(command)
+
+    monkeypatch.setattr(bash_command, "_tokenize", counting)
+    return calls
+
+
+class TestModel:
+    def test_statements_pipelines_redirections(self):
+        model = parse_bash_command("git status > out.txt 2>&1 | grep x && echo done")
+        assert [s.separator for s in model.statements] == ["|", "&&", None]
+        assert model.statements[0].redirections == [
+            Redirection(">", "out.txt"), Redirection(">&", "1"),
+        ]
+        # fd 數字為 shlex 獨立 token，仍留在 words（已知殘留）
+        assert model.statements[0].words == ["git", "status", "2"]
+        assert [len(p) for p in model.pipelines] == [2, 1]
+
+    def test_heredocs(self):
+        command = "cat <<'EOF' > f\nline1\nline2\nEOF\ngit add f"
+        model = parse_bash_command(command)
+        assert model.heredocs == (("EOF", "line1\nline2"),)
+        assert [inv.subcommand for inv in model.git_invocations()] == ["add"]
+
+    @pytest.mark.parametrize("command", [
+        "git commit -m 'a && b'; (cd x && git push) || true",
+        "env FOO=1 git -C repo add .\ngit status",
+        "git commit -F - <<EOF\ngit push\nEOF",
+        "echo $(git rev-parse HEAD) | tee log",
+    ])
+    def test_statements_match_legacy_pipeline(self, command):
+        legacy = _split_statements(
+            _tokenize(normalize_newlines_to_separators(strip_heredoc_bodies(command)))
+        )
+        assert parse_bash_command(command).statement_tokens() == legacy
+
+    def test_unparseable(self):
+        model = parse_bash_command("git commit -m 'unclosed")
+        assert not model.parseable
+        assert model.statement_tokens() is None
+        assert model.git_invocations({"commit"}) is None
+        assert find_git_invocations("git commit -m 'unclosed", {"commit"}) is None
+
+    def test_git_invocations_filter(self):
+        model = parse_bash_command("git stage . && git commit -m x && ls")
+        assert [inv.subcommand for inv in model.git_invocations()] == ["add", "commit"]
+        assert [inv.subcommand for inv in model.git_invocations({"add"})] == ["add"]
+
+
+class TestMemo:
+    def test_tokenized_once(self, count_tokenize):
+        command = "git add a.py && git commit -m msg"
+        first = find_git_invocations(command, {"add"})
+        find_git_invocations(command, {"commit"})
+        assert len(count_tokenize) == 1
+        first[0].statement.append("mutated")
+        assert find_git_invocations(command, {"add"})[0].statement == ["git", "add", "a.py"]
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    root = tmp_path / "repo"
+    root.mkdir()
+    subprocess.run(["git", "init", "-q", str(root)], check=True)
+    (root / ".claude").mkdir()
+    monkeypatch.chdir(root)
+    monkeypatch.delenv("CLAUDE_HOOK_CONTEXT_CACHE", raising=False)
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_WORK_TREE", raising=False)
+    return root
+
+
+class TestSharedCache:
+    def test_reused_across_processes(self, repo, count_tokenize):
+        command = "git commit -m '{}'".format("long message\n" * 30)
+        cache_file = repo / CACHE_SUBDIR / bash_command.BASH_CACHE_FILENAME
+        with hook_context_scope():
+            parse_bash_command(command)
+            assert cache_file.is_file()
+            bash_command.clear_memo()
+            model = parse_bash_command(command)
+        assert len(count_tokenize) == 1
+        assert [inv.subcommand for inv in model.git_invocations({"commit"})] == ["commit"]
+
+    def test_entries_bounded(self, repo, monkeypatch):
+        monkeypatch.setattr(bash_command, "BASH_CACHE_MAX_ENTRIES", 2)
+        with hook_context_scope():
+            for n in range(4):
+                parse_bash_command("echo {} {}".format(n, "x" * 300))
+        entries = bash_command._load_entries(
+            repo / CACHE_SUBDIR / bash_command.BASH_CACHE_FILENAME
+        )
+        assert len(entries) == 2
+
+    def test_not_written_outside_scope(self, repo):
+        parse_bash_command("git status " + "x" * 300)
+        assert not (repo / CACHE_SUBDIR / bash_command.BASH_CACHE_FILENAME).exists()
+
+    def test_short_command_not_written(self, repo):
+        with hook_context_scope():
+            parse_bash_command("git status")
+        assert not (repo / CACHE_SUBDIR / bash_command.BASH_CACHE_FILENAME).exists()
+
+    def test_disabled_by_env(self, repo, monkeypatch):
+        monkeypatch.setenv("CLAUDE_HOOK_CONTEXT_CACHE", "0")
+        with hook_context_scope():
+            parse_bash_command("git status " + "x" * 300)
+        assert not (repo / CACHE_SUBDIR / bash_command.BASH_CACHE_FILENAME).exists()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+hook_context（跨行程 git 情境快照）測試
+
+驗證項目：
+1. find_git_layout：主 repo 與 linked worktree 的檔案系統推導與
+   `git rev-parse --git-dir --git-common-dir --show-toplevel` 一致
+2. 啟用範圍：scope 外、CLAUDE_HOOK_CONTEXT_CACHE=0、GIT_DIR 設定時停用
+3. branch / head_sha 與 git 一致；commit 後指紋變動使快照重建
+4. 命令輸出寫入快照檔後，其他「行程」（清除程序內記憶）直接重用；
+   ttl 逾期時重算；dirty files 不跨行程共用；快取目錄自帶 .gitignore
+5. hook_base.get_project_root / git_utils 於 scope 內外結果一致（parity）
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import git_utils, hook_base, hook_context
+from lib.hook_context import find_git_layout, get_git_context, hook_context_scope
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=cwd, capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "main")
+    (root / ".claude").mkdir()
+    (root / ".gitignore").write_text(".claude/\n", encoding="utf-8")
+    (root / "a.txt").write_text("a\n", encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+    for name in ("GIT_DIR", "GIT_WORK_TREE", "CLAUDE_PROJECT_DIR", hook_context.ENV_CONTEXT_CACHE):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.chdir(root)
+    return root.resolve()
+
+
+@pytest.fixture
+def worktree(repo, tmp_path):
+    path = tmp_path / "wt"
+    _git(repo, "worktree", "add", "-q", "-b", "feat/x", str(path))
+    return path.resolve()
+
+
+class TestFindGitLayout:
+    def test_main_repo(self, repo):
+        (repo / "sub").mkdir()
+        root, git_dir, common_dir = find_git_layout(repo / "sub")
+        assert root == repo
+        assert git_dir == common_dir == repo / ".git"
+
+    def test_linked_worktree_matches_git(self, worktree):
+        root, git_dir, common_dir = find_git_layout(worktree)
+        lines = _git(worktree, "rev-parse", "--git-dir", "--git-common-dir", "--show-toplevel").splitlines()
+        assert git_dir == (worktree / lines[0]).resolve()
+        assert common_dir == (worktree / lines[1]).resolve()
+        assert root == Path(lines[2]).resolve()
+        assert git_dir != common_dir
+
+    def test_outside_repo(self, tmp_path):
+        outside = tmp_path / "plain"
+        outside.mkdir()
+        assert find_git_layout(outside) is None
+
+
+class TestEnablement:
+    def test_disabled_outside_scope(self, repo):
+        assert get_git_context() is None
+
+    def test_env_switch_disables(self, repo, monkeypatch):
+        monkeypatch.setenv(hook_context.ENV_CONTEXT_CACHE, "0")
+        with hook_context_scope():
+            assert get_git_context() is None
+
+    def test_git_dir_env_disables(self, repo, monkeypatch):
+        monkeypatch.setenv("GIT_DIR", str(repo / ".git"))
+        with hook_context_scope():
+            assert get_git_context() is None
+
+
+class TestSnapshot:
+    def test_branch_and_head_follow_commits(self, repo):
+        with hook_context_scope():
+            context = get_git_context()
+            assert context.branch == "main"
+            assert context.head_sha == _git(repo, "rev-parse", "HEAD")
+            assert (repo / hook_context.CACHE_SUBDIR / hook_context.CACHE_FILENAME).is_file()
+
+            (repo / "b.txt").write_text("b\n", encoding="utf-8")
+            _git(repo, "add", "-A")
+            _git(repo, "commit", "-q", "-m", "second")
+            assert get_git_context().head_sha == _git(repo, "rev-parse", "HEAD")
+
+    def test_packed_refs_and_detached_head(self, repo):
+        _git(repo, "pack-refs", "--all")
+        sha = _git(repo, "rev-parse", "HEAD")
+        with hook_context_scope():
+            assert get_git_context().head_sha == sha
+        _git(repo, "checkout", "-q", "--detach")
+        with hook_context_scope():
+            context = get_git_context()
+            assert context.branch is None
+            assert context.head_sha == sha
+
+    def test_command_output_shared_across_processes(self, repo):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return True, "output"
+
+        with hook_context_scope():
+            assert get_git_context().command_output("k", compute) == (True, "output")
+        # scope 結束即清除程序內記憶，等同另一支 hook 行程讀取快照檔
+        with hook_context_scope():
+            assert get_git_context().command_output("k", compute) == (True, "output")
+        assert len(calls) == 1
+
+    def test_command_output_ttl_and_failures(self, repo):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls) > 1, "x"
+
+        with hook_context_scope():
+            context = get_git_context()
+            assert context.command_output("k", compute) == (False, "x")
+            assert context.command_output("k", compute) == (True, "x")
+            context.command_output("k", compute, ttl=-1)
+        assert len(calls) == 3
+
+
+    def test_dirty_files_not_shared_across_processes(self, repo):
+        with hook_context_scope():
+            assert git_utils.get_uncommitted_files() == []
+        # 如同 Edit 工具：只改工作區檔案，不觸動 index
+        (repo / "a.txt").write_text("edited\n", encoding="utf-8")
+        with hook_context_scope():
+            assert [f.file_path for f in git_utils.get_uncommitted_files()] == ["a.txt"]
+
+    def test_cache_dir_ignores_itself(self, repo):
+        (repo / ".gitignore").write_text("", encoding="utf-8")
+        with hook_context_scope():
+            get_git_context().command_output("k", lambda: (True, "x"))
+        status = _git(repo, "status", "--porcelain", "--untracked-files=all")
+        assert "hook-logs" not in status
+        assert (repo / hook_context.CACHE_SUBDIR / ".gitignore").is_file()
+
+
+class TestParity:
+    def test_project_root_and_git_utils(self, repo, worktree, monkeypatch):
+        (repo / "dirty.txt").write_text("x\n", encoding="utf-8")
+        for cwd in (repo, worktree):
+            monkeypatch.chdir(cwd)
+            expected = (
+                hook_base.get_project_root(),
+                git_utils.get_current_branch(),
+                git_utils.get_worktree_list(),
+                git_utils.get_uncommitted_files(),
+            )
+            with hook_context_scope():
+                actual = (
+                    hook_base.get_project_root(),
+                    git_utils.get_current_branch(),
+                    git_utils.get_worktree_list(),
+                    git_utils.get_uncommitted_files(),
+                )
+            assert actual == expected, cwd
+
+    def test_env_project_dir_respected_outside_worktree(self, repo, monkeypatch):
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", "/somewhere/else")
+        with hook_context_scope():
+            assert hook_base.get_project_root() == Path("/somewhere/else")
+
+    def test_new_worktree_invalidates_list(self, repo, tmp_path):
+        with hook_context_scope():
+            assert len(git_utils.get_worktree_list()) == 1
+        _git(repo, "worktree", "add", "-q", "-b", "feat/y", str(tmp_path / "wt2"))
+        with hook_context_scope():
+            assert len(git_utils.get_worktree_list()) == 2
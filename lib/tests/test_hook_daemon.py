@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+hook_daemon（hookd）與 hook-daemon-client.py shim 測試
+
+驗證項目：
+1. run_hook_script：`__main__` 入口照常執行、SystemExit 換算、頂層例外
+   比照直譯器（traceback + exit 1）、bytecode 快取依 mtime 失效
+2. registered_hook_scripts：直接註冊與 shim 包裹兩種 settings.json 形式
+3. shim 與伺服器的 socket 路徑公式一致（parity）；runtime 目錄以 0700 建立，
+   權限過寬或擁有者不符時伺服器拒絕啟動、shim 拒絕連線
+4. 端對端：伺服器執行中時 shim 轉送並取回 stdout / exit code，且 hook 的
+   run_hook_safely(fail_closed=True) 契約保留；伺服器未啟動時 shim 回退
+   為直接執行 hook 腳本
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import hook_daemon
+
+CLAUDE_DIR = Path(__file__).resolve().parents[2]
+SHIM_PATH = CLAUDE_DIR / "hooks" / "hook-daemon-client.py"
+DAEMON_PATH = CLAUDE_DIR / "lib" / "hook_daemon.py"
+
+posix_only = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="hookd 依賴 AF_UNIX / fork"
+)
+
+
+def _load_shim():
+    spec = importlib.util.spec_from_file_location("hook_daemon_client", SHIM_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_hook(path: Path, body: str) -> Path:
+    path.write_text("#!{}\n{}".format(sys.executable, body), encoding="utf-8")
+    path.chmod(0o755)
+    return path
+
+
+SAFE_HOOK_BODY = '''
+import json
+import sys
+sys.path.insert(0, {claude_dir!r})
+from lib.hook_logging import run_hook_safely
+
+def main():
+    data = json.loads(sys.stdin.read() or "{{}}")
+    print(json.dumps({{"echo": data.get("tool_name"), "pid": __import__("os").getpid()}}))
+    if data.get("boom"):
+        raise RuntimeError("boom")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(run_hook_safely(main, "daemon-test-hook", fail_closed=True))
+'''
+
+
+class TestRunHookScript:
+    def test_main_block_runs_and_exit_code_is_returned(self, tmp_path, capsys):
+        script = _write_hook(
+            tmp_path / "exit3.py",
+            "import sys\nif __name__ == '__main__':\n    print('hi')\n    sys.exit(3)\n",
+        )
+        assert hook_daemon.run_hook_script(script) == 3
+        assert capsys.readouterr().out == "hi\n"
+
+    def test_no_exit_means_zero(self, tmp_path):
+        script = _write_hook(tmp_path / "plain.py", "x = 1\n")
+        assert hook_daemon.run_hook_script(script) == 0
+
+    def test_string_exit_prints_message_and_returns_one(self, tmp_path, capsys):
+        script = _write_hook(tmp_path / "msg.py", "import sys\nsys.exit('壞掉了')\n")
+        assert hook_daemon.run_hook_script(script) == 1
+        assert "壞掉了" in capsys.readouterr().err
+
+    def test_top_level_exception_prints_traceback(self, tmp_path, capsys):
+        script = _write_hook(tmp_path / "raise.py", "raise ValueError('頂層')\n")
+        assert hook_daemon.run_hook_script(script) == 1
+        err = capsys.readouterr().err
+        assert "Traceback" in err and "頂層" in err
+
+    def test_main_module_is_restored(self, tmp_path):
+        original = sys.modules["__main__"]
+        script = _write_hook(tmp_path / "m.py", "import sys\nassert sys.modules['__main__'].__file__ == __file__\n")
+        assert hook_daemon.run_hook_script(script) == 0
+        assert sys.modules["__main__"] is original
+
+    def test_code_cache_invalidated_by_mtime(self, tmp_path):
+        script = _write_hook(tmp_path / "v.py", "import sys\nsys.exit(1)\n")
+        first = hook_daemon.load_hook_code(script)
+        assert hook_daemon.load_hook_code(script) is first
+
+        script.write_text("import sys\nsys.exit(2)\n", encoding="utf-8")
+        stat = script.stat()
+        os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert hook_daemon.load_hook_code(script) is not first
+        assert hook_daemon.run_hook_script(script) == 2
+
+
+class TestRegisteredHookScripts:
+    def test_direct_and_shim_wrapped_forms(self, tmp_path):
+        settings = {
+            "hooks": {
+                "PreToolUse": [
+                    {"matcher": "Bash", "hooks": [
+                        {"type": "command", "command": "$CLAUDE_PROJECT_DIR/.claude/hooks/a-hook.py"},
+                        {"type": "command", "command": (
+                            "$CLAUDE_PROJECT_DIR/.claude/hooks/hook-daemon-client.py "
+                            "$CLAUDE_PROJECT_DIR/.claude/hooks/b-hook.py"
+                        )},
+                    ]},
+                ],
+                "Stop": [
+                    {"hooks": [
+                        {"type": "command", "command": "$CLAUDE_PROJECT_DIR/.claude/hooks/a-hook.py"},
+                        {"type": "command", "command": "echo not-python"},
+                    ]},
+                ],
+            }
+        }
+        settings_path = tmp_path / "settings.json"
+        settings_path.write_text(json.dumps(settings), encoding="utf-8")
+
+        scripts = hook_daemon.registered_hook_scripts(settings_path, tmp_path)
+
+        assert scripts == [
+            tmp_path / ".claude" / "hooks" / "a-hook.py",
+            tmp_path / ".claude" / "hooks" / "b-hook.py",
+        ]
+
+    def test_missing_settings_returns_empty(self, tmp_path):
+        assert hook_daemon.registered_hook_scripts(tmp_path / "nope.json", tmp_path) == []
+
+
+class TestSocketPathParity:
+    @pytest.mark.parametrize("variable", ["TMPDIR", "XDG_RUNTIME_DIR"])
+    def test_shim_and_server_agree(self, tmp_path, monkeypatch, variable):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv(variable, str(tmp_path))
+        shim = _load_shim()
+        assert shim._socket_path() == str(hook_daemon.socket_path(CLAUDE_DIR))
+        assert hook_daemon.socket_path(CLAUDE_DIR).parent.parent == tmp_path
+        assert shim.SOCKET_PREFIX == hook_daemon.SOCKET_PREFIX
+        assert shim.FRAME_HEADER.format == hook_daemon.FRAME_HEADER.format
+
+
+@posix_only
+class TestRuntimeDirSecurity:
+    @pytest.fixture(autouse=True)
+    def _tmpdir(self, monkeypatch):
+        # 短路徑：pytest 的 tmp_path 加上測試名稱容易超過 AF_UNIX 路徑上限
+        short = tempfile.mkdtemp(prefix="hookd-")
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", short)
+        yield Path(short)
+        shutil.rmtree(short, ignore_errors=True)
+
+    def _listen(self, path: Path):
+        import socket
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(path))
+        server.listen(1)
+        return server
+
+    def test_created_private(self):
+        path = hook_daemon.ensure_runtime_dir()
+        assert path == hook_daemon.runtime_dir()
+        assert path.stat().st_mode & 0o777 == 0o700
+
+    def test_loose_mode_is_rejected(self):
+        path = hook_daemon.runtime_dir()
+        path.mkdir(mode=0o700)
+        path.chmod(0o777)
+        with pytest.raises(PermissionError):
+            hook_daemon.ensure_runtime_dir()
+        assert hook_daemon.serve(CLAUDE_DIR) == hook_daemon.EXIT_ERROR
+
+    def test_symlinked_dir_is_rejected(self, _tmpdir):
+        target = _tmpdir / "elsewhere"
+        target.mkdir(mode=0o700)
+        hook_daemon.runtime_dir().symlink_to(target)
+        with pytest.raises(PermissionError):
+            hook_daemon.ensure_runtime_dir()
+
+    def test_shim_connects_to_private_socket(self):
+        hook_daemon.ensure_runtime_dir()
+        shim = _load_shim()
+        server = self._listen(hook_daemon.socket_path(CLAUDE_DIR))
+        try:
+            conn = shim._connect()
+            assert conn is not None
+            conn.close()
+        finally:
+            server.close()
+
+    def test_shim_refuses_socket_in_loose_dir(self):
+        hook_daemon.ensure_runtime_dir().chmod(0o755)
+        shim = _load_shim()
+        server = self._listen(hook_daemon.socket_path(CLAUDE_DIR))
+        try:
+            assert shim._connect() is None
+        finally:
+            server.close()
+
+    def test_shim_refuses_foreign_owner(self, monkeypatch):
+        hook_daemon.ensure_runtime_dir()
+        shim = _load_shim()
+        path = shim._socket_path()
+        server = self._listen(Path(path))
+        try:
+            assert shim._is_trusted_socket(path)
+            other_uid = os.getuid() + 1
+            monkeypatch.setattr(shim.os, "getuid", lambda: other_uid)
+            assert not shim._is_trusted_socket(path)
+        finally:
+            server.close()
+
+
+@posix_only
+class TestEndToEnd:
+    @pytest.fixture
+    def runtime_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        env = dict(os.environ)
+        env["CLAUDE_PROJECT_DIR"] = str(tmp_path)
+        return env
+
+    @pytest.fixture
+    def hook_script(self, tmp_path):
+        return _write_hook(
+            tmp_path / "echo-hook.py", SAFE_HOOK_BODY.format(claude_dir=str(CLAUDE_DIR))
+        )
+
+    def _run_shim(self, hook_script, payload, env):
+        return subprocess.run(
+            [sys.executable, str(SHIM_PATH), str(hook_script)],
+            input=json.dumps(payload).encode("utf-8"),
+            capture_output=True,
+            env=env,
+            timeout=60,
+        )
+
+    def test_fallback_without_daemon(self, hook_script, runtime_env):
+        result = self._run_shim(hook_script, {"tool_name": "Bash"}, runtime_env)
+        assert result.returncode == 0, result.stderr.decode()
+        assert json.loads(result.stdout)["echo"] == "Bash"
+
+    def test_forwarded_through_daemon(self, hook_script, runtime_env):
+        server = subprocess.Popen(
+            [sys.executable, str(DAEMON_PATH), "serve", "--idle-timeout", "30"],
+            env=runtime_env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            sock = hook_daemon.socket_path(CLAUDE_DIR)
+            while hook_daemon._ping(sock) is None:
+                assert server.poll() is None, server.stderr.read().decode()
+                assert time.monotonic() < deadline, "hookd 未在時限內就緒"
+                time.sleep(0.05)
+
+            ok = self._run_shim(hook_script, {"tool_name": "Bash"}, runtime_env)
+            assert ok.returncode == 0, ok.stderr.decode()
+            output = json.loads(ok.stdout)
+            assert output["echo"] == "Bash"
+            # 由伺服器 fork 的子行程執行，非 shim 自身
+            assert output["pid"] != server.pid
+
+            failed = self._run_shim(hook_script, {"tool_name": "Bash", "boom": True}, runtime_env)
+            assert failed.returncode == 2, "fail_closed=True 的例外應回傳 EXIT_DENY"
+            assert b"daemon-test-hook failed unexpectedly" in failed.stderr
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+        assert not hook_daemon.socket_path(CLAUDE_DIR).exists()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+hook_env（hook 共用預建環境）測試
+
+驗證項目：
+1. PEP 723 區塊解析與 specifier / 環境標記評估
+2. uv.lock 只計入 --no-dev 會安裝的套件
+3. 漂移偵測：缺套件、版本不符、requires-python 不符
+4. build：uv sync --locked 失敗即中止；成功時寫入漂移清單與 stamp
+5. hook-env-run.sh：環境可用時以環境直譯器執行，未建置 / 過期 / 漂移時
+   回退 hook 自身 shebang
+6. registered_hook_scripts 辨識啟動器包裹的命令
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import hook_daemon, hook_env
+
+CLAUDE_DIR = Path(__file__).resolve().parent.parent.parent
+
+LOCK = """version = 1
+requires-python = ">=3.10"
+
+[[package]]
+name = "claude-hooks"
+version = "0.1.0"
+source = { virtual = "." }
+dependencies = [{ name = "pyyaml" }]
+
+[package.dev-dependencies]
+dev = [{ name = "pytest" }]
+
+[[package]]
+name = "pytest"
+version = "8.0.0"
+source = { registry = "https://pypi.org/simple" }
+dependencies = [{ name = "pluggy" }]
+
+[[package]]
+name = "pluggy"
+version = "1.5.0"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "PyYAML"
+version = "6.0.2"
+source = { registry = "https://pypi.org/simple" }
+"""
+
+
+def _script(deps: str, requires: str = ">=3.10") -> str:
+    return (
+        "#!/usr/bin/env -S uv run --quiet --script\n"
+        "# /// script\n"
+        "# requires-python = \"{}\"\n"
+        "# dependencies = {}\n"
+        "# ///\n"
+        "import sys\n"
+        "print(sys.executable)\n"
+    ).format(requires, deps)
+
+
+@pytest.fixture
+def claude_dir(tmp_path):
+    hooks = tmp_path / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    (hooks / "pyproject.toml").write_text("[project]\nname = \"claude-hooks\"\n", encoding="utf-8")
+    (hooks / "uv.lock").write_text(LOCK, encoding="utf-8")
+    return tmp_path / ".claude"
+
+
+def _write_hook(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    path.chmod(0o755)
+    return path
+
+
+class TestMetadata:
+    def test_read_script_metadata(self):
+        meta = hook_env.read_script_metadata(_script('["pyyaml>=6.0", "filelock"]'))
+        assert meta == {"requires-python": ">=3.10", "dependencies": ["pyyaml>=6.0", "filelock"]}
+        assert hook_env.read_script_metadata("import sys\n") is None
+
+    @pytest.mark.parametrize("spec,version,expected", [
+        (">=6.0", "6.0.2", True),
+        (">=6.1,<7", "6.0.2", False),
+        ("~=6.0", "6.5", True),
+        ("~=6.0.1", "6.1.0", False),
+        ("==6.*", "6.0.2", True),
+        ("!=6.0.*", "6.0.2", False),
+        ("", "1.0", True),
+        ("@ https://x", "1.0", None),
+    ])
+    def test_specifier_satisfied(self, spec, version, expected):
+        assert hook_env.specifier_satisfied(spec, version) is expected
+
+    def test_requirement_markers(self):
+        name, spec, marker = hook_env.parse_requirement("Tomli>=1.2.0;python_version<'3.11'")
+        assert (name, spec) == ("tomli", ">=1.2.0")
+        assert hook_env.marker_applies(marker, "3.11.7") is False
+        assert hook_env.marker_applies(marker, "3.10.4") is True
+        assert hook_env.marker_applies("sys_platform == 'win32'", "3.11.7") is True
+
+
+class TestDrift:
+    def test_locked_packages_excludes_dev_only(self, claude_dir):
+        assert hook_env.locked_packages(claude_dir / "hooks" / "uv.lock") == {"pyyaml": "6.0.2"}
+
+    def test_check_drift(self, claude_dir):
+        hooks = claude_dir / "hooks"
+        ok = _write_hook(hooks / "ok-hook.py", _script('["PyYAML>=6.0"]'))
+        stdlib = _write_hook(hooks / "plain-hook.py", "#!/usr/bin/env python3\nprint(1)\n")
+        missing = _write_hook(hooks / "lock-hook.py", _script('["pyyaml", "filelock>=3.12"]'))
+        newer = _write_hook(claude_dir / "skills" / "x" / "hooks" / "new-hook.py",
+                            _script('["pyyaml>=7"]', requires=">=3.12"))
+
+        scripts = hook_env.discover_hook_scripts(claude_dir)
+        assert set(scripts) == {ok, stdlib, missing, newer}
+
+        drifts = {Path(d.script).name: d.issues for d in hook_env.check_drift(
+            scripts, {"pyyaml": "6.0.2"}, "3.11.7")}
+        assert set(drifts) == {"lock-hook.py", "new-hook.py"}
+        assert drifts["lock-hook.py"] == ["missing from locked env: filelock>=3.12"]
+        assert len(drifts["new-hook.py"]) == 2
+
+
+class TestBuild:
+    def test_requires_uv(self, claude_dir, monkeypatch):
+        monkeypatch.setattr(hook_env.shutil, "which", lambda name: None)
+        with pytest.raises(hook_env.HookEnvError):
+            hook_env.build_env(claude_dir)
+
+    def test_stale_lock_aborts(self, claude_dir, monkeypatch):
+        monkeypatch.setattr(hook_env.shutil, "which", lambda name: "/usr/bin/uv")
+
+        def runner(command, **kwargs):
+            return subprocess.CompletedProcess(command, 1, "", "error: The lockfile needs to be updated\n")
+
+        with pytest.raises(hook_env.HookEnvError, match="lockfile"):
+            hook_env.build_env(claude_dir, runner=runner)
+        assert hook_env.read_stamp(claude_dir) is None
+
+    def test_writes_stamp_and_fallback(self, claude_dir, monkeypatch):
+        monkeypatch.setattr(hook_env.shutil, "which", lambda name: "/usr/bin/uv")
+        _write_hook(claude_dir / "hooks" / "ok-hook.py", _script('["pyyaml"]'))
+        _write_hook(claude_dir / "hooks" / "lock-hook.py", _script('["filelock"]'))
+        commands = []
+
+        def runner(command, **kwargs):
+            commands.append((command, kwargs.get("env", {}).get("UV_PROJECT_ENVIRONMENT")))
+            if command[1] == "sync":
+                hook_env.env_dir(claude_dir).mkdir(parents=True)
+                return subprocess.CompletedProcess(command, 0, "", "")
+            return subprocess.CompletedProcess(command, 0, "3.11.7\n", "")
+
+        stamp = hook_env.build_env(claude_dir, runner=runner)
+
+        sync, env_location = commands[0]
+        assert sync[1:4] == ["sync", "--locked", "--no-dev"]
+        assert env_location == str(hook_env.env_dir(claude_dir))
+        assert stamp["python"] == "3.11.7"
+        assert stamp["fallback"] == ["hooks/lock-hook.py"]
+        assert hook_env.read_stamp(claude_dir)["packages"] == {"pyyaml": "6.0.2"}
+        fallback_file = hook_env.env_dir(claude_dir) / hook_env.FALLBACK_FILENAME
+        assert fallback_file.read_text(encoding="utf-8") == "hooks/lock-hook.py\n"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="啟動器為 POSIX sh")
+class TestLauncher:
+    @pytest.fixture
+    def built(self, claude_dir):
+        """以目前直譯器模擬已建置的環境；hook shebang 改為可直接執行的 sh"""
+        hooks = claude_dir / "hooks"
+        shutil.copy2(CLAUDE_DIR / "hooks" / hook_env.LAUNCHER_NAME, hooks / hook_env.LAUNCHER_NAME)
+        python = hook_env.env_python(claude_dir)
+        python.parent.mkdir(parents=True)
+        python.symlink_to(sys.executable)
+        hook = _write_hook(hooks / "probe-hook.py", "#!/bin/sh\necho shebang\n")
+        env = hook_env.env_dir(claude_dir)
+        past = time.time() - 60
+        for path in (hook, hooks / "pyproject.toml", hooks / "uv.lock"):
+            os.utime(path, (past, past))
+        (env / hook_env.FALLBACK_FILENAME).write_text("", encoding="utf-8")
+        (env / hook_env.STAMP_FILENAME).write_text("{}", encoding="utf-8")
+        return claude_dir
+
+    @staticmethod
+    def _run(claude_dir: Path, hook: Path) -> str:
+        launcher = claude_dir / "hooks" / hook_env.LAUNCHER_NAME
+        result = subprocess.run([str(launcher), str(hook)], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+
+    def test_uses_env_python(self, built):
+        hook = built / "hooks" / "probe-hook.py"
+        hook.write_text("import sys\nprint('env', sys.argv[0])\n", encoding="utf-8")
+        os.utime(hook, (time.time() - 60,) * 2)
+        assert self._run(built, hook) == "env {}".format(hook)
+
+    def test_falls_back_when_not_built(self, claude_dir):
+        hooks = claude_dir / "hooks"
+        shutil.copy2(CLAUDE_DIR / "hooks" / hook_env.LAUNCHER_NAME, hooks / hook_env.LAUNCHER_NAME)
+        hook = _write_hook(hooks / "probe-hook.py", "#!/bin/sh\necho shebang\n")
+        assert self._run(claude_dir, hook) == "shebang"
+
+    def test_falls_back_when_lock_newer(self, built):
+        (built / "hooks" / "uv.lock").touch()
+        os.utime(built / "hooks" / "uv.lock", (time.time() + 60,) * 2)
+        assert self._run(built, built / "hooks" / "probe-hook.py") == "shebang"
+
+    def test_falls_back_for_drifted_hook(self, built):
+        fallback = hook_env.env_dir(built) / hook_env.FALLBACK_FILENAME
+        fallback.write_text("hooks/other-hook.py\nhooks/probe-hook.py\n", encoding="utf-8")
+        assert self._run(built, built / "hooks" / "probe-hook.py") == "shebang"
+
+
+class TestRegisteredScripts:
+    def test_launcher_wrapped_command(self, tmp_path):
+        settings = tmp_path / "settings.json"
+        settings.write_text(json.dumps({"hooks": {"PreToolUse": [{"hooks": [{
+            "command": "$CLAUDE_PROJECT_DIR/.claude/hooks/hook-env-run.sh "
+                       "$CLAUDE_PROJECT_DIR/.claude/hooks/a-hook.py",
+        }]}]}}), encoding="utf-8")
+        scripts = hook_daemon.registered_hook_scripts(settings, tmp_path)
+        assert scripts == [tmp_path / ".claude" / "hooks" / "a-hook.py"]
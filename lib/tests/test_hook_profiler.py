@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+hook_profiler（hook 延遲剖析）測試
+
+驗證項目：
+1. 開關：環境變數優先，其次旗標檔；未開啟時 run_hook_safely 不寫明細
+2. run_hook_safely 寫入明細：鏈鍵取自 stdin tool_name 或 CLAUDE_HOOK_CHAIN、
+   子行程數由 audit hook 計數、import 時間自 mark_load_start 起算
+3. 百分位數（nearest-rank）與預算判定
+4. 同一次鏈觸發的分組：tool_use_id 優先，否則依時間視窗
+"""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import hook_io, hook_logging, hook_profiler
+from lib.hook_profiler import ProfileRecord, group_chain_runs, percentile, summarize_profiles
+
+
+BUDGETS = hook_profiler.load_budgets({"hook_ms": 50, "chain_ms": 100, "hooks": {"slow": 500}})
+
+
+def _rec(hook, start, total_ms, chain="PreToolUse/Bash", tool_use_id="", session="s1",
+         import_ms=0.0, subprocesses=0):
+    return ProfileRecord(
+        hook=hook, chain=chain, event=chain.split("/")[0], session=session,
+        tool_use_id=tool_use_id, start=start, end=start + total_ms / 1000.0,
+        import_ms=import_ms, main_ms=total_ms - import_ms,
+        subprocesses=subprocesses, exit_code=0,
+    )
+
+
+class TestEnabled:
+    def test_env_overrides_flag_file(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(hook_profiler.ENV_PROFILE, raising=False)
+        assert not hook_profiler.is_enabled(tmp_path)
+        hook_profiler.set_enabled(tmp_path, True)
+        assert hook_profiler.is_enabled(tmp_path)
+        monkeypatch.setenv(hook_profiler.ENV_PROFILE, "0")
+        assert not hook_profiler.is_enabled(tmp_path)
+        hook_profiler.set_enabled(tmp_path, False)
+        monkeypatch.setenv(hook_profiler.ENV_PROFILE, "1")
+        assert hook_profiler.is_enabled(tmp_path)
+
+
+class TestRunHookSafely:
+    @pytest.fixture
+    def profile_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(hook_logging, "get_project_root", lambda: tmp_path)
+        monkeypatch.setenv(hook_profiler.ENV_PROFILE, "1")
+        monkeypatch.delenv(hook_profiler.ENV_CHAIN, raising=False)
+        return tmp_path / ".claude" / "hook-logs" / hook_profiler.PROFILE_SUBDIR
+
+    def test_records_chain_and_subprocesses(self, profile_dir, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({
+            "hook_event_name": "PreToolUse", "tool_name": "Bash",
+            "tool_use_id": "toolu_1", "session_id": "s1",
+        })))
+
+        def main():
+            hook_io.read_hook_input()
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+            return 0
+
+        hook_profiler.mark_load_start()
+        assert hook_logging.run_hook_safely(main, "sample") == 0
+        (record,) = hook_profiler.iter_profiles(profile_dir)
+        assert (record.hook, record.chain, record.tool_use_id) == ("sample", "PreToolUse/Bash", "toolu_1")
+        assert record.subprocesses == 1
+        assert 0 <= record.import_ms < 1000
+        assert record.end >= record.start
+
+    def test_runner_chain_env_wins(self, profile_dir, monkeypatch):
+        monkeypatch.setenv(hook_profiler.ENV_CHAIN, "PostToolUse/Write|Edit")
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({
+            "hook_event_name": "PostToolUse", "tool_name": "Edit",
+        })))
+
+        def main():
+            hook_io.read_hook_input()
+            return 0
+
+        hook_logging.run_hook_safely(main, "sample")
+        (record,) = hook_profiler.iter_profiles(profile_dir)
+        assert record.chain == "PostToolUse/Write|Edit"
+
+    def test_disabled_writes_nothing(self, profile_dir, monkeypatch):
+        monkeypatch.setenv(hook_profiler.ENV_PROFILE, "0")
+        hook_logging.run_hook_safely(lambda: 0, "sample")
+        assert not profile_dir.exists()
+
+
+class TestSummary:
+    def test_nearest_rank_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([7.0], 99) == 7.0
+
+    def test_hook_budget_uses_override(self):
+        records = [_rec("fast", i, 10 + i * 3, tool_use_id=str(i)) for i in range(20)]
+        records += [_rec("slow", i, 300, tool_use_id=str(i), import_ms=250, subprocesses=2)
+                    for i in range(20)]
+        hooks = summarize_profiles(records, BUDGETS)["hooks"]
+        assert hooks["fast"]["p95"] == 64.0
+        assert hooks["fast"]["over_budget"]
+        assert hooks["slow"]["budget_ms"] == 500.0
+        assert not hooks["slow"]["over_budget"]
+        assert hooks["slow"]["import_ms_p50"] == 250.0
+        assert hooks["slow"]["subprocesses_mean"] == 2.0
+
+    def test_chain_wall_clock_per_trigger(self):
+        # 兩支 hook 平行：鏈耗時取牆鐘（max end - min start），非加總
+        records = [
+            _rec("a", 100.0, 80, tool_use_id="t1"),
+            _rec("b", 100.01, 80, tool_use_id="t1"),
+            _rec("a", 200.0, 40, tool_use_id="t2"),
+        ]
+        chain = summarize_profiles(records, BUDGETS)["chains"]["PreToolUse/Bash"]
+        assert chain["count"] == 2
+        assert chain["p99"] == pytest.approx(90.0)
+        assert chain["hooks"] == ["a", "b"]
+
+    def test_grouping_without_tool_use_id_uses_window(self):
+        records = [
+            _rec("a", 10.0, 5, chain="SessionStart"),
+            _rec("b", 10.5, 5, chain="SessionStart"),
+            _rec("a", 10.0 + hook_profiler.CHAIN_WINDOW_S + 1, 5, chain="SessionStart"),
+            _rec("a", 10.2, 5, chain="SessionStart", session="s2"),
+        ]
+        runs = group_chain_runs(records)
+        assert sorted(len(run) for run in runs) == [1, 1, 2]
+
+    def test_budget_config_defaults(self):
+        budgets = hook_profiler.load_budgets({"percentile": "p42", "hook_ms": 75})
+        assert budgets["percentile"] == "p95"
+        assert budgets["hook_ms"] == 75
+        assert budgets["chain_ms"] == hook_profiler.DEFAULT_BUDGETS["chain_ms"]
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+hook_runner（批次 Hook 派發器）測試
+
+驗證項目：
+1. run_one：行程內執行、stdin 共用、例外隔離依 fail_closed 轉為 exit 1/2、
+   逾時經 run_hook_safely 套用 fail_closed、行程狀態（sys.path / environ /
+   stdout）執行後還原
+2. merge_results：exit 2 deny-wins、permissionDecision 取最嚴格者、
+   additionalContext 串接、純文字 stdout 依事件分流
+3. load_group：群組鍵與 timeout_ms 解析
+4. config/hook-runner.yaml 與 settings.json 逐支註冊清單一致（parity）
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import hook_runner
+from lib.hook_runner import HookRunResult, HookSpec, merge_results, run_group, run_one
+
+CLAUDE_DIR = Path(__file__).resolve().parents[2]
+
+HOOK_TEMPLATE = '''
+import json
+import sys
+sys.path.insert(0, {claude_dir!r})
+from lib.hook_logging import run_hook_safely
+
+def main():
+    data = json.loads(sys.stdin.read() or "{{}}")
+{body}
+
+if __name__ == "__main__":
+    sys.exit(run_hook_safely(main, {name!r}, fail_closed={fail_closed}))
+'''
+
+
+@pytest.fixture(autouse=True)
+def isolated_logs(tmp_path, monkeypatch):
+    import lib.hook_logging as hl
+    monkeypatch.setattr(hl, "get_project_root", lambda: tmp_path)
+
+
+def _hook(tmp_path: Path, name: str, body: str, fail_closed: bool = False, timeout_ms: int = 5000) -> HookSpec:
+    indented = "\n".join("    " + line for line in body.strip("\n").splitlines())
+    script = tmp_path / "{}.py".format(name)
+    script.write_text(
+        HOOK_TEMPLATE.format(claude_dir=str(CLAUDE_DIR), body=indented, name=name, fail_closed=fail_closed),
+        encoding="utf-8",
+    )
+    return HookSpec(script=script, timeout_ms=timeout_ms)
+
+
+def _pre_output(decision: str, reason: str) -> str:
+    return json.dumps({
+        "hookSpecificOutput": {
+            "hookEventName": "PreToolUse",
+            "permissionDecision": decision,
+            "permissionDecisionReason": reason,
+        }
+    })
+
+
+class TestRunOne:
+    def test_hooks_share_same_input(self, tmp_path):
+        spec = _hook(tmp_path, "echo", "print(data['tool_name'])\nreturn 0")
+        assert run_one(spec, '{"tool_name": "Bash"}').stdout == "Bash\n"
+        assert run_one(spec, '{"tool_name": "Edit"}').stdout == "Edit\n"
+
+    def test_exception_isolated_fail_open(self, tmp_path):
+        spec = _hook(tmp_path, "boom-open", "raise RuntimeError('x')")
+        result = run_one(spec, "{}")
+        assert result.exit_code == 1
+        assert "boom-open failed unexpectedly" in result.stderr
+
+    def test_exception_isolated_fail_closed(self, tmp_path):
+        spec = _hook(tmp_path, "boom-closed", "raise RuntimeError('x')", fail_closed=True)
+        assert run_one(spec, "{}").exit_code == 2
+
+    def test_timeout_respects_fail_closed(self, tmp_path):
+        body = "import time\ntime.sleep(5)\nreturn 0"
+        closed = run_one(_hook(tmp_path, "slow-closed", body, fail_closed=True, timeout_ms=100), "{}")
+        opened = run_one(_hook(tmp_path, "slow-open", body, fail_closed=False, timeout_ms=100), "{}")
+        assert closed.exit_code == 2 and closed.timed_out
+        assert opened.exit_code == 1 and opened.timed_out
+
+    def test_process_state_restored(self, tmp_path):
+        body = (
+            "import os\n"
+            "sys.path.insert(0, '/nonexistent-hook-runner-path')\n"
+            "os.environ['HOOK_RUNNER_LEAK'] = '1'\n"
+            "return 0"
+        )
+        path_before = list(sys.path)
+        stdout_before = sys.stdout
+        run_one(_hook(tmp_path, "leaky", body), "{}")
+        assert sys.path == path_before
+        assert "HOOK_RUNNER_LEAK" not in os.environ
+        assert sys.stdout is stdout_before
+
+
+class TestMergeResults:
+    def test_exit2_wins_over_json(self):
+        merged = merge_results("PreToolUse", [
+            HookRunResult("a", 0, stdout=_pre_output("allow", "ok")),
+            HookRunResult("b", 2, stderr="阻擋 B\n"),
+            HookRunResult("c", 2, stderr="阻擋 C\n"),
+        ])
+        assert merged.exit_code == 2
+        assert "阻擋 B" in merged.stderr and "阻擋 C" in merged.stderr
+        assert merged.stdout == ""
+
+    def test_deny_beats_ask_beats_allow(self):
+        merged = merge_results("PreToolUse", [
+            HookRunResult("a", 0, stdout=_pre_output("allow", "fine")),
+            HookRunResult("b", 0, stdout=_pre_output("ask", "確認一下")),
+            HookRunResult("c", 0, stdout=_pre_output("deny", "不行")),
+        ])
+        hso = json.loads(merged.stdout)["hookSpecificOutput"]
+        assert merged.exit_code == 0
+        assert hso["permissionDecision"] == "deny"
+        assert hso["permissionDecisionReason"] == "不行"
+
+    def test_context_concatenated_in_order(self):
+        def ctx(text):
+            return json.dumps({"hookSpecificOutput": {"hookEventName": "SessionStart", "additionalContext": text}})
+
+        merged = merge_results("SessionStart", [
+            HookRunResult("a", 0, stdout=ctx("第一")),
+            HookRunResult("b", 0, stdout="純文字提醒\n"),
+            HookRunResult("c", 0, stdout=ctx("第三")),
+        ])
+        hso = json.loads(merged.stdout)["hookSpecificOutput"]
+        assert hso["hookEventName"] == "SessionStart"
+        assert hso["additionalContext"] == "第一\n\n第三\n\n純文字提醒"
+
+    def test_plain_stdout_goes_to_stderr_for_tool_events(self):
+        merged = merge_results("PreToolUse", [HookRunResult("a", 0, stdout="debug 訊息\n")])
+        assert merged.stdout == ""
+        assert "debug 訊息" in merged.stderr
+
+    def test_block_decision_and_continue_false(self):
+        merged = merge_results("Stop", [
+            HookRunResult("a", 0, stdout=json.dumps({"decision": "block", "reason": "還有事"})),
+            HookRunResult("b", 0, stdout=json.dumps({"continue": False, "stopReason": "停"})),
+        ])
+        output = json.loads(merged.stdout)
+        assert output["decision"] == "block" and output["reason"] == "還有事"
+        assert output["continue"] is False and output["stopReason"] == "停"
+
+
+class TestRunGroup:
+    def test_group_end_to_end(self, tmp_path):
+        specs = [
+            _hook(tmp_path, "g-allow", "print(json.dumps({'hookSpecificOutput': {'hookEventName': 'PreToolUse', 'permissionDecision': 'allow', 'permissionDecisionReason': 'ok'}}))\nreturn 0"),
+            _hook(tmp_path, "g-crash", "raise RuntimeError('x')"),
+            _hook(tmp_path, "g-deny", "print('不可以', file=sys.stderr)\nreturn 2"),
+        ]
+        merged = run_group("PreToolUse", specs, '{"tool_name": "Bash"}')
+        assert merged.exit_code == 2
+        assert "不可以" in merged.stderr
+        assert [r.exit_code for r in merged.results] == [0, 1, 2]
+
+
+class TestLoadGroup:
+    def test_group_key_and_timeouts(self, tmp_path):
+        config = {"groups": {
+            "PreToolUse/Bash": [{"script": "hooks/a.py", "timeout_ms": 5000}, "hooks/b.py"],
+            "SessionStart": [{"script": "hooks/c.py"}],
+        }}
+        bash = hook_runner.load_group("PreToolUse", "Bash", config=config, claude_dir=tmp_path)
+        assert [(s.script, s.timeout_ms) for s in bash] == [
+            (tmp_path / "hooks/a.py", 5000),
+            (tmp_path / "hooks/b.py", hook_runner.DEFAULT_HOOK_TIMEOUT_MS),
+        ]
+        assert hook_runner.load_group("SessionStart", config=config, claude_dir=tmp_path)[0].name == "c"
+
+    def test_missing_group_raises(self):
+        with pytest.raises(KeyError):
+            hook_runner.load_group("Stop", config={"groups": {}})
+
+
+class TestConfigSettingsParity:
+    """settings.json 仍逐支註冊時，runner 群組清單須與其一致"""
+
+    def test_groups_match_settings_registration(self):
+        config = yaml.safe_load((CLAUDE_DIR / "config" / "hook-runner.yaml").read_text(encoding="utf-8"))
+        settings = json.loads((CLAUDE_DIR / "settings.json").read_text(encoding="utf-8"))
+
+        for key, entries in config["groups"].items():
+            event, _, matcher = key.partition("/")
+            registered = []
+            for group in settings["hooks"].get(event, []):
+                if (group.get("matcher") or "") != matcher:
+                    continue
+                for hook in group["hooks"]:
+                    # 取出 .py 腳本 token（部分命令帶 `uv run` 前綴）
+                    script = next(t for t in hook["command"].split() if t.endswith(".py"))
+                    registered.append(script.replace("$CLAUDE_PROJECT_DIR/.claude/", ""))
+            if any("hook-runner.py" in command for command in registered):
+                continue  # 已切換為 runner 註冊，清單以本設定為準
+            assert [e["script"] for e in entries] == registered, key
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+hook_telemetry（hook 執行遙測）測試
+
+驗證項目：
+1. 紀錄編碼 / 解碼往返；不完整尾端紀錄不解碼、下次續讀
+2. load_rollup 增量彙總（僅讀新紀錄）、保留期外 segment 刪除
+3. summarize 依小時粒度過濾 since，計算耗時與 error / block
+4. run_hook_safely 寫入遙測：事件名取自 stdin、例外與 sys.exit 皆記錄；
+   hook_io 輸出 JSON ask / deny 決策（exit 0）記為該決策；日誌改寫每日一檔
+"""
+
+import io
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import hook_io, hook_logging, hook_telemetry
+from lib.hook_telemetry import load_rollup, record_invocation, summarize
+
+
+NOW = datetime(2026, 10, 18, 12, 30, 0)
+
+
+@pytest.fixture
+def telemetry_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv(hook_telemetry.ENV_TELEMETRY, raising=False)
+    return tmp_path / "hook-logs" / hook_telemetry.TELEMETRY_SUBDIR
+
+
+def _record(telemetry_dir, hook, when, duration_s=0.01, exit_code=0, **kwargs):
+    record_invocation(telemetry_dir, hook, duration_s, exit_code,
+                      event=kwargs.pop("event", "PreToolUse"), now=when.timestamp(), **kwargs)
+
+
+class TestRecords:
+    def test_roundtrip(self, telemetry_dir):
+        _record(telemetry_dir, "phase4-decision-enforcement", NOW, 0.0125, 2, event="PreToolUse")
+        _record(telemetry_dir, "中文-hook", NOW, 0.5, 0, event="Stop")
+        records = list(hook_telemetry.iter_records(telemetry_dir))
+        assert [(r.hook, r.event, r.exit_code, r.decision) for r in records] == [
+            ("phase4-decision-enforcement", "PreToolUse", 2, "block"),
+            ("中文-hook", "Stop", 0, "allow"),
+        ]
+        assert records[0].duration_ms == pytest.approx(12.5)
+
+    def test_partial_tail_record_left_for_next_fold(self, telemetry_dir):
+        _record(telemetry_dir, "a", NOW)
+        segment = next(telemetry_dir.glob("*.bin"))
+        payload = hook_telemetry.encode_record("b", "Stop", 0.01, 0, "allow", NOW.timestamp())
+        with open(segment, "ab") as f:
+            f.write(payload[:5])
+        assert summarize(load_rollup(telemetry_dir, NOW))["a"]["total"] == 1
+        assert "b" not in summarize(load_rollup(telemetry_dir, NOW))
+
+        with open(segment, "ab") as f:
+            f.write(payload[5:])
+        assert summarize(load_rollup(telemetry_dir, NOW))["b"]["total"] == 1
+
+    def test_env_disables_writes(self, telemetry_dir, monkeypatch):
+        monkeypatch.setenv(hook_telemetry.ENV_TELEMETRY, "0")
+        _record(telemetry_dir, "a", NOW)
+        assert not telemetry_dir.exists()
+
+
+class TestRollup:
+    def test_incremental_fold_reads_only_new_records(self, telemetry_dir, monkeypatch):
+        _record(telemetry_dir, "a", NOW)
+        load_rollup(telemetry_dir, NOW)
+        _record(telemetry_dir, "a", NOW + timedelta(minutes=1))
+
+        decoded = []
+        original = hook_telemetry._decode_records
+
+        def spy(data, start=0):
+            records, consumed = original(data, start)
+            decoded.extend(records)
+            return records, consumed
+
+        monkeypatch.setattr(hook_telemetry, "_decode_records", spy)
+        stats = summarize(load_rollup(telemetry_dir, NOW))
+        assert len(decoded) == 1
+        assert stats["a"]["total"] == 2
+        assert (telemetry_dir / hook_telemetry.ROLLUP_FILENAME).is_file()
+
+    def test_summary_latency_and_outcomes(self, telemetry_dir):
+        _record(telemetry_dir, "a", NOW, 0.010, 0)
+        _record(telemetry_dir, "a", NOW, 0.030, 2)
+        _record(telemetry_dir, "a", NOW, 0.020, 1)
+        _record(telemetry_dir, "a", NOW, 0.020, 0, decision=hook_telemetry.DECISION_DENY)
+        stats = summarize(load_rollup(telemetry_dir, NOW))["a"]
+        assert stats["total"] == 4
+        assert stats["errors"] == 1
+        assert stats["blocks"] == 2
+        assert stats["duration_ms_mean"] == pytest.approx(20.0)
+        assert stats["duration_ms_max"] == pytest.approx(30.0)
+
+    def test_since_filters_by_hour(self, telemetry_dir):
+        _record(telemetry_dir, "a", NOW - timedelta(days=2))
+        _record(telemetry_dir, "a", NOW)
+        stats = summarize(load_rollup(telemetry_dir, NOW), since=NOW - timedelta(hours=1))
+        assert stats["a"]["total"] == 1
+        assert stats["a"]["per_day"] == {"2026-10-18": 1}
+
+    def test_retention_prunes_old_segments(self, telemetry_dir):
+        old = NOW - timedelta(days=hook_telemetry.RETENTION_DAYS + 2)
+        _record(telemetry_dir, "a", old)
+        _record(telemetry_dir, "a", NOW)
+        rollup = load_rollup(telemetry_dir, NOW)
+        assert len(list(telemetry_dir.glob("*.bin"))) == 1
+        assert summarize(rollup)["a"]["total"] == 1
+
+
+class TestRunHookSafely:
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(hook_logging, "get_project_root", lambda: tmp_path)
+        monkeypatch.delenv(hook_telemetry.ENV_TELEMETRY, raising=False)
+        return tmp_path / ".claude" / "hook-logs" / hook_telemetry.TELEMETRY_SUBDIR
+
+    def test_records_event_and_exit_code(self, project, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({"hook_event_name": "PostToolUse"})))
+
+        def main():
+            hook_io.read_hook_input()
+            return 2
+
+        assert hook_logging.run_hook_safely(main, "sample/hook") == 2
+        (record,) = hook_telemetry.iter_records(project)
+        assert (record.hook, record.event, record.exit_code, record.decision) == (
+            "sample-hook", "PostToolUse", 2, "block",
+        )
+
+    def test_json_deny_output_recorded_as_deny(self, project, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps({"hook_event_name": "PreToolUse"})))
+
+        def deny():
+            hook_io.read_hook_input()
+            hook_io.write_hook_output(hook_io.create_pretooluse_output("deny", "blocked"))
+            return 0
+
+        def ask():
+            hook_io.emit_hook_output("PreToolUse", permission_decision="ask")
+            return 0
+
+        def allow():
+            hook_io.write_hook_output(hook_io.create_pretooluse_output("allow", "ok"))
+            return 0
+
+        for name, main in (("deny", deny), ("ask", ask), ("allow", allow)):
+            assert hook_logging.run_hook_safely(main, name) == 0
+        records = {r.hook: r for r in hook_telemetry.iter_records(project)}
+        assert records["deny"].decision == hook_telemetry.DECISION_DENY
+        assert records["ask"].decision == hook_telemetry.DECISION_ASK
+        assert records["allow"].decision == hook_telemetry.DECISION_ALLOW
+
+    def test_logs_appended_to_daily_file(self, project):
+        def main():
+            hook_logging.setup_hook_logging("daily").info("run")
+            return 0
+
+        for _ in range(3):
+            assert hook_logging.run_hook_safely(main, "daily") == 0
+        (log_file,) = (project.parent / "daily").glob("*.log")
+        assert log_file.name == "daily-{}.log".format(
+            datetime.now().strftime(hook_logging.DAILY_LOG_DATE_FORMAT)
+        )
+        assert log_file.read_text(encoding="utf-8").count("run") == 3
+
+    def test_records_exception_and_sys_exit(self, project):
+        def crashing():
+            raise RuntimeError("boom")
+
+        def exiting():
+            sys.exit(0)
+
+        assert hook_logging.run_hook_safely(crashing, "crash") == hook_logging.EXIT_ERROR
+        with pytest.raises(SystemExit):
+            hook_logging.run_hook_safely(exiting, "exit")
+        records = {r.hook: r for r in hook_telemetry.iter_records(project)}
+        assert records["crash"].decision == hook_telemetry.DECISION_EXCEPTION
+        assert records["crash"].event == ""
+        assert records["exit"].exit_code == 0
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+lib 惰性載入與 import_audit（hook import 成本稽核）測試
+
+驗證項目：
+1. `import lib` 不載入任何子模組；公開符號與子模組名稱於首次存取時才載入
+2. run_hook_safely 熱路徑不載入 pyyaml
+3. parse_importtime 解析縮排深度與表頭
+4. audit_script 只計入基線以外的頂層 import，且不執行 hook 主流程
+5. main 依 settings.json 註冊清單量測並以 exit code 反映預算
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import import_audit
+
+CLAUDE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+def _modules_after(code: str) -> set:
+    probe = code + "\nimport sys; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=str(CLAUDE_DIR),
+        capture_output=True, text=True, check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyPackage:
+    def test_import_lib_loads_no_submodules(self):
+        modules = _modules_after("import lib")
+        assert {m for m in modules if m.startswith("lib.")} == set()
+
+    def test_hot_path_does_not_load_yaml(self):
+        modules = _modules_after(
+            "from lib.hook_logging import run_hook_safely\n"
+            "from lib.hook_io import read_hook_input\n"
+            "from lib import parse_ticket_frontmatter"
+        )
+        assert "yaml" not in modules
+        assert "lib.config_loader" not in modules
+
+    def test_exports_resolve_on_access(self):
+        import lib
+        from lib import hook_logging
+
+        assert lib.run_hook_safely is hook_logging.run_hook_safely
+        assert lib.hook_messages.__name__ == "lib.hook_messages"
+        assert set(lib.__all__) <= set(dir(lib))
+        with pytest.raises(AttributeError):
+            lib.no_such_module
+
+
+class TestParseImporttime:
+    def test_depth_and_header(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _yaml\n"
+            "import time:       500 |       2000 | yaml\n"
+            "Traceback (most recent call last):\n"
+        )
+        entries = import_audit.parse_importtime(stderr)
+        assert [(e.name, e.cumulative_us, e.depth) for e in entries] == [
+            ("_yaml", 120, 1),
+            ("yaml", 2000, 0),
+        ]
+
+
+class TestAudit:
+    @pytest.fixture
+    def hook(self, tmp_path):
+        script = tmp_path / "sample-hook.py"
+        script.write_text(
+            "import json, sys\n"
+            "import xml.dom.minidom\n"
+            "if __name__ == '__main__':\n"
+            "    sys.stdin.read()\n"
+            "    sys.exit(3)\n",
+            encoding="utf-8",
+        )
+        return script
+
+    def test_counts_only_non_baseline_top_level(self, hook):
+        baseline = import_audit.baseline_modules()
+        cost = import_audit.audit_script(hook, baseline, top=5, budget_ms=100000)
+        assert cost.error == ""
+        modules = [t["module"] for t in cost.top]
+        assert "xml.dom.minidom" in modules or "xml" in modules
+        assert "runpy" not in modules
+        assert cost.import_ms > 0
+        assert not cost.over_budget
+
+    def test_import_error_is_reported(self, tmp_path):
+        script = tmp_path / "broken-hook.py"
+        script.write_text("import no_such_module_for_audit\n", encoding="utf-8")
+        cost = import_audit.audit_script(script, frozenset())
+        assert "ModuleNotFoundError" in cost.error
+
+    def test_main_reads_settings(self, hook, tmp_path, capsys):
+        settings = tmp_path / "settings.json"
+        settings.write_text(json.dumps({"hooks": {"PreToolUse": [{
+            "matcher": "Bash",
+            "hooks": [{"type": "command", "command": "$CLAUDE_PROJECT_DIR/sample-hook.py"}],
+        }]}}), encoding="utf-8")
+
+        rc = import_audit.main([
+            "--settings", str(settings), "--project-dir", str(tmp_path),
+            "--format", "json", "--budget-ms", "0",
+        ])
+        (cost,) = json.loads(capsys.readouterr().out)
+        assert cost["script"] == str(hook)
+        assert cost["over_budget"]
+        assert rc == 1
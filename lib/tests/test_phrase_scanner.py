@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+phrase_scanner（多規則片語掃描引擎）測試
+
+驗證項目：
+1. scan_lines 與逐行 × 逐規則 finditer 結果（順序、重疊、跨規則）完全相同
+2. 含位置斷言的規則退回逐行掃描，結果仍正確
+3. 同一規則表只編譯一次
+4. segment_markdown_regions 單趟切分各區段
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import phrase_scanner
+from lib.phrase_scanner import (
+    REGION_CONTEXT_BUNDLE,
+    REGION_FENCED_BLOCK,
+    REGION_FRONTMATTER,
+    REGION_RESOLVED_SPAWN_REQUEST,
+    REGION_SCHEMA_PLACEHOLDER,
+    ScanRule,
+    compile_rules,
+    lines_in_region,
+    segment_markdown_regions,
+)
+
+
+def _naive(rules, lines):
+    patterns = [re.compile(pattern, flags) for _key, pattern, flags in rules]
+    return [
+        (line_index, rule_index, match.span())
+        for line_index, line in enumerate(lines)
+        for rule_index, pattern in enumerate(patterns)
+        for match in pattern.finditer(line)
+    ]
+
+
+def _scanned(rules, lines):
+    compiled = compile_rules(ScanRule(*rule) for rule in rules)
+    return [(li, ri, m.span()) for li, ri, m in compiled.scan_lines(lines)]
+
+
+LINES = [
+    "之後再說，未來可能需要",
+    "",
+    "Phase 5 再決定，phase 6 在評估",
+    "無命中的一般內文",
+    "之後",
+    "再說 TODO: 之後",
+]
+
+
+class TestScanLines:
+    def test_matches_naive_scan(self):
+        rules = [
+            ("M1", r"Phase\s*[0-9]+[^\n，,]{0,30}?(?:再|在)(?:決定|評估)", re.IGNORECASE),
+            ("M2", r"(?:之後|以後)\s*(?:再|才)?(?:決定|說)", 0),
+            ("W2", r"未來\s*(?:可能|或許)\s*需要", 0),
+            ("I1", r"(?:TBD|TODO)\s*[:：]?\s*之後", re.IGNORECASE),
+            ("X", r"之後", 0),
+        ]
+        compiled = compile_rules(ScanRule(*rule) for rule in rules)
+        assert compiled.line_local
+        # 「之後」獨立成行、「再說」在下一行：\s* 可跨行但逐行語意不得跨行
+        assert _scanned(rules, LINES) == _naive(rules, LINES)
+
+    def test_position_assertions_fall_back(self):
+        rules = [("A", r"^之後", 0), ("B", r"說$", re.MULTILINE), ("C", r"(?<!再)說", 0)]
+        compiled = compile_rules(ScanRule(*rule) for rule in rules)
+        assert not compiled.line_local
+        assert _scanned(rules, LINES) == _naive(rules, LINES)
+
+    @pytest.mark.parametrize("pattern,expected", [
+        (r"[^\n，,]{0,30}", False),
+        (r"a\$b", False),
+        (r"[$^]x", False),
+        (r"\bword", True),
+        (r"(?=x)y", True),
+        (r"x$", True),
+    ])
+    def test_position_assertion_detection(self, pattern, expected):
+        assert phrase_scanner._has_position_assertion(pattern) is expected
+
+    def test_compiled_once_per_rule_set(self):
+        table = [("M2", re.compile(r"之後再說", re.IGNORECASE))]
+        assert compile_rules(table) is compile_rules(list(table))
+        assert compile_rules(table) is not compile_rules([("M2", r"之後再說")])
+
+
+class TestSegmentMarkdownRegions:
+    def test_regions(self):
+        lines = [
+            "---",                                   # 1 frontmatter
+            "why: Phase 5 再決定",                    # 2
+            "---",                                   # 3
+            "```",                                   # 4 fenced
+            "<!-- Schema[x/y]: note -->",             # 5 fenced + placeholder
+            "```",                                   # 6 fenced + placeholder
+            "## Context Bundle",                     # 7 boundary
+            "<!-- auto-extracted: v1 -->",            # 8 bundle
+            "quoted",                                # 9 bundle
+            "## Spawn Requests",                     # 10 boundary / section start
+            "- **SR-1** first",                      # 11 resolved
+            "  - status: processed",                 # 12 resolved
+            "- **SR-2** second",                     # 13 pending
+            "  - status: pending",                   # 14 pending
+            "## Next",                               # 15
+        ]
+        masks = segment_markdown_regions(lines)
+        assert lines_in_region(masks, REGION_FRONTMATTER) == {1, 2, 3}
+        assert lines_in_region(masks, REGION_FENCED_BLOCK) == {4, 5, 6}
+        assert lines_in_region(masks, REGION_SCHEMA_PLACEHOLDER) == {5, 6}
+        assert lines_in_region(masks, REGION_CONTEXT_BUNDLE) == {8, 9}
+        assert lines_in_region(masks, REGION_RESOLVED_SPAWN_REQUEST) == {11, 12}
+        assert masks[14] == 0
+
+    def test_unclosed_frontmatter_and_fence(self):
+        masks = segment_markdown_regions(["---", "a", "~~~~", "b", "~~~"])
+        assert lines_in_region(masks, REGION_FRONTMATTER) == set()
+        assert lines_in_region(masks, REGION_FENCED_BLOCK) == {3, 4, 5}
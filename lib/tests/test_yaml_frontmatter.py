@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+yaml_frontmatter（共用 frontmatter 解析服務）測試
+
+驗證項目：
+1. load_yaml 與 yaml.safe_load 結果相等（型別一致），涵蓋快速路徑與退回路徑
+2. 語法錯誤、不可列印字元與非法純量（如非法日期）的例外型別與 safe_load 相同
+3. 生成的 1,000 張 Ticket 語料逐張一致
+4. 快速路徑確實處理扁平形狀、遇巢狀結構退回
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from lib import yaml_frontmatter
+from lib.tests.bench_yaml_frontmatter import generate_corpus
+
+
+FLAT_CASES = [
+    "id: 0.31.0-W4-001\nstatus: pending\nwave: 3\nassigned: true\nparent_id: null\n",
+    "created: 2026-01-02\nupdated: 2026-01-02 10:30:00\nratio: 1.5e3\ncount: 1_000\nclock: 12:30:00\n",
+    "children:\n- 0.31.0-W4-001.1\n- 0.31.0-W4-001.2\nblockedBy: []\nwhere: {}\n",
+    "acceptance:\n  - '[ ] 條件 ''一'''\n  - \"[x] 條件二\"\nempty:\nlast: ~\n",
+    "yes: on\nno: off\nhex: 0x1F\noctal: 0o17\ninf: .inf\nnan_key: .NaN\n",
+    "title: 中文 標題：含全形冒號\ncrlf: value\r\nurl: http://example.com/a\n",
+]
+
+FALLBACK_CASES = [
+    "who:\n  current: parsley\n  history: []\n",
+    "# 註解\nid: x\n",
+    "title: value # 行內註解\n",
+    "why: >\n  折行\n  內容\n",
+    "tags: [a, b]\n",
+    "anchor: &a 1\nref: *a\n",
+    "escaped: \"tab\\there\"\n",
+    "folded: first\n  continued\n",
+    "list:\n- a\n  - b\n",
+    "- top\n- level\n",
+    "just a scalar\n",
+    "nel: x\x85\n",
+    "ls: x\u2028next: 1\n",
+    "ps: x\u2029next: 1\n",
+    "cr: x\rnext: 1\n",
+    "\ufeffbom: 1\n",
+    "",
+]
+
+# safe_load 拒絕（ReaderError / ScannerError）、快速路徑須退回以產生相同錯誤
+INVALID_CHAR_CASES = [
+    "title: bell\x07\n",
+    "title: del\x7f\n",
+    "list:\n- a\x85b\n",
+]
+
+
+def _assert_same(text: str) -> None:
+    expected = yaml.safe_load(text)
+    actual = yaml_frontmatter.load_yaml(text)
+    assert actual == expected
+    assert repr(actual) == repr(expected)
+
+
+class TestParity:
+    @pytest.mark.parametrize("text", FLAT_CASES + FALLBACK_CASES)
+    def test_matches_safe_load(self, text):
+        _assert_same(text)
+
+    def test_generated_corpus(self):
+        for text in generate_corpus(1000):
+            _assert_same(text)
+
+    @pytest.mark.parametrize(
+        "text", ["id: [unclosed\n", "a: 1\n b: 2\n", "a: =\n"] + INVALID_CHAR_CASES
+    )
+    def test_yaml_errors_match(self, text):
+        with pytest.raises(yaml.YAMLError):
+            yaml.safe_load(text)
+        with pytest.raises(yaml.YAMLError):
+            yaml_frontmatter.load_yaml(text)
+
+    def test_invalid_date_raises_like_safe_load(self):
+        with pytest.raises(ValueError):
+            yaml.safe_load("created: 2026-02-30\n")
+        with pytest.raises(ValueError):
+            yaml_frontmatter.load_yaml("created: 2026-02-30\n")
+
+
+class TestFastPath:
+    @pytest.mark.parametrize("text", FLAT_CASES)
+    def test_flat_shapes_use_fast_path(self, text):
+        assert yaml_frontmatter._load_flat(text) == yaml.safe_load(text)
+
+    @pytest.mark.parametrize("text", FALLBACK_CASES[:-1])
+    def test_non_flat_shapes_fall_back(self, text):
+        with pytest.raises(yaml_frontmatter._NotFlat):
+            yaml_frontmatter._load_flat(text)
+
+    @pytest.mark.parametrize("text", INVALID_CHAR_CASES)
+    def test_invalid_characters_fall_back(self, text):
+        with pytest.raises(yaml_frontmatter._NotFlat):
+            yaml_frontmatter._load_flat(text)
+
+    def test_unconstructable_scalar_falls_back(self):
+        with pytest.raises(yaml_frontmatter._NotFlat):
+            yaml_frontmatter._load_flat("a: =\n")
@@ -1,33 +1,66 @@
 """Transcript tail-reader 共用工具。
 
-提供反向讀取 Claude Code session JSONL transcript 的工具，避免每次 hook 觸發
-都全檔掃描造成熱路徑成本（W11-004 Phase 4 ginger 視角發現：長 session 可達
+提供讀取 Claude Code session JSONL transcript 尾端訊息的工具，避免每次 hook
+觸發都全檔掃描造成熱路徑成本（W11-004 Phase 4 ginger 視角發現：長 session 可達
 50-100ms/觸發）。
 
 設計重點：
-- 反向讀取（從檔尾往檔頭），找到最後一則 assistant 訊息後立即停止。
-- offset 快取：同一 transcript 路徑的最後 assistant 訊息位置（byte offset）
-  在 process 內存活，下次優先從該 offset 之後讀；命中即返回。
-- 快取失效：transcript 檔案的 (mtime, size) 變動時自動丟棄舊 offset，避免
-  讀到陳舊資料或 transcript 被截斷時讀錯位置。
-- 失敗策略：所有 I/O 與 JSON 解析失敗都吞掉並回傳 None（呼叫端走放行路徑），
-  hook 不可因 transcript 讀取失敗阻擋主流程。
+- 持久化 sidecar 索引：每份 transcript 對應一份索引檔
+  （`<transcript 目錄>/.tail-index/<transcript 檔名>.json`），記錄已掃描的
+  byte 位置與最近 RECENT_LIMIT 則 assistant / user / tool_use 訊息的行起始
+  offset。索引跨 hook 行程共用：Stop / PostToolUse 等各 hook 只需掃描上次
+  索引之後新增的位元組（O(新增量)）。
+- 索引驗證：(inode, mtime_ns, size) 與索引相同 → 直接使用，不讀 transcript；
+  檔案變大且「已索引區段尾端位元組簽章」相符 → append-only 增量續掃；
+  其餘（截斷、重寫、inode 改變）→ 整份重建。
+- 未以換行結尾且無法解析的尾行視為寫入中，不計入已掃描位置，下次續讀。
+- 行程內快取：同一行程多次查詢共用同一 TranscriptIndex（_OFFSET_CACHE），
+  hook-runner 批次執行時亦只掃描一次。
+- 環境變數 CLAUDE_TRANSCRIPT_INDEX=0 停用索引落地（僅保留行程內快取）。
+- 失敗策略：所有 I/O 與 JSON 解析失敗都吞掉並回傳 None / 空結果（呼叫端走放行
+  路徑），hook 不可因 transcript 讀取失敗阻擋主流程；索引寫入失敗不影響結果。
+
+查詢：
+- read_last_assistant_text(): 最後一則 assistant 訊息文字
+- TranscriptIndex.last_entries(kind, k): 最近 k 則指定種類的訊息
+- TranscriptIndex.last_tool_calls(k): 最近 k 個 tool_use block
+- TranscriptIndex.messages_since(offset): 指定 offset 之後的所有訊息
 
 對應 ticket: 0.18.0-W11-004.11
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 索引種類
+KIND_ASSISTANT = "assistant"            # 所有 assistant 訊息（含純 tool_use）
+KIND_ASSISTANT_TEXT = "assistant_text"  # 含文字內容的 assistant 訊息
+KIND_USER = "user"                      # user 訊息（含 tool_result）
+KIND_TOOL_USE = "tool_use"              # assistant 訊息內的 tool_use block
+INDEX_KINDS = (KIND_ASSISTANT, KIND_ASSISTANT_TEXT, KIND_USER, KIND_TOOL_USE)
+
+# 每種類保留的最近訊息數
+RECENT_LIMIT = 64
+
+# 已索引區段尾端簽章長度（bytes），用於判定 append-only
+SIGNATURE_BYTES = 64
 
+INDEX_DIRNAME = ".tail-index"
+INDEX_FORMAT_VERSION = 1
+ENV_TRANSCRIPT_INDEX = "CLAUDE_TRANSCRIPT_INDEX"
+_DISABLED_VALUES = frozenset({"0", "false", "off", "no"})
 
-# (mtime_ns, size_bytes, last_assistant_offset, last_assistant_text)
-# offset 為「該訊息所在行的起始 byte offset」，用於下次從此處往後續讀
-_CacheEntry = Tuple[int, int, int, Optional[str]]
-_OFFSET_CACHE: Dict[str, _CacheEntry] = {}
+# 掃描結果：(行起始 offset, 種類, tool_use 額外資訊 [name, id, block 序號])
+_ScanRecord = Tuple[int, str, Optional[list]]
+
+# 行程內快取：transcript 絕對路徑 → TranscriptIndex
+_OFFSET_CACHE: Dict[str, "TranscriptIndex"] = {}
 
 
 def _extract_assistant_text(obj: dict) -> Optional[str]:
@@ -58,37 +91,290 @@ def _extract_assistant_text(obj: dict) -> Optional[str]:
     return None
 
 
+def _classify(obj: dict, offset: int) -> List[_ScanRecord]:
+    """判定單行 JSONL 物件屬於哪些索引種類。"""
+    msg = obj.get("message")
+    if not isinstance(msg, dict):
+        msg = obj
+    role = msg.get("role") or obj.get("type")
+    if role == "user":
+        return [(offset, KIND_USER, None)]
+    if role != "assistant":
+        return []
+
+    records: List[_ScanRecord] = [(offset, KIND_ASSISTANT, None)]
+    if _extract_assistant_text(obj) is not None:
+        records.append((offset, KIND_ASSISTANT_TEXT, None))
+    content = msg.get("content")
+    if isinstance(content, list):
+        for position, block in enumerate(content):
+            if isinstance(block, dict) and block.get("type") == "tool_use":
+                records.append(
+                    (offset, KIND_TOOL_USE, [block.get("name"), block.get("id"), position])
+                )
+    return records
+
+
+def _read_json_line(f, offset: int) -> Optional[dict]:
+    try:
+        f.seek(offset)
+        obj = json.loads(f.readline().decode("utf-8"))
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _iter_lines(f, start_offset: int):
+    """從 start_offset 逐行產出 (行起始 offset, 行尾 offset, 物件或 None)。
+
+    未以換行結尾且無法解析的尾行視為寫入中，不產出。
+    """
+    f.seek(start_offset)
+    offset = start_offset
+    for raw in f:
+        end = offset + len(raw)
+        stripped = raw.strip()
+        obj = None
+        if stripped:
+            try:
+                obj = json.loads(stripped.decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                if not raw.endswith(b"\n"):
+                    return
+        yield offset, end, obj if isinstance(obj, dict) else None
+        offset = end
+
+
 def _scan_forward_from(
     path: Path, start_offset: int
-) -> Tuple[Optional[int], Optional[str]]:
-    """從 start_offset 開始往檔尾掃描，回傳最後一則 assistant 訊息的 (offset, text)。
+) -> Optional[Tuple[int, List[_ScanRecord]]]:
+    """從 start_offset 開始往檔尾掃描，回傳 (已掃描至的 offset, 索引紀錄)。
 
-    若沒找到回傳 (None, None)。
+    讀取失敗回傳 None。
     """
-    last_offset: Optional[int] = None
-    last_text: Optional[str] = None
+    records: List[_ScanRecord] = []
+    end_offset = start_offset
     try:
         with path.open("rb") as f:
-            f.seek(start_offset)
-            while True:
-                line_start = f.tell()
-                raw = f.readline()
-                if not raw:
-                    break
-                stripped = raw.strip()
-                if not stripped:
-                    continue
-                try:
-                    obj = json.loads(stripped.decode("utf-8"))
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    continue
-                text = _extract_assistant_text(obj)
-                if text is not None:
-                    last_offset = line_start
-                    last_text = text
+            for offset, end, obj in _iter_lines(f, start_offset):
+                end_offset = end
+                if obj is not None:
+                    records.extend(_classify(obj, offset))
+    except OSError:
+        return None
+    return end_offset, records
+
+
+def _index_enabled() -> bool:
+    return os.environ.get(ENV_TRANSCRIPT_INDEX, "").strip().lower() not in _DISABLED_VALUES
+
+
+class TranscriptIndex:
+    """單一 transcript 的尾端訊息索引（持久化於 sidecar 檔）。
+
+    使用方式：
+        index = get_transcript_index(transcript_path)
+        if index is not None:
+            text = index.last_assistant_text()
+            calls = index.last_tool_calls(5)
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.index_path = path.parent / INDEX_DIRNAME / f"{path.name}.json"
+        self._state: Dict[str, Any] = self._empty_state()
+        self._loaded = False
+        self._last_text: Optional[Tuple[int, Optional[str]]] = None
+
+    @staticmethod
+    def _empty_state() -> Dict[str, Any]:
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "ino": None,
+            "mtime_ns": None,
+            "size": None,
+            "indexed": 0,
+            "signature": "",
+            "recent": {kind: [] for kind in INDEX_KINDS},
+        }
+
+    # --- 索引維護 -----------------------------------------------------------
+
+    @property
+    def indexed_offset(self) -> int:
+        """已掃描至的 byte offset（messages_since 的續讀起點）。"""
+        return self._state["indexed"]
+
+    def refresh(self) -> bool:
+        """將索引更新至 transcript 目前內容；transcript 無法讀取時回傳 False。"""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return False
+
+        if not self._loaded:
+            self._loaded = True
+            if _index_enabled():
+                self._state = self._load() or self._state
+
+        state = self._state
+        if (state["ino"], state["mtime_ns"], state["size"]) == (st.st_ino, st.st_mtime_ns, st.st_size):
+            return True
+
+        start = state["indexed"]
+        if state["ino"] != st.st_ino or st.st_size < start or not self._signature_matches(start):
+            state = self._state = self._empty_state()
+            self._last_text = None
+            start = 0
+
+        scanned = _scan_forward_from(self.path, start)
+        if scanned is None:
+            return False
+        end_offset, records = scanned
+        recent = state["recent"]
+        for offset, kind, extra in records:
+            recent[kind].append(offset if extra is None else [offset, *extra])
+        for kind in INDEX_KINDS:
+            del recent[kind][:-RECENT_LIMIT]
+
+        state.update(
+            ino=st.st_ino,
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            indexed=end_offset,
+            signature=self._read_signature(end_offset),
+        )
+        if _index_enabled():
+            self._save()
+        return True
+
+    def _read_signature(self, end_offset: int) -> str:
+        start = max(0, end_offset - SIGNATURE_BYTES)
+        try:
+            with self.path.open("rb") as f:
+                f.seek(start)
+                return f.read(end_offset - start).hex()
+        except OSError:
+            return ""
+
+    def _signature_matches(self, end_offset: int) -> bool:
+        return self._read_signature(end_offset) == self._state["signature"]
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return None
+        recent = data.get("recent")
+        if not isinstance(recent, dict) or any(
+            not isinstance(recent.get(kind), list) for kind in INDEX_KINDS
+        ):
+            return None
+        return data
+
+    def _save(self) -> None:
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(exist_ok=True)
+            tmp_path.write_text(json.dumps(self._state), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # 索引僅為加速，寫入失敗（唯讀目錄等）不影響查詢結果
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+    # --- 查詢 ---------------------------------------------------------------
+
+    def _read_entries(self, offsets: List[int]) -> List[dict]:
+        entries = []
+        try:
+            with self.path.open("rb") as f:
+                for offset in offsets:
+                    obj = _read_json_line(f, offset)
+                    if obj is not None:
+                        entries.append(obj)
+        except OSError:
+            return []
+        return entries
+
+    def last_assistant_text(self) -> Optional[str]:
+        """最後一則含文字內容的 assistant 訊息文字；無則回傳 None。"""
+        offsets = self._state["recent"][KIND_ASSISTANT_TEXT]
+        if not offsets:
+            return None
+        offset = offsets[-1]
+        if self._last_text is not None and self._last_text[0] == offset:
+            return self._last_text[1]
+        entries = self._read_entries([offset])
+        text = _extract_assistant_text(entries[0]) if entries else None
+        self._last_text = (offset, text)
+        return text
+
+    def last_entries(self, kind: str, k: int = 1) -> List[dict]:
+        """最近 k 則指定種類的 JSONL 物件（舊 → 新）；k 上限為 RECENT_LIMIT。"""
+        if k <= 0:
+            return []
+        recent = self._state["recent"][kind]
+        if kind == KIND_TOOL_USE:
+            offsets = sorted({item[0] for item in recent})
+        else:
+            offsets = list(recent)
+        return self._read_entries(offsets[-k:])
+
+    def last_tool_calls(self, k: int = 1) -> List[dict]:
+        """最近 k 個 tool_use block（舊 → 新），含 name / id / input。"""
+        if k <= 0:
+            return []
+        selected = self._state["recent"][KIND_TOOL_USE][-k:]
+        calls: List[dict] = []
+        try:
+            with self.path.open("rb") as f:
+                for offset, _name, _tool_id, position in selected:
+                    obj = _read_json_line(f, offset)
+                    content = ((obj or {}).get("message") or {}).get("content")
+                    if isinstance(content, list) and position < len(content):
+                        calls.append(content[position])
+        except OSError:
+            return []
+        return calls
+
+    def messages_since(self, offset: int) -> Tuple[List[Tuple[int, dict]], int]:
+        """讀取 offset（須為行起點，如前次回傳的續讀 offset）之後的所有訊息。
+
+        Returns:
+            ([(行起始 offset, JSONL 物件), ...], 下次續讀 offset)
+        """
+        messages: List[Tuple[int, dict]] = []
+        next_offset = offset
+        try:
+            with self.path.open("rb") as f:
+                for line_offset, end, obj in _iter_lines(f, offset):
+                    next_offset = end
+                    if obj is not None:
+                        messages.append((line_offset, obj))
+        except OSError:
+            return [], offset
+        return messages, next_offset
+
+
+def get_transcript_index(transcript_path: Optional[str]) -> Optional[TranscriptIndex]:
+    """取得（並更新至最新）transcript 索引；無路徑或檔案無法讀取時回傳 None。"""
+    if not transcript_path:
+        return None
+    path = Path(transcript_path)
+    try:
+        key = str(path.resolve())
     except OSError:
-        return None, None
-    return last_offset, last_text
+        return None
+    index = _OFFSET_CACHE.get(key)
+    if index is None:
+        index = TranscriptIndex(Path(key))
+    if not index.refresh():
+        return None
+    _OFFSET_CACHE[key] = index
+    return index
 
 
 def read_last_assistant_text(
@@ -96,8 +382,8 @@ def read_last_assistant_text(
 ) -> Optional[str]:
     """從 JSONL transcript 讀取最後一則 assistant 訊息文字。
 
-    命中快取時從上次 offset 起續讀；快取無效或 stale（檔案 mtime/size 變動）時
-    全檔掃描後更新快取。失敗一律回傳 None，由呼叫端走放行路徑。
+    經 TranscriptIndex 查詢：索引與檔案一致時不讀 transcript；append 後只掃描
+    新增區段；截斷或重寫時整份重建。失敗一律回傳 None，由呼叫端走放行路徑。
 
     Args:
         transcript_path: transcript JSONL 絕對路徑（None / 空字串視為無）
@@ -110,53 +396,18 @@ def read_last_assistant_text(
         logger.info("transcript_path 為空，跳過")
         return None
 
-    path = Path(transcript_path)
-    if not path.exists():
+    if not Path(transcript_path).exists():
         logger.info("transcript 檔案不存在: %s", transcript_path)
         return None
 
-    try:
-        st = path.stat()
-    except OSError as e:
-        logger.info("transcript stat 失敗: %s", e)
+    index = get_transcript_index(transcript_path)
+    if index is None:
+        logger.info("transcript 讀取失敗: %s", transcript_path)
         return None
-
-    key = str(path.resolve())
-    cached = _OFFSET_CACHE.get(key)
-    start_offset = 0
-    fallback_text: Optional[str] = None
-
-    if cached is not None:
-        cached_mtime, cached_size, cached_offset, cached_text = cached
-        if cached_mtime == st.st_mtime_ns and cached_size <= st.st_size:
-            # 檔案沒被截斷且 mtime 沒變 → cached_text 仍有效；
-            # 若 size 增加，從 cached_offset 之後續讀以更新到最新。
-            if cached_size == st.st_size:
-                logger.debug("transcript 命中快取（檔案無變動）")
-                return cached_text
-            start_offset = cached_size  # 從上次讀過的尾端續讀
-            fallback_text = cached_text
-        else:
-            logger.debug("transcript 快取失效（mtime/size 變動），全檔重掃")
-
-    last_offset, last_text = _scan_forward_from(path, start_offset)
-
-    if last_text is None:
-        # 增量區段沒新 assistant 訊息 → 沿用 fallback（上次快取結果）
-        last_text = fallback_text
-        if last_offset is None and cached is not None:
-            last_offset = cached[2]
-
-    # 更新快取（即使 last_text 為 None，記住已掃過的位置避免下次重掃）
-    _OFFSET_CACHE[key] = (
-        st.st_mtime_ns,
-        st.st_size,
-        last_offset if last_offset is not None else 0,
-        last_text,
-    )
-    return last_text
+    logger.debug("transcript 索引已更新至 offset %d", index.indexed_offset)
+    return index.last_assistant_text()
 
 
 def clear_cache() -> None:
-    """清除 offset 快取（測試用）。"""
+    """清除行程內索引快取（測試用；不刪除 sidecar 索引檔）。"""
     _OFFSET_CACHE.clear()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+YAML frontmatter 共用解析服務
+
+ticket / doc / hook 各自的 frontmatter parser 原本皆直接呼叫
+`yaml.safe_load`（純 Python 掃描器），整版本掃描時 YAML 解析是主要成本。
+本模組集中兩項加速，各 parser 只保留自己的邊界判定與錯誤語意：
+
+1. C 載入器：libyaml 可用時使用 `yaml.CSafeLoader`，否則退回純 Python
+   `yaml.SafeLoader`（HAS_LIBYAML 標示實際使用者）
+2. 扁平 frontmatter 快速路徑：Ticket frontmatter 多為「頂層 key: 純量」
+   與「key: 後接 `- 純量` 區塊清單」的扁平形狀。快速路徑逐行處理這種形狀，
+   純量型別判定沿用 PyYAML SafeLoader 的 implicit resolver 與 constructor
+   （int / float / bool / null / timestamp 等結果與 safe_load 完全一致）；
+   遇到任何超出此形狀的語法（巢狀 mapping、flow 容器、錨點、block scalar、
+   註解、折行續行、跳脫序列等），或含 YAML 不可列印字元（ReaderError）、
+   `\n` / `\r\n` 以外的換行字元（NEL、LS、PS、單獨 CR）時，即整段改走完整
+   YAML 解析
+
+相容性契約：load_yaml(text) 與 yaml.safe_load(text) 回傳值相等、錯誤型別
+相同（yaml.YAMLError）。快速路徑只在「確定等價」時生效，否則退回。
+
+獨立性：本模組僅依賴 stdlib 與 pyyaml，不 import lib 套件其他模組。
+ticket_system 經 claude_lib_loader.load_claude_lib_file() 以檔案路徑載入
+（不觸發 lib/__init__ 的 eager import）；doc_system 以相同方式載入。
+
+效能基準：lib/tests/bench_yaml_frontmatter.py（1,000 張生成 Ticket）。
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.nodes import ScalarNode
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# libyaml 可用時使用 C 載入器
+HAS_LIBYAML = hasattr(yaml, "CSafeLoader")
+SAFE_LOADER = yaml.CSafeLoader if HAS_LIBYAML else yaml.SafeLoader
+
+# 快速路徑：頂層 key 行（key 限簡單識別字，值為單行）
+_KEY_LINE_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):(?:[ ]+(.*))?$")
+
+# 快速路徑：區塊清單項目（記錄縮排以確認同一清單縮排一致）
+_LIST_ITEM_RE = re.compile(r"( *)- (.*)$")
+
+# 不走快速路徑的字元：YAML 不可列印字元（同 yaml.reader.Reader.NON_PRINTABLE，
+# tab 另行處理）、`\n` 以外的換行字元（NEL / LS / PS / 不接 LF 的 CR）與 BOM
+_NON_FLAT_CHARS_RE = re.compile(
+    "[^\x09\x0A\x0D\x20-\x7E\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]"
+    "|[\x85\u2028\u2029\uFEFF]|\r(?!\n)"
+)
+
+# 純量開頭為下列指示字元時不走快速路徑（引號另行處理）
+_PLAIN_INDICATORS = frozenset("?:,[]{}#&*!|>'\"%@`")
+
+# 純量建構沿用 SafeConstructor（與 safe_load 相同的型別轉換實作）
+_CONSTRUCTOR = SafeConstructor()
+_IMPLICIT_RESOLVERS = yaml.SafeLoader.yaml_implicit_resolvers
+
+
+class _NotFlat(Exception):
+    """內容超出快速路徑可處理的形狀"""
+
+
+# ============================================================================
+# 快速路徑
+# ============================================================================
+
+@lru_cache(maxsize=4096)
+def _resolve_plain(value: str) -> Any:
+    """
+    依 SafeLoader 的 implicit resolver 判定純量型別並建構（同 BaseResolver.resolve）
+
+    建構結果皆為不可變型別（str / int / float / bool / None / date / datetime），
+    可安全快取；key 名稱與 status / type 等列舉值在 Ticket 間高度重複。
+    """
+    resolvers = _IMPLICIT_RESOLVERS.get(value[0] if value else "", [])
+    wildcard = _IMPLICIT_RESOLVERS.get(None, [])
+    for tag, regexp in resolvers + wildcard:
+        if regexp.match(value):
+            constructor = _CONSTRUCTOR.yaml_constructors.get(tag)
+            if constructor is None:
+                # 如 `=`（tag:yaml.org,2002:value）：safe_load 會丟出錯誤，交由完整解析
+                raise _NotFlat(value)
+            return constructor(_CONSTRUCTOR, ScalarNode(tag, value))
+    return value
+
+
+def _scalar(raw: str) -> Any:
+    """解析單行純量；非快速路徑可確定等價的寫法丟出 _NotFlat"""
+    value = raw.rstrip(" ")
+    if not value:
+        return None
+    if "\t" in value:
+        raise _NotFlat(raw)
+
+    first = value[0]
+    # 單引號字串：'' 為唯一跳脫
+    if first == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):
+            raise _NotFlat(raw)
+        return inner.replace("''", "'")
+    # 雙引號字串：僅處理無跳脫、無內嵌引號者
+    if first == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or "\\" in inner:
+            raise _NotFlat(raw)
+        return inner
+    # 空 flow 容器
+    if value == "[]":
+        return []
+    if value == "{}":
+        return {}
+
+    # 純量：排除指示字元開頭、mapping 指示（": " / 結尾 ":"）與行內註解
+    if first in _PLAIN_INDICATORS or value.startswith(("- ", "...")) or value == "-":
+        raise _NotFlat(raw)
+    if ": " in value or value.endswith(":") or " #" in value:
+        raise _NotFlat(raw)
+    return _resolve_plain(value)
+
+
+def _load_flat(text: str) -> Optional[Dict[str, Any]]:
+    """扁平 frontmatter 快速路徑；形狀不符丟出 _NotFlat，空內容返回 None"""
+    result: Dict[Any, Any] = {}
+    pending_key: Any = None       # 值為空、可能接區塊清單的 key
+    current_list: Optional[List[Any]] = None
+    list_indent: Optional[int] = None
+
+    unsupported = _NON_FLAT_CHARS_RE.search(text)
+    if unsupported is not None:
+        raise _NotFlat(unsupported.group())
+
+    for line in text.split("\n"):
+        if line.endswith("\r"):
+            line = line[:-1]
+        if not line.strip():
+            continue
+        if line.startswith("#") or "\t" in line:
+            raise _NotFlat(line)
+
+        item = _LIST_ITEM_RE.match(line)
+        if item is not None:
+            indent = len(item.group(1))
+            if current_list is None:
+                if pending_key is None:
+                    raise _NotFlat(line)
+                current_list = []
+                list_indent = indent
+                result[pending_key] = current_list
+                pending_key = None
+            elif indent != list_indent:
+                raise _NotFlat(line)
+            current_list.append(_scalar(item.group(2)))
+            continue
+
+        if line[0] == " ":
+            # 巢狀 mapping 或折行續行
+            raise _NotFlat(line)
+
+        match = _KEY_LINE_RE.match(line)
+        if match is None:
+            raise _NotFlat(line)
+        key = _resolve_plain(match.group(1))
+        raw_value = match.group(2)
+        current_list = None
+        list_indent = None
+        if raw_value is None or not raw_value.strip():
+            pending_key = key
+            result[key] = None
+        else:
+            pending_key = None
+            result[key] = _scalar(raw_value)
+
+    return result or None
+
+
+# ============================================================================
+# 公開 API
+# ============================================================================
+
+def safe_load(text: str) -> Any:
+    """yaml.safe_load 的替代：libyaml 可用時使用 C 載入器"""
+    return yaml.load(text, Loader=SAFE_LOADER)
+
+
+def load_yaml(text: str) -> Any:
+    """
+    解析 frontmatter YAML 文字（扁平快速路徑 → C 載入器 → 純 Python）
+
+    Args:
+        text: frontmatter 本體（不含 --- 邊界線）
+
+    Returns:
+        Any: 同 yaml.safe_load（空內容為 None）
+
+    Raises:
+        yaml.YAMLError: YAML 語法錯誤
+    """
+    try:
+        return _load_flat(text)
+    except (_NotFlat, ValueError, yaml.YAMLError):
+        # ValueError / YAMLError：純量建構失敗（如非法日期），交由完整解析器
+        # 產生與 safe_load 一致的結果或錯誤
+        return safe_load(text)
+
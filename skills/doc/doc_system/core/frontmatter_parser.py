@@ -1,5 +1,6 @@
 """解析 Markdown 文件的 YAML frontmatter。"""
 
+import importlib.util
 from pathlib import Path
 
 import yaml
@@ -7,6 +8,25 @@ import yaml
 
 FRONTMATTER_DELIMITER = "---"
 
+# .claude/lib/yaml_frontmatter.py：共用 frontmatter 解析服務（libyaml + 扁平快速路徑）
+_SHARED_PARSER_PATH = Path(__file__).resolve().parents[4] / "lib" / "yaml_frontmatter.py"
+
+
+def _load_yaml_loader():
+    """取得 YAML 解析函式：共用服務可用時用其 load_yaml，否則 yaml.safe_load。"""
+    if not _SHARED_PARSER_PATH.is_file():
+        return yaml.safe_load
+    try:
+        spec = importlib.util.spec_from_file_location("_doc_yaml_frontmatter", _SHARED_PARSER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception:
+        return yaml.safe_load
+    return module.load_yaml
+
+
+_load_yaml = _load_yaml_loader()
+
 
 def parse_frontmatter_text(text: str) -> dict | None:
     """解析文字內容中的 YAML frontmatter，回傳 dict 或 None。
@@ -32,7 +52,7 @@ def parse_frontmatter(file_path: str) -> dict | None:
     規則：
     - 檔案第一行必須是 '---'
     - 找到第二個 '---' 作為 frontmatter 結尾
-    - 用 yaml.safe_load 解析中間內容
+    - 用 yaml.safe_load 語意解析中間內容（見 _load_yaml）
     - 檔案不存在、無 frontmatter、解析失敗時回傳 None
     """
     path = Path(file_path)
@@ -58,7 +78,7 @@ def _find_closing_delimiter(lines: list[str]) -> int | None:
 def _safe_parse_yaml(content: str) -> dict | None:
     """安全解析 YAML 字串，失敗時回傳 None。"""
     try:
-        result = yaml.safe_load(content)
+        result = _load_yaml(content)
     except yaml.YAMLError:
         return None
 
@@ -42,6 +42,7 @@ Hook 類型: PreToolUse
 import sys
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple, List, NamedTuple, TypedDict
@@ -92,6 +93,8 @@ from acceptance_checkers import (
     check_file_scope_diversity,
     check_hook_protection_acceptance,
     check_experiment_artifact_residual,
+    TicketStore,
+    VerdictCache,
 )
 # W17-120.2 / PC-091: ana_spawned_checker 退場
 # ANA complete 阻擋判斷統一收斂到 children_checker（PC-091 路線：
@@ -159,6 +162,10 @@ EXIT_SUCCESS = 0
 EXIT_ERROR = 1
 EXIT_BLOCK = 2
 
+# 工作區相關 checker（error-pattern grep / mtime 掃描、sibling 掃描、
+# git status + ticket CLI）的並行數：四者互相獨立，各佔一個 worker
+BACKGROUND_CHECKER_WORKERS = 4
+
 TICKET_ID_PATTERN = r'\d+\.\d+\.\d+-W\d+-\d+(?:\.\d+)*'
 
 # Error-pattern 衝突提醒訊息模板
@@ -298,6 +305,41 @@ def detect_chained_pre_complete_write(command: str) -> bool:
 # 主協調函式
 # ============================================================================
 
+def collect_new_error_patterns(
+    ticket_id: str, content: str, frontmatter: Dict[str, Any], project_dir: Path, logger
+) -> Tuple[bool, List[str]]:
+    """步驟 3：ticket 開始後新增、且歸屬本 ticket 的 error-pattern（場景 #17）"""
+    has_new_error_patterns = False
+    new_error_pattern_files: List[str] = []
+
+    ticket_start_time = get_ticket_start_time(frontmatter, logger)
+    if ticket_start_time:
+        has_new_error_patterns, new_error_pattern_files = check_error_patterns_changed(
+            project_dir, ticket_start_time, logger
+        )
+        if has_new_error_patterns:
+            logger.info(
+                f"mtime 比對發現 {len(new_error_pattern_files)} 個候選 error-pattern，"
+                "進入 PC-099 歸屬過濾"
+            )
+            # PC-099 防護：以 frontmatter source_ticket + ticket md 引用雙重過濾
+            new_error_pattern_files = filter_error_patterns_by_ticket_scope(
+                new_error_pattern_files,
+                ticket_id,
+                content,
+                project_dir,
+                logger,
+            )
+            has_new_error_patterns = bool(new_error_pattern_files)
+            logger.info(
+                f"歸屬過濾後保留 {len(new_error_pattern_files)} 個真正屬於當前 ticket 的 error-pattern"
+            )
+    else:
+        logger.warning(f"無法取得 ticket 的開始時間，跳過 error-pattern 檢查")
+
+    return has_new_error_patterns, new_error_pattern_files
+
+
 def check_acceptance_status(
     ticket_id: str, project_dir: Path, logger, command: str = ""
 ) -> AcceptanceCheckResult:
@@ -314,6 +356,11 @@ def check_acceptance_status(
     5. 5W1H 完整性
     6. Execution log 填寫
 
+    ticket 與其後代只讀取、解析一次（TicketStore，children / sibling 共用）；
+    只依 ticket 內文的 checker 經 VerdictCache 記憶結果，重試 complete 時
+    輸入未變者直接重用；工作區相關 checker 在阻擋型內文檢查通過後並行送出，
+    結果仍依原步驟順序取用（阻擋優先序不變）。
+
     Args:
         command: 觸發本次檢查的完整 Bash 命令字串（選填）。用於偵測 complete
             是否與 git merge / set-acceptance / append-log 串接於同一呼叫
@@ -326,13 +373,18 @@ def check_acceptance_status(
         logger.error(f"找不到 Ticket 檔案: {ticket_id}")
         return AcceptanceCheckResult(False, False, None, False, [])
 
+    verdicts: Optional[VerdictCache] = None
+    background: Optional[ThreadPoolExecutor] = None
     try:
         content = ticket_file.read_text(encoding="utf-8")
         frontmatter = parse_ticket_frontmatter(content)
+        store = TicketStore(project_dir, logger)
+        store.remember(ticket_file, frontmatter)
+        verdicts = VerdictCache(project_dir, content, frontmatter, logger)
 
         # 步驟 1：檢查子任務完成度
         should_block, error_msg = check_children_completed_from_frontmatter(
-            ticket_file, frontmatter, project_dir, ticket_id, logger
+            ticket_file, frontmatter, project_dir, ticket_id, logger, store=store
         )
         if should_block:
             return AcceptanceCheckResult(True, False, error_msg, False, [], [], "", "", [], [], False)
@@ -340,8 +392,8 @@ def check_acceptance_status(
         # 步驟 1.5：防護類 hook ticket 的必含項目（前三項命中 acceptance，
         # 第四項「產生路徑盤點結果」命中 how.strategy 缺則 Solution 的盤點表
         # 正本，需傳入 content 供 Solution fallback 讀取）
-        hook_protection_should_block, hook_protection_msg = check_hook_protection_acceptance(
-            frontmatter, logger, content
+        hook_protection_should_block, hook_protection_msg = verdicts.call(
+            check_hook_protection_acceptance, frontmatter, logger, content
         )
         if hook_protection_should_block:
             return AcceptanceCheckResult(
@@ -357,8 +409,8 @@ def check_acceptance_status(
             )
 
         # 步驟 2：驗證驗收記錄
-        should_block, warning_msg, should_check_acceptance, has_acceptance = verify_acceptance_record(
-            content, frontmatter, ticket_id, logger
+        should_block, warning_msg, should_check_acceptance, has_acceptance = verdicts.call(
+            verify_acceptance_record, content, frontmatter, ticket_id, logger
         )
 
         # chained_write_detected 時，verify_acceptance_record 剛回傳的 warning_msg
@@ -371,8 +423,11 @@ def check_acceptance_status(
             logger.info(f"Ticket {ticket_id} 驗收檢查通過")
 
         # 步驟 2.5：檢查 ANA Ticket 是否有後續 Ticket
+        # 不經 VerdictCache：checker 自行寫 stderr WARNING，快取命中會吞掉該警告
         if is_ana_type(frontmatter.get("type")):
-            ana_should_warn, ana_warning_msg = check_ana_has_spawned_tickets(frontmatter, logger)
+            ana_should_warn, ana_warning_msg = check_ana_has_spawned_tickets(
+                frontmatter, logger
+            )
             if ana_should_warn:
                 if warning_msg:
                     warning_msg = warning_msg + "\n\n" + ana_warning_msg
@@ -390,8 +445,8 @@ def check_acceptance_status(
         # 與 frontmatter spawned_tickets + children 比對。N>0 且 S+C==0 → 阻擋；
         # N>0 且 S+C<N → warning；含豁免標記（「無需建 ticket」「不 spawn」）→ 跳過。
         if is_ana_type(frontmatter.get("type")):
-            spawn_should_block, spawn_msg = check_ana_spawn_consistency(
-                content, frontmatter, logger
+            spawn_should_block, spawn_msg = verdicts.call(
+                check_ana_spawn_consistency, content, frontmatter, logger
             )
             if spawn_should_block:
                 return AcceptanceCheckResult(
@@ -430,9 +485,27 @@ def check_acceptance_status(
                 else:
                     warning_msg = mv_msg
 
+        # 阻擋型內文檢查已通過：工作區相關 checker（subprocess / 目錄掃描）
+        # 彼此獨立，於此並行送出，與後續內文 checker 重疊執行
+        background = ThreadPoolExecutor(max_workers=BACKGROUND_CHECKER_WORKERS)
+        error_pattern_conflicts_future = background.submit(
+            check_error_pattern_conflicts, frontmatter, project_dir, logger
+        )
+        new_error_patterns_future = None
+        if should_check_acceptance:
+            new_error_patterns_future = background.submit(
+                collect_new_error_patterns, ticket_id, content, frontmatter, project_dir, logger
+            )
+        pending_siblings_future = background.submit(
+            find_pending_sibling_tickets, ticket_id, project_dir, logger, store=store
+        )
+        experiment_future = background.submit(
+            check_experiment_artifact_residual, ticket_id, project_dir, logger
+        )
+
         # 步驟 2.6.1：檢查 Spawn Requests 章節是否有未處理條目（1.5.0-W5-024）
-        spawn_request_should_warn, spawn_request_msg = check_spawn_requests(
-            content, frontmatter, logger
+        spawn_request_should_warn, spawn_request_msg = verdicts.call(
+            check_spawn_requests, content, frontmatter, logger
         )
         if spawn_request_should_warn and spawn_request_msg:
             if warning_msg:
@@ -441,48 +514,23 @@ def check_acceptance_status(
                 warning_msg = spawn_request_msg
 
         # 步驟 2.7：檢查修改模組與既有 error-pattern 的衝突
-        error_pattern_conflicts = check_error_pattern_conflicts(frontmatter, project_dir, logger)
+        error_pattern_conflicts = error_pattern_conflicts_future.result()
 
-        # 步驟 3：檢查 error-pattern 新增
-        has_new_error_patterns = False
-        new_error_pattern_files = []
-
-        if should_check_acceptance:
-            ticket_start_time = get_ticket_start_time(frontmatter, logger)
-            if ticket_start_time:
-                has_new_error_patterns, new_error_pattern_files = check_error_patterns_changed(
-                    project_dir, ticket_start_time, logger
-                )
-                if has_new_error_patterns:
-                    logger.info(
-                        f"mtime 比對發現 {len(new_error_pattern_files)} 個候選 error-pattern，"
-                        "進入 PC-099 歸屬過濾"
-                    )
-                    # PC-099 防護：以 frontmatter source_ticket + ticket md 引用雙重過濾
-                    new_error_pattern_files = filter_error_patterns_by_ticket_scope(
-                        new_error_pattern_files,
-                        ticket_id,
-                        content,
-                        project_dir,
-                        logger,
-                    )
-                    has_new_error_patterns = bool(new_error_pattern_files)
-                    logger.info(
-                        f"歸屬過濾後保留 {len(new_error_pattern_files)} 個真正屬於當前 ticket 的 error-pattern"
-                    )
-            else:
-                logger.warning(f"無法取得 ticket 的開始時間，跳過 error-pattern 檢查")
+        # 步驟 3：檢查 error-pattern 新增（已於背景執行，見上方並行送出）
+        has_new_error_patterns, new_error_pattern_files = (
+            new_error_patterns_future.result() if new_error_patterns_future else (False, [])
+        )
 
         # 步驟 4：檢查 pending sibling tickets（場景 #9）
-        pending_siblings = find_pending_sibling_tickets(ticket_id, project_dir, logger)
+        pending_siblings = pending_siblings_future.result()
         logger.info(f"發現 {len(pending_siblings)} 個 pending sibling tickets")
 
         # 步驟 5：檢查 5W1H 完整性
-        incomplete_5w1h = check_5w1h_completeness(frontmatter, logger)
+        incomplete_5w1h = verdicts.call(check_5w1h_completeness, frontmatter, logger)
 
         # 步驟 6：檢查 execution log 填寫（W8-007：ANA type 額外查重現實驗結果）
-        has_empty_log = check_execution_log_filled(
-            content, logger, ticket_type=frontmatter.get("type", "")
+        has_empty_log = verdicts.call(
+            check_execution_log_filled, content, logger, ticket_type=frontmatter.get("type", "")
         )
         # chained_write_detected 時同鏈的 append-log 尚未執行，本次讀到的 log
         # 必然滯後，不視為真正「未填寫」（checklist 會改用 [--] 標記略過判定）
@@ -490,31 +538,31 @@ def check_acceptance_status(
             has_empty_log = False
 
         # 步驟 7：檢查自定義 H2 章節（W17-072，warning 不阻擋）
-        custom_h2 = check_custom_h2_sections(content, logger)
+        custom_h2 = verdicts.call(check_custom_h2_sections, content, logger)
 
         # 步驟 8：檢查 Layer 1 自檢可觀測性（W17-064，warning 不阻擋）
-        self_check_warning = check_self_check_visibility(
-            content, frontmatter.get("type", ""), logger
+        self_check_warning = verdicts.call(
+            check_self_check_visibility, content, frontmatter.get("type", ""), logger
         )
 
         # 步驟 9：檢查 Phase 4 審查證據（W1-080.1，warning 不阻擋）
-        phase4_warning = check_phase4_review_evidence(
-            content, frontmatter.get("type", ""), logger
+        phase4_warning = verdicts.call(
+            check_phase4_review_evidence, content, frontmatter.get("type", ""), logger
         )
 
         # 步驟 10：檢查規模判準（0.2.1-W3-052.1，C1 移植，warning 不阻擋）
-        god_ticket_scale_violations = check_god_ticket_scale(frontmatter, logger)
+        god_ticket_scale_violations = verdicts.call(check_god_ticket_scale, frontmatter, logger)
 
         # 步驟 11：檢查職責邊界判準（0.2.1-W3-052.1，C3 移植，warning 不阻擋）
-        responsibility_scope_violations = check_file_scope_diversity(frontmatter, logger)
+        responsibility_scope_violations = verdicts.call(
+            check_file_scope_diversity, frontmatter, logger
+        )
 
         # 步驟 12：檢查實驗器材殘留（阻擋）
         # 掃描工作區找出屬於本 ticket、依規範命名但尚未妥善處置的實驗器材，
         # 不依賴票面登記本身是否完整（見 experiment_artifact_checker 模組
         # docstring 的三情境判定與阻擋層級理由）。
-        exp_should_block, exp_msg = check_experiment_artifact_residual(
-            ticket_id, project_dir, logger
-        )
+        exp_should_block, exp_msg = experiment_future.result()
         if exp_should_block:
             return AcceptanceCheckResult(
                 True, False, exp_msg, False, [], [], "", "", [], [], False
@@ -550,6 +598,13 @@ def check_acceptance_status(
         sys.stderr.write(f"ERROR: 檢查驗收狀態失敗: {e}\n")
         return AcceptanceCheckResult(False, False, None, False, [])
 
+    finally:
+        if background is not None:
+            # 提前阻擋返回時不等待尚未開始的背景 checker
+            background.shutdown(wait=False, cancel_futures=True)
+        if verdicts is not None:
+            verdicts.save()
+
 
 # ============================================================================
 # 輸出生成
@@ -38,11 +38,6 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "hooks"))
 
 from lib import setup_hook_logging, run_hook_safely, read_json_from_stdin, get_effort_level
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
-
 
 # ============================================================================
 # 常數定義
@@ -114,7 +109,10 @@ def is_ticket_file(file_path: Path) -> bool:
 
 def parse_frontmatter(content: str, logger) -> Optional[Dict[str, Any]]:
     """解析 ticket frontmatter。"""
-    if yaml is None:
+    # 延後 import：非 ticket 檔案的放行路徑不付 pyyaml 載入成本
+    try:
+        import yaml
+    except ImportError:
         logger.error("PyYAML 不可用，無法解析 frontmatter")
         return None
 
@@ -301,7 +301,7 @@ class TestCreateBatchTickets:
 
                 with patch("ticket_system.commands.bulk_create.create_ticket_frontmatter"):
                     with patch("ticket_system.commands.bulk_create.create_ticket_body"):
-                        with patch("ticket_system.commands.bulk_create.save_ticket") as mock_save:
+                        with patch("ticket_system.commands.bulk_create.save_tickets") as mock_save:
                             result = _create_batch_tickets(
                                 template_defaults,
                                 targets,
@@ -313,7 +313,7 @@ class TestCreateBatchTickets:
                             assert result.total == 2
                             assert len(result.created) == 2
                             assert result.dry_run is True
-                            # dry-run 不應該呼叫 save_ticket
+                            # dry-run 不應該呼叫 save_tickets
                             mock_save.assert_not_called()
 
     def test_create_batch_tickets_success(self):
@@ -341,7 +341,7 @@ class TestCreateBatchTickets:
                     with patch("ticket_system.commands.bulk_create.create_ticket_frontmatter"):
                         with patch("ticket_system.commands.bulk_create.create_ticket_body"):
                             with patch("ticket_system.commands.bulk_create.get_ticket_path"):
-                                with patch("ticket_system.commands.bulk_create.save_ticket"):
+                                with patch("ticket_system.commands.bulk_create.save_tickets"):
                                     result = _create_batch_tickets(
                                         template_defaults,
                                         targets,
@@ -388,7 +388,7 @@ class TestCreateBatchTickets:
                         with patch("ticket_system.commands.bulk_create.create_ticket_frontmatter"):
                             with patch("ticket_system.commands.bulk_create.create_ticket_body"):
                                 with patch("ticket_system.commands.bulk_create.get_ticket_path"):
-                                    with patch("ticket_system.commands.bulk_create.save_ticket"):
+                                    with patch("ticket_system.commands.bulk_create.save_tickets"):
                                         result = _create_batch_tickets(
                                             template_defaults,
                                             targets,
@@ -426,7 +426,7 @@ class TestCreateBatchTickets:
                     with patch("ticket_system.commands.bulk_create.create_ticket_frontmatter"):
                         with patch("ticket_system.commands.bulk_create.create_ticket_body"):
                             with patch("ticket_system.commands.bulk_create.get_ticket_path"):
-                                with patch("ticket_system.commands.bulk_create.save_ticket"):
+                                with patch("ticket_system.commands.bulk_create.save_tickets"):
                                     result = _create_batch_tickets(
                                         template_defaults,
                                         targets,
@@ -464,7 +464,7 @@ class TestCreateBatchTickets:
                     with patch("ticket_system.commands.bulk_create.create_ticket_frontmatter"):
                         with patch("ticket_system.commands.bulk_create.create_ticket_body"):
                             with patch("ticket_system.commands.bulk_create.get_ticket_path"):
-                                with patch("ticket_system.commands.bulk_create.save_ticket"):
+                                with patch("ticket_system.commands.bulk_create.save_tickets"):
                                     result = _create_batch_tickets(
                                         template_defaults,
                                         targets,
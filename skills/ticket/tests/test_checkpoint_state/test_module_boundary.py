@@ -56,8 +56,8 @@ def test_F1_checkpoint_state_does_not_import_track_modules():
 def test_F2_checkpoint_state_imports_only_allowed_modules():
     """Phase 3a §T5 + Phase 2 §3 Group F2：import 清單白名單檢查。
 
-    允許：paths / constants / handoff_utils / subprocess / dataclasses /
-          datetime / json / pathlib / typing / time / sys / __future__
+    允許：paths / constants / handoff_utils / subprocess / concurrent.futures / threading /
+          dataclasses / datetime / json / pathlib / typing / time / sys / __future__
     """
 
     import ticket_system.lib.checkpoint_state as mod
@@ -67,11 +67,13 @@ def test_F2_checkpoint_state_imports_only_allowed_modules():
 
     allowed = {
         "__future__",
+        "concurrent.futures",
         "dataclasses",
         "datetime",
         "json",
         "pathlib",
         "subprocess",
+        "threading",
         "sys",
         "time",
         "typing",
@@ -0,0 +1,174 @@
+"""Group G：資料來源並行收集 + 個別截止時間 + collector_ms 觀測欄位。
+
+驗證：
+- G1: 5 個來源確實並行（以 Barrier 要求全部同時進入）
+- G2: 單一來源逾時 → 該來源 fallback + TimeoutError 記錄，其餘結果照常
+- G3: metrics log 含 collector_ms（每個來源一筆）
+- G4: 非 IO_ERRORS 例外照樣上拋（程式 bug 不吞）
+- G5: errors / pending 合併順序與 DATA_SOURCES 一致
+- G6: 逾時來源的執行緒不拖住行程結束（子行程實測 wall time）
+
+以替換 DATA_SOURCES reader 隔離外部世界，不依賴 git / ticket CLI 計時。
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+import ticket_system.lib.checkpoint_state as mod
+from ticket_system.lib.checkpoint_state import checkpoint_state
+
+
+_STUB_VALUES: Dict[str, Any] = {
+    "git-status": 3,
+    "dispatch-active": (2, {}),
+    "handoff-pending": {"ticket_id": "W10-017.8"},
+    "ticket-query": ["A"],
+    "git-worktree": ["wt-1"],
+}
+
+
+def _patch_readers(monkeypatch, overrides: Dict[str, Callable[[Path], Any]]) -> None:
+    """以 stub reader 取代 DATA_SOURCES（未覆寫的來源回傳 _STUB_VALUES）。"""
+
+    sources = []
+    for field_name, source, _reader, fallback, extractor in mod.DATA_SOURCES:
+        reader = overrides.get(source, lambda root, v=_STUB_VALUES[source]: v)
+        sources.append((field_name, source, reader, fallback, extractor))
+    monkeypatch.setattr(mod, "DATA_SOURCES", sources)
+
+
+def test_G1_collectors_run_concurrently(tmp_path: Path, monkeypatch):
+    barrier = threading.Barrier(len(mod.DATA_SOURCES), timeout=5)
+
+    def waiting(value):
+        def _reader(root):
+            barrier.wait()
+            return value
+        return _reader
+
+    _patch_readers(monkeypatch, {s: waiting(v) for s, v in _STUB_VALUES.items()})
+
+    state = checkpoint_state(log_metrics=False, project_root=tmp_path)
+
+    assert state.uncommitted_files == 3
+    assert state.active_agents == 2
+    assert set(state.data_sources.values()) == {"ok"}
+
+
+def test_G2_slow_collector_times_out_with_partial_results(tmp_path: Path, monkeypatch):
+    release = threading.Event()
+
+    def hanging(root):
+        release.wait(5)
+        return 99
+
+    _patch_readers(monkeypatch, {"git-status": hanging})
+    monkeypatch.setitem(mod._COLLECTOR_DEADLINES, "git-status", 0.2)
+
+    start = time.perf_counter()
+    try:
+        state = checkpoint_state(log_metrics=False, project_root=tmp_path)
+    finally:
+        release.set()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2.0
+    assert state.uncommitted_files is None
+    assert state.data_sources["git-status"].startswith("TimeoutError")
+    assert state.active_agents == 2
+    assert state.in_progress_tickets == ["A"]
+    assert state.unmerged_worktrees == ["wt-1"]
+    timeout_checks = [c for c in state.pending_checks if c.check_id == "data_source_git-status"]
+    assert len(timeout_checks) == 1
+    assert timeout_checks[0].auto_detectable is False
+
+
+def test_G3_metrics_log_records_collector_timings(tmp_path: Path, monkeypatch):
+    def slow(root):
+        time.sleep(0.05)
+        return ["wt-1"]
+
+    _patch_readers(monkeypatch, {"git-worktree": slow})
+
+    checkpoint_state(caller="snapshot", project_root=tmp_path)
+
+    log_path = tmp_path / ".claude" / "logs" / "pm-automation-metrics.jsonl"
+    entry = json.loads(log_path.read_text(encoding="utf-8").strip().splitlines()[-1])
+    timings = entry["collector_ms"]
+    assert list(timings) == [source for _f, source, *_rest in mod.DATA_SOURCES]
+    assert timings["git-worktree"] >= 50.0
+    assert timings["git-worktree"] <= entry["duration_ms"]
+
+
+def test_G4_non_io_error_propagates(tmp_path: Path, monkeypatch):
+    def buggy(root):
+        raise KeyError("bug")
+
+    _patch_readers(monkeypatch, {"handoff-pending": buggy})
+
+    with pytest.raises(KeyError):
+        checkpoint_state(log_metrics=False, project_root=tmp_path)
+
+
+def test_G5_merge_order_follows_data_sources(tmp_path: Path, monkeypatch):
+    def failing_after(delay):
+        def _reader(root):
+            time.sleep(delay)
+            raise FileNotFoundError("gone")
+        return _reader
+
+    # 較晚列出的來源先失敗，合併結果仍依 DATA_SOURCES 順序
+    _patch_readers(monkeypatch, {
+        "dispatch-active": failing_after(0.1),
+        "git-worktree": failing_after(0.0),
+    })
+
+    state = checkpoint_state(log_metrics=False, project_root=tmp_path)
+
+    assert list(state.data_sources) == [source for _f, source, *_rest in mod.DATA_SOURCES]
+    assert [c.check_id for c in state.pending_checks] == [
+        "data_source_dispatch-active", "data_source_git-worktree",
+    ]
+
+
+def test_G6_stalled_collector_does_not_block_interpreter_exit(tmp_path: Path):
+    package_root = Path(mod.__file__).resolve().parents[2]
+    script = textwrap.dedent(
+        """
+        import sys, time
+        sys.path.insert(0, {package_root!r})
+        import ticket_system.lib.checkpoint_state as mod
+
+        def stalled(root):
+            time.sleep(30)
+
+        mod.DATA_SOURCES = [
+            (f, s, stalled if s == "git-status" else (lambda root, r=r: r), r, e)
+            for f, s, _reader, r, e in mod.DATA_SOURCES
+        ]
+        mod._COLLECTOR_DEADLINES["git-status"] = 0.2
+        state = mod.checkpoint_state(log_metrics=False, project_root=__import__("pathlib").Path({root!r}))
+        print(state.data_sources["git-status"].split(":")[0])
+        """
+    ).format(package_root=str(package_root), root=str(tmp_path))
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=60,
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "TimeoutError"
+    # 啟動 + 0.2s 截止；若直譯器結束時 join 收集器執行緒則需 30s
+    assert elapsed < 10.0
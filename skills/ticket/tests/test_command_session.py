@@ -0,0 +1,141 @@
+"""
+command_session 模組與 ticket batch / shell 命令測試
+
+驗證：
+- 單行切分（註解、空行、行首 ticket、引號未閉合）
+- 每個命令的 exit code 個別記錄（return / sys.exit / argparse 錯誤 / 例外）
+- batch 預設遇錯即停，--keep-going 全部執行
+- 命令間剔除被外部改寫的 Ticket 快取
+- batch / shell 不可巢狀
+"""
+
+import argparse
+import io
+import sys
+
+import pytest
+
+from ticket_system.commands import session as session_cmd
+from ticket_system.lib import parser as ticket_parser
+from ticket_system.lib.command_session import (
+    EXIT_USAGE,
+    CommandLineError,
+    CommandSession,
+    split_command_line,
+)
+
+
+def _toy_parser(calls):
+    root = argparse.ArgumentParser(prog="ticket")
+    sub = root.add_subparsers(dest="command", required=True)
+
+    ok = sub.add_parser("ok")
+    ok.add_argument("name")
+    ok.set_defaults(func=lambda args: calls.append(args.name) or 0)
+
+    sub.add_parser("fail").set_defaults(func=lambda args: 3)
+    sub.add_parser("exit").set_defaults(func=lambda args: sys.exit(4))
+    sub.add_parser("boom").set_defaults(func=lambda args: 1 / 0)
+
+    # 模擬命令載入 Ticket：寫入 parser._ticket_cache
+    load = sub.add_parser("load")
+    load.add_argument("paths", nargs="+")
+    load.set_defaults(
+        func=lambda args: ticket_parser._ticket_cache.update({p: {"_path": p} for p in args.paths})
+    )
+    return root
+
+
+def _dispatch(parser, argv):
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def session(calls):
+    return CommandSession(_toy_parser(calls), _dispatch)
+
+
+class TestSplitCommandLine:
+    def test_comments_blank_and_program_name(self):
+        assert split_command_line("   ") is None
+        assert split_command_line("# note") is None
+        assert split_command_line("ticket") is None
+        assert split_command_line('ticket track claim "W1 001"  # why') == [
+            "track", "claim", "W1 001",
+        ]
+
+    def test_unbalanced_quote(self):
+        with pytest.raises(CommandLineError):
+            split_command_line('track append-log "oops')
+
+
+class TestCommandSession:
+    def test_exit_codes_per_command(self, session, calls, capsys):
+        lines = ["ok a", "fail", "exit", "boom", "ok", "nope", 'ok "x', "", "ok b"]
+        codes = [r.exit_code for r in (session.run_line(l, i) for i, l in enumerate(lines, 1)) if r]
+        assert codes == [0, 3, 4, 1, 2, 2, EXIT_USAGE, 0]
+        assert calls == ["a", "b"]
+        assert session.exit_code() == 3
+        assert "ZeroDivisionError" in capsys.readouterr().err
+
+    def test_nested_session_rejected(self, session):
+        assert session.run(["batch"]) == EXIT_USAGE
+        assert session.run(["shell"]) == EXIT_USAGE
+
+    def test_evicts_externally_changed_tickets(self, tmp_path, session, monkeypatch):
+        unchanged = tmp_path / "a.md"
+        changed = tmp_path / "b.md"
+        unchanged.write_text("a", encoding="utf-8")
+        changed.write_text("b", encoding="utf-8")
+        monkeypatch.setattr(ticket_parser, "_ticket_cache", {})
+        session.run(["load", str(unchanged), str(changed)])
+
+        changed.write_text("b changed", encoding="utf-8")
+        session.run(["ok", "second"])
+        assert list(ticket_parser._ticket_cache) == [str(unchanged)]
+
+
+class TestBatchCommand:
+    def test_stops_at_first_failure(self, session, calls):
+        assert session_cmd.run_batch(session, ["ok a", "fail", "ok b"]) == 3
+        assert calls == ["a"]
+
+    def test_keep_going(self, session, calls):
+        assert session_cmd.run_batch(session, ["ok a", "fail", "ok b"], keep_going=True) == 3
+        assert calls == ["a", "b"]
+
+    def test_execute_batch_reports_to_stderr(self, tmp_path, monkeypatch, calls, capsys):
+        script = tmp_path / "handoff.txt"
+        script.write_text("# handoff\nticket ok a\nok b\n", encoding="utf-8")
+        monkeypatch.setattr(
+            session_cmd, "_new_session", lambda: CommandSession(_toy_parser(calls), _dispatch)
+        )
+        args = argparse.Namespace(file=str(script), keep_going=False, quiet=False)
+        assert session_cmd.execute_batch(args) == 0
+        assert calls == ["a", "b"]
+        err = capsys.readouterr().err
+        assert "2 個命令：2 成功、0 失敗" in err
+        assert "L2    rc=0" in err
+
+    def test_real_parser_usage_error(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("show\n"))
+        args = argparse.Namespace(file="-", keep_going=False, quiet=True)
+        assert session_cmd.execute_batch(args) == 2
+        assert "ticket_id" in capsys.readouterr().err
+
+
+class TestShellCommand:
+    def test_runs_until_exit(self, monkeypatch, calls, capsys):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("ok a\nfail\nok b\nexit\nok c\n"))
+        monkeypatch.setattr(
+            session_cmd, "_new_session", lambda: CommandSession(_toy_parser(calls), _dispatch)
+        )
+        assert session_cmd.execute_shell(argparse.Namespace()) == 0
+        assert calls == ["a", "b"]
+        assert "[rc=3]" in capsys.readouterr().err
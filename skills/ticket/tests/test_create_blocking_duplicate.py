@@ -17,6 +17,7 @@ from ticket_system.lib.duplicate_detector import (
     _find_blocking_duplicate,
     enforce_blocking_duplicate,
 )
+from ticket_system.lib.duplicate_token_index import DuplicateTokenIndex
 from ticket_system.commands.create import (
     _validate_before_persist,
 )
@@ -34,8 +35,8 @@ def test_block_constants_match_design():
 
 def _patch_tickets(mocker, tickets):
     mocker.patch(
-        "ticket_system.lib.duplicate_detector.list_tickets",
-        return_value=tickets,
+        "ticket_system.lib.duplicate_detector.get_duplicate_index",
+        side_effect=lambda version: DuplicateTokenIndex.from_tickets(tickets),
     )
 
 
@@ -16,6 +16,7 @@ from ticket_system.lib.duplicate_detector import (
     _is_in_detection_scope,
     _get_status_label,
 )
+from ticket_system.lib.duplicate_token_index import DuplicateTokenIndex
 from ticket_system.lib.constants import (
     STATUS_PENDING,
     STATUS_IN_PROGRESS,
@@ -30,6 +31,21 @@ from ticket_system.lib.constants import (
 # ============================================================
 
 
+def _patch_corpus(mocker, source):
+    """以 Ticket 清單（或 version -> 清單的函式、或例外）取代版本重複偵測索引。"""
+    if isinstance(source, BaseException):
+        return mocker.patch(
+            "ticket_system.lib.duplicate_detector.get_duplicate_index",
+            side_effect=source,
+        )
+    return mocker.patch(
+        "ticket_system.lib.duplicate_detector.get_duplicate_index",
+        side_effect=lambda version: DuplicateTokenIndex.from_tickets(
+            source(version) if callable(source) else source
+        ),
+    )
+
+
 class TestJaccardSimilarity:
     """Jaccard 相似度計算演算法測試"""
 
@@ -194,9 +210,9 @@ class TestDuplicateDetection:
             return []
 
         # Patch 使用端（create.py 內部 import）
-        return mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=_mock_impl,
+        return _patch_corpus(
+            mocker,
+            _mock_impl,
         )
 
     def test_b001_single_similar_ticket(self, mock_list_tickets, capsys):
@@ -235,9 +251,9 @@ class TestDuplicateDetection:
                 },
             ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         detect_duplicate_tickets(
@@ -272,9 +288,9 @@ class TestDuplicateDetection:
                 },
             ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         detect_duplicate_tickets(
@@ -305,9 +321,9 @@ class TestDuplicateDetection:
                 },
             ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         detect_duplicate_tickets(
@@ -337,9 +353,9 @@ class TestDuplicateDetection:
                 },
             ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         detect_duplicate_tickets(
@@ -365,9 +381,9 @@ class TestDuplicateDetection:
                 return []
             return []
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         detect_duplicate_tickets(
@@ -402,9 +418,9 @@ class TestDuplicateDetection:
                 },
             ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         # 建立子任務 0.1.2-W3-001.1，與 parent 標題相似
@@ -436,9 +452,9 @@ class TestDuplicateDetection:
                 },
             ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         detect_duplicate_tickets(
@@ -466,9 +482,9 @@ class TestDuplicateDetection:
                 },
             ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         detect_duplicate_tickets(
@@ -486,9 +502,9 @@ class TestDuplicateDetection:
     def test_b010_both_empty_skip_detection(self, mocker, capsys):
         """B-010：title 和 what 均為空 → 跳過重複偵測"""
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W3-001",
                     "title": "實作 SRP",
@@ -514,9 +530,9 @@ class TestDuplicateDetection:
     def test_b011_list_tickets_exception_silent_pass(self, mocker, capsys):
         """B-011：list_tickets() 拋出例外 → 靜默通過"""
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=FileNotFoundError("Directory not found"),
+        _patch_corpus(
+            mocker,
+            FileNotFoundError("Directory not found"),
         )
 
         # 應靜默通過，無例外向上拋出
@@ -551,9 +567,9 @@ class TestDuplicateDetection:
                 },
             ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=mock_list_impl,
+        _patch_corpus(
+            mocker,
+            mock_list_impl,
         )
 
         # Mock _calculate_jaccard_similarity 在第二個 Ticket 時拋出異常
@@ -591,9 +607,9 @@ class TestDuplicateDetection:
     def test_b013_empty_pending_tickets(self, mocker, capsys):
         """B-013：pending tickets 目錄為空 → 靜默通過"""
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [],
+        _patch_corpus(
+            mocker,
+            lambda v: [],
         )
 
         detect_duplicate_tickets(
@@ -621,9 +637,9 @@ class TestExtendedScopeDetection:
         """ES-001：7 天內 completed Ticket 觸發警告"""
         recent_time = (datetime.now() - timedelta(days=3)).isoformat()
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W2-007",
                     "title": "修正 Registry 模組品質問題",
@@ -650,9 +666,9 @@ class TestExtendedScopeDetection:
         """ES-002：超過 7 天的 completed Ticket 不觸發警告"""
         old_time = (datetime.now() - timedelta(days=10)).isoformat()
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W1-001",
                     "title": "修正 Registry 模組品質問題",
@@ -678,9 +694,9 @@ class TestExtendedScopeDetection:
         # 7 天 + 1 秒前 → 應排除
         boundary_time = (datetime.now() - timedelta(days=7, seconds=1)).isoformat()
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W1-001",
                     "title": "修正 Registry 模組品質問題",
@@ -703,9 +719,9 @@ class TestExtendedScopeDetection:
 
     def test_es004_in_progress_triggers_warning(self, mocker, capsys):
         """ES-004：in_progress Ticket 觸發警告（含 [進行中] 標籤）"""
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W2-008",
                     "title": "建立檔案所有權隔離檢查 Hook",
@@ -729,9 +745,9 @@ class TestExtendedScopeDetection:
 
     def test_es007_completed_no_completed_at_excluded(self, mocker, capsys):
         """ES-007：completed 但無 completed_at 欄位 → 排除（保守策略）"""
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W1-001",
                     "title": "修正 Registry 模組品質問題",
@@ -754,9 +770,9 @@ class TestExtendedScopeDetection:
 
     def test_es008_completed_invalid_completed_at_excluded(self, mocker, capsys):
         """ES-008：completed_at 格式異常 → 排除（保守策略）"""
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W1-001",
                     "title": "修正 Registry 模組品質問題",
@@ -779,9 +795,9 @@ class TestExtendedScopeDetection:
 
     def test_es009_pending_no_status_label(self, mocker, capsys):
         """ES-009：pending Ticket 不加標籤（向下相容）"""
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W3-001",
                     "title": "實作 SRP 自動偵測機制",
@@ -866,9 +882,9 @@ class TestIntegration:
         """I-001：驗證呼叫時機（blockedBy 後、save 前）"""
         # 此測試驗證呼叫位置，在 execute() 中進行
         # 這裡只驗證函式簽名和行為
-        mock = mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [],
+        mock = _patch_corpus(
+            mocker,
+            lambda v: [],
         )
 
         # 調用函式，驗證不拋出例外
@@ -879,15 +895,15 @@ class TestIntegration:
             new_ticket_id="0.1.2-W3-003",
         )
 
-        # 確認 list_tickets 被呼叫
+        # 確認版本重複偵測索引被載入
         mock.assert_called_once_with("0.1.2")
 
     def test_i002_detection_does_not_block_creation(self, mocker, capsys):
         """I-002：偵測結果不影響後續儲存流程"""
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W3-001",
                     "title": "實作 SRP 機制",
@@ -917,9 +933,9 @@ class TestIntegration:
             return_value=0.0,
         )
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: [
+        _patch_corpus(
+            mocker,
+            lambda v: [
                 {
                     "id": "0.1.2-W3-001",
                     "title": "實作 SRP 機制",
@@ -931,23 +947,23 @@ class TestIntegration:
 
         detect_duplicate_tickets(
             version="0.1.2",
-            new_title="新增功能",
-            new_what="修復問題",
+            new_title="新增 SRP 功能",
+            new_what="自動偵測",
             new_ticket_id="0.1.2-W3-003",
         )
 
-        # 驗證參數傳遞正確
+        # 驗證參數傳遞正確（相似度上界達閾值，經索引成為候選後逐一確認）
         assert mock_calc.called
         call_args = mock_calc.call_args[0]
-        assert "新增功能" in call_args[0]
-        assert "修復問題" in call_args[0]
+        assert "新增 SRP 功能" in call_args[0]
+        assert "自動偵測" in call_args[0]
 
     def test_i004_exception_does_not_block_creation(self, mocker):
         """I-004：detect_duplicate_tickets 異常不阻斷建立"""
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=RuntimeError("Unexpected error"),
+        _patch_corpus(
+            mocker,
+            RuntimeError("Unexpected error"),
         )
 
         # 應無例外拋出
@@ -988,9 +1004,9 @@ class TestPerformance:
             for i in range(10)
         ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: pending_tickets,
+        _patch_corpus(
+            mocker,
+            lambda v: pending_tickets,
         )
 
         start = time.time()
@@ -1024,9 +1040,9 @@ class TestPerformance:
             for i in range(50)
         ]
 
-        mocker.patch(
-            "ticket_system.lib.duplicate_detector.list_tickets",
-            side_effect=lambda v: pending_tickets,
+        _patch_corpus(
+            mocker,
+            lambda v: pending_tickets,
         )
 
         start = time.time()
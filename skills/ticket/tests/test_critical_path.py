@@ -14,17 +14,52 @@
 - 邊界情況：空清單、單一 Ticket、有環等
 - 多條關鍵路徑 → 等長的平行路徑
 - 自訂 duration_map → 非等權重的情況
+- 菱形鏈（關鍵路徑數指數成長）→ DP 計數 + 代表路徑上限
+- 5k 節點合成 DAG 壓力基準（perf 標記，預設排除）
 """
 
+import random
+import time
+
 import pytest
 from typing import List, Dict, Any
 
 from ticket_system.lib.critical_path import (
+    MAX_REPRESENTATIVE_PATHS,
     CriticalPathAnalyzer,
     CriticalPathResult,
 )
 
 
+def _diamond_chain(count: int) -> List[Dict[str, Any]]:
+    """count 個菱形首尾相接：每個菱形使關鍵路徑數加倍（共 2^count 條）"""
+    tickets = [{"id": "J000", "blockedBy": []}]
+    for i in range(count):
+        join = f"J{i:03d}"
+        left, right, next_join = f"L{i:03d}", f"R{i:03d}", f"J{i + 1:03d}"
+        tickets += [
+            {"id": left, "blockedBy": [join]},
+            {"id": right, "blockedBy": [join]},
+            {"id": next_join, "blockedBy": [left, right]},
+        ]
+    return tickets
+
+
+def _layered_dag(nodes: int, width: int, fan_in: int, seed: int) -> List[Dict[str, Any]]:
+    """合成寬 wave DAG：每層 width 張票，每張隨機依賴上一層 fan_in 張"""
+    rng = random.Random(seed)
+    tickets: List[Dict[str, Any]] = []
+    previous: List[str] = []
+    for index in range(nodes):
+        layer, slot = divmod(index, width)
+        ticket_id = f"0.1.0-W{layer + 1}-{slot + 1:03d}"
+        blocked_by = rng.sample(previous, min(fan_in, len(previous))) if previous else []
+        tickets.append({"id": ticket_id, "blockedBy": blocked_by})
+        if slot == width - 1:
+            previous = [t["id"] for t in tickets[-width:]]
+    return tickets
+
+
 class TestAnalyzeCriticalPath:
     """測試 analyze() 方法的關鍵路徑計算功能"""
 
@@ -422,3 +457,79 @@ class TestEdgeCases:
         # D 的 ES 應為 max(ef_A, ef_B, ef_C) = 1
         assert result.ticket_schedule["D"]["es"] == 1
         assert result.ticket_schedule["D"]["ef"] == 2
+
+
+class TestPathCountingAndEnumerationCap:
+    """DP 路徑計數與代表路徑列舉上限"""
+
+    def test_diamond_chain_counts_without_enumerating(self):
+        """40 個菱形 → 2^40 條關鍵路徑，只列舉上限條數"""
+        result = CriticalPathAnalyzer.analyze(_diamond_chain(40))
+        assert result.critical_path_count == 2 ** 40
+        assert len(result.all_critical_paths) == MAX_REPRESENTATIVE_PATHS
+        assert result.critical_path_length == 81
+        assert all(len(path) == 81 for path in result.all_critical_paths)
+        # 代表路徑依 ID 排序列舉，結果穩定
+        assert result.critical_path[:3] == ["J000", "L000", "J001"]
+
+    def test_max_paths_argument(self):
+        result = CriticalPathAnalyzer.analyze(_diamond_chain(3), max_paths=3)
+        assert result.critical_path_count == 8
+        assert len(result.all_critical_paths) == 3
+
+    def test_only_tight_edges_form_critical_paths(self):
+        """兩端皆 slack = 0 但 EF(前) < ES(後) 的邊不構成關鍵路徑"""
+        tickets = [
+            {"id": "A", "blockedBy": []},
+            {"id": "W", "blockedBy": ["A"]},
+            {"id": "X", "blockedBy": ["W"]},
+            {"id": "B", "blockedBy": []},
+            {"id": "B2", "blockedBy": ["B"]},
+            {"id": "C", "blockedBy": ["B2", "A"]},
+        ]
+        result = CriticalPathAnalyzer.analyze(tickets)
+        assert result.critical_path_count == 2
+        assert result.all_critical_paths == [["A", "W", "X"], ["B", "B2", "C"]]
+
+    def test_deep_chain_is_not_recursive(self):
+        """5000 層線性鏈不觸發遞迴深度上限"""
+        tickets = [{"id": "T0", "blockedBy": []}] + [
+            {"id": f"T{i}", "blockedBy": [f"T{i - 1}"]} for i in range(1, 5000)
+        ]
+        result = CriticalPathAnalyzer.analyze(tickets)
+        assert result.critical_path_length == 5000
+        assert result.critical_path_count == 1
+
+    def test_cycle_path_follows_blocked_by(self):
+        tickets = [
+            {"id": "D", "blockedBy": ["A"]},
+            {"id": "A", "blockedBy": ["B"]},
+            {"id": "B", "blockedBy": ["C"]},
+            {"id": "C", "blockedBy": ["A"]},
+        ]
+        result = CriticalPathAnalyzer.analyze(tickets)
+        assert result.is_valid is False
+        assert result.cycle_info == ["A", "B", "C", "A"]
+
+    def test_summary_reports_total_and_listed(self):
+        result = CriticalPathAnalyzer.analyze(_diamond_chain(4), max_paths=2)
+        summary = CriticalPathAnalyzer.get_critical_path_summary(result)
+        assert "共 16 條，列出前 2 條" in summary
+
+
+@pytest.mark.perf
+class TestStressBenchmark:
+    """5k 節點合成 DAG 壓力基準（pytest -m perf）"""
+
+    @pytest.mark.parametrize("width,fan_in", [(50, 3), (200, 8), (500, 20)])
+    def test_5k_node_dag_under_one_second(self, width, fan_in):
+        tickets = _layered_dag(5000, width, fan_in, seed=width)
+        start = time.perf_counter()
+        result = CriticalPathAnalyzer.analyze(tickets)
+        elapsed = time.perf_counter() - start
+
+        assert result.is_valid is True
+        assert len(result.ticket_schedule) == 5000
+        assert result.critical_path_length == 5000 // width
+        assert len(result.all_critical_paths) <= MAX_REPRESENTATIVE_PATHS
+        assert elapsed < 1.0, f"5k 節點分析耗時 {elapsed:.3f}s"
@@ -0,0 +1,150 @@
+"""
+duplicate_token_index 模組測試
+
+驗證重複偵測的 token 倒排索引：
+- candidates() 與逐票 Jaccard 全掃的命中集合一致（固定 seed 隨機語料）
+- 持久化後只重新載入戳記不符的檔案，消失的檔案剔除
+- save_ticket 寫入後同 process 已載入的索引立即反映
+- bulk-create 整批共用一份索引，批次內前序票亦參與比對
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ticket_system.lib import duplicate_token_index, parser
+from ticket_system.lib.duplicate_detector import _calculate_jaccard_similarity
+from ticket_system.lib.duplicate_token_index import (
+    INDEX_DIRNAME,
+    INDEX_FILENAME,
+    DuplicateTokenIndex,
+    combined_text,
+    get_duplicate_index,
+)
+
+
+VERSION = "0.31.0"
+
+
+@pytest.fixture
+def tickets_dir(temp_project_dir, monkeypatch):
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+    path = temp_project_dir / "docs" / "work-logs" / "v0" / "v0.31" / "v0.31.0" / "tickets"
+    path.mkdir(parents=True, exist_ok=True)
+    parser._ticket_cache.clear()
+    duplicate_token_index.clear_duplicate_index_cache()
+    yield path
+    parser._ticket_cache.clear()
+    duplicate_token_index.clear_duplicate_index_cache()
+
+
+def _write_ticket(tickets_dir: Path, seq: int, title: str, what: str = "", status: str = "pending") -> Path:
+    ticket_id = f"{VERSION}-W4-{seq:03d}"
+    data = {"id": ticket_id, "title": title, "what": what, "status": status}
+    path = tickets_dir / f"{ticket_id}.md"
+    path.write_text(
+        f"---\n{yaml.dump(data, allow_unicode=True)}---\n\n# Body {seq}\n", encoding="utf-8"
+    )
+    return path
+
+
+class TestCandidates:
+    @pytest.mark.parametrize("threshold", [0.3, 0.6])
+    def test_matches_brute_force_jaccard(self, threshold):
+        rng = random.Random(7)
+        words = ["實作", "SRP", "偵測", "hook", "index", "快取", "修復", "API", "驗證"]
+        tickets = [
+            {
+                "id": f"T-{i:03d}",
+                "title": " ".join(rng.sample(words, rng.randint(1, 4))),
+                "what": " ".join(rng.sample(words, rng.randint(0, 3))),
+                "status": "pending",
+            }
+            for i in range(200)
+        ]
+        index = DuplicateTokenIndex.from_tickets(tickets)
+        for _ in range(30):
+            text = " ".join(rng.sample(words, rng.randint(1, 5)))
+            expected = [
+                t["id"] for t in tickets
+                if t["id"] != "T-000"
+                and _calculate_jaccard_similarity(text, combined_text(t)) >= threshold
+            ]
+            actual = [e["id"] for e in index.candidates(text, threshold, {"T-000"})]
+            assert actual == expected
+
+    def test_no_shared_token_no_candidate(self):
+        index = DuplicateTokenIndex.from_tickets(
+            [{"id": "T-1", "title": "alpha", "what": "beta", "status": "pending"}]
+        )
+        assert index.candidates("gamma", 0.0) == []
+        assert index.candidates("!!!", 0.0) == []
+
+
+class TestPersistence:
+    def test_reloads_only_changed_files(self, tickets_dir, monkeypatch):
+        _write_ticket(tickets_dir, 1, "實作 SRP 偵測")
+        _write_ticket(tickets_dir, 2, "修復 hook 快取")
+        get_duplicate_index(VERSION)
+        assert (tickets_dir / INDEX_DIRNAME / INDEX_FILENAME).is_file()
+
+        duplicate_token_index.clear_duplicate_index_cache()
+        parser._ticket_cache.clear()
+        _write_ticket(tickets_dir, 3, "新增 SRP 驗證")
+        loaded = []
+        original = parser.load_ticket
+
+        def spy(version, ticket_id, *args, **kwargs):
+            loaded.append(ticket_id)
+            return original(version, ticket_id, *args, **kwargs)
+
+        monkeypatch.setattr(parser, "load_ticket", spy)
+        index = get_duplicate_index(VERSION)
+        assert loaded == [f"{VERSION}-W4-003"]
+        assert [e["id"] for e in index.candidates("SRP", 0.0)] == [
+            f"{VERSION}-W4-001",
+            f"{VERSION}-W4-003",
+        ]
+
+        (tickets_dir / f"{VERSION}-W4-001.md").unlink()
+        assert [e["id"] for e in get_duplicate_index(VERSION).candidates("SRP", 0.0)] == [
+            f"{VERSION}-W4-003",
+        ]
+
+    def test_save_ticket_updates_loaded_index(self, tickets_dir):
+        path = _write_ticket(tickets_dir, 1, "修復 hook 快取")
+        index = get_duplicate_index(VERSION)
+        assert index.candidates("SRP", 0.0) == []
+
+        parser.save_ticket(
+            {"id": f"{VERSION}-W4-001", "title": "實作 SRP 偵測", "status": "pending"}, path
+        )
+        assert [e["id"] for e in index.candidates("SRP", 0.0)] == [f"{VERSION}-W4-001"]
+
+
+class TestBulkCreateBatch:
+    def test_dry_run_checks_batch_against_itself(self, tickets_dir, mocker, capsys):
+        from ticket_system.commands import bulk_create
+
+        mocker.patch("ticket_system.commands.bulk_create.get_next_seq", return_value=1)
+        mocker.patch(
+            "ticket_system.commands.bulk_create.validate_create_checklist", return_value=[]
+        )
+        load_index = mocker.spy(bulk_create, "get_duplicate_index")
+
+        result = bulk_create._create_batch_tickets(
+            template_defaults={"type": "IMP", "priority": "P2"},
+            targets=["hook 快取失效修復", "hook 快取失效修復 補測試"],
+            version=VERSION,
+            wave=4,
+            dry_run=True,
+        )
+
+        assert result.created == [f"{VERSION}-W4-001", f"{VERSION}-W4-002"]
+        assert load_index.call_count == 1
+        out = capsys.readouterr().out
+        assert f"{VERSION}-W4-001" in out.split("[WARNING]", 1)[-1]
+        # 預演未落盤：下次 refresh 即剔除批次登記
+        assert get_duplicate_index(VERSION).candidates("hook", 0.0) == []
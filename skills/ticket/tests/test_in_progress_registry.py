@@ -0,0 +1,128 @@
+"""
+in_progress_registry 模組測試（ticket CLI 維護的 in_progress 登錄檔）
+
+驗證：
+- 登錄檔不存在時首次寫入以整份重掃建立（排除 archive）
+- 登錄後 CLI 以外出現的票檔（目錄 mtime 變化超出本次寫入）觸發整份重掃
+- save_ticket 轉入 in_progress 登錄、轉出移除，記錄認領 session
+- 同一張票後續寫入保留原認領 session / since，刷新 mtime_ns
+- ticket_write_batch 整批寫入同樣維護登錄檔
+- 不在 docs/work-logs 之下的票檔不建立登錄檔
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ticket_system.lib import in_progress_registry as mod
+from ticket_system.lib.parser import save_ticket
+from ticket_system.lib.ticket_write_batch import save_tickets
+
+
+def _ticket(tid, status="pending"):
+    return {"id": tid, "status": status, "title": f"title {tid}", "_body": f"# {tid}\n"}
+
+
+def _registry(work_logs: Path):
+    return json.loads(mod.registry_path(work_logs).read_text(encoding="utf-8"))["tickets"]
+
+
+@pytest.fixture
+def work_logs(tmp_path, monkeypatch):
+    monkeypatch.setenv(mod.ENV_SESSION_ID, "sess-a")
+    root = tmp_path / "docs" / "work-logs"
+    (root / "v0.1.0" / "tickets").mkdir(parents=True)
+    return root
+
+
+def _path(work_logs: Path, tid: str) -> Path:
+    return work_logs / "v0.1.0" / "tickets" / f"{tid}.md"
+
+
+class TestRebuild:
+    def test_first_save_scans_existing_tickets(self, work_logs):
+        existing = _path(work_logs, "0.1.0-W1-001")
+        existing.write_text("---\nid: 0.1.0-W1-001\nstatus: in_progress\n---\n", encoding="utf-8")
+        archived = work_logs / "v0.1.0" / "archive" / "tickets" / "0.1.0-W0-001.md"
+        archived.parent.mkdir(parents=True)
+        archived.write_text("---\nid: 0.1.0-W0-001\nstatus: in_progress\n---\n", encoding="utf-8")
+
+        save_ticket(_ticket("0.1.0-W1-002", "in_progress"), _path(work_logs, "0.1.0-W1-002"))
+
+        tickets = _registry(work_logs)
+        assert set(tickets) == {"0.1.0-W1-001", "0.1.0-W1-002"}
+        assert tickets["0.1.0-W1-001"]["path"] == "v0.1.0/tickets/0.1.0-W1-001.md"
+        assert (work_logs / mod.INDEX_DIRNAME / ".gitignore").read_text(encoding="utf-8") == "*\n"
+
+    def test_corrupt_registry_is_rebuilt(self, work_logs):
+        registry = mod.registry_path(work_logs)
+        registry.parent.mkdir()
+        registry.write_text("{not json", encoding="utf-8")
+
+        save_ticket(_ticket("0.1.0-W1-001", "in_progress"), _path(work_logs, "0.1.0-W1-001"))
+        assert set(_registry(work_logs)) == {"0.1.0-W1-001"}
+
+    def test_out_of_band_ticket_is_picked_up(self, work_logs):
+        save_ticket(_ticket("0.1.0-W1-001"), _path(work_logs, "0.1.0-W1-001"))
+        assert _registry(work_logs) == {}
+
+        # 未經 CLI 出現的票檔（git pull / 手動建立），位於另一個版本目錄
+        other = work_logs / "v0.2.0" / "tickets" / "0.2.0-W1-001.md"
+        other.parent.mkdir(parents=True)
+        other.write_text("---\nid: 0.2.0-W1-001\nstatus: in_progress\n---\n", encoding="utf-8")
+        data = json.loads(mod.registry_path(work_logs).read_text(encoding="utf-8"))
+        assert data["dirs"] != mod.directory_stamps(work_logs)
+
+        save_ticket(_ticket("0.1.0-W1-002"), _path(work_logs, "0.1.0-W1-002"))
+        data = json.loads(mod.registry_path(work_logs).read_text(encoding="utf-8"))
+        assert set(data["tickets"]) == {"0.2.0-W1-001"}
+        assert data["dirs"] == mod.directory_stamps(work_logs)
+
+    def test_same_dir_addition_before_own_save_is_picked_up(self, work_logs):
+        save_ticket(_ticket("0.1.0-W1-001"), _path(work_logs, "0.1.0-W1-001"))
+        _path(work_logs, "0.1.0-W1-002").write_text(
+            "---\nid: 0.1.0-W1-002\nstatus: in_progress\n---\n", encoding="utf-8"
+        )
+
+        save_ticket(_ticket("0.1.0-W1-003"), _path(work_logs, "0.1.0-W1-003"))
+        assert set(_registry(work_logs)) == {"0.1.0-W1-002"}
+
+
+class TestTransitions:
+    def test_claim_and_release(self, work_logs, monkeypatch):
+        path = _path(work_logs, "0.1.0-W1-001")
+        save_ticket(_ticket("0.1.0-W1-001"), path)
+        assert _registry(work_logs) == {}
+
+        ticket = _ticket("0.1.0-W1-001", "in_progress")
+        save_ticket(ticket, path)
+        entry = _registry(work_logs)["0.1.0-W1-001"]
+        assert entry["session"] == "sess-a"
+        assert entry["since"]
+        assert entry["mtime_ns"] == path.stat().st_mtime_ns
+
+        # 他人 session 後續寫入不改認領歸屬，mtime 仍刷新
+        monkeypatch.setenv(mod.ENV_SESSION_ID, "sess-b")
+        ticket["title"] = "retitled"
+        save_ticket(ticket, path)
+        updated = _registry(work_logs)["0.1.0-W1-001"]
+        assert (updated["session"], updated["since"]) == (entry["session"], entry["since"])
+        assert updated["mtime_ns"] == path.stat().st_mtime_ns
+
+        ticket["status"] = "completed"
+        save_ticket(ticket, path)
+        assert _registry(work_logs) == {}
+
+    def test_batch_write_updates_registry(self, work_logs):
+        save_tickets([
+            (_ticket(f"0.1.0-W1-00{n}", "in_progress"), _path(work_logs, f"0.1.0-W1-00{n}"))
+            for n in (1, 2)
+        ])
+        assert set(_registry(work_logs)) == {"0.1.0-W1-001", "0.1.0-W1-002"}
+
+
+def test_ticket_outside_work_logs_is_ignored(tmp_path):
+    save_ticket(_ticket("0.1.0-W1-001", "in_progress"), tmp_path / "tickets" / "0.1.0-W1-001.md")
+    assert not (tmp_path / mod.INDEX_DIRNAME).exists()
+    assert mod.work_logs_root_for(tmp_path / "tickets" / "x.md") is None
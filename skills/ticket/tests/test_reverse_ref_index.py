@@ -0,0 +1,166 @@
+"""
+測試 reverse_ref_index（Ticket 反向引用索引）
+
+測試範圍：
+- extract_refs 萃取六個引用欄位（children dict 形式、去重、略過非字串）
+- refresh 持久化後只重新解析戳記不符的檔案，消失的檔案剔除
+- save_ticket 寫入後同 process 已載入的索引立即反映新引用
+- migrate / version-shift 只載入索引給出的候選檔案
+- track referenced-by 輸出反向邊
+"""
+
+import argparse
+
+import pytest
+
+from ticket_system.lib import reverse_ref_index
+from ticket_system.lib.parser import save_ticket
+from ticket_system.lib.reverse_ref_index import (
+    ReverseRefIndex,
+    extract_refs,
+    get_reverse_ref_index,
+)
+
+
+def _write_ticket(tickets_dir, ticket_id, **fields):
+    lines = ["---", f"id: {ticket_id}", "status: pending"]
+    for key, value in fields.items():
+        if isinstance(value, list):
+            lines.append(f"{key}:")
+            lines.extend(f"  - {item}" for item in value)
+        else:
+            lines.append(f"{key}: {value}")
+    lines += ["---", "", "# Body", ""]
+    path = tickets_dir / f"{ticket_id}.md"
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    reverse_ref_index.clear_reverse_ref_cache()
+    yield
+    reverse_ref_index.clear_reverse_ref_cache()
+
+
+@pytest.fixture
+def work_logs(tmp_path):
+    root = tmp_path / "docs" / "work-logs"
+    (root / "v0" / "v0.18" / "v0.18.0" / "tickets").mkdir(parents=True)
+    (root / "v0.17.0" / "tickets").mkdir(parents=True)
+    return root
+
+
+def _hier(work_logs):
+    return work_logs / "v0" / "v0.18" / "v0.18.0" / "tickets"
+
+
+class TestExtractRefs:
+    def test_all_fields(self):
+        ticket = {
+            "blockedBy": ["A", "A"],
+            "relatedTo": ["B", 3],
+            "children": ["C", {"id": "D", "title": "x"}],
+            "source_ticket": "E",
+            "parent_id": None,
+            "spawned_tickets": ["F"],
+        }
+        assert extract_refs(ticket) == [
+            ("A", "blockedBy"), ("B", "relatedTo"), ("C", "children"),
+            ("D", "children"), ("E", "source_ticket"), ("F", "spawned_tickets"),
+        ]
+
+
+class TestRefresh:
+    def test_persisted_index_reparses_only_changed(self, work_logs, monkeypatch):
+        tickets = _hier(work_logs)
+        _write_ticket(tickets, "0.18.0-W1-001")
+        _write_ticket(tickets, "0.18.0-W1-002", blockedBy=["0.18.0-W1-001"])
+        index = ReverseRefIndex(work_logs).refresh()
+        index.save()
+        assert (work_logs / ".index" / ".gitignore").is_file()
+
+        _write_ticket(tickets, "0.18.0-W1-003", parent_id="0.18.0-W1-001")
+        parsed = []
+        original = reverse_ref_index._parse_refs
+
+        def spy(path):
+            parsed.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(reverse_ref_index, "_parse_refs", spy)
+        fresh = ReverseRefIndex(work_logs).refresh()
+        assert parsed == ["0.18.0-W1-003.md"]
+        assert [(s, f) for s, f, _ in fresh.references_to("0.18.0-W1-001")] == [
+            ("0.18.0-W1-002", "blockedBy"),
+            ("0.18.0-W1-003", "parent_id"),
+        ]
+
+        (tickets / "0.18.0-W1-002.md").unlink()
+        assert [s for s, _, _ in fresh.refresh().references_to("0.18.0-W1-001")] == [
+            "0.18.0-W1-003",
+        ]
+
+    def test_save_ticket_updates_loaded_index(self, work_logs):
+        tickets = _hier(work_logs)
+        path = _write_ticket(tickets, "0.18.0-W1-002")
+        index = get_reverse_ref_index(work_logs)
+        assert index.files_referencing("0.18.0-W1-001") == []
+
+        save_ticket({"id": "0.18.0-W1-002", "relatedTo": ["0.18.0-W1-001"]}, path)
+        assert index.files_referencing("0.18.0-W1-001") == [path]
+        assert index.files_referencing_prefix("0.18.0-") == [path]
+
+
+class TestConsumers:
+    def test_migrate_loads_only_candidates(self, work_logs, monkeypatch):
+        import ticket_system.commands.migrate as migrate_mod
+
+        tickets = _hier(work_logs)
+        _write_ticket(tickets, "0.18.0-W1-002", blockedBy=["0.18.0-W1-001"])
+        for n in range(3, 8):
+            _write_ticket(tickets, f"0.18.0-W1-00{n}")
+        monkeypatch.setattr(migrate_mod, "get_project_root", lambda: work_logs.parent.parent)
+
+        loaded = []
+        original = migrate_mod._load_ticket_from_path
+
+        def spy(path):
+            loaded.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(migrate_mod, "_load_ticket_from_path", spy)
+        assert migrate_mod._update_cross_references("0.18.0-W1-001", "0.18.0-W1-009") == 1
+        assert loaded == ["0.18.0-W1-002.md"]
+        assert "0.18.0-W1-009" in (tickets / "0.18.0-W1-002.md").read_text(encoding="utf-8")
+        assert get_reverse_ref_index(work_logs).files_referencing("0.18.0-W1-001") == []
+
+    def test_version_shift_flat_candidates(self, work_logs):
+        from ticket_system.commands.version_shift import _update_cross_version_refs
+
+        flat = work_logs / "v0.17.0" / "tickets"
+        referencing = _write_ticket(flat, "0.17.0-W1-001", relatedTo=["0.18.0-W1-001"])
+        _write_ticket(flat, "0.17.0-W1-002", relatedTo=["0.17.0-W1-001"])
+
+        assert _update_cross_version_refs("0.18.0", "0.19.0", work_logs.parent.parent) == 1
+        assert "0.19.0-W1-001" in referencing.read_text(encoding="utf-8")
+
+
+class TestReferencedByCommand:
+    def test_lists_inbound_edges(self, work_logs, monkeypatch, capsys):
+        import ticket_system.commands.track_relations as relations_mod
+
+        tickets = _hier(work_logs)
+        _write_ticket(tickets, "0.18.0-W1-002", blockedBy=["0.18.0-W1-001"])
+        _write_ticket(tickets, "0.18.0-W1-003", relatedTo=["0.18.0-W1-001"])
+        monkeypatch.setattr(relations_mod, "get_project_root", lambda: work_logs.parent.parent)
+
+        args = argparse.Namespace(ticket_id="0.18.0-W1-001", field=None)
+        assert relations_mod.execute_referenced_by(args) == 0
+        out = capsys.readouterr().out
+        assert "0.18.0-W1-002  (blockedBy)" in out
+        assert "0.18.0-W1-003  (relatedTo)" in out
+
+        args.field = "blockedBy"
+        relations_mod.execute_referenced_by(args)
+        assert "0.18.0-W1-003" not in capsys.readouterr().out
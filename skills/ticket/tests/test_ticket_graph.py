@@ -0,0 +1,161 @@
+"""
+ticket_graph 模組測試（ChainAnalyzer / acceptance_auditor / complete 共用關係圖）
+
+驗證：
+- 關係查詢：children / descendants / siblings / spawned / blockers，循環參照不無限走訪
+- 節點與狀態彙總記憶化：同一張票只載入一次
+- run_audit / determine_direction 在 50 子任務 epic 上每張票至多載入一次
+- complete 前置檢查（spawned + children）共用一次 list_tickets
+"""
+
+from collections import Counter
+from unittest.mock import patch
+
+from ticket_system.commands import lifecycle
+from ticket_system.lib.acceptance_auditor import run_audit, validate_children_completed
+from ticket_system.lib.chain_analyzer import ChainAnalyzer
+from ticket_system.lib.ticket_graph import STATUS_NOT_FOUND, TicketGraph
+
+VERSION = "0.1.0"
+EPIC = "0.1.0-W1-001"
+
+
+def _ticket(tid, status="completed", parent=None, children=(), **extra):
+    ticket = {
+        "id": tid,
+        "status": status,
+        "chain": {"parent": parent} if parent else {},
+        "children": list(children),
+    }
+    ticket.update(extra)
+    return ticket
+
+
+def _epic_store(child_count=50, pending_grandchild=True):
+    """EPIC → N 個子任務，每個子任務各 2 個孫任務；最後一個孫任務 pending"""
+    store = {}
+    child_ids = [f"{EPIC}.{n}" for n in range(1, child_count + 1)]
+    for cid in child_ids:
+        grand = [f"{cid}.1", f"{cid}.2"]
+        store[cid] = _ticket(cid, parent=EPIC, children=grand, type="IMP")
+        for gid in grand:
+            store[gid] = _ticket(gid, parent=cid)
+    if pending_grandchild:
+        store[f"{child_ids[-1]}.2"]["status"] = "pending"
+    store[EPIC] = _ticket(EPIC, status="in_progress", children=child_ids, type="IMP")
+    return store
+
+
+class _CountingLoader:
+    def __init__(self, store):
+        self.store = store
+        self.calls = Counter()
+
+    def __call__(self, version, ticket_id):
+        self.calls[ticket_id] += 1
+        return self.store.get(ticket_id)
+
+
+class TestTicketGraph:
+    def test_relations(self):
+        store = {
+            "A": _ticket("A", children=["A.1", {"id": "A.2", "status": "pending"}],
+                         spawned_tickets=["S"], blockedBy=["B"]),
+            "A.1": _ticket("A.1", parent="A", children=["A.1.1"]),
+            "A.1.1": _ticket("A.1.1", parent="A.1"),
+            "A.2": _ticket("A.2", status="pending", parent="A"),
+        }
+        graph = TicketGraph(VERSION, tickets=store.values())
+        assert graph.children("A") == ["A.1", "A.2"]
+        assert graph.descendants("A") == ["A.1", "A.1.1", "A.2"]
+        assert graph.siblings("A.1") == ["A.2"]
+        assert graph.spawned("A") == ["S"]
+        assert graph.blockers("A") == ["B"]
+        assert graph.subtree_terminal("A.1") is True
+        assert graph.subtree_terminal("A") is False
+        assert graph.non_terminal(["A.1", "A.2", "X"]) == [("A.2", "pending"), ("X", STATUS_NOT_FOUND)]
+
+    def test_cycle_terminates(self):
+        graph = TicketGraph(VERSION, tickets=[
+            _ticket("A", children=["B"]), _ticket("B", children=["A"]),
+        ])
+        assert graph.descendants("A") == ["B"]
+        assert graph.subtree_terminal("A") is True
+
+    def test_loads_each_node_once(self):
+        loader = _CountingLoader(_epic_store(5))
+        graph = TicketGraph(VERSION, loader=loader)
+        graph.descendants(EPIC)
+        graph.subtree_terminal(EPIC)
+        for cid in graph.children(EPIC):
+            graph.subtree_terminal(cid)
+        graph.get("missing")
+        graph.get("missing")
+        assert max(loader.calls.values()) == 1
+
+    def test_lister_called_once(self):
+        listed = []
+
+        def lister(version):
+            listed.append(version)
+            return [_ticket("A.1"), _ticket("A.2")]
+
+        graph = TicketGraph(VERSION, lister=lister)
+        assert [t["id"] for t in graph.chain_members("A")] == ["A.1", "A.2"]
+        graph.all_tickets()
+        assert listed == [VERSION]
+
+
+class TestLargeEpic:
+    def test_children_check_loads_each_ticket_once(self):
+        loader = _CountingLoader(_epic_store())
+        with patch("ticket_system.lib.acceptance_auditor.load_ticket", loader):
+            passed, issues, _ = validate_children_completed(loader.store[EPIC], VERSION)
+        assert passed is False
+        assert issues == [f"未完成的子任務：{EPIC}.50.2"]
+        assert max(loader.calls.values()) == 1
+
+    def test_run_audit_loads_each_ticket_once(self):
+        loader = _CountingLoader(_epic_store(pending_grandchild=False))
+        with patch("ticket_system.lib.acceptance_auditor.load_ticket", loader), \
+             patch("ticket_system.lib.ticket_loader.list_tickets",
+                   lambda version: list(loader.store.values())):
+            report = run_audit(EPIC, VERSION)
+        children_step = next(s for s in report.steps if s.name == "子任務完成狀態檢查")
+        assert children_step.passed is True
+        assert max(loader.calls.values()) == 1
+        assert set(loader.calls) <= set(loader.store)
+
+    def test_direction_loads_parent_once(self):
+        store = _epic_store()
+        store[f"{EPIC}.50"]["status"] = "in_progress"
+        loader = _CountingLoader(store)
+        ticket = dict(store[f"{EPIC}.1"], children=[])
+        with patch("ticket_system.lib.chain_analyzer.load_ticket", loader):
+            graph = TicketGraph(VERSION, loader=loader)
+            direction = ChainAnalyzer.determine_direction(ticket, VERSION, graph)
+            rec = ChainAnalyzer.get_recommendation(direction, ticket, VERSION, graph)
+        assert direction == "to-sibling"
+        assert rec.next_target_id == f"{EPIC}.50"
+        assert max(loader.calls.values()) == 1
+
+
+class TestCompletePrecheck:
+    def test_spawned_and_children_share_one_listing(self):
+        store = {
+            "A": _ticket("A", status="in_progress", children=["A.1"], type="ANA",
+                         spawned_tickets=["S"]),
+            "A.1": _ticket("A.1", parent="A"),
+            "S": _ticket("S"),
+        }
+        calls = []
+
+        def fake_list(version):
+            calls.append(version)
+            return list(store.values())
+
+        with patch.object(lifecycle, "list_tickets", fake_list):
+            graph = TicketGraph(VERSION, lister=lifecycle.list_tickets)
+            assert lifecycle._handle_ana_spawned_confirmation(store["A"], VERSION, False, graph) is None
+            assert lifecycle._handle_pending_children_block(store["A"], VERSION, False, graph) is None
+        assert calls == [VERSION]
@@ -0,0 +1,114 @@
+"""
+ticket_index 模組測試
+
+驗證 list_tickets() 的持久化 frontmatter 索引：
+- 第二次呼叫（新 process 等價：清空 _ticket_cache）不再 YAML 解析
+- 僅 mtime / size 變動的檔案重新解析
+- date 型別往返保真、刪除的檔案自索引剔除
+- 無法 JSON 往返的 frontmatter 不入索引但照常載入
+"""
+
+import os
+from datetime import date
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ticket_system.lib import parser
+from ticket_system.lib.ticket_index import INDEX_DIRNAME, INDEX_FILENAME, TicketIndex
+from ticket_system.lib.ticket_loader import list_tickets
+
+
+VERSION = "0.31.0"
+
+
+@pytest.fixture
+def tickets_dir(temp_project_dir, monkeypatch):
+    monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+    path = temp_project_dir / "docs" / "work-logs" / "v0" / "v0.31" / "v0.31.0" / "tickets"
+    path.mkdir(parents=True, exist_ok=True)
+    parser._ticket_cache.clear()
+    yield path
+    parser._ticket_cache.clear()
+
+
+@pytest.fixture
+def yaml_parse_counter(monkeypatch):
+    calls = []
+    original = parser._yaml_safe_load
+
+    def _counting_safe_load(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(parser, "_yaml_safe_load", _counting_safe_load)
+    return calls
+
+
+def _write_ticket(tickets_dir: Path, seq: int, status: str = "pending", **extra) -> Path:
+    ticket_id = f"{VERSION}-W4-{seq:03d}"
+    data = {"id": ticket_id, "title": f"Ticket {seq}", "status": status, **extra}
+    path = tickets_dir / f"{ticket_id}.md"
+    path.write_text(
+        f"---\n{yaml.dump(data, allow_unicode=True)}---\n\n# Body {seq}\n", encoding="utf-8"
+    )
+    return path
+
+
+def _fresh_list():
+    """模擬新的 CLI process：清空 process-scoped 快取後再列出"""
+    parser._ticket_cache.clear()
+    return list_tickets(VERSION)
+
+
+class TestTicketIndex:
+    def test_second_call_skips_yaml_parse(self, tickets_dir, yaml_parse_counter):
+        for seq in range(1, 4):
+            _write_ticket(tickets_dir, seq)
+
+        first = _fresh_list()
+        assert len(yaml_parse_counter) == 3
+        assert (tickets_dir / INDEX_DIRNAME / INDEX_FILENAME).is_file()
+        assert (tickets_dir / INDEX_DIRNAME / ".gitignore").read_text() == "*\n"
+
+        second = _fresh_list()
+        assert len(yaml_parse_counter) == 3
+        assert second == first
+        assert second[0]["_body"] == "# Body 1"
+        assert second[0] is not first[0]
+
+    def test_only_changed_file_reparsed(self, tickets_dir, yaml_parse_counter):
+        for seq in range(1, 4):
+            _write_ticket(tickets_dir, seq)
+        _fresh_list()
+
+        path = _write_ticket(tickets_dir, 2, status="in_progress", note="longer")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        tickets = _fresh_list()
+
+        assert len(yaml_parse_counter) == 4
+        assert [t["status"] for t in tickets] == ["pending", "in_progress", "pending"]
+
+    def test_date_roundtrip_and_prune(self, tickets_dir):
+        _write_ticket(tickets_dir, 1, created=date(2026, 1, 2))
+        removed = _write_ticket(tickets_dir, 2)
+        _fresh_list()
+
+        removed.unlink()
+        tickets = _fresh_list()
+        assert tickets[0]["created"] == date(2026, 1, 2)
+        assert set(TicketIndex(tickets_dir)._entries) == {f"{VERSION}-W4-001.md"}
+
+    def test_unindexable_frontmatter_still_loads(self, tickets_dir, yaml_parse_counter):
+        _write_ticket(tickets_dir, 1, mapping={1: "int key"})
+        assert _fresh_list()[0]["mapping"] == {1: "int key"}
+        assert _fresh_list()[0]["mapping"] == {1: "int key"}
+        assert len(yaml_parse_counter) == 2
+
+    def test_yaml_error_not_indexed(self, tickets_dir):
+        bad = tickets_dir / f"{VERSION}-W4-001.md"
+        bad.write_text("---\nid: [unclosed\n---\nBody\n", encoding="utf-8")
+        assert "_yaml_error" in _fresh_list()[0]
+        assert "_yaml_error" in _fresh_list()[0]
@@ -661,3 +661,68 @@ class TestListTickets:
                 os.environ["CLAUDE_PROJECT_DIR"] = old_env
             elif "CLAUDE_PROJECT_DIR" in os.environ:
                 del os.environ["CLAUDE_PROJECT_DIR"]
+
+
+class TestLazyTicketBody:
+    """Markdown Ticket 的 _body 延遲載入測試"""
+
+    @pytest.fixture
+    def ticket_path(self, temp_project_dir, monkeypatch):
+        from ticket_system.lib import parser
+
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+        tickets_dir = temp_project_dir / "docs" / "work-logs" / "v0" / "v0.31" / "v0.31.0" / "tickets"
+        tickets_dir.mkdir(parents=True, exist_ok=True)
+        path = tickets_dir / "0.31.0-W4-001.md"
+        path.write_text(
+            "---\nid: 0.31.0-W4-001\nstatus: pending\n---\n\n# Body\n\n" + "log line\n" * 2000,
+            encoding="utf-8",
+        )
+        parser._ticket_cache.clear()
+        yield path
+        parser._ticket_cache.clear()
+
+    def test_body_not_read_until_accessed(self, ticket_path, monkeypatch):
+        from ticket_system.lib import parser
+
+        body_reads = []
+        original = parser._read_body
+        monkeypatch.setattr(parser, "_read_body", lambda p: body_reads.append(p) or original(p))
+
+        ticket = load_ticket("0.31.0", "0.31.0-W4-001")
+        assert ticket["status"] == "pending"
+        assert "_body" in ticket and bool(ticket)
+        assert body_reads == []
+
+        assert ticket["_body"].startswith("# Body")
+        assert ticket.get("_body").endswith("log line")
+        assert len(body_reads) == 1
+
+    def test_mapping_views_include_body(self, ticket_path):
+        ticket = load_ticket("0.31.0", "0.31.0-W4-001")
+        assert dict(ticket)["_body"].startswith("# Body")
+
+        parsed, _ = parse_frontmatter("---\n" + yaml.dump(load_ticket("0.31.0", "0.31.0-W4-001")) + "---\n")
+        assert parsed["_body"].startswith("# Body")
+
+    def test_assigned_body_wins_and_save_roundtrip(self, ticket_path):
+        from ticket_system.lib import parser
+
+        ticket = load_ticket("0.31.0", "0.31.0-W4-001")
+        ticket["_body"] = "# Replaced"
+        ticket["status"] = "in_progress"
+        save_ticket(ticket, ticket_path)
+
+        content = ticket_path.read_text(encoding="utf-8")
+        assert "!!python" not in content
+        parser._ticket_cache.clear()
+        reloaded = load_ticket("0.31.0", "0.31.0-W4-001")
+        assert reloaded["status"] == "in_progress"
+        assert reloaded["_body"] == "# Replaced"
+
+    def test_prefix_read_matches_full_split(self, ticket_path):
+        from ticket_system.lib import parser
+
+        yaml_text, offset = parser._read_frontmatter_prefix(ticket_path)
+        content = ticket_path.read_text(encoding="utf-8")
+        assert parser._split_frontmatter(content) == (yaml_text, offset)
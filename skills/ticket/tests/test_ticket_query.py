@@ -0,0 +1,236 @@
+"""
+ticket_query 模組測試
+
+驗證查詢層：
+- parse_where 語法（優先序、括號、引號、多值、null、語法錯誤）
+- TicketTable.mask() 與逐票直譯的結果一致（固定 seed 隨機語料）
+- get_ticket_table 同 process 重用，save_ticket / 目錄變動後重建
+- CLI：--where 語法錯誤 exit 2；list / runqueue 套用篩選
+"""
+
+import argparse
+import io
+import random
+from contextlib import redirect_stdout
+from unittest.mock import Mock, patch
+
+import pytest
+import yaml
+
+from ticket_system.lib import parser, ticket_query
+from ticket_system.lib.ticket_query import (
+    BoolOp,
+    Comparison,
+    Not,
+    TicketTable,
+    WhereSyntaxError,
+    add_where_argument,
+    get_ticket_table,
+    parse_where,
+    where_from_args,
+)
+
+
+VERSION = "0.31.0"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    ticket_query.clear_ticket_table_cache()
+    yield
+    ticket_query.clear_ticket_table_cache()
+
+
+def _ticket(seq, status="pending", wave=1, priority="P2", **extra):
+    return {
+        "id": f"{VERSION}-W{wave}-{seq:03d}",
+        "status": status,
+        "wave": wave,
+        "priority": priority,
+        "title": f"Task {seq}",
+        **extra,
+    }
+
+
+def _ids(rows):
+    return [t["id"] for t in rows]
+
+
+class TestParseWhere:
+    def test_precedence_not_and_or(self):
+        assert parse_where("a=1 or b=2 and not c=3") == BoolOp("or", (
+            Comparison("a", "=", ("1",)),
+            BoolOp("and", (
+                Comparison("b", "=", ("2",)),
+                Not(Comparison("c", "=", ("3",))),
+            )),
+        ))
+
+    def test_parentheses_quotes_and_aliases(self):
+        expr = parse_where("(parent=X or agent='thyme bot') and title~\"a b\"")
+        assert expr == BoolOp("and", (
+            BoolOp("or", (
+                Comparison("parent_id", "=", ("X",)),
+                Comparison("assignee", "=", ("thyme bot",)),
+            )),
+            Comparison("title", "~", ("a b",)),
+        ))
+
+    def test_comma_values_only_for_equality(self):
+        assert parse_where("status!=completed,closed") == Comparison(
+            "status", "!=", ("completed", "closed")
+        )
+        assert parse_where("title~a,b") == Comparison("title", "~", ("a,b",))
+
+    @pytest.mark.parametrize("text", ["", "status", "status=", "a=1 and", "(a=1", "a=1)", "a=1 b=2"])
+    def test_syntax_errors(self, text):
+        with pytest.raises(WhereSyntaxError):
+            parse_where(text)
+
+    def test_argparse_rejects_with_exit_2(self, capsys):
+        cli = argparse.ArgumentParser()
+        add_where_argument(cli)
+        with pytest.raises(SystemExit) as exc:
+            cli.parse_args(["--where", "status="])
+        assert exc.value.code == 2
+        assert "--where" in capsys.readouterr().err
+
+    def test_where_from_args(self):
+        expr = parse_where("wave=1")
+        assert where_from_args(argparse.Namespace(where=expr)) is expr
+        assert where_from_args(argparse.Namespace(where="wave=1")) == expr
+        assert where_from_args(argparse.Namespace()) is None
+        assert where_from_args(Mock()) is None
+
+
+class TestTicketTable:
+    def test_operators(self):
+        rows = [
+            _ticket(1, wave=1, priority="P0", parent_id="P"),
+            _ticket(2, status="in_progress", wave=3, priority="P1", who={"current": "thyme"}),
+            _ticket(3, status="completed", wave=4, priority="P3", blockedBy=["X", "Y"]),
+            _ticket(4, wave=5, priority=""),
+        ]
+        table = TicketTable(rows)
+
+        def select(text):
+            return [t["id"][-3:] for t in table.select(parse_where(text))]
+
+        assert select("status=pending and wave>=3") == ["004"]
+        assert select("wave>=W3 and wave<5") == ["002", "003"]
+        assert select("priority<=P1") == ["001", "002"]
+        assert select("priority=null") == ["004"]
+        assert select("parent=P or assignee=thyme") == ["001", "002"]
+        assert select("blockedBy=Y") == ["003"]
+        assert select("not status=completed,in_progress") == ["001", "004"]
+        assert select("status!=pending") == ["002", "003"]
+        assert select("title~'TASK 3'") == ["003"]
+        assert select("wave>abc") == []
+
+    def test_select_status_and_wave_keep_row_order(self):
+        rows = [_ticket(i, status=s, wave=w) for i, (s, w) in enumerate(
+            [("pending", 2), ("completed", 1), ("pending", 1), ("blocked", 1)], 1
+        )]
+        table = TicketTable(rows)
+        selected = table.select(status={"pending", "blocked"}, wave=1)
+        assert _ids(selected) == [rows[2]["id"], rows[3]["id"]]
+        assert selected[0] is rows[2]
+        assert table.select(status=set()) == rows
+
+    def test_mask_matches_row_by_row_evaluation(self):
+        rng = random.Random(11)
+        statuses = ["pending", "in_progress", "completed", "blocked"]
+        rows = [
+            _ticket(
+                i,
+                status=rng.choice(statuses),
+                wave=rng.randint(1, 6),
+                priority=rng.choice(["P0", "P1", "P2", "P3", None]),
+            )
+            for i in range(300)
+        ]
+        table = TicketTable(rows)
+        leaves = [
+            ("status=pending,blocked", lambda t: t["status"] in ("pending", "blocked")),
+            ("wave>=4", lambda t: t["wave"] >= 4),
+            ("wave<2", lambda t: t["wave"] < 2),
+            ("priority<=P1", lambda t: t["priority"] is not None and t["priority"] <= "P1"),
+            ("priority=null", lambda t: t["priority"] is None),
+        ]
+        for _ in range(40):
+            (ta, fa), (tb, fb), (tc, fc) = rng.sample(leaves, 3)
+            text = f"{ta} and (not {tb} or {tc})"
+            expected = [t["id"] for t in rows if fa(t) and (not fb(t) or fc(t))]
+            assert _ids(table.select(parse_where(text))) == expected, text
+
+
+class TestTableCache:
+    @pytest.fixture
+    def tickets_dir(self, temp_project_dir, monkeypatch):
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(temp_project_dir))
+        parser._ticket_cache.clear()
+        yield temp_project_dir / "docs" / "work-logs" / "v0" / "v0.31" / "v0.31.0" / "tickets"
+        parser._ticket_cache.clear()
+
+    def test_reuses_table_until_save_or_dir_change(self, tickets_dir):
+        path = tickets_dir / f"{VERSION}-W1-001.md"
+        path.write_text(f"---\n{yaml.dump(_ticket(1))}---\n\n# Body\n", encoding="utf-8")
+        loader = Mock(side_effect=lambda version: [_ticket(1)])
+
+        table = get_ticket_table(VERSION, loader)
+        assert get_ticket_table(VERSION, loader) is table
+        assert loader.call_count == 1
+
+        parser.save_ticket(_ticket(1, status="in_progress"), path)
+        rebuilt = get_ticket_table(VERSION, loader)
+        assert rebuilt is not table
+        assert loader.call_count == 2
+
+        (tickets_dir / f"{VERSION}-W1-002.md").write_text("---\nid: x\n---\n", encoding="utf-8")
+        assert get_ticket_table(VERSION, loader) is not rebuilt
+        assert loader.call_count == 3
+
+    def test_different_loader_is_not_shared(self, tickets_dir):
+        first = get_ticket_table(VERSION, lambda version: [_ticket(1)])
+        second = get_ticket_table(VERSION, lambda version: [_ticket(2)])
+        assert _ids(first.rows) != _ids(second.rows)
+
+
+class TestCommands:
+    TICKETS = [
+        _ticket(1, wave=1, priority="P1"),
+        _ticket(2, wave=3, priority="P2"),
+        _ticket(3, status="completed", wave=3, priority="P0"),
+        _ticket(4, wave=4, priority="P0"),
+    ]
+
+    def _list_args(self, where):
+        return argparse.Namespace(
+            pending=False, in_progress=False, completed=False, blocked=False,
+            status=None, wave=None, format="ids", version=VERSION, top=None,
+            all=True, where=parse_where(where),
+        )
+
+    def test_track_list_where(self):
+        from ticket_system.commands import track_query
+
+        buf = io.StringIO()
+        with patch.object(track_query, "list_tickets", return_value=self.TICKETS), \
+                redirect_stdout(buf):
+            assert track_query.execute_list(self._list_args("status=pending and wave>=3"), VERSION) == 0
+        ids = [line for line in buf.getvalue().split() if line.startswith(VERSION)]
+        assert sorted(ids) == [f"{VERSION}-W3-002", f"{VERSION}-W4-004"]
+
+    def test_runqueue_where(self):
+        from ticket_system.commands import track_runqueue
+
+        args = argparse.Namespace(
+            format="list", top=None, context=None, wave=None, topic=None,
+            groups=False, where=parse_where("priority=P0"),
+        )
+        with patch.object(track_runqueue, "list_tickets", return_value=self.TICKETS), \
+                patch.object(track_runqueue.topic_assignments, "list_assignments", return_value={}), \
+                patch.object(track_runqueue, "_get_pending_handoff_info", return_value={}):
+            output = track_runqueue.render_runqueue(args, VERSION)
+        assert f"{VERSION}-W4-004" in output
+        assert f"{VERSION}-W1-001" not in output
@@ -0,0 +1,143 @@
+"""
+ticket_write_batch 模組測試（多張 Ticket 交易式寫入）
+
+驗證：
+- 整批寫入內容與逐張 save_ticket 相同，ticket 物件特殊欄位恢復
+- 取鎖依解析後路徑排序、每個目錄只 fsync 一次
+- 序列化失敗：未寫入任何檔案
+- 替換途中失敗：已替換檔案還原、新檔刪除、暫存檔清除
+- track batch-claim 寫入失敗：回傳 1 且不執行 lease 等後續動作
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from ticket_system.commands import track_batch
+from ticket_system.lib import ticket_write_batch as mod
+from ticket_system.lib.parser import save_ticket
+from ticket_system.lib.ticket_write_batch import TicketWriteBatch, save_tickets
+
+
+def _ticket(tid, status="pending"):
+    return {"id": tid, "status": status, "title": f"title {tid}", "_body": f"# {tid}\n"}
+
+
+def _snapshot(directory: Path):
+    return {p.name: p.read_text(encoding="utf-8") for p in sorted(directory.iterdir())}
+
+
+@pytest.fixture
+def tickets_dir(tmp_path):
+    directory = tmp_path / "tickets"
+    directory.mkdir()
+    for n in (1, 2):
+        save_ticket(_ticket(f"0.1.0-W1-00{n}"), directory / f"0.1.0-W1-00{n}.md")
+    for lock in directory.glob("*.lock"):
+        lock.unlink()
+    return directory
+
+
+class TestCommit:
+    def test_matches_save_ticket_output(self, tmp_path):
+        single, batched = tmp_path / "single", tmp_path / "batched"
+        tickets = [_ticket(f"0.1.0-W1-00{n}", "in_progress") for n in (1, 2, 3)]
+        for ticket in tickets:
+            save_ticket(ticket, single / f"{ticket['id']}.md")
+        save_tickets([(t, batched / f"{t['id']}.md") for t in tickets])
+
+        for ticket in tickets:
+            name = f"{ticket['id']}.md"
+            assert (batched / name).read_text(encoding="utf-8") == \
+                (single / name).read_text(encoding="utf-8")
+            assert ticket["_body"] == f"# {ticket['id']}\n"
+        assert not list(batched.glob("*.tmp"))
+
+    def test_locks_sorted_and_one_fsync_per_directory(self, tmp_path, monkeypatch):
+        locked, synced = [], []
+
+        @contextmanager
+        def fake_lock(path):
+            locked.append(path.name)
+            yield
+
+        monkeypatch.setattr(mod, "file_lock", fake_lock)
+        monkeypatch.setattr(mod, "_fsync_dir", lambda d: synced.append(d))
+
+        batch = TicketWriteBatch()
+        for n in (3, 1, 2):
+            batch.stage(_ticket(f"0.1.0-W1-00{n}"), tmp_path / f"0.1.0-W1-00{n}.md")
+        batch.stage(_ticket("0.1.0-W1-001", "completed"), tmp_path / "0.1.0-W1-001.md")
+        assert len(batch) == 3
+        batch.commit()
+
+        assert locked == ["0.1.0-W1-001.md", "0.1.0-W1-002.md", "0.1.0-W1-003.md"]
+        assert synced == [tmp_path]
+        assert "status: completed" in (tmp_path / "0.1.0-W1-001.md").read_text(encoding="utf-8")
+
+
+class TestRollback:
+    def test_render_failure_writes_nothing(self, tickets_dir, monkeypatch):
+        before = _snapshot(tickets_dir)
+        real_render = mod.render_ticket_content
+
+        def render(ticket, path):
+            if ticket["id"].endswith("002"):
+                raise ValueError("bad enum")
+            return real_render(ticket, path)
+
+        monkeypatch.setattr(mod, "render_ticket_content", render)
+        with pytest.raises(ValueError):
+            save_tickets([
+                (_ticket(f"0.1.0-W1-00{n}", "in_progress"), tickets_dir / f"0.1.0-W1-00{n}.md")
+                for n in (1, 2, 3)
+            ])
+
+        after = {k: v for k, v in _snapshot(tickets_dir).items() if not k.endswith(".lock")}
+        assert after == before
+
+    def test_replace_failure_restores_replaced_files(self, tickets_dir, monkeypatch):
+        before = _snapshot(tickets_dir)
+        real_replace = mod.os.replace
+        calls = []
+
+        def flaky_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 3:
+                raise OSError("disk full")
+            return real_replace(src, dst)
+
+        monkeypatch.setattr(mod.os, "replace", flaky_replace)
+        with pytest.raises(OSError):
+            save_tickets([
+                (_ticket(f"0.1.0-W1-00{n}", "in_progress"), tickets_dir / f"0.1.0-W1-00{n}.md")
+                for n in (1, 2, 3)
+            ])
+
+        after = {k: v for k, v in _snapshot(tickets_dir).items() if not k.endswith(".lock")}
+        assert after == before
+
+
+class TestTrackBatchAtomic:
+    def test_write_failure_skips_side_effects(self, monkeypatch, capsys):
+        leases = []
+        monkeypatch.setattr(track_batch, "claim_lease", lambda v, t: leases.append(t))
+        monkeypatch.setattr(
+            track_batch, "load_and_validate_ticket",
+            lambda version, ticket_id, auto_print_error=False: ({"id": ticket_id, "status": "pending"}, None),
+        )
+        monkeypatch.setattr(track_batch, "resolve_ticket_path", lambda t, v, tid: Path(f"/tmp/{tid}.md"))
+
+        def failing_save(entries):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(track_batch, "save_tickets", failing_save)
+        args = Mock(ticket_ids="0.1.0-W1-001,0.1.0-W1-002", version="0.1.0")
+
+        assert track_batch.execute_batch_claim(args, "0.1.0") == 1
+        assert leases == []
+        out = capsys.readouterr().out
+        assert "[OK]" not in out
+        assert "皆已回滾" in out
@@ -37,12 +37,12 @@ class TestBatchClaim:
 
             mock_load_validate.side_effect = load_side_effect
 
-            with patch('ticket_system.commands.track_batch.save_ticket') as mock_save:
+            with patch('ticket_system.commands.track_batch.save_tickets') as mock_save:
                 result = execute_batch_claim(args, "0.31.0")
 
                 assert result == 0
                 # 應保存 3 個 Ticket
-                assert mock_save.call_count == 3
+                assert len(mock_save.call_args.args[0]) == 3
 
     def test_batch_claim_partial_failure(self):
         """
@@ -63,7 +63,7 @@ class TestBatchClaim:
 
             mock_load.side_effect = load_side_effect
 
-            with patch('ticket_system.commands.track_batch.save_ticket'):
+            with patch('ticket_system.commands.track_batch.save_tickets'):
                 result = execute_batch_claim(args, "0.31.0")
 
                 # 由於有一個成功的項目，返回 0（實現邏輯：success_count > 0）
@@ -103,7 +103,7 @@ class TestBatchClaim:
 
             mock_load.side_effect = load_side_effect
 
-            with patch('ticket_system.commands.track_batch.save_ticket'):
+            with patch('ticket_system.commands.track_batch.save_tickets'):
                 result = execute_batch_claim(args, "0.31.0")
 
                 assert result == 0
@@ -136,11 +136,11 @@ class TestBatchComplete:
 
             mock_load.side_effect = load_side_effect
 
-            with patch('ticket_system.commands.track_batch.save_ticket') as mock_save:
+            with patch('ticket_system.commands.track_batch.save_tickets') as mock_save:
                 result = execute_batch_complete(args, "0.31.0")
 
                 assert result == 0
-                assert mock_save.call_count == 2
+                assert len(mock_save.call_args.args[0]) == 2
 
     def test_batch_complete_with_incomplete_criteria_failure(self):
         """
@@ -176,7 +176,7 @@ class TestBatchComplete:
 
             mock_load.side_effect = load_side_effect
 
-            with patch('ticket_system.commands.track_batch.save_ticket'):
+            with patch('ticket_system.commands.track_batch.save_tickets'):
                 result = execute_batch_complete(args, "0.31.0")
 
                 # 由於有一個成功的項目，返回 0（實現邏輯：success_count > 0）
@@ -207,7 +207,7 @@ class TestBatchComplete:
 
             mock_load.side_effect = load_side_effect
 
-            with patch('ticket_system.commands.track_batch.save_ticket'):
+            with patch('ticket_system.commands.track_batch.save_tickets'):
                 result = execute_batch_complete(args, "0.31.0")
 
                 # 由於有一個成功的項目，返回 0（實現邏輯：success_count > 0）
@@ -231,7 +231,7 @@ class TestBatchComplete:
             }
             mock_load.return_value = (mock_ticket, None)
 
-            with patch('ticket_system.commands.track_batch.save_ticket') as mock_save:
+            with patch('ticket_system.commands.track_batch.save_tickets') as mock_save:
                 result = execute_batch_complete(args, "0.31.0")
 
                 assert result == 0
@@ -250,7 +250,7 @@ class TestBatchComplete:
         args.ticket_ids = "invalid-id-1,invalid-id-2"
         args.version = "0.31.0"
 
-        with patch('ticket_system.commands.track_batch.save_ticket'):
+        with patch('ticket_system.commands.track_batch.save_tickets'):
             result = execute_batch_complete(args, "0.31.0")
 
             # 全部 ID 無效 → success_count=0 → return 2
@@ -280,7 +280,7 @@ class TestBatchComplete:
 
             mock_load.side_effect = load_side_effect
 
-            with patch('ticket_system.commands.track_batch.save_ticket') as mock_save:
+            with patch('ticket_system.commands.track_batch.save_tickets') as mock_save:
                 result = execute_batch_complete(args, "0.31.0")
 
                 # 應該處理重複 ID（會嘗試保存 3 次）
@@ -322,12 +322,12 @@ class TestBatchCompleteEnhanced:
 
                 mock_load.side_effect = load_side_effect
 
-                with patch('ticket_system.commands.track_batch.save_ticket') as mock_save:
+                with patch('ticket_system.commands.track_batch.save_tickets') as mock_save:
                     result = execute_batch_complete(args, "0.31.0")
 
                     assert result == 0
                     # 應該只保存 2 個（符合 wave=28 的）
-                    assert mock_save.call_count == 2
+                    assert len(mock_save.call_args.args[0]) == 2
 
     def test_batch_complete_by_parent(self):
         """
@@ -361,12 +361,12 @@ class TestBatchCompleteEnhanced:
 
                 mock_load.side_effect = load_side_effect
 
-                with patch('ticket_system.commands.track_batch.save_ticket') as mock_save:
+                with patch('ticket_system.commands.track_batch.save_tickets') as mock_save:
                     result = execute_batch_complete(args, "0.31.0")
 
                     assert result == 0
                     # 應該只保存 2 個子任務
-                    assert mock_save.call_count == 2
+                    assert len(mock_save.call_args.args[0]) == 2
 
     def test_batch_complete_by_parent_with_chain_format(self):
         """
@@ -414,12 +414,12 @@ class TestBatchCompleteEnhanced:
 
                 mock_load.side_effect = load_side_effect
 
-                with patch('ticket_system.commands.track_batch.save_ticket') as mock_save:
+                with patch('ticket_system.commands.track_batch.save_tickets') as mock_save:
                     result = execute_batch_complete(args, "0.31.1")
 
                     assert result == 0
                     # 應該只保存 2 個子任務（0.31.1-W1-001.1 和 0.31.1-W1-001.2）
-                    assert mock_save.call_count == 2
+                    assert len(mock_save.call_args.args[0]) == 2
 
     def test_batch_complete_dry_run(self):
         """
@@ -451,7 +451,7 @@ class TestBatchCompleteEnhanced:
 
                 mock_load.side_effect = load_side_effect
 
-                with patch('ticket_system.commands.track_batch.save_ticket') as mock_save:
+                with patch('ticket_system.commands.track_batch.save_tickets') as mock_save:
                     result = execute_batch_complete(args, "0.31.0")
 
                     # Dry-run 應返回 0 但不保存
@@ -483,7 +483,7 @@ class TestBatchCompleteEnhanced:
             with patch('ticket_system.commands.track_batch.load_and_validate_ticket') as mock_load:
                 mock_load.return_value = None
 
-                with patch('ticket_system.commands.track_batch.save_ticket'):
+                with patch('ticket_system.commands.track_batch.save_tickets'):
                     result = execute_batch_complete(args, "0.31.0")
 
                     assert result == 2
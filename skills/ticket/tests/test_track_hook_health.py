@@ -185,3 +185,71 @@ class TestHookHealthExecution:
         # since=3 → 大約 3 天前
         delta_days = (datetime.now() - captured["since"]).days
         assert 2 <= delta_days <= 4
+
+
+def _fake_profile() -> Dict[str, Dict]:
+    """模擬 scan_profiles 回傳：一支 hook 超出預算、一條鏈在預算內。"""
+    hook_stats = {
+        "count": 20, "p50": 80.0, "p95": 240.0, "p99": 300.0,
+        "import_ms_p50": 60.0, "main_ms_p50": 20.0, "subprocesses_mean": 1.5,
+        "budget_ms": 200.0, "over_budget": True,
+    }
+    chain_stats = {
+        "count": 10, "p50": 300.0, "p95": 500.0, "p99": 600.0,
+        "hooks": ["phase4-decision-enforcement"], "budget_ms": 1500.0, "over_budget": False,
+    }
+    return {
+        "hooks": {"phase4-decision-enforcement": hook_stats},
+        "chains": {"PreToolUse/Bash": chain_stats},
+    }
+
+
+class TestHookHealthProfile:
+    def test_profile_flag_defaults_to_report(self):
+        from ticket_system.commands.track_hook_health import register_hook_health
+
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest="operation")
+        register_hook_health(subparsers)
+
+        assert parser.parse_args(["hook-health"]).profile is None
+        assert parser.parse_args(["hook-health", "--profile"]).profile == "report"
+        assert parser.parse_args(["hook-health", "--profile", "on"]).profile == "on"
+
+    def test_report_table_flags_over_budget(self):
+        from ticket_system.commands.track_hook_health import execute_hook_health
+
+        buf = io.StringIO()
+        with patch(
+            "ticket_system.commands.track_hook_health.scan_profiles",
+            return_value=_fake_profile(),
+        ), redirect_stdout(buf):
+            rc = execute_hook_health(_args(profile="report"))
+        assert rc == 0
+        out = buf.getvalue()
+        assert "PreToolUse/Bash" in out
+        assert "OVER" in out
+        assert "1 項超出預算" in out
+
+    def test_report_json_counts_over_budget(self):
+        from ticket_system.commands.track_hook_health import execute_hook_health
+
+        buf = io.StringIO()
+        with patch(
+            "ticket_system.commands.track_hook_health.scan_profiles",
+            return_value=_fake_profile(),
+        ), redirect_stdout(buf):
+            rc = execute_hook_health(_args(profile="report", format="json"))
+        assert rc == 0
+        payload = json.loads(buf.getvalue())
+        assert payload["over_budget_count"] == 1
+        assert payload["chains"]["PreToolUse/Bash"]["p95"] == 500.0
+
+    def test_toggle_refused_under_dry_run(self):
+        from ticket_system.commands.track_hook_health import execute_hook_health
+
+        with patch("ticket_system.commands.track_hook_health.set_profiling") as toggle, \
+                redirect_stdout(io.StringIO()):
+            assert execute_hook_health(_args(profile="on", dry_run=True)) == 2
+            assert execute_hook_health(_args(profile="on")) == 0
+        toggle.assert_called_once_with(True)
@@ -1,7 +1,8 @@
 """
 Ticket 系統子命令模組
 
-提供 create, track, handoff, resume, migrate, generate, batch-create 七個子命令的實作。
+提供 create, track, handoff, resume, migrate, generate, batch-create 七個子命令的實作，
+以及在同一 process 內連續執行多個命令的 batch / shell。
 """
 
 from .create import register as create_register
@@ -12,6 +13,7 @@ from .migrate import register as migrate_register
 from .generate import register as generate_register
 from .bulk_create import register as batch_create_register
 from .show import register as show_register
+from .session import register as session_register
 
 __all__ = [
     "create_register",
@@ -22,4 +24,5 @@ __all__ = [
     "generate_register",
     "batch_create_register",
     "show_register",
+    "session_register",
 ]
@@ -28,8 +28,8 @@ from ticket_system.lib.ticket_builder import (
 from ticket_system.lib.ticket_loader import (
     get_tickets_dir,
     get_ticket_path,
-    save_ticket,
 )
+from ticket_system.lib.ticket_write_batch import save_tickets
 from ticket_system.lib.file_lock import create_id_allocation_lock
 from ticket_system.lib.messages import (
     ErrorMessages,
@@ -44,6 +44,7 @@ from ticket_system.lib.command_tracking_messages import (
 )
 from ticket_system.lib.ui_constants import SEPARATOR_PRIMARY
 from ticket_system.lib.duplicate_detector import detect_duplicate_tickets
+from ticket_system.lib.duplicate_token_index import get_duplicate_index
 
 
 @dataclass
@@ -233,6 +234,13 @@ def _create_batch_tickets(
         tickets_dir = get_tickets_dir(version)
         tickets_dir.mkdir(parents=True, exist_ok=True)
 
+    # 整批共用一份重複偵測索引：只載入一次，批次內已處理的票登記為 pending，
+    # 後續 target 同時比對既有票與批次內前序票（預演模式亦同）
+    duplicate_index = get_duplicate_index(version)
+
+    # 通過建立流程的票先暫存，迴圈結束後整批寫入（全部寫入或全部回滾）
+    staged: List[Tuple[str, Dict[str, any], Path]] = []
+
     # 迴圈建立各 Ticket
     for i, target in enumerate(targets, 1):
         try:
@@ -267,6 +275,10 @@ def _create_batch_tickets(
                 new_title=config.get("title", ""),
                 new_what=config.get("what", ""),
                 new_ticket_id=ticket_id,
+                index=duplicate_index,
+            )
+            duplicate_index.add_pending(
+                ticket_id, config.get("title", ""), config.get("what", "")
             )
 
             # checklist 驗證（1.0.0-W1-027：warning 級，不阻擋）
@@ -289,16 +301,24 @@ def _create_batch_tickets(
                 frontmatter.get("type", ""),
             )
 
-            # 寫入檔案（除非是預演模式）
+            # 暫存待寫入（除非是預演模式）
             if not dry_run:
                 ticket_path = get_ticket_path(version, ticket_id)
-                save_ticket(frontmatter, ticket_path)
+                staged.append((target, frontmatter, ticket_path))
 
             result.created.append(ticket_id)
 
         except Exception as e:
             result.failed.append((target, str(e)))
 
+    if staged:
+        try:
+            save_tickets([(frontmatter, path) for _target, frontmatter, path in staged])
+        except Exception as e:
+            # 整批已回滾：原列為 created 的票全數改記為失敗
+            result.failed.extend((target, str(e)) for target, _fm, _path in staged)
+            result.created = []
+
     return result
 
 
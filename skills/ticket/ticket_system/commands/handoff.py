@@ -62,6 +62,7 @@ from ticket_system.lib.command_lifecycle_messages import (
     format_msg,
 )
 from ticket_system.lib.chain_analyzer import ChainAnalyzer, Recommendation
+from ticket_system.lib.ticket_graph import TicketGraph
 from ticket_system.lib.ticket_ops import (
     load_and_validate_ticket,
     resolve_ticket_path,
@@ -839,11 +840,12 @@ def _print_status(ticket: dict) -> int:
     # 版本號提取一次，傳入各子函式
     version = extract_version_from_ticket_id(ticket_id)
 
-    # 預先載入父任務，避免兄弟選項查詢時重複 I/O
+    # 方向判斷與建議共用同一份關係圖；預先載入父任務，避免兄弟選項查詢時重複 I/O
+    graph = TicketGraph(version, loader=load_ticket)
     parent_id = chain.get("parent")
     parent_ticket = None
     if parent_id and version:
-        parent_ticket = load_ticket(version, parent_id)
+        parent_ticket = graph.get(parent_id)
 
     # 列印基本資訊
     _print_header(ticket)
@@ -854,7 +856,7 @@ def _print_status(ticket: dict) -> int:
 
     # 列印交接方向選項
     print(HandoffMessages.STATUS_OPTIONS)
-    direction = ChainAnalyzer.determine_direction(ticket, version)
+    direction = ChainAnalyzer.determine_direction(ticket, version, graph)
     _print_direction_options(ticket, direction, version, children, parent_ticket)
 
     # 列印建議下一步
@@ -862,7 +864,7 @@ def _print_status(ticket: dict) -> int:
     print(SEPARATOR_SECONDARY)
     print(SectionHeaders.SUGGESTED_NEXT_STEP)
     print(SEPARATOR_SECONDARY)
-    _print_recommendation(ticket, direction, version)
+    _print_recommendation(ticket, direction, version, graph)
 
     return 0
 
@@ -947,7 +949,12 @@ def _print_completed_recommendation(recommendation: Recommendation) -> None:
     print(format_msg(HandoffMessages.RECOMMENDATION_REASON, reason=recommendation.reason))
 
 
-def _print_recommendation(ticket: dict, direction: str, version: str = None) -> None:
+def _print_recommendation(
+    ticket: dict,
+    direction: str,
+    version: str = None,
+    graph: Optional[TicketGraph] = None,
+) -> None:
     """
     列印建議下一步行動。
 
@@ -957,8 +964,9 @@ def _print_recommendation(ticket: dict, direction: str, version: str = None) ->
         ticket: Ticket 資料
         direction: 交接方向
         version: 版本號
+        graph: 與方向判斷共用的 Ticket 關係圖（可選）
     """
-    recommendation = ChainAnalyzer.get_recommendation(direction, ticket, version)
+    recommendation = ChainAnalyzer.get_recommendation(direction, ticket, version, graph)
 
     # 根據方向類型輸出對應資訊
     if recommendation.direction in _DIRECTION_MESSAGE_MAP:
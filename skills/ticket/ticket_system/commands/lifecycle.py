@@ -36,6 +36,7 @@ from ticket_system.lib.ticket_loader import (
     save_ticket,
 )
 from ticket_system.lib.staleness import format_stale_warning
+from ticket_system.lib.ticket_graph import TicketGraph
 from ticket_system.lib.ticket_validator import (
     validate_claimable_status,
     validate_completable_status,
@@ -103,7 +104,9 @@ from ticket_system.commands.claim_verification import (
 # Source ANA 完成提示（W17-008.15 方案 D）
 # ============================================================================
 
-def _print_source_ana_complete_hint(ticket: Dict[str, Any], version: str) -> None:
+def _print_source_ana_complete_hint(
+    ticket: Dict[str, Any], version: str, graph: Optional[TicketGraph] = None
+) -> None:
     """IMP complete 後檢查 source ANA 的 spawned 是否全 completed，給出提示。
 
     觸發條件：
@@ -114,6 +117,8 @@ def _print_source_ana_complete_hint(ticket: Dict[str, Any], version: str) -> Non
 
     輸出（stdout，非阻擋）：
       → Source ANA <id> spawned 全 completed，可考慮 ticket track complete <id>
+
+    graph 為 complete 後建立的關係圖（可選）；未傳入時逐一 load_ticket。
     """
     if ticket.get("type") != "IMP":
         return
@@ -121,7 +126,9 @@ def _print_source_ana_complete_hint(ticket: Dict[str, Any], version: str) -> Non
     if not source_id:
         return
 
-    source = load_ticket(version, source_id)
+    if graph is None:
+        graph = TicketGraph(version, loader=load_ticket)
+    source = graph.get(source_id)
     if not source:
         return
     if source.get("type") != "ANA":
@@ -134,7 +141,7 @@ def _print_source_ana_complete_hint(ticket: Dict[str, Any], version: str) -> Non
         return
 
     for sid in spawned_ids:
-        spawned = load_ticket(version, sid)
+        spawned = graph.get(sid)
         if not spawned:
             return
         if spawned.get("status") not in TERMINAL_STATUSES:
@@ -898,15 +905,22 @@ class TicketLifecycle:
                     print("   --skip-body-check 已啟用，強制完成；請於 Completion Info 記錄理由")
                     print()
 
+            # Step 3.6 / 3.7 共用同一份關係圖：版本列表至多載入一次
+            precheck_graph = TicketGraph(self.version, lister=list_tickets)
+
             # Step 3.6：ANA spawned 非 terminal blocking confirmation（W12-005 / PC-075 Phase 2）
-            spawned_exit = _handle_ana_spawned_confirmation(ticket, self.version, yes_spawned)
+            spawned_exit = _handle_ana_spawned_confirmation(
+                ticket, self.version, yes_spawned, precheck_graph
+            )
             if spawned_exit is not None:
                 return spawned_exit
 
             # Step 3.7：pending children blocking（W11-003.2）
             # 父 ticket 含未完成（非 terminal）children 時阻擋 complete；--force 旁路（警告但成功）。
             # W5-019 cascade 解鎖在通過此 step 後（含 --force 路徑）仍會執行。
-            children_exit = _handle_pending_children_block(ticket, self.version, force)
+            children_exit = _handle_pending_children_block(
+                ticket, self.version, force, precheck_graph
+            )
             if children_exit is not None:
                 return children_exit
 
@@ -974,6 +988,7 @@ class TicketLifecycle:
         # 給 _analyze_next_steps 與 _post_complete_cascade，消除 cascade 內重複 I/O
         all_tickets = list_tickets(self.version)
         ticket_map: Dict[str, Any] = {t.get("id"): t for t in all_tickets}
+        graph = TicketGraph(self.version, tickets=all_tickets, loader=load_ticket)
         analysis = _analyze_next_steps(ticket, all_tickets)
         _print_next_steps(analysis)
 
@@ -990,7 +1005,7 @@ class TicketLifecycle:
         _reverse_unblock_blockedby(ticket_id, self.version, ticket_map)
 
         # W17-008.15 方案 D：IMP complete 後檢查 source ANA 是否可 complete
-        _print_source_ana_complete_hint(ticket, self.version)
+        _print_source_ana_complete_hint(ticket, self.version, graph)
 
         # where.files 重疊 pending 票提示：純提示不阻擋，判定交由收尾者
         _print_overlapping_pending_hint(ticket, ticket_map)
@@ -1682,16 +1697,18 @@ def _can_cascade_unblock(
 
 
 def _collect_non_terminal_spawned(
-    spawned_ids: List[str], version: str
+    spawned_ids: List[str], version: str, graph: Optional[TicketGraph] = None
 ) -> List[Tuple[str, str]]:
     """查詢 spawned ticket 清單中非 terminal 的項目。
 
     透過 list_tickets 一次性查詢版本下全部 tickets（process-scoped 快取），
-    避免 N 次 load_ticket I/O。
+    避免 N 次 load_ticket I/O。complete 前置檢查傳入共用 graph，與
+    _collect_pending_children 共用同一次列表。
 
     Args:
         spawned_ids: spawned_tickets 欄位 ID 清單
         version: 版本字串
+        graph: 以 list_tickets 為 lister 的關係圖（可選）
 
     Returns:
         List[(ticket_id, status)] — 非 terminal 項目。
@@ -1699,20 +1716,17 @@ def _collect_non_terminal_spawned(
     """
     if not spawned_ids:
         return []
+    return _non_terminal_in_listing(spawned_ids, version, graph)
 
-    all_tickets = list_tickets(version)
-    ticket_map: Dict[str, Any] = {t.get("id"): t for t in all_tickets}
 
-    non_terminal: List[Tuple[str, str]] = []
-    for sid in spawned_ids:
-        t = ticket_map.get(sid)
-        if t is None:
-            non_terminal.append((sid, "not_found"))
-            continue
-        status = t.get("status", "unknown")
-        if status not in TERMINAL_STATUSES:
-            non_terminal.append((sid, status))
-    return non_terminal
+def _non_terminal_in_listing(
+    ticket_ids: List[str], version: str, graph: Optional[TicketGraph]
+) -> List[Tuple[str, str]]:
+    """以版本全列表判定 ID 清單中的非 terminal 項目（不在列表中視為 not_found）"""
+    if graph is None:
+        graph = TicketGraph(version, lister=list_tickets)
+    graph.all_tickets()
+    return graph.non_terminal(ticket_ids)
 
 
 def _print_spawned_list(non_terminal: List[Tuple[str, str]]) -> None:
@@ -1729,7 +1743,10 @@ def _print_spawned_list(non_terminal: List[Tuple[str, str]]) -> None:
 
 
 def _handle_ana_spawned_confirmation(
-    ticket: Dict[str, Any], version: str, yes_spawned: bool
+    ticket: Dict[str, Any],
+    version: str,
+    yes_spawned: bool,
+    graph: Optional[TicketGraph] = None,
 ) -> Optional[int]:
     """檢查 ANA type Ticket 的 spawned 非 terminal 狀態，必要時阻擋 complete。
 
@@ -1749,6 +1766,7 @@ def _handle_ana_spawned_confirmation(
         ticket: 當前 Ticket dict
         version: 版本字串
         yes_spawned: CLI --yes-spawned flag
+        graph: complete 前置檢查共用的關係圖（可選）
 
     Returns:
         None — 通過檢查，繼續 complete
@@ -1761,7 +1779,7 @@ def _handle_ana_spawned_confirmation(
     if not spawned_ids:
         return None
 
-    non_terminal = _collect_non_terminal_spawned(spawned_ids, version)
+    non_terminal = _collect_non_terminal_spawned(spawned_ids, version, graph)
     if not non_terminal:
         return None
 
@@ -1819,13 +1837,14 @@ def _handle_ana_spawned_confirmation(
 
 
 def _collect_pending_children(
-    children_ids: List[str], version: str
+    children_ids: List[str], version: str, graph: Optional[TicketGraph] = None
 ) -> List[Tuple[str, str]]:
     """查詢 children 清單中非 terminal（pending / in_progress / blocked）的項目。
 
     Args:
         children_ids: children 欄位 ID 清單
         version: 版本字串
+        graph: 以 list_tickets 為 lister 的關係圖（可選）
 
     Returns:
         List[(ticket_id, status)] — 非 terminal 項目。
@@ -1833,24 +1852,14 @@ def _collect_pending_children(
     """
     if not children_ids:
         return []
-
-    all_tickets = list_tickets(version)
-    ticket_map: Dict[str, Any] = {t.get("id"): t for t in all_tickets}
-
-    pending: List[Tuple[str, str]] = []
-    for cid in children_ids:
-        child = ticket_map.get(cid)
-        if child is None:
-            pending.append((cid, "not_found"))
-            continue
-        status = child.get("status", "unknown")
-        if status not in TERMINAL_STATUSES:
-            pending.append((cid, status))
-    return pending
+    return _non_terminal_in_listing(children_ids, version, graph)
 
 
 def _handle_pending_children_block(
-    ticket: Dict[str, Any], version: str, force: bool
+    ticket: Dict[str, Any],
+    version: str,
+    force: bool,
+    graph: Optional[TicketGraph] = None,
 ) -> Optional[int]:
     """檢查 ticket 的 children 狀態，必要時阻擋 complete（W11-003.2）。
 
@@ -1865,6 +1874,7 @@ def _handle_pending_children_block(
         ticket: 當前 Ticket dict
         version: 版本字串
         force: CLI --force flag
+        graph: complete 前置檢查共用的關係圖（可選）
 
     Returns:
         None — 通過檢查，繼續 complete
@@ -1874,7 +1884,7 @@ def _handle_pending_children_block(
     if not children_ids:
         return None
 
-    pending = _collect_pending_children(children_ids, version)
+    pending = _collect_pending_children(children_ids, version, graph)
     if not pending:
         return None
 
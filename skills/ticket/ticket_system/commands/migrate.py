@@ -30,6 +30,7 @@ from ticket_system.lib.ticket_loader import (
     resolve_version,
 )
 from ticket_system.lib.parser import parse_frontmatter
+from ticket_system.lib.reverse_ref_index import get_reverse_ref_index
 from ticket_system.lib.ticket_validator import validate_ticket_id
 from ticket_system.lib.id_parser import (
     extract_id_components,
@@ -105,8 +106,8 @@ def _update_cross_references(old_id: str, new_id: str) -> int:
     """
     搜尋所有 Ticket 文件並更新對舊 ID 的交叉引用
 
-    掃描所有版本目錄下的 tickets 資料夾，查找並更新以下欄位中
-    對舊 ID 的引用：
+    透過反向引用索引（lib/reverse_ref_index）找出所有版本目錄下引用舊 ID
+    的 Ticket，更新以下欄位中對舊 ID 的引用：
     - blockedBy: 阻塞依賴列表
     - relatedTo: 相關 Ticket 列表
     - children: 子 Ticket 列表（支援字串和 dict 形式）
@@ -122,88 +123,88 @@ def _update_cross_references(old_id: str, new_id: str) -> int:
         int: 更新的檔案數量
     """
     updated_count = 0
-    work_logs_root = get_project_root() / "docs" / "work-logs"
-
-    # 掃描所有版本目錄下的 tickets 資料夾
-    # 支援 flat (v{ver}/tickets) 與三層 (v{major}/v{major.minor}/v{ver}/tickets)
-    flat_dirs = list(work_logs_root.glob("v*/tickets"))
-    hierarchical_dirs = list(work_logs_root.glob("v*/v*/v*/tickets"))
-    for tickets_dir in sorted(set(flat_dirs + hierarchical_dirs)):
-        for ticket_file in sorted(tickets_dir.glob("*.md")):
-            # 跳過剛遷移的 Ticket 本身（來源：0.18.0-W10-037 Bug 2）
-            # 原本使用 startswith 會誤跳過子 Ticket（檔名以 new_id 開頭），
-            # 導致它們的 blockedBy / parent_id / relatedTo 等引用不被更新。
-            # 改用 extract_core_ticket_id 取得核心 ID 做精確比較，
-            # 僅跳過「確實等於 new_id 的那個檔案」，子任務與帶後綴檔案都會被掃描。
-            core_id = extract_core_ticket_id(ticket_file.stem)
-            if core_id == new_id:
-                continue
+    work_logs_root = get_project_root() / WORK_LOGS_DIR
+
+    # 以反向引用索引取得候選檔案（flat v{ver}/tickets 與三層
+    # v{major}/v{major.minor}/v{ver}/tickets 皆涵蓋），不再逐檔解析全部 Ticket；
+    # 候選檔仍逐欄比對實際值，索引僅縮小掃描範圍
+    ref_index = get_reverse_ref_index(work_logs_root)
+    for ticket_file in ref_index.files_referencing(old_id):
+        # 跳過剛遷移的 Ticket 本身（來源：0.18.0-W10-037 Bug 2）
+        # 原本使用 startswith 會誤跳過子 Ticket（檔名以 new_id 開頭），
+        # 導致它們的 blockedBy / parent_id / relatedTo 等引用不被更新。
+        # 改用 extract_core_ticket_id 取得核心 ID 做精確比較，
+        # 僅跳過「確實等於 new_id 的那個檔案」，子任務與帶後綴檔案都會被掃描。
+        core_id = extract_core_ticket_id(ticket_file.stem)
+        if core_id == new_id:
+            continue
 
-            # 載入 Ticket
-            ticket = _load_ticket_from_path(ticket_file)
-            if not ticket:
-                continue
+        # 載入 Ticket
+        ticket = _load_ticket_from_path(ticket_file)
+        if not ticket:
+            continue
 
-            # 檢查是否包含舊 ID 的引用
-            updated = False
-
-            # 更新 blockedBy
-            if "blockedBy" in ticket and ticket.get("blockedBy"):
-                if isinstance(ticket["blockedBy"], list):
-                    for i, ref in enumerate(ticket["blockedBy"]):
-                        if ref == old_id:
-                            ticket["blockedBy"][i] = new_id
-                            updated = True
-
-            # 更新 relatedTo
-            if "relatedTo" in ticket and ticket.get("relatedTo"):
-                if isinstance(ticket["relatedTo"], list):
-                    for i, ref in enumerate(ticket["relatedTo"]):
-                        if ref == old_id:
-                            ticket["relatedTo"][i] = new_id
-                            updated = True
-
-            # 更新 children（支援字串和 dict 形式）
-            if "children" in ticket and ticket.get("children"):
-                if isinstance(ticket["children"], list):
-                    for i, child in enumerate(ticket["children"]):
-                        if isinstance(child, str) and child == old_id:
-                            ticket["children"][i] = new_id
-                            updated = True
-                        elif isinstance(child, dict) and child.get("id") == old_id:
-                            child["id"] = new_id
-                            updated = True
-
-            # 更新 source_ticket
-            if "source_ticket" in ticket and ticket.get("source_ticket") == old_id:
-                ticket["source_ticket"] = new_id
-                updated = True
-
-            # 更新 parent_id
-            if "parent_id" in ticket and ticket.get("parent_id") == old_id:
-                ticket["parent_id"] = new_id
-                updated = True
-
-            # 更新 spawned_tickets
-            if "spawned_tickets" in ticket and ticket.get("spawned_tickets"):
-                if isinstance(ticket["spawned_tickets"], list):
-                    for i, ref in enumerate(ticket["spawned_tickets"]):
-                        if ref == old_id:
-                            ticket["spawned_tickets"][i] = new_id
-                            updated = True
-
-            # 儲存修改
-            if updated:
-                try:
-                    save_ticket(ticket, ticket_file)
-                    updated_count += 1
-                except (IOError, OSError) as e:
-                    print(format_warning(
-                        WarningMessages.FILE_UPDATE_FAILED,
-                        path=str(ticket_file),
-                        error=str(e)
-                    ))
+        # 檢查是否包含舊 ID 的引用
+        updated = False
+
+        # 更新 blockedBy
+        if "blockedBy" in ticket and ticket.get("blockedBy"):
+            if isinstance(ticket["blockedBy"], list):
+                for i, ref in enumerate(ticket["blockedBy"]):
+                    if ref == old_id:
+                        ticket["blockedBy"][i] = new_id
+                        updated = True
+
+        # 更新 relatedTo
+        if "relatedTo" in ticket and ticket.get("relatedTo"):
+            if isinstance(ticket["relatedTo"], list):
+                for i, ref in enumerate(ticket["relatedTo"]):
+                    if ref == old_id:
+                        ticket["relatedTo"][i] = new_id
+                        updated = True
+
+        # 更新 children（支援字串和 dict 形式）
+        if "children" in ticket and ticket.get("children"):
+            if isinstance(ticket["children"], list):
+                for i, child in enumerate(ticket["children"]):
+                    if isinstance(child, str) and child == old_id:
+                        ticket["children"][i] = new_id
+                        updated = True
+                    elif isinstance(child, dict) and child.get("id") == old_id:
+                        child["id"] = new_id
+                        updated = True
+
+        # 更新 source_ticket
+        if "source_ticket" in ticket and ticket.get("source_ticket") == old_id:
+            ticket["source_ticket"] = new_id
+            updated = True
 
+        # 更新 parent_id
+        if "parent_id" in ticket and ticket.get("parent_id") == old_id:
+            ticket["parent_id"] = new_id
+            updated = True
+
+        # 更新 spawned_tickets
+        if "spawned_tickets" in ticket and ticket.get("spawned_tickets"):
+            if isinstance(ticket["spawned_tickets"], list):
+                for i, ref in enumerate(ticket["spawned_tickets"]):
+                    if ref == old_id:
+                        ticket["spawned_tickets"][i] = new_id
+                        updated = True
+
+        # 儲存修改
+        if updated:
+            try:
+                save_ticket(ticket, ticket_file)
+                updated_count += 1
+            except (IOError, OSError) as e:
+                print(format_warning(
+                    WarningMessages.FILE_UPDATE_FAILED,
+                    path=str(ticket_file),
+                    error=str(e)
+                ))
+
+    ref_index.save()
     return updated_count
 
 
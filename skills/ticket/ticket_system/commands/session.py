@@ -0,0 +1,173 @@
+"""
+ticket batch / ticket shell 子命令
+
+在同一 process 內連續執行多個 ticket 子命令（引擎見 lib/command_session.py）：
+
+- `ticket batch [FILE]`：逐行讀取命令（省略 FILE 或 `-` 讀 stdin），每行
+  一個子命令，`#` 註解與空行略過，行首 `ticket` 可省略。預設遇到第一個
+  失敗命令即停止（同 `set -e`），`--keep-going` 改為全部執行
+- `ticket shell`：互動 REPL，失敗不中斷，`exit` / `quit` / EOF 離開
+
+範例：
+
+    ticket batch <<'EOF'
+    track claim 0.18.0-W17-001
+    track append-log 0.18.0-W17-001 --section "Solution" "..."
+    track complete 0.18.0-W17-001
+    track runqueue --top 3
+    EOF
+
+exit code：batch 回傳第一個失敗命令的 exit code（全數成功為 0），每個命令
+的 exit code 於結束時彙總至 stderr（stdout 保留給各命令自身的輸出）；
+shell 一律回傳 0。
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterable, Optional, TextIO, Tuple
+
+from ticket_system.lib.command_session import CommandSession
+
+
+# REPL 離開指令
+_SHELL_EXIT_WORDS = ("exit", "quit")
+
+_SHELL_PROMPT = "ticket> "
+
+
+def _new_session() -> CommandSession:
+    # 函式內 import：scripts.ticket 於模組層 import 本模組（註冊子命令）
+    from ticket_system.scripts.ticket import build_parser, dispatch
+
+    return CommandSession(build_parser(), dispatch)
+
+
+def _open_source(path: Optional[str]) -> Tuple[TextIO, bool]:
+    """回傳 (串流, 是否需由呼叫端關閉)"""
+    if path is None or path == "-":
+        return sys.stdin, False
+    return open(Path(path), "r", encoding="utf-8"), True
+
+
+def run_batch(session: CommandSession, lines: Iterable[str], keep_going: bool = False) -> int:
+    """逐行執行；keep_going=False 時第一個失敗命令後停止。回傳 session exit code"""
+    for line_no, line in enumerate(lines, 1):
+        result = session.run_line(line, line_no)
+        if result is not None and result.exit_code != 0 and not keep_going:
+            break
+    return session.exit_code()
+
+
+def _print_report(session: CommandSession) -> None:
+    results = session.results
+    failed = len(session.failed)
+    sys.stderr.write(
+        f"[batch] {len(results)} 個命令：{len(results) - failed} 成功、{failed} 失敗\n"
+    )
+    for result in results:
+        sys.stderr.write(f"  L{result.line_no:<4} rc={result.exit_code:<3} {result.line}\n")
+
+
+def execute_batch(args: argparse.Namespace) -> int:
+    """執行 ticket batch 命令"""
+    try:
+        stream, owned = _open_source(getattr(args, "file", None))
+    except OSError as e:
+        print(f"[ERROR] 無法讀取命令檔：{e}", file=sys.stderr)
+        return 1
+    session = _new_session()
+    try:
+        rc = run_batch(session, stream, keep_going=bool(getattr(args, "keep_going", False)))
+    finally:
+        if owned:
+            stream.close()
+    if not getattr(args, "quiet", False):
+        _print_report(session)
+    return rc
+
+
+def _enable_line_editing() -> None:
+    try:
+        import readline  # noqa: F401  # 匯入即啟用 input() 的行編輯與歷史
+    except ImportError:
+        # Windows 等無 readline 的平台：維持基本 input()
+        pass
+
+
+def execute_shell(args: argparse.Namespace) -> int:
+    """執行 ticket shell 命令"""
+    interactive = sys.stdin.isatty()
+    if interactive:
+        _enable_line_editing()
+        print("ticket shell：輸入子命令（如 track runqueue --top 3），exit / quit / Ctrl-D 離開")
+    session = _new_session()
+    line_no = 0
+    while True:
+        try:
+            line = input(_SHELL_PROMPT if interactive else "")
+        except EOFError:
+            break
+        except KeyboardInterrupt:
+            # Ctrl-C 只放棄目前輸入行
+            print()
+            continue
+        line_no += 1
+        if line.strip() in _SHELL_EXIT_WORDS:
+            break
+        try:
+            result = session.run_line(line, line_no)
+        except KeyboardInterrupt:
+            print("\n[中斷]", file=sys.stderr)
+            continue
+        if result is not None and result.exit_code != 0:
+            print(f"[rc={result.exit_code}]", file=sys.stderr)
+    if interactive:
+        print()
+    return 0
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    """註冊 batch 與 shell 子命令"""
+    batch = subparsers.add_parser(
+        "batch",
+        help="同一 process 內逐行執行多個 ticket 子命令（stdin 或檔案）",
+        description=(
+            "逐行讀取 ticket 子命令並在同一 process 內執行，共用命令樹、Ticket 快取\n"
+            "與專案根目錄解析。每行一個子命令（行首 ticket 可省略），# 註解與空行略過。\n\n"
+            "範例：\n"
+            "  ticket batch handoff.txt\n"
+            "  printf 'track claim W17-001\\ntrack runqueue --top 3\\n' | ticket batch"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    batch.add_argument(
+        "file",
+        nargs="?",
+        default=None,
+        help="命令檔路徑（省略或 - 讀 stdin）",
+    )
+    batch.add_argument(
+        "-k",
+        "--keep-going",
+        action="store_true",
+        help="命令失敗後繼續執行後續命令（預設遇第一個失敗即停止）",
+    )
+    batch.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="不輸出結束時的各命令 exit code 彙總",
+    )
+    batch.set_defaults(func=execute_batch)
+
+    shell = subparsers.add_parser(
+        "shell",
+        help="互動式 ticket REPL（同一 process 連續執行子命令）",
+    )
+    shell.set_defaults(func=execute_shell)
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
@@ -43,6 +43,8 @@ from ticket_system.lib.ticket_loader import (
     require_version,
 )
 from ticket_system.lib.ticket_validator import extract_version_from_ticket_id
+from ticket_system.lib.reverse_ref_index import REF_FIELDS
+from ticket_system.lib.ticket_query import add_where_argument
 from ticket_system.lib.ambiguous_prefix import register_ambiguous_prefix
 from ticket_system.lib.messages import (
     ArgparseFormatErrorParser,
@@ -134,6 +136,7 @@ from .track_relations import (
     execute_agent,
     execute_set_blocked_by,
     execute_set_related_to,
+    execute_referenced_by,
 )
 # 導入驗收審核模組
 from .track_audit import (
@@ -366,6 +369,7 @@ def _create_version_agnostic_handlers() -> dict:
         "stale-list": execute_stale_list,
         "parallel-check": execute_parallel_check,
         "hook-health": execute_hook_health,
+        "referenced-by": execute_referenced_by,
         "sessions": execute_sessions,
         "activity": execute_activity,
         "conflicts": execute_conflicts,
@@ -740,6 +744,7 @@ def _register_query_commands(
     p_list.add_argument("--status", nargs='+', help=TrackMessages.ARG_STATUS)
     p_list.add_argument("--format", choices=["table", "ids", "yaml"], default="table", help=TrackMessages.ARG_FORMAT)
     p_list.add_argument("--version", help=TrackMessages.ARG_VERSION)
+    add_where_argument(p_list)
     # W10-115: 預設限制 top 10 + priority 排序，--all 取得全量
     p_list.add_argument(
         "--top",
@@ -954,7 +959,7 @@ def _register_batch_commands(
 def _register_relation_commands(
     subparsers: argparse._SubParsersAction,
 ) -> None:
-    """註冊關係和狀態管理子命令：agent, phase, add-child, set-blocked-by, set-related-to"""
+    """註冊關係和狀態管理子命令：agent, phase, add-child, set-blocked-by, set-related-to, referenced-by"""
     # agent 操作
     p_agent = subparsers.add_parser("agent", help=TrackMessages.HELP_AGENT)
     p_agent.add_argument("agent_name", help=TrackMessages.ARG_AGENT_NAME)
@@ -1009,6 +1014,18 @@ def _register_relation_commands(
     p_set_related_to.add_argument("--remove", action="store_true", help="移除模式")
     p_set_related_to.add_argument("--version", help=TrackMessages.ARG_VERSION)
 
+    # referenced-by 查詢（反向引用，跨版本，不需 --version）
+    p_referenced_by = subparsers.add_parser(
+        "referenced-by",
+        help=TrackMessages.HELP_REFERENCED_BY
+    )
+    p_referenced_by.add_argument("ticket_id", help=TrackMessages.ARG_TICKET_ID)
+    p_referenced_by.add_argument(
+        "--field",
+        choices=REF_FIELDS,
+        help="只列出經由指定欄位的引用",
+    )
+
 
 def _register_acceptance_commands(
     subparsers: argparse._SubParsersAction,
@@ -1442,6 +1459,7 @@ def _register_board_commands(
         default=GROUP_BY_WAVE,
         help=TrackMessages.ARG_GROUP_BY,
     )
+    add_where_argument(p_board)
 
 
 def _register_all_subcommands(
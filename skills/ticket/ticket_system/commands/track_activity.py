@@ -8,7 +8,9 @@ L1 activity：票面進度是事件驅動更新（claim/append-log/complete）
 
 三源（取最新者，附來源標記）：
   1. ticket md 檔案 mtime
-  2. `git log --grep=<id>` 最後一筆 commit 時間
+  2. commit subject 引用該票的最後一筆 commit 時間（整批票共用一趟
+     `git log`，見 lib/commit_activity_index.py；以 HEAD 為鍵持久化，
+     HEAD 未變的重複呼叫不再執行 git log）
   3. working tree 髒檔命中該票 where.files 的歸屬（取命中檔案的磁碟 mtime）
 
 三源皆缺 → no-signal（非報錯，票剛 claim 尚無任何副作用時的正常狀態）。
@@ -31,6 +33,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from ticket_system.lib.claude_lib_loader import load_claude_lib
 from ticket_system.lib.command_tracking_messages import TrackMessages
+from ticket_system.lib.commit_activity_index import DEFAULT_SINCE, CommitActivityIndex
+from ticket_system.lib.constants import WORK_LOGS_DIR
 from ticket_system.lib.file_conflict import where_files as _lib_where_files
 from ticket_system.lib.paths import get_project_root
 from ticket_system.lib.ticket_loader import list_tickets
@@ -153,6 +157,28 @@ def _git_commit_source(ticket_id: str, cwd: Optional[str] = None) -> Optional[Tu
     return None
 
 
+def batch_commit_times(
+    ticket_ids: List[str],
+    project_root: Path,
+    *,
+    since: str = DEFAULT_SINCE,
+) -> Dict[str, datetime]:
+    """整批票的 git commit 源：一趟 git log（或 HEAD 未變時直接讀索引）。
+
+    與 `_git_commit_source` 逐票 grep 的差異僅在 since 下限：更早的 commit
+    不列入（進行中票的活動訊號不會落在數月前）。
+    """
+    index = CommitActivityIndex(
+        project_root / WORK_LOGS_DIR,
+        lambda args, cwd=None: run_git_command(args, cwd=cwd),
+        cwd=str(project_root),
+        since=since,
+    )
+    times = index.last_commit_times(ticket_ids)
+    index.save()
+    return times
+
+
 def list_dirty_files(cwd: Optional[str] = None) -> List[str]:
     """回傳 working tree 髒檔路徑清單（porcelain 格式，含 staged/unstaged/untracked）。"""
     ok, out = run_git_command(["status", "--porcelain"], cwd=cwd)
@@ -215,11 +241,20 @@ def compute_activity(
     dirty_paths: List[str],
     project_root: Path,
     cwd: Optional[str] = None,
+    commit_times: Optional[Dict[str, datetime]] = None,
 ) -> Dict[str, Any]:
-    """對單一 ticket 彙整三源，回傳最新活動時間與來源標記；三源皆缺回傳 no-signal。"""
+    """對單一 ticket 彙整三源，回傳最新活動時間與來源標記；三源皆缺回傳 no-signal。
+
+    commit_times 為 batch_commit_times 的整批結果；未提供時退回逐票 git log。
+    """
     ticket_id = ticket.get("id") or ""
     md_source = _md_mtime_source(ticket.get("_path"))
-    commit_source = _git_commit_source(ticket_id, cwd=cwd)
+    if commit_times is None:
+        commit_source = _git_commit_source(ticket_id, cwd=cwd)
+    elif ticket_id in commit_times:
+        commit_source = (commit_times[ticket_id], SOURCE_GIT_COMMIT)
+    else:
+        commit_source = None
     dirty_source = _dirty_file_source(_where_files(ticket), dirty_paths, project_root)
 
     candidates = [s for s in (md_source, commit_source, dirty_source) if s is not None]
@@ -313,10 +348,22 @@ def execute_activity(args: argparse.Namespace) -> int:
     tickets = _gather_in_progress_tickets(explicit_version)
     project_root = get_project_root()
     dirty_paths = list_dirty_files(cwd=str(project_root))
+    commit_times = (
+        batch_commit_times(
+            [t.get("id") or "" for t in tickets],
+            project_root,
+            since=getattr(args, "since", None) or DEFAULT_SINCE,
+        )
+        if tickets else {}
+    )
 
     rows = [
         compute_activity(
-            t, dirty_paths=dirty_paths, project_root=project_root, cwd=str(project_root)
+            t,
+            dirty_paths=dirty_paths,
+            project_root=project_root,
+            cwd=str(project_root),
+            commit_times=commit_times,
         )
         for t in tickets
     ]
@@ -336,7 +383,7 @@ def register_activity(
     p = subparsers.add_parser(
         "activity",
         help=(
-            "L1 activity：md mtime + git log --grep + 髒檔歸屬三源機械推導"
+            "L1 activity：md mtime + git commit 引用 + 髒檔歸屬三源機械推導"
             "每張 in_progress 票的最後活動時間（multi-PM 協調層 Phase 2）"
         ),
     )
@@ -357,6 +404,11 @@ def register_activity(
         default=FORMAT_TABLE,
         help=f"輸出格式（預設 {FORMAT_TABLE}）",
     )
+    p.add_argument(
+        "--since",
+        default=DEFAULT_SINCE,
+        help=f"git commit 源的掃描下限（git --since 語法，預設 {DEFAULT_SINCE}）",
+    )
     return p
 
 
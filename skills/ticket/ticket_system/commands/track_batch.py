@@ -37,9 +37,9 @@ from ticket_system.lib.constants import (
 )
 from ticket_system.lib.ticket_loader import (
     get_ticket_path,
-    save_ticket,
     list_tickets,
 )
+from ticket_system.lib.ticket_write_batch import save_tickets
 from ticket_system.lib.ticket_validator import (
     validate_claimable_status,
     validate_completable_status,
@@ -301,7 +301,7 @@ def _execute_batch_operation(
     Returns:
         int: 結束碼
             0: 全部或部分成功（success_count > 0）
-            1: 內部錯誤（保留給未捕獲 exception；目前未使用）
+            1: 內部錯誤（整批寫入失敗，已回滾，無任何 Ticket 變更）
             2: 業務拒絕（無有效 ticket ID、批量全部失敗）
         詳見 .claude/references/cli-exit-code-rules.md
     """
@@ -333,7 +333,9 @@ def _execute_batch_operation(
     # 實際執行模式
     print(format_msg(TrackBatchMessages.BATCH_OPERATION_HEADER, operation_name=operation_name, count=len(ticket_ids)))
 
-    success_count = 0
+    # 逐票驗證與處理只改記憶體中的 ticket；成功者暫存後整批寫入
+    # （ticket_write_batch：全部寫入或全部回滾，不留半批狀態）
+    staged = []
     for ticket_id in ticket_ids:
         # 使用 auto_print_error=False 以支援自訂 BATCH 格式
         ticket, error = load_and_validate_ticket(version, ticket_id, auto_print_error=False)
@@ -345,36 +347,50 @@ def _execute_batch_operation(
         success, message = processor(ticket, ticket_id)
 
         if success:
-            # 保存更改
             ticket_path = resolve_ticket_path(ticket, version, ticket_id)
-            save_ticket(ticket, ticket_path)
-            # registry lease 附加動作：批次路徑刻意與單票路徑（track.py 的
-            # claim_lease/release_lease 裸呼叫）不對稱——單票路徑不攔截，
-            # 降級全靠 lease.py 內部 early return + stderr；批次路徑改攔截
-            # 是因為一張票的 lease 問題不該中斷整批已成功的項目，此為批次
-            # 語意的刻意選擇，非沿用單票路徑的對稱處理。
-            try:
-                if operation == "claim":
-                    claim_lease(version, ticket_id)
-                elif operation == "complete":
-                    release_lease(version, ticket_id)
-            except Exception as lease_error:  # noqa: BLE001 - 附加動作降級
-                print(
-                    f"   [lease] {ticket_id} lease 寫入失敗，該票操作仍已完成"
-                    f"（registry 與 frontmatter 暫不同步）："
-                    f"{type(lease_error).__name__}: {lease_error}",
-                    file=sys.stderr,
-                )
-            # 完成操作時自動追加 worklog 進度行
-            if operation == "complete":
-                ticket_title = ticket.get("title", "")
-                append_worklog_progress(version, ticket_id, ticket_title)
-            # 使用 format_info 確保一致的訊息格式
-            print(f"   {TrackBatchMessages.OK_PREFIX} {message}")
-            success_count += 1
+            staged.append((ticket, ticket_id, ticket_path, message))
         else:
             print(f"   {format_error(ErrorMessages.STATUS_ERROR, status_msg=message)}")
 
+    if staged:
+        try:
+            save_tickets([(ticket, path) for ticket, _tid, path, _msg in staged])
+        except Exception as write_error:  # noqa: BLE001 - 整批已回滾，回報後結束
+            error_text = format_error(
+                TrackBatchMessages.BATCH_WRITE_FAILED_FORMAT,
+                count=len(staged),
+                error=f"{type(write_error).__name__}: {write_error}",
+            )
+            print(f"   {error_text}")
+            return 1
+
+    success_count = 0
+    for ticket, ticket_id, _ticket_path, message in staged:
+        # registry lease 附加動作：批次路徑刻意與單票路徑（track.py 的
+        # claim_lease/release_lease 裸呼叫）不對稱——單票路徑不攔截，
+        # 降級全靠 lease.py 內部 early return + stderr；批次路徑改攔截
+        # 是因為一張票的 lease 問題不該中斷整批已成功的項目，此為批次
+        # 語意的刻意選擇，非沿用單票路徑的對稱處理。
+        try:
+            if operation == "claim":
+                claim_lease(version, ticket_id)
+            elif operation == "complete":
+                release_lease(version, ticket_id)
+        except Exception as lease_error:  # noqa: BLE001 - 附加動作降級
+            print(
+                f"   [lease] {ticket_id} lease 寫入失敗，該票操作仍已完成"
+                f"（registry 與 frontmatter 暫不同步）："
+                f"{type(lease_error).__name__}: {lease_error}",
+                file=sys.stderr,
+            )
+        # 完成操作時自動追加 worklog 進度行
+        if operation == "complete":
+            ticket_title = ticket.get("title", "")
+            append_worklog_progress(version, ticket_id, ticket_title)
+        # 使用 format_info 確保一致的訊息格式
+        print(f"   {TrackBatchMessages.OK_PREFIX} {message}")
+        success_count += 1
+
     print()
     print(format_info(result_message_key, success=success_count, total=len(ticket_ids)))
 
@@ -28,6 +28,7 @@ from typing import Any, Dict, List
 
 from ticket_system.constants import PRIORITY_LEVELS
 from ticket_system.lib.ticket_loader import list_tickets
+from ticket_system.lib.ticket_query import get_ticket_table, where_from_args
 from ticket_system.lib.constants import TERMINAL_STATUSES
 from ticket_system.lib.messages import format_error
 from ticket_system.lib.command_tracking_messages import (
@@ -354,7 +355,7 @@ def execute_board(args: argparse.Namespace, version: str) -> int:
     執行 board 命令主入口（預設輸出 Wave 分組樹狀看板）
 
     Args:
-        args: 命令列參數（包含 --version, --wave, --all, --group-by 選項）
+        args: 命令列參數（包含 --version, --wave, --all, --group-by, --where 選項）
         version: 目標版本號（從 resolve_version 取得）
 
     Returns:
@@ -364,8 +365,8 @@ def execute_board(args: argparse.Namespace, version: str) -> int:
     （acceptance 3：呼叫 render_board_tree，不經任何主題相關路徑）。
     """
     try:
-        # 載入 Ticket 資料
-        tickets = list_tickets(version)
+        # 載入 Ticket 資料（套用 --where 篩選）
+        tickets = get_ticket_table(version, list_tickets).select(where_from_args(args))
 
         # 套用 Wave 過濾
         if hasattr(args, "wave") and args.wave:
@@ -13,11 +13,11 @@ ticket track dashboard 命令（W10-114 落地，W10-113 ANA Solution M1+M4'）
 - 任一階段失敗 → stderr + return 非 0，stdout 為空（D7）
 
 複用既有：
-- track_runqueue._priority_rank / _is_unblocked_pending / _filter_by_wave
+- track_runqueue._priority_rank / _is_unblocked_pending
   / _compute_readiness / _get_pending_handoff_info（0.2.1-W3-220 起同時以
   target_ticket_id 建索引，新增 [Handoff Target] 章節見 load_handoff_targets）
 - lib.staleness.compute_stale_minutes（W10-114 新增分鐘粒度純函式）
-- lib.ticket_loader.list_tickets
+- lib.ticket_loader.list_tickets（經 lib.ticket_query 欄式索引篩選 --wave / --where）
 
 不複用：
 - track_runqueue._render_list / _render_dag / _render_critical_path（格式不同）
@@ -49,7 +49,6 @@ from ticket_system.commands.track_runqueue import (
     READINESS_NO_CB,
     READINESS_READY,
     _compute_readiness,
-    _filter_by_wave,
     _get_pending_handoff_info,
     _is_unblocked_pending,
     _priority_rank,
@@ -58,6 +57,11 @@ from ticket_system.lib import lease
 from ticket_system.lib.constants import TERMINAL_STATUSES
 from ticket_system.lib.staleness import compute_stale_minutes
 from ticket_system.lib.ticket_loader import list_tickets
+from ticket_system.lib.ticket_query import (
+    add_where_argument,
+    get_ticket_table,
+    where_from_args,
+)
 from ticket_system.lib.ticket_ops import resolve_id_from_ref
 from ticket_system.lib.version import check_version_all_completed
 from ticket_system.lib.command_tracking_messages import (
@@ -444,7 +448,7 @@ def dashboard_main(args: argparse.Namespace, version: Optional[str]) -> int:
     _auto_gc_stale_handoffs()
 
     try:
-        all_tickets = list_tickets(version) or []
+        table = get_ticket_table(version, list_tickets)
     except Exception as exc:
         # 內部錯誤：ticket index 載入拋出 exception
         sys.stderr.write(f"Failed to load ticket index: {exc}\n")
@@ -460,7 +464,9 @@ def dashboard_main(args: argparse.Namespace, version: Optional[str]) -> int:
     no_stale = bool(getattr(args, "no_stale", False))
     fmt = getattr(args, "format", FORMAT_TEXT) or FORMAT_TEXT
 
-    scoped = _filter_by_wave(all_tickets, wave)
+    # in_progress / ready / stale / handoff 四組共用同一張欄式索引的篩選結果
+    all_tickets = table.rows
+    scoped = table.select(where_from_args(args), wave=wave)
     handoff_info = _get_pending_handoff_info()
 
     # multi-PM 協調層：一次性載入 registry 快照供 In Progress 逐票判定 lease
@@ -575,6 +581,7 @@ def register_dashboard(
         help="輸出格式（預設 text）",
     )
     p.add_argument("--version", help="指定版本號")
+    add_where_argument(p)
     return p
 
 
@@ -10,6 +10,9 @@ ticket track hook-health 命令（W13-018 落地，源自 W13-008 IMP-3）
 - 與 W13-017 hook-health-monitor.py 共用 baseline 邏輯（per_day sum / window_days）
 - 預設 --since 7 天；--format table（PM 預設視圖）/ json（自動化消費）
 - --dry-run 為契約點：本命令本即不寫入 ticket / 檔案；旗標明示「禁止副作用」
+- --profile：改輸出剖析模式（lib/hook_profiler.py）收集的延遲分佈
+  （每支 hook / 每條 event+matcher 鏈的 p50/p95/p99）與預算判定；
+  --profile on|off 切換剖析模式旗標檔（本命令唯一的寫入動作，--dry-run 下拒絕）
 
 複用既有：
 - .claude/lib/hook_health.py（scan_logs / classify_hook / evaluate / Verdict）
@@ -61,6 +64,15 @@ def scan_logs(since: datetime, logs_root: Optional[Path] = None) -> Dict[str, Di
     return _load_hook_health().scan_logs(since=since, logs_root=logs_root)
 
 
+def scan_profiles(since: datetime, logs_root: Optional[Path] = None) -> Dict[str, Dict]:
+    """Thin wrapper：對外暴露 scan_profiles 名稱以便測試 patch。"""
+    return _load_hook_health().scan_profiles(since=since, logs_root=logs_root)
+
+
+def set_profiling(enabled: bool, logs_root: Optional[Path] = None) -> None:
+    _load_hook_health().set_profiling(enabled, logs_root=logs_root)
+
+
 def classify_hook(name: str, settings: Dict) -> str:
     return _load_hook_health().classify_hook(name, settings)
 
@@ -78,6 +90,10 @@ FORMAT_JSON = "json"
 
 DEFAULT_SINCE_DAYS = 7
 
+PROFILE_REPORT = "report"
+PROFILE_ON = "on"
+PROFILE_OFF = "off"
+
 
 # ---------------------------------------------------------------------------
 # 評估邏輯（與 hook-health-monitor._compute_baseline 對齊）
@@ -215,6 +231,69 @@ def _render_json(
     return json.dumps(payload, ensure_ascii=False, indent=2)
 
 
+def _render_profile_table(
+    profile: Dict[str, Dict],
+    *,
+    since_days: int,
+) -> str:
+    lines: List[str] = [f"=== Hook Latency Profile (since {since_days}d) ===", ""]
+    hooks = profile.get("hooks") or {}
+    chains = profile.get("chains") or {}
+    if not hooks:
+        lines.append(
+            "(無剖析資料；以 ticket track hook-health --profile on 或 "
+            "CLAUDE_HOOK_PROFILE=1 開啟剖析模式後再查詢)"
+        )
+        return "\n".join(lines)
+
+    for title, entries in (("hook", hooks), ("chain", chains)):
+        width = max(len(title), max(len(name) for name in entries))
+        lines.append("  {name:<{w}}  {n:>6}  {p50:>8}  {p95:>8}  {p99:>8}  {budget:>8}".format(
+            name=title, n="runs", p50="p50", p95="p95", p99="p99", budget="budget", w=width,
+        ))
+        lines.append("  " + "-" * (width + 48))
+        for name, stats in entries.items():
+            row = "  {name:<{w}}  {n:>6}  {p50:>8.1f}  {p95:>8.1f}  {p99:>8.1f}  {budget:>8.0f}".format(
+                name=name, n=stats["count"], p50=stats["p50"], p95=stats["p95"],
+                p99=stats["p99"], budget=stats["budget_ms"], w=width,
+            )
+            if stats["over_budget"]:
+                row += "  OVER"
+            lines.append(row)
+            if title == "hook":
+                lines.append("      import p50 {:.1f}ms / main p50 {:.1f}ms / subprocesses {:.1f}".format(
+                    stats["import_ms_p50"], stats["main_ms_p50"], stats["subprocesses_mean"],
+                ))
+        lines.append("")
+
+    over = [name for entries in (hooks, chains) for name, s in entries.items() if s["over_budget"]]
+    if over:
+        lines.append(f"  {len(over)} 項超出預算（.claude/config/hook-budget.yaml）：" + ", ".join(over))
+    else:
+        lines.append("  all hooks within budget")
+    return "\n".join(lines)
+
+
+def _execute_profile(mode: str, *, since_days: int, fmt: str, dry_run: bool) -> int:
+    if mode in (PROFILE_ON, PROFILE_OFF):
+        if dry_run:
+            sys.stderr.write("--profile on/off writes the profiling flag; refused under --dry-run\n")
+            return 2
+        set_profiling(mode == PROFILE_ON)
+        print(f"hook profiling {mode}")
+        return 0
+
+    profile = scan_profiles(since=datetime.now() - timedelta(days=since_days))
+    if fmt == FORMAT_JSON:
+        payload = dict(profile, since_days=since_days, over_budget_count=sum(
+            1 for entries in profile.values() for s in entries.values() if s["over_budget"]
+        ))
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+    else:
+        print(_render_profile_table(profile, since_days=since_days))
+    return 0
+
+
 # ---------------------------------------------------------------------------
 # 主入口
 # ---------------------------------------------------------------------------
@@ -223,8 +302,8 @@ def execute_hook_health(args: argparse.Namespace) -> int:
     """執行 track hook-health 命令（version-agnostic）。
 
     Returns:
-        0: 正常輸出（含 flagged）
-        2: 參數錯誤（--since 非正整數）
+        0: 正常輸出（含 flagged / 超出預算）
+        2: 參數錯誤（--since 非正整數；--dry-run 下 --profile on/off）
     """
     since_days = getattr(args, "since", DEFAULT_SINCE_DAYS) or DEFAULT_SINCE_DAYS
     fmt = getattr(args, "format", FORMAT_TABLE) or FORMAT_TABLE
@@ -234,6 +313,10 @@ def execute_hook_health(args: argparse.Namespace) -> int:
         sys.stderr.write("--since must be positive integer\n")
         return 2
 
+    profile_mode = getattr(args, "profile", None)
+    if profile_mode:
+        return _execute_profile(profile_mode, since_days=since_days, fmt=fmt, dry_run=dry_run)
+
     since_dt = datetime.now() - timedelta(days=since_days)
     stats_by_hook = scan_logs(since=since_dt)
     results = _evaluate_all(stats_by_hook, window_days=since_days)
@@ -278,6 +361,17 @@ def register_hook_health(
         action="store_true",
         help="明示禁止任何副作用（本命令本即無副作用，此旗標為契約點）",
     )
+    p.add_argument(
+        "--profile",
+        nargs="?",
+        const=PROFILE_REPORT,
+        choices=[PROFILE_REPORT, PROFILE_ON, PROFILE_OFF],
+        default=None,
+        help=(
+            "輸出剖析模式的 p50/p95/p99 延遲與預算判定；"
+            "on / off 切換剖析模式（亦可用 CLAUDE_HOOK_PROFILE=1）"
+        ),
+    )
     return p
 
 
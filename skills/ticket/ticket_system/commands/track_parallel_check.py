@@ -24,7 +24,7 @@ import sys
 from pathlib import PurePosixPath
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from ticket_system.lib.file_conflict import group_by_conflict, write_files
+from ticket_system.lib.file_conflict import PathPrefixTrie, group_by_conflict, write_files
 from ticket_system.lib.id_parser import extract_id_components
 from ticket_system.lib.ticket_loader import list_tickets
 
@@ -96,6 +96,35 @@ def _tickets_conflict(files_a: Sequence[str], files_b: Sequence[str]) -> Optiona
     return None
 
 
+def _first_conflicts(
+    ids: Sequence[str], files_map: Dict[str, List[str]]
+) -> Dict[Tuple[int, int], Tuple[Tuple[int, str], Tuple[int, str]]]:
+    """以路徑前綴 trie 一次找出所有衝突 ticket 對與其第一個衝突路徑對。
+
+    判準同 ``_path_conflict``：互為前綴（強衝突）或前 ``_SHARED_ANCESTOR_DEPTH``
+    段相同（弱衝突，trie 的 shared_depth 模式）。每對 ticket 保留
+    (files_a 位置, files_b 位置) 最小的路徑對，與 ``_tickets_conflict`` 的
+    逐對掃描回傳相同描述，但不再對 ticket 數平方成長。
+
+    Returns:
+        {(i, j): ((位置, 原始路徑), (位置, 原始路徑))}，i < j 為 ids 索引
+    """
+    trie = PathPrefixTrie()
+    for index, tid in enumerate(ids):
+        for position, raw in enumerate(files_map[tid]):
+            trie.add(index, _normalize_path(raw).parts, (position, raw))
+
+    first: Dict[Tuple[int, int], Tuple[Tuple[int, str], Tuple[int, str]]] = {}
+    for (i, path_i), (j, path_j) in trie.overlapping_pairs(shared_depth=_SHARED_ANCESTOR_DEPTH):
+        if i > j:
+            (i, path_i), (j, path_j) = (j, path_j), (i, path_i)
+        candidate = (path_i, path_j)
+        kept = first.get((i, j))
+        if kept is None or (path_i[0], path_j[0]) < (kept[0][0], kept[1][0]):
+            first[(i, j)] = candidate
+    return first
+
+
 # ---------------------------------------------------------------------------
 # 主分析邏輯
 #
@@ -168,16 +197,13 @@ def analyze_parallel(
     pending_by_id = {t["id"]: t for t in pending}
     files_map = {t["id"]: _extract_files(t) for t in pending}
 
-    reasons: Dict[Tuple[str, str], str] = {}
     ids = list(pending_by_id.keys())
+    reasons: Dict[Tuple[str, str], str] = {}
     conflict_pairs: List[Tuple[str, str]] = []
-    for i in range(len(ids)):
-        for j in range(i + 1, len(ids)):
-            a, b = ids[i], ids[j]
-            reason = _tickets_conflict(files_map[a], files_map[b])
-            if reason:
-                conflict_pairs.append((a, b))
-                reasons[(a, b)] = reason
+    for (i, j), ((_, fa), (_, fb)) in sorted(_first_conflicts(ids, files_map).items()):
+        a, b = ids[i], ids[j]
+        conflict_pairs.append((a, b))
+        reasons[(a, b)] = f"{fa} <-> {fb}"
 
     parallel_ids, conflict_groups = group_by_conflict(ids, conflict_pairs)
     # group_by_conflict 保留 isolated 節點的輸入序（同 file_conflict 的
@@ -92,6 +92,7 @@ from ticket_system.lib.ticket_ops import (
     load_and_validate_ticket,
 )
 from ticket_system.lib.version import check_version_all_completed
+from ticket_system.lib.ticket_query import get_ticket_table, where_from_args
 
 # 狀態值映射
 STATUS_MAP = {
@@ -713,6 +714,7 @@ def _execute_list_all_versions(args: argparse.Namespace) -> int:
 
     status_filters = _build_status_filters(args)
     wave_value = getattr(args, "wave", None)
+    where = where_from_args(args)
     output_format = getattr(args, "format", "table")
     found_any = False
 
@@ -727,15 +729,11 @@ def _execute_list_all_versions(args: argparse.Namespace) -> int:
     full_filtered_by_version = {}  # ver_clean -> 篩選後全量清單（截斷前），供 total_stats 使用
     for ver in sorted(active_versions):
         ver_clean = ver.lstrip("v")
-        all_tickets = list_tickets(ver_clean)
-        if not all_tickets:
+        table = get_ticket_table(ver_clean, list_tickets)
+        if not len(table):
             continue
 
-        filtered = all_tickets
-        if status_filters:
-            filtered = [t for t in filtered if t.get("status") in status_filters]
-        if wave_value is not None:
-            filtered = [t for t in filtered if t.get("wave") == wave_value]
+        filtered = table.select(where, status=status_filters, wave=wave_value)
 
         full_filtered_by_version[ver_clean] = filtered
         for t in filtered:
@@ -770,19 +768,17 @@ def _execute_list_cross_version(
     candidates = [v.lstrip("v") for v in active_versions] if active_versions else [default_version]
 
     status_filters = _build_status_filters(args)
+    where = where_from_args(args)
 
     # 聚合所有版本的結果（不止第一個匹配版本）
     all_filtered = []
     matched_versions = []
     for ver in candidates:
-        all_tickets = list_tickets(ver)
-        if not all_tickets:
+        table = get_ticket_table(ver, list_tickets)
+        if not len(table):
             continue
 
-        filtered = all_tickets
-        if status_filters:
-            filtered = [t for t in filtered if t.get("status") in status_filters]
-        filtered = [t for t in filtered if t.get("wave") == wave_value]
+        filtered = table.select(where, status=status_filters, wave=wave_value)
 
         if filtered:
             all_filtered.extend(filtered)
@@ -813,22 +809,19 @@ def _execute_list_single_version(
     args: argparse.Namespace, version: str, wave_value: Optional[int]
 ) -> int:
     """單一版本列表（原始邏輯，用於明確指定 --version 時）"""
-    all_tickets = list_tickets(version)
-    if not all_tickets:
+    table = get_ticket_table(version, list_tickets)
+    if not len(table):
         print(format_msg(TrackQueryMessages.LIST_NO_TICKETS_TITLE, version=version))
         print(TrackQueryMessages.NO_TICKETS_MESSAGE)
         _print_cross_version_warning(version)
         return 0
 
-    # 應用狀態篩選（支援 --status 和 --pending 等 flag）
+    # 應用狀態（--status 和 --pending 等 flag）、Wave 與 --where 篩選
+    # （lib.ticket_query 欄式索引，各條件 AND）
     status_filters = _build_status_filters(args)
-    filtered_tickets = all_tickets
-    if status_filters:
-        filtered_tickets = [t for t in filtered_tickets if t.get("status") in status_filters]
-
-    # 應用 Wave 篩選（如果指定）
-    if wave_value is not None:
-        filtered_tickets = [t for t in filtered_tickets if t.get("wave") == wave_value]
+    filtered_tickets = table.select(
+        where_from_args(args), status=status_filters, wave=wave_value
+    )
 
     # W10-115: 排序 + 限制（執行順序：篩選 → 排序 → 限制）
     effective_top, top_warning = _resolve_top_conflict(args)
@@ -36,7 +36,10 @@ from ticket_system.lib.constants import (
     STATUS_SUPERSEDED,
 )
 from ticket_system.lib.file_lock import file_lock
+from ticket_system.lib.constants import WORK_LOGS_DIR
+from ticket_system.lib.reverse_ref_index import get_reverse_ref_index
 from ticket_system.lib.ticket_loader import (
+    get_project_root,
     get_ticket_path,
     list_tickets,
     load_ticket,
@@ -534,3 +537,38 @@ def execute_agent(args: argparse.Namespace, version: str) -> int:
         print()
 
     return 0
+
+
+def execute_referenced_by(args: argparse.Namespace) -> int:
+    """
+    查詢引用指定 Ticket 的所有 Ticket（blockedBy / relatedTo / children /
+    source_ticket / parent_id / spawned_tickets 的反向邊）
+
+    跨全部版本查詢，不需版本資訊；由反向引用索引回答，不逐檔解析 Ticket。
+
+    命令格式：ticket track referenced-by <ticket-id> [--field FIELD]
+    """
+    if not validate_ticket_id(args.ticket_id):
+        print(format_error(ErrorMessages.INVALID_TICKET_ID_FORMAT, ticket_id=args.ticket_id))
+        return 1
+
+    ref_index = get_reverse_ref_index(get_project_root() / WORK_LOGS_DIR)
+    references = [
+        (source_id, field)
+        for source_id, field, _path in ref_index.references_to(args.ticket_id)
+        if not args.field or field == args.field
+    ]
+    ref_index.save()
+
+    if not references:
+        print(TrackRelationsMessages.REFERENCED_BY_EMPTY.format(ticket_id=args.ticket_id))
+        return 0
+
+    print(TrackRelationsMessages.REFERENCED_BY_HEADER.format(
+        ticket_id=args.ticket_id, count=len(references),
+    ))
+    for source_id, field in references:
+        print(TrackRelationsMessages.REFERENCED_BY_ITEM_FORMAT.format(
+            source_id=source_id or "?", field=field,
+        ))
+    return 0
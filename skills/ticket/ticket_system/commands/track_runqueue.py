@@ -43,6 +43,11 @@ from ticket_system.lib.handoff_utils import (
     is_task_chain_direction,
 )
 from ticket_system.lib.ticket_loader import list_tickets, load_ticket
+from ticket_system.lib.ticket_query import (
+    add_where_argument,
+    get_ticket_table,
+    where_from_args,
+)
 from ticket_system.lib.paths import get_project_root
 from ticket_system.lib.section_locator import find_section
 from ticket_system.lib.staleness import is_stale_in_progress
@@ -668,9 +673,10 @@ def render_runqueue(args: argparse.Namespace, version: str) -> str:
     topic = getattr(args, "topic", None)
     groups = bool(getattr(args, "groups", False))
 
-    all_tickets = list_tickets(version) or []
+    table = get_ticket_table(version, list_tickets)
     assignments = topic_assignments.list_assignments()
-    wave_scoped = _filter_by_wave(all_tickets, wave)
+    # --wave / --where 同屬「wave 階段」篩選（欄式索引），--topic 另行套用
+    wave_scoped = table.select(where_from_args(args), wave=wave)
     topic_scoped = _filter_by_topic(wave_scoped, topic, assignments)
     scoped = _apply_context_resume(topic_scoped, context)
     empty_reason = _empty_reason(wave, topic, len(wave_scoped), len(topic_scoped))
@@ -777,6 +783,7 @@ def register_runqueue(
         help="目前僅支援 pending（預設）",
     )
     p.add_argument("--version", help="指定版本號")
+    add_where_argument(p)
     return p
 
 
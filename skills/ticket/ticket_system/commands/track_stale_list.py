@@ -35,6 +35,12 @@ from ticket_system.lib.staleness import (
     is_stale_in_progress,
 )
 from ticket_system.lib.ticket_loader import list_tickets
+from ticket_system.lib.ticket_query import (
+    WhereExpr,
+    add_where_argument,
+    get_ticket_table,
+    where_from_args,
+)
 from ticket_system.lib.version import get_active_versions
 
 
@@ -140,15 +146,16 @@ def _collect_stale_in_progress(
 
 def _gather_tickets(
     explicit_version: Optional[str],
+    where: Optional[WhereExpr] = None,
 ) -> List[Dict]:
-    """依 --version / 自動 active 版本收集 ticket。"""
+    """依 --version / 自動 active 版本收集 ticket（--where 經欄式索引篩選）。"""
     if explicit_version:
         versions = [explicit_version]
     else:
         versions = get_active_versions() or []
     aggregated: List[Dict] = []
     for version in versions:
-        aggregated.extend(list_tickets(version) or [])
+        aggregated.extend(get_ticket_table(version, list_tickets).select(where))
     return aggregated
 
 
@@ -232,7 +239,7 @@ def execute_stale_list(args: argparse.Namespace) -> int:
     today = today_override or date.today()
     now_override = getattr(args, "_now", None)  # 測試用 hook（in_progress 判定）
 
-    tickets = _gather_tickets(explicit_version)
+    tickets = _gather_tickets(explicit_version, where_from_args(args))
     rows = _collect_stale(
         tickets, threshold=threshold, wave=wave, today=today
     )
@@ -295,6 +302,7 @@ def register_stale_list(
         default="table",
         help="輸出格式（預設 table）",
     )
+    add_where_argument(p)
     return p
 
 
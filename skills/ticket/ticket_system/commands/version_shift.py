@@ -22,8 +22,10 @@ from ticket_system.lib.ticket_loader import (
     load_ticket,
     save_ticket,
 )
+from ticket_system.lib.ticket_write_batch import save_tickets
 from ticket_system.lib.constants import WORK_LOGS_DIR, TICKETS_DIR
 from ticket_system.lib.parser import parse_frontmatter, YAMLParseError
+from ticket_system.lib.reverse_ref_index import get_reverse_ref_index
 from ticket_system.lib.messages import (
     ErrorMessages,
     InfoMessages,
@@ -168,7 +170,8 @@ def _shift_version_in_references(ticket: Dict[str, Any], from_version: str, to_v
 def _shift_single_ticket(
     ticket_path: Path,
     from_version: str,
-    to_version: str
+    to_version: str,
+    save: bool = True,
 ) -> Tuple[bool, Optional[Dict[str, Any]]]:
     """
     更新單一 Ticket 的所有版本欄位和內部引用。
@@ -180,6 +183,8 @@ def _shift_single_ticket(
         ticket_path: Ticket 檔案路徑
         from_version: 來源版本號
         to_version: 目標版本號
+        save: 是否立即寫回；False 時只回傳更新後的 Ticket，
+              由呼叫端整批寫入（_shift_ticket_files）
 
     Returns:
         (成功, 更新後的 Ticket 字典)
@@ -222,7 +227,8 @@ def _shift_single_ticket(
         ticket = _shift_version_in_references(ticket, from_version, to_version)
 
         # 保存更新（save_ticket 接受 Path）
-        save_ticket(ticket, ticket_path)
+        if save:
+            save_ticket(ticket, ticket_path)
         return (True, ticket)
 
     except Exception as e:
@@ -250,18 +256,28 @@ def _shift_ticket_files(
     if not tickets_dir.exists():
         return (0, [])
 
-    update_count = 0
+    staged = []
     skipped_files = []
 
-    # 遍歷所有 .md 檔案
+    # 遍歷所有 .md 檔案，更新後暫存，最後整批寫入（全部寫入或全部回滾）
     for ticket_file in sorted(tickets_dir.glob("*.md")):
-        success, _ = _shift_single_ticket(ticket_file, from_version, to_version)
+        success, ticket = _shift_single_ticket(
+            ticket_file, from_version, to_version, save=False
+        )
         if success:
-            update_count += 1
+            staged.append((ticket, ticket_file))
         else:
             skipped_files.append(ticket_file.name)
 
-    return (update_count, skipped_files)
+    if staged:
+        try:
+            save_tickets(staged)
+        except Exception:
+            # 整批已回滾：暫存的票皆維持原內容，視同跳過
+            skipped_files.extend(path.name for _ticket, path in staged)
+            return (0, sorted(skipped_files))
+
+    return (len(staged), skipped_files)
 
 
 def _find_auxiliary_files(from_version: str, project_root: Path) -> List[Path]:
@@ -425,23 +441,22 @@ def _update_cross_version_refs(
     if not work_logs_root.exists():
         return 0
 
-    # 遍歷所有版本目錄
-    for version_dir in sorted(work_logs_root.glob("v*")):
-        version_name = version_dir.name
-        if version_name in (f"v{from_version}", f"v{to_version}"):
-            continue  # 跳過已處理的版本
-
-        tickets_dir = version_dir / "tickets"
-        if not tickets_dir.exists():
+    # 以反向引用索引取得引用 from_version 任一 Ticket 的候選檔案，
+    # 候選檔仍由 _process_ticket_for_cross_refs 比對實際欄位值
+    skipped_dirs = (f"v{from_version}", f"v{to_version}")
+    ref_index = get_reverse_ref_index(work_logs_root)
+    for ticket_file in ref_index.files_referencing_prefix(old_prefix):
+        # 僅處理 flat 版本目錄（v{ver}/tickets/*.md），跳過已處理的版本
+        relative_parts = ticket_file.relative_to(work_logs_root).parts
+        if len(relative_parts) != 3 or relative_parts[0] in skipped_dirs:
             continue
 
-        # 遍歷該版本的所有 Ticket
-        for ticket_file in sorted(tickets_dir.glob("*.md")):
-            if _process_ticket_for_cross_refs(
-                ticket_file, from_version, to_version, old_prefix
-            ):
-                updated_count += 1
+        if _process_ticket_for_cross_refs(
+            ticket_file, from_version, to_version, old_prefix
+        ):
+            updated_count += 1
 
+    ref_index.save()
     return updated_count
 
 
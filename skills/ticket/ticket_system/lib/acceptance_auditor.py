@@ -6,6 +6,10 @@ Acceptance Auditor 驗收檢查模組
 2. 子任務完成狀態檢查
 3. 執行日誌完整性檢查
 4. 驗收條件一致性檢查
+
+子任務 / spawned / 後續任務檢查經 TicketGraph 走訪相關 Ticket：run_audit
+建立一份關係圖供各步驟共用，同一張票在整次驗收中只載入一次，共用子樹的
+「全部 terminal」判定也只計算一次。
 """
 # 防止直接執行此模組
 import re
@@ -13,6 +17,7 @@ from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from .ticket_graph import TicketGraph
 from .ticket_loader import load_ticket, resolve_version, get_project_root, get_tickets_dir
 from .parser import parse_frontmatter
 from .checkbox_utils import strip_checkbox_prefix
@@ -154,24 +159,49 @@ def validate_structure(ticket: Dict[str, Any]) -> Tuple[bool, List[str]]:
     return passed, issues
 
 
+def _audit_graph(version: str, graph: Optional[TicketGraph]) -> TicketGraph:
+    """未傳入 graph 時建立本次檢查專用的記憶化檢視（經本模組 load_ticket 載入）"""
+    if graph is not None:
+        return graph
+    return TicketGraph(version, loader=load_ticket, lister=_list_version_tickets)
+
+
+def _list_version_tickets(version: str) -> List[Dict[str, Any]]:
+    try:
+        from .ticket_loader import list_tickets
+    except ImportError:
+        return []
+    return list_tickets(version)
+
+
 # ============================================================
 # Step 2: 子任務完成狀態檢查
 # ============================================================
 
-def _check_children_recursive(children_ids: List[str], version: str, visited: Optional[set] = None) -> Tuple[bool, List[str]]:
+def _check_children_recursive(
+    children_ids: List[str],
+    version: str,
+    visited: Optional[set] = None,
+    graph: Optional[TicketGraph] = None,
+) -> Tuple[bool, List[str]]:
     """
     遞迴檢查子任務是否全部完成
 
+    子樹已全部 terminal 的子任務（graph.subtree_terminal，記憶化）直接略過，
+    不再逐層走訪。
+
     Args:
         children_ids: 子任務 ID 列表
         version: 版本號
         visited: 已訪問的 ID 集合（防止循環參照）
+        graph: 共用的 Ticket 關係圖（可選）
 
     Returns:
         (all_completed: bool, incomplete_ids: list[str])
     """
     if visited is None:
         visited = set()
+    graph = _audit_graph(version, graph)
 
     incomplete = []
 
@@ -182,19 +212,25 @@ def _check_children_recursive(children_ids: List[str], version: str, visited: Op
         visited.add(child_id)
 
         # 載入子任務
-        child_ticket = load_ticket(version, child_id)
+        child_ticket = graph.get(child_id)
         if not child_ticket:
             incomplete.append(f"找不到檔案：{child_id}")
             continue
 
+        # 整棵子樹皆 terminal：無需回報，也不必遞迴
+        if graph.subtree_terminal(child_id):
+            continue
+
         # 檢查子任務狀態
         if child_ticket.get("status") not in TERMINAL_STATUSES:
             incomplete.append(child_id)
 
         # 遞迴檢查孫任務
-        grandchildren = child_ticket.get("children", [])
+        grandchildren = graph.children(child_id)
         if grandchildren:
-            _, grandchild_incomplete = _check_children_recursive(grandchildren, version, visited)
+            _, grandchild_incomplete = _check_children_recursive(
+                grandchildren, version, visited, graph
+            )
             incomplete.extend(grandchild_incomplete)
 
     all_completed = len(incomplete) == 0
@@ -205,6 +241,7 @@ def _check_spawned_recursive(
     spawned_ids: List[str],
     version: str,
     visited: Optional[set] = None,
+    graph: Optional[TicketGraph] = None,
 ) -> Tuple[bool, List[str]]:
     """
     檢查 spawned_tickets 是否全部完成（shallow 一層 + 循環引用防護）
@@ -223,6 +260,7 @@ def _check_spawned_recursive(
         spawned_ids: spawned ticket ID 列表
         version: 版本號
         visited: 已訪問的 ID 集合（防止循環參照 / 重複計數）
+        graph: 共用的 Ticket 關係圖（可選）
 
     Returns:
         (all_completed: bool, incomplete_ids: list[str])
@@ -230,6 +268,7 @@ def _check_spawned_recursive(
     """
     if visited is None:
         visited = set()
+    graph = _audit_graph(version, graph)
 
     incomplete: List[str] = []
 
@@ -240,7 +279,7 @@ def _check_spawned_recursive(
         visited.add(spawned_id)
 
         # 載入 spawned ticket
-        spawned_ticket = load_ticket(version, spawned_id)
+        spawned_ticket = graph.get(spawned_id)
         if not spawned_ticket:
             incomplete.append(f"{spawned_id}: not_found")
             continue
@@ -255,7 +294,7 @@ def _check_spawned_recursive(
 
 
 def validate_spawned_tickets_completed(
-    ticket: Dict[str, Any], version: str
+    ticket: Dict[str, Any], version: str, graph: Optional[TicketGraph] = None
 ) -> Tuple[bool, List[str], bool]:
     """
     檢查 spawned_tickets 全部完成（W15-003）
@@ -278,7 +317,7 @@ def validate_spawned_tickets_completed(
     if not spawned:
         return True, [], True
 
-    all_completed, incomplete = _check_spawned_recursive(spawned, version)
+    all_completed, incomplete = _check_spawned_recursive(spawned, version, graph=graph)
 
     if not all_completed:
         # 統計直接 spawned 完成度（不含遞迴衍生層）
@@ -298,7 +337,9 @@ def validate_spawned_tickets_completed(
     return True, [], False
 
 
-def validate_children_completed(ticket: Dict[str, Any], version: str) -> Tuple[bool, List[str], bool]:
+def validate_children_completed(
+    ticket: Dict[str, Any], version: str, graph: Optional[TicketGraph] = None
+) -> Tuple[bool, List[str], bool]:
     """
     檢查子任務全部完成
 
@@ -312,7 +353,7 @@ def validate_children_completed(ticket: Dict[str, Any], version: str) -> Tuple[b
         return True, [], True
 
     # 檢查子任務
-    all_completed, incomplete = _check_children_recursive(children, version)
+    all_completed, incomplete = _check_children_recursive(children, version, graph=graph)
 
     if not all_completed:
         issues = [f"未完成的子任務：{', '.join(incomplete)}"]
@@ -675,41 +716,33 @@ def _extract_root_ticket_id(ticket_id: str) -> str:
     return ".".join(parts[:3])
 
 
-def _get_all_siblings_in_chain(root_id: str, version: str) -> List[Dict[str, Any]]:
+def _get_all_siblings_in_chain(
+    root_id: str, version: str, graph: Optional[TicketGraph] = None
+) -> List[Dict[str, Any]]:
     """
     取得同一任務鏈中所有的兄弟 Ticket
 
     Args:
         root_id: 任務鏈根 ID（如 "0.31.0-W4-052"）
         version: 版本號
+        graph: 共用的 Ticket 關係圖（可選；全版本列表只載入一次）
 
     Returns:
-        同任務鏈的所有 Ticket 列表
+        同任務鏈的所有 Ticket 列表（ID 以 root_id 開頭）
     """
-    try:
-        from .ticket_loader import list_tickets
-    except ImportError:
-        return []
+    return _audit_graph(version, graph).chain_members(root_id)
 
-    # 取得所有 Ticket
-    all_tickets = list_tickets(version)
 
-    # 過濾出同任務鏈的 Ticket（ID 以 root_id 開頭）
-    siblings = [
-        t for t in all_tickets
-        if isinstance(t.get("id"), str) and t.get("id").startswith(root_id)
-    ]
-
-    return siblings
-
-
-def _has_impl_or_adj_child(ticket: Dict[str, Any], version: str) -> bool:
+def _has_impl_or_adj_child(
+    ticket: Dict[str, Any], version: str, graph: Optional[TicketGraph] = None
+) -> bool:
     """
     檢查 children 中是否包含 IMP 或 ADJ 類型的子任務
 
     Args:
         ticket: Ticket 資料
         version: 版本號
+        graph: 共用的 Ticket 關係圖（可選）
 
     Returns:
         True 若有 IMP/ADJ 子任務，False 否則
@@ -718,8 +751,9 @@ def _has_impl_or_adj_child(ticket: Dict[str, Any], version: str) -> bool:
     if not children_ids:
         return False
 
+    graph = _audit_graph(version, graph)
     for child_id in children_ids:
-        child_ticket = load_ticket(version, child_id)
+        child_ticket = graph.get(child_id)
         if child_ticket and child_ticket.get("type") in ["IMP", "ADJ"]:
             return True
 
@@ -740,7 +774,9 @@ def _has_followup_in_spawned(ticket: Dict[str, Any]) -> bool:
     return len(spawned) > 0
 
 
-def _has_followup_in_chain(ticket_id: str, version: str) -> bool:
+def _has_followup_in_chain(
+    ticket_id: str, version: str, graph: Optional[TicketGraph] = None
+) -> bool:
     """
     檢查同任務鏈中是否有序號更大的 Ticket
 
@@ -750,12 +786,13 @@ def _has_followup_in_chain(ticket_id: str, version: str) -> bool:
     Args:
         ticket_id: Ticket ID
         version: 版本號
+        graph: 共用的 Ticket 關係圖（可選）
 
     Returns:
         True 若有後續 Ticket，False 否則
     """
     root_id = _extract_root_ticket_id(ticket_id)
-    siblings = _get_all_siblings_in_chain(root_id, version)
+    siblings = _get_all_siblings_in_chain(root_id, version, graph)
 
     # 提取當前 Ticket 的序號深度和值
     # 例如："0.31.0-W4-052.1.2" → [52, 1, 2]
@@ -827,7 +864,12 @@ def _has_no_followup_declaration(body: str) -> bool:
     return False
 
 
-def validate_followup_tasks(ticket: Dict[str, Any], version: str, body: str) -> Tuple[bool, List[str], bool]:
+def validate_followup_tasks(
+    ticket: Dict[str, Any],
+    version: str,
+    body: str,
+    graph: Optional[TicketGraph] = None,
+) -> Tuple[bool, List[str], bool]:
     """
     檢查是否有後續任務（設計/分析/調查/研究類任務應有後續行動 Ticket）
 
@@ -841,6 +883,7 @@ def validate_followup_tasks(ticket: Dict[str, Any], version: str, body: str) ->
         ticket: Ticket 資料
         version: 版本號
         body: Ticket body 文字
+        graph: 共用的 Ticket 關係圖（可選）
 
     Returns:
         (passed: bool, warnings: list[str], skipped: bool)
@@ -867,7 +910,7 @@ def validate_followup_tasks(ticket: Dict[str, Any], version: str, body: str) ->
 
     # 現在開始檢查是否有後續任務
     # 優先級 1：children 中有 IMP/ADJ 類型
-    if _has_impl_or_adj_child(ticket, version):
+    if _has_impl_or_adj_child(ticket, version, graph):
         return True, [], False
 
     # 優先級 2：spawned_tickets 中有後續任務
@@ -875,7 +918,7 @@ def validate_followup_tasks(ticket: Dict[str, Any], version: str, body: str) ->
         return True, [], False
 
     # 優先級 3：同任務鏈中有序號更大的 Ticket
-    if _has_followup_in_chain(ticket_id, version):
+    if _has_followup_in_chain(ticket_id, version, graph):
         return True, [], False
 
     # 無後續任務 → 失敗
@@ -920,8 +963,9 @@ def run_audit(ticket_id: str, version: Optional[str] = None) -> AuditReport:
         except ValueError as e:
             raise ValueError(f"無法解析版本號：{e}")
 
-    # 載入 Ticket
-    ticket = load_ticket(version, ticket_id)
+    # 載入 Ticket（各步驟共用同一份關係圖，相關 Ticket 只載入一次）
+    graph = _audit_graph(version, None)
+    ticket = graph.get(ticket_id)
     if not ticket:
         raise ValueError(f"找不到 Ticket：{ticket_id}")
 
@@ -952,7 +996,9 @@ def run_audit(ticket_id: str, version: Optional[str] = None) -> AuditReport:
     ))
 
     # Step 2: 子任務完成狀態檢查
-    children_passed, children_issues, children_skipped = validate_children_completed(ticket, version)
+    children_passed, children_issues, children_skipped = validate_children_completed(
+        ticket, version, graph
+    )
     report.add_step(AuditStep(
         name="子任務完成狀態檢查",
         passed=children_passed,
@@ -962,7 +1008,7 @@ def run_audit(ticket_id: str, version: Optional[str] = None) -> AuditReport:
 
     # Step 2.5: spawned_tickets 完成狀態檢查（W15-003，僅 ANA）
     spawned_passed, spawned_issues, spawned_skipped = validate_spawned_tickets_completed(
-        ticket, version
+        ticket, version, graph
     )
     report.add_step(AuditStep(
         name="spawned_tickets 完成狀態檢查",
@@ -1012,7 +1058,8 @@ def run_audit(ticket_id: str, version: Optional[str] = None) -> AuditReport:
     followup_passed, followup_warnings, followup_skipped = validate_followup_tasks(
         ticket,
         version,
-        body
+        body,
+        graph
     )
     report.add_step(AuditStep(
         name="後續任務銜接檢查",
@@ -3,12 +3,17 @@ Ticket 任務鏈分析模組
 
 負責分析 Ticket 的任務鏈狀態和方向判斷邏輯，純分析層，無 I/O 操作。
 所有與檔案讀取相關的操作由調用者負責。
+
+相關 Ticket（子任務、父任務、兄弟任務）經 TicketGraph 取得：呼叫端可傳入
+共用的 graph（如 handoff 狀態顯示先判斷方向再產生建議），未傳入時每次呼叫
+建立僅本次使用的記憶化檢視，同一張票在單次分析中只載入一次。
 """
 # 防止直接執行此模組
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, List
 
 from ticket_system.lib.constants import STATUS_IN_PROGRESS, STATUS_COMPLETED, STATUS_PENDING, STATUS_BLOCKED, TERMINAL_STATUSES
+from ticket_system.lib.ticket_graph import TicketGraph
 from ticket_system.lib.ticket_loader import load_ticket
 from ticket_system.lib.ticket_ops import resolve_id_from_ref
 from ticket_system.lib.ticket_validator import extract_version_from_ticket_id
@@ -25,6 +30,13 @@ class Recommendation:
     blocked_by: Optional[list] = None
 
 
+def _graph_for(version: Optional[str], graph: Optional[TicketGraph]) -> TicketGraph:
+    """未傳入 graph 時建立本次呼叫專用的記憶化檢視（經本模組 load_ticket 載入）"""
+    if graph is not None:
+        return graph
+    return TicketGraph(version, loader=load_ticket)
+
+
 class ChainAnalyzer:
     """
     Ticket 任務鏈分析器
@@ -57,7 +69,11 @@ class ChainAnalyzer:
         return ChainAnalyzer.determine_direction(ticket, version)
 
     @staticmethod
-    def determine_direction(ticket: Dict[str, Any], version: Optional[str] = None) -> str:
+    def determine_direction(
+        ticket: Dict[str, Any],
+        version: Optional[str] = None,
+        graph: Optional[TicketGraph] = None,
+    ) -> str:
         """
         自動判斷 handoff 方向
 
@@ -84,6 +100,7 @@ class ChainAnalyzer:
             ticket: Ticket 資料字典（必須含 id, status, chain, children）
             version: 版本號（用於載入相關 Ticket）
                     可選，若不提供會從 ticket_id 提取
+            graph: 共用的 Ticket 關係圖（可選，未傳入時本次呼叫內建立）
 
         Returns:
             str: handoff 方向，值為：
@@ -113,12 +130,15 @@ class ChainAnalyzer:
         if not version:
             version = extract_version_from_ticket_id(ticket_id)
 
+        # 子任務與兄弟任務判斷共用同一份關係圖，父任務只載入一次
+        graph = _graph_for(version, graph)
+
         # Guard Clause 1：情境 2 - 被阻塞，等待前置任務完成
         if status == STATUS_BLOCKED:
             return "wait"
 
         # Guard Clause 2：情境 1 - 有待執行的子任務，進入子任務
-        if ChainAnalyzer._has_pending_children(children, version):
+        if ChainAnalyzer._has_pending_children(children, version, graph):
             return "to-child"
 
         # Guard Clause 3：情境 3 - 無父任務，當前為根節點，任務完成
@@ -126,14 +146,18 @@ class ChainAnalyzer:
             return "completed"
 
         # Guard Clause 4：情境 4 - 有待處理的兄弟任務，轉向兄弟
-        if ChainAnalyzer._get_sibling_status(ticket, version) == "has_pending":
+        if ChainAnalyzer._get_sibling_status(ticket, version, graph) == "has_pending":
             return "to-sibling"
 
         # 預設情境 5 - 無待處理兄弟，返回父任務回報進度
         return "to-parent"
 
     @staticmethod
-    def _has_pending_children(children: list, version: Optional[str] = None) -> bool:
+    def _has_pending_children(
+        children: list,
+        version: Optional[str] = None,
+        graph: Optional[TicketGraph] = None,
+    ) -> bool:
         """
         檢查是否有待完成的子任務。
 
@@ -152,6 +176,7 @@ class ChainAnalyzer:
             children: 子任務清單，可能為空、字串 ID、或字典混合
             version: 版本號（用於載入字串型子 Ticket）
                     可選，若無版本則無法載入字串型子任務
+            graph: 共用的 Ticket 關係圖（可選）
 
         Returns:
             bool: 是否有未完成（status != completed）的子任務
@@ -168,6 +193,8 @@ class ChainAnalyzer:
         if not children:
             return False
 
+        graph = _graph_for(version, graph)
+
         # 檢查每個子任務
         for child_item in children:
             # 提取子任務 ID
@@ -180,9 +207,9 @@ class ChainAnalyzer:
                     return True
 
             # 情況 2：字串型 ID（需要載入檔案）
-            elif child_id and version:
-                # 載入子 Ticket 以檢查其狀態
-                child_ticket = load_ticket(version, child_id)
+            elif child_id:
+                # 載入子 Ticket 以檢查其狀態（無版本且非已知節點時為 None）
+                child_ticket = graph.get(child_id)
                 # 只要有一個子任務未完成，立即返回 True
                 if child_ticket and child_ticket.get("status") not in TERMINAL_STATUSES:
                     return True
@@ -191,7 +218,11 @@ class ChainAnalyzer:
         return False
 
     @staticmethod
-    def _get_sibling_status(ticket: Dict[str, Any], version: Optional[str] = None) -> str:
+    def _get_sibling_status(
+        ticket: Dict[str, Any],
+        version: Optional[str] = None,
+        graph: Optional[TicketGraph] = None,
+    ) -> str:
         """
         取得兄弟任務狀態。
 
@@ -209,6 +240,7 @@ class ChainAnalyzer:
         Args:
             ticket: 當前 Ticket 資料（需要 id 和 chain.parent）
             version: 版本號（用於載入父任務和兄弟任務）
+            graph: 共用的 Ticket 關係圖（可選）
 
         Returns:
             str: 兄弟狀態，值為：
@@ -231,8 +263,9 @@ class ChainAnalyzer:
 
         # Guard Clause 2：無版本 → 無法載入父任務，假設無待處理兄弟
         if version:
+            graph = _graph_for(version, graph)
             # 載入父任務以取得兄弟清單
-            parent_ticket = load_ticket(version, parent_id)
+            parent_ticket = graph.get(parent_id)
             if parent_ticket:
                 # 取得父任務的所有子任務（兄弟 + 自己）
                 siblings = parent_ticket.get("children", [])
@@ -257,7 +290,7 @@ class ChainAnalyzer:
                         if sibling_id == ticket_id:
                             continue
                         # 載入兄弟 Ticket 以檢查其狀態
-                        sibling_ticket = load_ticket(version, sibling_id)
+                        sibling_ticket = graph.get(sibling_id)
                         # 只要有一個兄弟未完成，立即返回
                         if sibling_ticket and sibling_ticket.get("status") not in TERMINAL_STATUSES:
                             return "has_pending"
@@ -269,7 +302,8 @@ class ChainAnalyzer:
     def get_recommendation(
         direction: str,
         ticket: Dict[str, Any],
-        version: Optional[str] = None
+        version: Optional[str] = None,
+        graph: Optional[TicketGraph] = None,
     ) -> Recommendation:
         """
         根據交接方向生成具體建議。
@@ -288,6 +322,7 @@ class ChainAnalyzer:
                       可能值：to-child, to-sibling, to-parent, wait, completed
             ticket: Ticket 資料字典（需要 id, children, chain, blockedBy 等欄位）
             version: 版本號（用於載入相關 Ticket 的詳細資訊）
+            graph: 共用的 Ticket 關係圖（可選，與 determine_direction 共用可免重複載入）
 
         Returns:
             Recommendation: 包含以下資訊的建議物件：
@@ -313,15 +348,15 @@ class ChainAnalyzer:
 
         # Guard Clause 1：進入子任務
         if direction == "to-child":
-            return ChainAnalyzer._get_to_child_recommendation(ticket_id, children, version)
+            return ChainAnalyzer._get_to_child_recommendation(ticket_id, children, version, graph)
 
         # Guard Clause 2：切換到兄弟任務
         if direction == "to-sibling":
-            return ChainAnalyzer._get_to_sibling_recommendation(ticket_id, parent_id, version)
+            return ChainAnalyzer._get_to_sibling_recommendation(ticket_id, parent_id, version, graph)
 
         # Guard Clause 3：返回父任務
         if direction == "to-parent":
-            return ChainAnalyzer._get_to_parent_recommendation(ticket_id, parent_id, version)
+            return ChainAnalyzer._get_to_parent_recommendation(ticket_id, parent_id, version, graph)
 
         # Guard Clause 4：被阻塞等待
         if direction == "wait":
@@ -355,7 +390,12 @@ class ChainAnalyzer:
         )
 
     @staticmethod
-    def _get_to_child_recommendation(ticket_id: str, children: list, version: Optional[str] = None) -> Recommendation:
+    def _get_to_child_recommendation(
+        ticket_id: str,
+        children: list,
+        version: Optional[str] = None,
+        graph: Optional[TicketGraph] = None,
+    ) -> Recommendation:
         """
         生成進入子任務的建議。
 
@@ -363,10 +403,12 @@ class ChainAnalyzer:
             ticket_id: 當前 Ticket ID
             children: 子任務列表
             version: 版本號
+            graph: 共用的 Ticket 關係圖（可選）
 
         Returns:
             Recommendation: 子任務建議
         """
+        graph = _graph_for(version, graph)
         for child_item in children:
             # 提取子任務 ID
             child_id = resolve_id_from_ref(child_item)
@@ -383,7 +425,7 @@ class ChainAnalyzer:
 
             # 情況 2：字串型 ID（需要載入檔案）
             elif child_id and version:
-                child_ticket = load_ticket(version, child_id)
+                child_ticket = graph.get(child_id)
                 if child_ticket and child_ticket.get("status") not in TERMINAL_STATUSES:
                     child_title = child_ticket.get("title", "")
                     return Recommendation(
@@ -402,7 +444,12 @@ class ChainAnalyzer:
         )
 
     @staticmethod
-    def _get_to_sibling_recommendation(ticket_id: str, parent_id: Optional[str], version: Optional[str] = None) -> Recommendation:
+    def _get_to_sibling_recommendation(
+        ticket_id: str,
+        parent_id: Optional[str],
+        version: Optional[str] = None,
+        graph: Optional[TicketGraph] = None,
+    ) -> Recommendation:
         """
         生成切換到兄弟任務的建議。
 
@@ -410,6 +457,7 @@ class ChainAnalyzer:
             ticket_id: 當前 Ticket ID
             parent_id: 父任務 ID
             version: 版本號
+            graph: 共用的 Ticket 關係圖（可選）
 
         Returns:
             Recommendation: 兄弟任務建議
@@ -423,7 +471,8 @@ class ChainAnalyzer:
             )
 
         # Guard：無法載入父任務
-        parent_ticket = load_ticket(version, parent_id)
+        graph = _graph_for(version, graph)
+        parent_ticket = graph.get(parent_id)
         if not parent_ticket:
             return Recommendation(
                 direction="to-sibling",
@@ -454,7 +503,7 @@ class ChainAnalyzer:
             elif sibling_id:
                 if sibling_id == ticket_id:
                     continue
-                sibling_ticket = load_ticket(version, sibling_id)
+                sibling_ticket = graph.get(sibling_id)
                 if sibling_ticket and sibling_ticket.get("status") not in TERMINAL_STATUSES:
                     sibling_title = sibling_ticket.get("title", "")
                     return Recommendation(
@@ -473,7 +522,12 @@ class ChainAnalyzer:
         )
 
     @staticmethod
-    def _get_to_parent_recommendation(ticket_id: str, parent_id: Optional[str], version: Optional[str] = None) -> Recommendation:
+    def _get_to_parent_recommendation(
+        ticket_id: str,
+        parent_id: Optional[str],
+        version: Optional[str] = None,
+        graph: Optional[TicketGraph] = None,
+    ) -> Recommendation:
         """
         生成返回父任務的建議。
 
@@ -481,6 +535,7 @@ class ChainAnalyzer:
             ticket_id: 當前 Ticket ID
             parent_id: 父任務 ID
             version: 版本號
+            graph: 共用的 Ticket 關係圖（可選）
 
         Returns:
             Recommendation: 父任務建議
@@ -503,7 +558,7 @@ class ChainAnalyzer:
             )
 
         # 載入父任務資訊
-        parent_ticket = load_ticket(version, parent_id)
+        parent_ticket = _graph_for(version, graph).get(parent_id)
         if not parent_ticket:
             return Recommendation(
                 direction="to-parent",
@@ -6,6 +6,10 @@
 - §4 _write_metrics_log(state, caller, duration_ms, errors) + 10MB rotate（fail-open）
 - §1.2 checkpoint_state() 主函式串接 SAFE_CALL → _derive_checkpoint → log
 
+並行收集：5 個資料來源各以一條 daemon 執行緒並行執行，各有截止時間
+（_COLLECTOR_DEADLINES），逾時來源走 fallback、其餘照常渲染；各來源耗時寫入
+metrics log 的 collector_ms。
+
 設計依據：Phase 3a §1.2 / §4 / §5；Phase 2 §3 Group D / E。
 
 TD / AD 錨點（W10-017.13 AC5 回填，供後續追溯；完整表見 017.1 worklog §技債追蹤）:
@@ -33,7 +37,10 @@ from __future__ import annotations
 import json
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -308,21 +315,32 @@ def SAFE_CALL(
     try:
         result = fn()
     except IO_ERRORS as e:
-        errors[source] = f"{type(e).__name__}: {str(e)[:100]}"
-        pending.append(
-            PendingCheck(
-                check_id=f"data_source_{source}",
-                reason=f"{source} unavailable: {e}",
-                blocker=False,
-                auto_detectable=False,
-            )
-        )
+        _mark_unavailable(errors, pending, source, e)
         return fallback
     else:
         errors.setdefault(source, "ok")
         return result
 
 
+def _mark_unavailable(
+    errors: Dict[str, str],
+    pending: List[PendingCheck],
+    source: str,
+    exc: BaseException,
+) -> None:
+    """記錄資料來源不可用（SAFE_CALL 捕獲的 I/O 例外與收集器逾時共用）。"""
+
+    errors[source] = f"{type(exc).__name__}: {str(exc)[:100]}"
+    pending.append(
+        PendingCheck(
+            check_id=f"data_source_{source}",
+            reason=f"{source} unavailable: {exc}",
+            blocker=False,
+            auto_detectable=False,
+        )
+    )
+
+
 # ---------------------------------------------------------------------------
 # 5 層 fail-open 資料來源（Phase 1 §3 / Phase 2 §3 Group B）
 # ---------------------------------------------------------------------------
@@ -571,6 +589,7 @@ def _write_metrics_log(
     errors: Dict[str, str],
     *,
     project_root: Optional[Path] = None,
+    collector_ms: Optional[Dict[str, float]] = None,
 ) -> None:
     """Append 一行 JSONL 到 pm-automation-metrics.jsonl（fail-open）。
 
@@ -578,6 +597,9 @@ def _write_metrics_log(
         ts / event / caller / ticket_id / current_phase / ready_for_clear
         / active_agents / uncommitted_files / duration_ms / data_source_errors
 
+    collector_ms 有傳入時另加 `collector_ms` 欄位（source -> 該收集器耗時 ms；
+    逾時者為等待至截止的時間），供比對 duration_ms 找出拖慢的資料來源。
+
     Rotate：檔案 > 10 MB 時滾動為 .1/.2/.../.N.jsonl（預設保留 N=3 份），
     新檔從 0 開始；超過 N 份則丟棄最舊的 .N。
 
@@ -613,6 +635,8 @@ def _write_metrics_log(
         "duration_ms": round(duration_ms, 2),
         "data_source_errors": data_source_errors,
     }
+    if collector_ms is not None:
+        entry["collector_ms"] = {k: round(v, 2) for k, v in collector_ms.items()}
 
     with log_path.open("a", encoding="utf-8") as f:
         f.write(json.dumps(entry, ensure_ascii=False) + "\n")
@@ -670,6 +694,97 @@ DATA_SOURCES: List[
 ]
 
 
+# ---------------------------------------------------------------------------
+# 並行收集（各資料來源互不相依，總耗時由加總降為最慢者）
+# ---------------------------------------------------------------------------
+
+# 各來源截止時間（秒，自開始收集起算）。subprocess 來源比其 timeout 多 1 秒
+# 寬限，讓 TimeoutExpired 的原始訊息優先；逾時來源走 fallback，其餘照常渲染。
+_COLLECTOR_DEADLINES: Dict[str, float] = {
+    "git-status": _GIT_CMD_TIMEOUT + 1,
+    "dispatch-active": 2.0,
+    "handoff-pending": 2.0,
+    "ticket-query": _TICKET_CMD_TIMEOUT + 1,
+    "git-worktree": _GIT_CMD_TIMEOUT + 1,
+}
+_DEFAULT_COLLECTOR_DEADLINE = 5.0
+
+
+def _run_collector(
+    reader: Callable[[Path], Any], root: Path, source: str, fallback: Any,
+) -> Tuple[Any, Dict[str, str], List[PendingCheck], float]:
+    """於收集器執行緒跑單一資料來源；errors/pending 各自獨立，由主執行緒合併。"""
+
+    errors: Dict[str, str] = {}
+    pending: List[PendingCheck] = []
+    start = time.perf_counter()
+    raw = SAFE_CALL(lambda: reader(root), errors, pending, source, fallback=fallback)
+    return raw, errors, pending, (time.perf_counter() - start) * 1000.0
+
+
+def _start_collector(
+    reader: Callable[[Path], Any], root: Path, source: str, fallback: Any,
+) -> Future:
+    """以 daemon 執行緒啟動單一來源，結果（或例外）放入回傳的 Future。
+
+    不用 ThreadPoolExecutor：其 worker 非 daemon，直譯器結束時會 join 全部
+    worker，逾時來源卡住時 shutdown(wait=False) 也無法讓行程提早結束。
+    """
+
+    future: Future = Future()
+
+    def _target() -> None:
+        try:
+            future.set_result(_run_collector(reader, root, source, fallback))
+        except BaseException as exc:  # 交由主執行緒 future.result() 重拋
+            future.set_exception(exc)
+
+    threading.Thread(
+        target=_target, name=f"checkpoint-collector-{source}", daemon=True,
+    ).start()
+    return future
+
+
+def _collect_data_sources(
+    root: Path, errors: Dict[str, str], pending: List[PendingCheck],
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """並行執行 DATA_SOURCES，回傳 (collected, collector_ms)。
+
+    - 結果依 DATA_SOURCES 順序合併進 errors/pending，輸出與序列版一致
+    - 逾時來源：fallback + errors/pending 記 TimeoutError（auto_detectable=False），
+      不等待該執行緒結束；收集器為 daemon 執行緒，不拖住行程結束
+    - 非 IO_ERRORS 例外照樣上拋（程式 bug 不吞）
+    """
+
+    start = time.perf_counter()
+    collected: Dict[str, Any] = {}
+    collector_ms: Dict[str, float] = {}
+    futures: List[Future] = [
+        _start_collector(reader, root, source, fallback)
+        for _field, source, reader, fallback, _extractor in DATA_SOURCES
+    ]
+    for (field_name, source, _reader, fallback, extractor), future in zip(
+        DATA_SOURCES, futures
+    ):
+        deadline = _COLLECTOR_DEADLINES.get(source, _DEFAULT_COLLECTOR_DEADLINE)
+        remaining = max(0.0, start + deadline - time.perf_counter())
+        try:
+            raw, src_errors, src_pending, elapsed_ms = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            _mark_unavailable(
+                errors, pending, source,
+                TimeoutError(f"collector exceeded {deadline:g}s deadline"),
+            )
+            raw = fallback
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+        else:
+            errors.update(src_errors)
+            pending.extend(src_pending)
+        collected[field_name] = extractor(raw)
+        collector_ms[source] = elapsed_ms
+    return collected, collector_ms
+
+
 # ---------------------------------------------------------------------------
 # View functions（Phase 4 L10 重構：view 與 state 解耦，便於 i18n 擴展）
 # ---------------------------------------------------------------------------
@@ -711,6 +826,9 @@ def checkpoint_state(
 ) -> CheckpointState:
     """整合 5 層 SAFE_CALL 資料收集 → _derive_checkpoint → metrics log。
 
+    資料來源以 daemon 執行緒並行收集（見 _collect_data_sources），單一來源
+    逾時不影響其他來源結果；各來源耗時寫入 metrics log 的 collector_ms。
+
     Args:
         ticket_id: 當前 ticket 識別（None = 使用 in_progress 推導）。
         log_metrics: False 時不寫 metrics log（單元測試隔離）。
@@ -727,14 +845,9 @@ def checkpoint_state(
     errors: Dict[str, str] = {}
     pending: List[PendingCheck] = []
 
-    # Step 1：5 層 fail-open 資料收集（table-driven，與 PRIORITIES 同構）
-    collected: Dict[str, Any] = {}
-    for field_name, source, reader, fallback, extractor in DATA_SOURCES:
-        raw = SAFE_CALL(
-            lambda r=reader: r(root),
-            errors, pending, source, fallback=fallback,
-        )
-        collected[field_name] = extractor(raw)
+    # Step 1：5 層 fail-open 資料收集（table-driven，與 PRIORITIES 同構；
+    # 各來源並行、個別截止，逾時者走 fallback 不拖住其餘來源）
+    collected, collector_ms = _collect_data_sources(root, errors, pending)
 
     # Step 2：先組半成品 state 讓 _derive_checkpoint 可查
     state = CheckpointState(
@@ -766,7 +879,10 @@ def checkpoint_state(
     # Step 5：觀測 log（fail-open；規則 4 stderr + log 雙通道）
     if log_metrics:
         try:
-            _write_metrics_log(state, caller, duration_ms, errors, project_root=root)
+            _write_metrics_log(
+                state, caller, duration_ms, errors,
+                project_root=root, collector_ms=collector_ms,
+            )
         except (OSError, json.JSONDecodeError, TypeError) as e:
             # fail-open 邊界；規則 4 stderr 保留可見性
             # whitelist 對齊 SAFE_CALL IO_ERRORS 哲學（檔案 I/O + JSON + 序列化）
@@ -21,6 +21,7 @@ git 執行 callable（供既有測試 mock 邊界延續）的呼叫端（如
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import os
 import subprocess
 import sys
@@ -98,6 +99,43 @@ def load_claude_lib(module_name: str, marker: Optional[str] = None) -> Optional[
     return module
 
 
+def load_claude_lib_file(module_name: str) -> Optional[Any]:
+    """以檔案路徑載入 `.claude/lib/<module_name>.py`，不經 `lib` 套件。
+
+    `load_claude_lib` 走 `import lib.<name>`，會先執行 `lib/__init__.py`
+    的 eager import（hook_base / git_utils / hook_logging 等），對只需要
+    單一自足模組的熱路徑（如 frontmatter 解析服務 `yaml_frontmatter`）
+    成本過高。本函式以 `spec_from_file_location` 直接載入單檔，模組名稱
+    註冊為 `_claude_lib_<name>`，與 `lib.<name>` 互不干擾。
+
+    僅適用於不以相對 import 引用 lib 其他模組的自足模組。找不到檔案時
+    回傳 None，呼叫端負責降級。
+    """
+    cache_key = (f"{module_name}.py", f"file:{module_name}")
+    if cache_key in _MODULE_CACHE:
+        return _MODULE_CACHE[cache_key]
+
+    claude_dir = find_claude_dir(f"{module_name}.py")
+    if claude_dir is None:
+        return None
+
+    qualified_name = f"_claude_lib_{module_name}"
+    module = sys.modules.get(qualified_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            qualified_name, claude_dir / "lib" / f"{module_name}.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[qualified_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[qualified_name]
+            raise
+    _MODULE_CACHE[cache_key] = module
+    return module
+
+
 # ---------------------------------------------------------------------------
 # git toplevel 解析（收斂 lease.py / track_sessions.py 原本各自實作的
 # 「取得當前 git toplevel 絕對路徑字串」helper；`resolve_toplevel` 為核心
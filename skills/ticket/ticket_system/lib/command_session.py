@@ -0,0 +1,158 @@
+"""
+多命令 session 模組（ticket batch / ticket shell 共用）
+
+每次 `ticket <cmd>` 都是獨立 process：重新 import 整棵命令樹、重新解析專案
+根目錄、冷啟動載入 Ticket，結束時收割 stale lock。PM 交接常連續執行 5-10
+個命令（claim → append-log → set-acceptance → complete → runqueue），啟動
+成本佔了大半。CommandSession 在同一 process 內逐一執行命令：
+
+- 頂層 parser 只建一次，get_project_root() 快取與 parser._ticket_cache /
+  ticket_query 欄式索引在命令間共用
+- 命令間以 (mtime_ns, size) 比對快取內的 Ticket 檔，剔除期間被其他
+  process 改寫者，避免長駐 shell 讀到過期內容（同 process 內經 save_ticket
+  的寫入本來就會失效對應快取）
+- 每個命令的 exit code 個別記錄；argparse 錯誤 / sys.exit 轉為該命令的
+  exit code，未預期例外印出 traceback 後記為 1，不中斷整個 session
+- stale lock 收割留給最外層 `ticket` 入口在 session 結束時做一次
+"""
+# 防止直接執行此模組
+import argparse
+import shlex
+import sys
+import traceback
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from . import parser as ticket_parser
+
+
+# session 內不可再巢狀的命令（batch 內跑 shell 會搶走 stdin）
+SESSION_COMMANDS = ("batch", "shell")
+
+# 行首可省略的程式名（方便直接貼上 `ticket track claim ...`）
+PROGRAM_NAME = "ticket"
+
+# 巢狀 / 解析失敗等 session 層拒絕的 exit code（與 argparse 用法錯誤一致）
+EXIT_USAGE = 2
+
+
+class CommandLineError(ValueError):
+    """batch / shell 單行無法切分（如引號未閉合）"""
+
+
+@dataclass
+class CommandResult:
+    """單一命令的執行結果"""
+
+    line_no: int
+    line: str
+    exit_code: int
+
+
+def split_command_line(line: str) -> Optional[List[str]]:
+    """
+    將一行命令切成 argv
+
+    空行與 `#` 開頭的註解回傳 None；行首的 `ticket` 會被去除。
+
+    Raises:
+        CommandLineError: 引號未閉合等 shlex 無法切分的輸入
+    """
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#"):
+        return None
+    try:
+        argv = shlex.split(stripped, comments=True)
+    except ValueError as e:
+        raise CommandLineError(str(e))
+    if argv and argv[0] == PROGRAM_NAME:
+        argv = argv[1:]
+    return argv or None
+
+
+def _exit_code_from(exc: SystemExit) -> int:
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    # sys.exit("訊息")：比照直譯器行為，訊息寫 stderr、exit code 1
+    print(code, file=sys.stderr)
+    return 1
+
+
+class CommandSession:
+    """
+    在同一 process 內逐一執行 ticket 子命令
+
+    Args:
+        parser: 頂層 parser（scripts.ticket.build_parser() 的結果）
+        dispatch: 解析並執行 argv 的函式（scripts.ticket.dispatch）
+    """
+
+    def __init__(
+        self,
+        parser: argparse.ArgumentParser,
+        dispatch: Callable[[argparse.ArgumentParser, List[str]], int],
+    ) -> None:
+        self.parser = parser
+        self.dispatch = dispatch
+        self.results: List[CommandResult] = []
+        self._stamps = ticket_parser.ticket_cache_stamps()
+
+    def run_line(self, line: str, line_no: int = 0) -> Optional[CommandResult]:
+        """執行一行命令；空行 / 註解回傳 None（不計入結果）"""
+        try:
+            argv = split_command_line(line)
+        except CommandLineError as e:
+            print(f"[ERROR] 第 {line_no} 行無法解析：{e}", file=sys.stderr)
+            return self._record(line_no, line, EXIT_USAGE)
+        if argv is None:
+            return None
+        return self._record(line_no, line, self.run(argv))
+
+    def run(self, argv: List[str]) -> int:
+        """執行單一命令，回傳其 exit code"""
+        if argv[0] in SESSION_COMMANDS:
+            print(f"[ERROR] session 內不可巢狀執行 {argv[0]}", file=sys.stderr)
+            return EXIT_USAGE
+        self._revalidate()
+        try:
+            rc = self.dispatch(self.parser, argv)
+        except SystemExit as e:
+            rc = _exit_code_from(e)
+        except KeyboardInterrupt:
+            raise
+        except Exception:
+            traceback.print_exc()
+            rc = 1
+        finally:
+            sys.stdout.flush()
+            self._stamps = ticket_parser.ticket_cache_stamps()
+        return rc if isinstance(rc, int) else 0
+
+    def _record(self, line_no: int, line: str, exit_code: int) -> CommandResult:
+        result = CommandResult(line_no, line.strip(), exit_code)
+        self.results.append(result)
+        return result
+
+    def _revalidate(self) -> None:
+        """剔除命令間被外部改寫的 Ticket 快取，連帶失效依賴它的衍生索引"""
+        if ticket_parser.evict_changed_tickets(self._stamps):
+            from . import ticket_loader, ticket_query
+            ticket_loader._chain_index_cache.clear()
+            ticket_query.clear_ticket_table_cache()
+
+    @property
+    def failed(self) -> List[CommandResult]:
+        return [r for r in self.results if r.exit_code != 0]
+
+    def exit_code(self) -> int:
+        """整個 session 的 exit code：第一個失敗命令的 exit code，全數成功為 0"""
+        failed = self.failed
+        return failed[0].exit_code if failed else 0
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
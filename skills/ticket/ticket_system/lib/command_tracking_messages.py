@@ -127,6 +127,9 @@ class TrackBatchMessages:
     # _execute_batch_operation 中的成功訊息前綴
     OK_PREFIX = "[OK]"
 
+    # _execute_batch_operation 整批寫入失敗（已回滾）
+    BATCH_WRITE_FAILED_FORMAT = "批量寫入失敗，{count} 個 Ticket 皆已回滾未變更：{error}"
+
     # 批量操作的優先操作類型
     VALID_OPERATION_CLAIM = "claim"
     VALID_OPERATION_COMPLETE = "complete"
@@ -340,6 +343,11 @@ class TrackRelationsMessages:
     # execute_agent 中的項目前綴
     AGENT_ITEM_PREFIX = "  -"
 
+    # execute_referenced_by 中的標題與空結果
+    REFERENCED_BY_HEADER = "[Info] 引用 {ticket_id} 的 Ticket（{count} 筆）"
+    REFERENCED_BY_EMPTY = "[Info] 沒有 Ticket 引用 {ticket_id}"
+    REFERENCED_BY_ITEM_FORMAT = "  - {source_id}  ({field})"
+
 
 # ============================================================================
 # TrackMessages - track.py 相關訊息
@@ -387,6 +395,7 @@ class TrackMessages:
     HELP_APPEND_LOG = "追加執行日誌到 Ticket"
     HELP_ACCEPT_CREATION = "標記 Ticket 建立後驗收已通過"
     HELP_ADD_CHILD = "建立 Ticket 父子關係"
+    HELP_REFERENCED_BY = "查詢引用指定 Ticket 的所有 Ticket（反向引用，跨版本）"
     HELP_AUDIT = "執行驗收檢查"
     HELP_BOARD = "顯示樹狀看板視圖"
     HELP_TRACK = "追蹤 Ticket 狀態"
@@ -0,0 +1,297 @@
+"""
+Ticket commit 活動索引模組
+
+`track activity` 原本對每張 in_progress 票各跑一次
+`git log --grep=<id> --fixed-strings`，每次都從 HEAD 走完整段歷史；票數 × 歷史
+長度的成本在長歷史 repo 上明顯。本模組改為：
+
+- 單趟掃描：一次 `git log --format=%H%x00%cI%x00%s`（附 --since 下限），
+  以 Aho-Corasick 自動機對每個 commit subject 同時比對全部 ticket ID
+- 持久化：ticket_id → 最後 commit 時間 存於
+  {work_logs_root}/.index/commit-activity.json（內附 `*` 的 .gitignore），
+  以掃描時的 HEAD 為鍵；HEAD 未變時直接命中，不呼叫 git log
+- 增量：HEAD 前進（舊 HEAD 為新 HEAD 的祖先）時只掃 `舊HEAD..新HEAD`；
+  歷史被改寫（rebase / reset 到非祖先）時整份重建；新出現的 ticket ID 另以
+  一趟完整掃描補上
+
+比對語意與逐票 grep 相同：只看 subject，ticket ID 命中後緊接「. + 數字」
+視為子票引用（父票 ID 恰為子票 ID 的字首），不算父票的活動。
+"""
+# 防止直接執行此模組
+import json
+import os
+import re
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# 索引目錄與檔名（相對 work_logs_root，同 reverse_ref_index）
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "commit-activity.json"
+
+# 索引格式版本（欄位或編碼方式變動時遞增，舊索引自動整份失效）
+INDEX_FORMAT_VERSION = 1
+
+# 索引目錄自我忽略（同 ticket_index）
+INDEX_GITIGNORE_CONTENT = "*\n"
+
+# 掃描下限（git --since 語法）；更早的 commit 不視為進行中票的活動訊號
+DEFAULT_SINCE = "180.days.ago"
+
+# 一行一個 commit：sha \0 committer 時間（ISO 8601） \0 subject
+LOG_FORMAT = "--format=%H%x00%cI%x00%s"
+
+# 子票 ID 尾綴：ticket ID 命中位置之後緊接「. + 數字」
+CHILD_TICKET_SUFFIX_RE = re.compile(r"\.\d")
+
+GitRunner = Callable[..., Tuple[bool, str]]
+
+
+# ============================================================================
+# 多字串比對
+# ============================================================================
+
+class TicketIdMatcher:
+    """
+    Aho-Corasick 自動機：一趟掃描找出文字中出現的所有 ticket ID
+
+    ID 彼此可為字首 / 子字串（父票與子票），失敗連結讓重疊命中全部回報；
+    子票尾綴的排除在 find() 依命中結束位置判斷。
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+        for pattern in set(patterns):
+            if pattern:
+                self._insert(pattern)
+        self._link()
+
+    def _insert(self, pattern: str) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (pattern,)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """文字中有「獨立引用」的 ticket ID（排除僅作為子票 ID 字首的命中）"""
+        found: Set[str] = set()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state] and not CHILD_TICKET_SUFFIX_RE.match(text, position + 1):
+                found.update(out[state])
+        return found
+
+
+def _parse_time(value: str) -> Optional[datetime]:
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+def scan_commit_log(output: str, matcher: TicketIdMatcher) -> Dict[str, datetime]:
+    """解析 LOG_FORMAT 輸出，回傳 ticket ID → 最新的引用 commit 時間"""
+    latest: Dict[str, datetime] = {}
+    for line in output.splitlines():
+        parts = line.split("\x00", 2)
+        if len(parts) != 3:
+            continue
+        hits = matcher.find(parts[2])
+        if not hits:
+            continue
+        ts = _parse_time(parts[1])
+        if ts is None:
+            continue
+        for ticket_id in hits:
+            if ticket_id not in latest or ts > latest[ticket_id]:
+                latest[ticket_id] = ts
+    return latest
+
+
+# ============================================================================
+# 持久化索引
+# ============================================================================
+
+class CommitActivityIndex:
+    """
+    ticket ID → 最後 commit 時間，以 HEAD 為鍵的持久化索引
+
+    Args:
+        work_logs_root: 工作日誌根目錄（索引存於其下 .index/）
+        run_git: git 執行函式，簽名同 git_utils.run_git_command(args, cwd=...)
+        cwd: git 執行目錄
+        since: 掃描下限（git --since 語法；變更時索引整份重建）
+    """
+
+    def __init__(
+        self,
+        work_logs_root: Path,
+        run_git: GitRunner,
+        cwd: Optional[str] = None,
+        since: str = DEFAULT_SINCE,
+    ) -> None:
+        self.root = Path(work_logs_root)
+        self.index_path = self.root / INDEX_DIRNAME / INDEX_FILENAME
+        self.run_git = run_git
+        self.cwd = cwd
+        self.since = since
+        self._head: Optional[str] = None
+        # ticket_id → ISO 時間；None 表示掃描過但無引用
+        self._entries: Dict[str, Optional[str]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_FORMAT_VERSION
+            or data.get("since") != self.since
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return
+        self._head = data.get("head")
+        self._entries = data["entries"]
+
+    def _log(self, matcher: TicketIdMatcher, revision: str) -> Optional[Dict[str, datetime]]:
+        ok, out = self.run_git(
+            ["log", LOG_FORMAT, f"--since={self.since}", revision], cwd=self.cwd
+        )
+        if not ok:
+            return None
+        return scan_commit_log(out, matcher)
+
+    def _advance(self, head: str) -> None:
+        """HEAD 變動：祖先關係成立時增量掃描新 commit，否則整份作廢"""
+        if self._head is None or self._head == head:
+            return
+        tracked = list(self._entries)
+        hits = None
+        if tracked:
+            is_ancestor, _ = self.run_git(
+                ["merge-base", "--is-ancestor", self._head, head], cwd=self.cwd
+            )
+            if is_ancestor:
+                hits = self._log(TicketIdMatcher(tracked), f"{self._head}..{head}")
+        if hits is None:
+            self._entries = {}
+        else:
+            for ticket_id, ts in hits.items():
+                # 合併進來的舊分支 commit 時間可能早於既有紀錄，取較新者
+                known = self._entries.get(ticket_id)
+                known_ts = _parse_time(known) if known else None
+                if known_ts is None or ts > known_ts:
+                    self._entries[ticket_id] = ts.isoformat()
+        self._dirty = True
+
+    def last_commit_times(self, ticket_ids: Iterable[str]) -> Dict[str, datetime]:
+        """
+        各 ticket 最後一筆引用 commit 的 committer 時間
+
+        非 git 目錄、無 commit 或 git 失敗時回傳空 dict（該源為缺，非報錯）。
+        索引只保留本次查詢的 ID，不隨歷史查詢無限累積。
+        """
+        wanted = sorted({t for t in ticket_ids if t})
+        ok, head = self.run_git(["rev-parse", "HEAD"], cwd=self.cwd)
+        head = head.strip()
+        if not ok or not head:
+            return {}
+        self._advance(head)
+        if self._head != head:
+            self._head = head
+            self._dirty = True
+
+        missing = [t for t in wanted if t not in self._entries]
+        if missing:
+            hits = self._log(TicketIdMatcher(missing), head)
+            if hits is not None:
+                for ticket_id in missing:
+                    ts = hits.get(ticket_id)
+                    self._entries[ticket_id] = ts.isoformat() if ts else None
+                self._dirty = True
+
+        if set(self._entries) - set(wanted):
+            self._entries = {t: v for t, v in self._entries.items() if t in wanted}
+            self._dirty = True
+
+        result: Dict[str, datetime] = {}
+        for ticket_id in wanted:
+            value = self._entries.get(ticket_id)
+            ts = _parse_time(value) if value else None
+            if ts is not None:
+                result[ticket_id] = ts
+        return result
+
+    def save(self) -> None:
+        """有變動時寫回索引；寫入失敗靜默略過（索引僅為加速）"""
+        if not self._dirty or not self.root.is_dir():
+            return
+        index_dir = self.index_path.parent
+        tmp_path = index_dir / f"{INDEX_FILENAME}.{os.getpid()}.tmp"
+        try:
+            index_dir.mkdir(exist_ok=True)
+            gitignore = index_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text(INDEX_GITIGNORE_CONTENT, encoding="utf-8")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": INDEX_FORMAT_VERSION,
+                        "head": self._head,
+                        "since": self.since,
+                        "entries": self._entries,
+                    },
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._dirty = False
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
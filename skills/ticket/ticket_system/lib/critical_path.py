@@ -9,20 +9,34 @@
 - 正向遍歷（Forward Pass）：計算每個節點的最早開始時間（ES）和最早完成時間（EF）
 - 反向遍歷（Backward Pass）：計算最晚開始時間（LS）和最晚完成時間（LF）
 - 浮動時間計算：Slack = LS - ES，Slack = 0 的節點在關鍵路徑上
-- 關鍵路徑：DAG 中最長的依賴鏈
+- 關鍵路徑：DAG 中最長的依賴鏈；總條數以 DP 計數，僅列舉有上限的代表路徑
+  （寬 wave 扇入形成的菱形 DAG 關鍵路徑數呈指數成長，不可全數列舉）
 
-時間複雜度：O(V + E)，其中 V 為 Ticket 數，E 為依賴數
-空間複雜度：O(V)
+時間複雜度：O(V + E + max_paths × 路徑長)，其中 V 為 Ticket 數，E 為依賴數
+空間複雜度：O(V + E)
 """
 # 防止直接執行此模組
+import heapq
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 
-from .cycle_detector import CycleDetector
 from .ui_constants import SEPARATOR_SECONDARY, SEPARATOR_SECONDARY_DASH
 
 
+# 代表關鍵路徑列舉上限（總條數另以 DP 計算，見 critical_path_count）
+MAX_REPRESENTATIVE_PATHS = 10
+
+
+def _normalize_blocked_by(blocked_by: Any) -> List[str]:
+    """標準化 blockedBy：清單原樣返回，逗號分隔字串拆分，其他型別視為無依賴"""
+    if isinstance(blocked_by, str):
+        return [d.strip() for d in blocked_by.split(",") if d.strip()]
+    if isinstance(blocked_by, list):
+        return blocked_by
+    return []
+
+
 @dataclass
 class CriticalPathResult:
     """
@@ -39,7 +53,8 @@ class CriticalPathResult:
     cycle_info: Optional[List[str]] = None  # 若有環，環路資訊
     all_critical_paths: List[List[str]] = field(
         default_factory=list
-    )  # 所有關鍵路徑（可能有多條等長的關鍵路徑）
+    )  # 代表關鍵路徑（多條等長時至多列舉 max_paths 條）
+    critical_path_count: int = 0  # 關鍵路徑總條數（DP 計數，可能遠大於列舉條數）
 
 
 class CriticalPathAnalyzer:
@@ -49,14 +64,17 @@ class CriticalPathAnalyzer:
     使用 CPM 演算法計算關鍵路徑和進度時程。
     設計特點：
     - 純函式式設計（無副作用）
-    - 整合 CycleDetector 進行環檢測
+    - 拓撲排序（Kahn）同時完成環檢測與正反向遍歷順序，全程非遞迴
+    - 關鍵路徑以 DP 計數、僅列舉有上限的代表路徑（不做全路徑列舉）
     - 支援孤立節點（無依賴也無被依賴）
     - Guard Clause 風格處理邊界情況
     """
 
     @staticmethod
     def analyze(
-        tickets: List[Dict], duration_map: Optional[Dict[str, int]] = None
+        tickets: List[Dict],
+        duration_map: Optional[Dict[str, int]] = None,
+        max_paths: int = MAX_REPRESENTATIVE_PATHS,
     ) -> CriticalPathResult:
         """
         使用 CPM 計算關鍵路徑
@@ -64,14 +82,15 @@ class CriticalPathAnalyzer:
         演算法步驟：
         1. Guard Clause：檢查輸入有效性
         2. 建立票據 ID 集合（用於識別外部依賴）
-        3. 使用 CycleDetector 檢查循環依賴
-        4. 若有環，返回無效結果
-        5. 建立鄰接表和反向鄰接表
-        6. 正向遍歷：計算 ES 和 EF
-        7. 反向遍歷：計算 LS 和 LF
-        8. 計算 Slack 並識別關鍵路徑（Slack = 0 的節點）
-        9. 回溯找出所有關鍵路徑
-        10. 返回結果
+        3. 建立鄰接表和反向鄰接表
+        4. 拓撲排序；排不進拓撲序的節點即在環上或環的下游，返回無效結果
+        5. 正向遍歷（拓撲序）：計算 ES 和 EF
+        6. 反向遍歷（逆拓撲序）：計算 LS 和 LF
+        7. 計算 Slack 並識別關鍵節點（Slack = 0）
+        8. DP 計算關鍵路徑總數，列舉至多 max_paths 條代表路徑
+        9. 返回結果
+
+        時間複雜度 O(V + E + max_paths × 路徑長)，不受關鍵路徑總條數影響。
 
         blockedBy 語義：
         若 B.blockedBy = [A]，表示 A 必須先完成，B 才能開始。
@@ -84,6 +103,7 @@ class CriticalPathAnalyzer:
                    其他欄位會被忽略
             duration_map: 可選的工期映射 {ticket_id: duration}
                          若未提供，預設每個 Ticket 工期為 1
+            max_paths: 代表關鍵路徑列舉上限（預設 MAX_REPRESENTATIVE_PATHS）
 
         Returns:
             CriticalPathResult: 包含以下資訊的分析結果：
@@ -97,7 +117,8 @@ class CriticalPathAnalyzer:
                   - slack: 浮動時間
                 - is_valid: bool - 是否為有效 DAG（無環）
                 - cycle_info: Optional[List[str]] - 環路資訊（若有環）
-                - all_critical_paths: List[List[str]] - 所有關鍵路徑
+                - all_critical_paths: List[List[str]] - 代表關鍵路徑（依 ID 排序列舉）
+                - critical_path_count: int - 關鍵路徑總條數
 
         Examples:
             >>> # 無依賴 Ticket → 都在關鍵路徑上
@@ -106,7 +127,7 @@ class CriticalPathAnalyzer:
             ...     {"id": "B", "blockedBy": []},
             ... ]
             >>> result = CriticalPathAnalyzer.analyze(tickets)
-            >>> len(result.critical_path)  # 孤立節點都在關鍵路徑上
+            >>> result.critical_path_count  # 孤立節點各自為一條關鍵路徑
             2
             >>> result.critical_path_length
             1
@@ -148,20 +169,7 @@ class CriticalPathAnalyzer:
                 all_critical_paths=[],
             )
 
-        # 步驟 1：檢查循環依賴
-        cycles = CycleDetector.detect_cycles_in_all_tickets(tickets)
-        if cycles:
-            _, cycle_path = cycles[0]
-            return CriticalPathResult(
-                critical_path=[],
-                critical_path_length=0,
-                ticket_schedule={},
-                is_valid=False,
-                cycle_info=cycle_path,
-                all_critical_paths=[],
-            )
-
-        # 步驟 2：初始化工期映射（預設每個 Ticket 工期為 1）
+        # 步驟 1：初始化工期映射（預設每個 Ticket 工期為 1）
         if duration_map is None:
             duration_map = {}
 
@@ -169,7 +177,7 @@ class CriticalPathAnalyzer:
             """取得 Ticket 的工期，預設為 1"""
             return duration_map.get(ticket_id, 1)
 
-        # 步驟 3：建立鄰接表和反向鄰接表
+        # 步驟 2：建立鄰接表和反向鄰接表
         # adjacency_list: ticket_id → [依賴它的 ticket_ids]
         # reverse_adjacency_list: ticket_id → [它依賴的 ticket_ids]
         adjacency_list: Dict[str, List[str]] = defaultdict(list)
@@ -177,20 +185,13 @@ class CriticalPathAnalyzer:
 
         for ticket in tickets:
             ticket_id = ticket.get("id")
-            blocked_by = ticket.get("blockedBy", [])
 
             # Guard Clause：無效 ticket_id
             if not ticket_id or ticket_id not in all_ticket_ids:
                 continue
 
-            # 標準化 blockedBy
-            if isinstance(blocked_by, str):
-                blocked_by = [d.strip() for d in blocked_by.split(",") if d.strip()]
-            elif not isinstance(blocked_by, list):
-                blocked_by = []
-
             # 為每個依賴建立邊
-            for dep_id in blocked_by:
+            for dep_id in _normalize_blocked_by(ticket.get("blockedBy", [])):
                 # Guard Clause：忽略不存在的依賴（外部依賴）
                 if dep_id not in all_ticket_ids:
                     continue
@@ -199,90 +200,50 @@ class CriticalPathAnalyzer:
                 adjacency_list[dep_id].append(ticket_id)
                 reverse_adjacency_list[ticket_id].append(dep_id)
 
-        # 步驟 4：正向遍歷（Forward Pass）計算 ES 和 EF
-        # ES（最早開始時間）= max(所有前置節點的 EF)
+        # 步驟 3：拓撲排序；有節點排不進拓撲序即存在循環依賴
+        topo_order = CriticalPathAnalyzer._topological_order(
+            all_ticket_ids, adjacency_list, reverse_adjacency_list
+        )
+        if len(topo_order) < len(all_ticket_ids):
+            return CriticalPathResult(
+                critical_path=[],
+                critical_path_length=0,
+                ticket_schedule={},
+                is_valid=False,
+                cycle_info=CriticalPathAnalyzer._find_cycle(
+                    tickets, set(topo_order), reverse_adjacency_list
+                ),
+                all_critical_paths=[],
+            )
+
+        # 步驟 4：正向遍歷（Forward Pass，拓撲序）計算 ES 和 EF
+        # ES（最早開始時間）= max(所有前置節點的 EF)，無前置節點為 0
         # EF（最早完成時間）= ES + duration
         es_time: Dict[str, int] = {}
         ef_time: Dict[str, int] = {}
-
-        def compute_forward_pass(ticket_id: str) -> int:
-            """
-            遞迴計算某個 Ticket 的 EF（最早完成時間）
-            使用備忘錄模式避免重複計算
-            """
-            # 如果已計算過，直接返回
-            if ticket_id in ef_time:
-                return ef_time[ticket_id]
-
-            # 計算前置節點的最大 EF
+        for ticket_id in topo_order:
             predecessors = reverse_adjacency_list.get(ticket_id, [])
-
-            if not predecessors:
-                # 無前置節點，ES = 0
-                es_time[ticket_id] = 0
-            else:
-                # ES = max(所有前置節點的 EF)
-                max_predecessor_ef = max(
-                    compute_forward_pass(pred) for pred in predecessors
-                )
-                es_time[ticket_id] = max_predecessor_ef
-
-            # EF = ES + duration
-            duration = get_duration(ticket_id)
-            ef_time[ticket_id] = es_time[ticket_id] + duration
-
-            return ef_time[ticket_id]
-
-        # 對所有 Ticket 執行正向遍歷
-        for ticket_id in all_ticket_ids:
-            compute_forward_pass(ticket_id)
+            es_time[ticket_id] = max((ef_time[pred] for pred in predecessors), default=0)
+            ef_time[ticket_id] = es_time[ticket_id] + get_duration(ticket_id)
 
         # 計算專案最早完成時間（所有節點的最大 EF）
         project_ef = max(ef_time.values()) if ef_time else 0
 
-        # 步驟 5：反向遍歷（Backward Pass）計算 LS 和 LF
-        # LF（最晚完成時間）= min(所有後繼節點的 LS)
+        # 步驟 5：反向遍歷（Backward Pass，逆拓撲序）計算 LS 和 LF
+        # LF（最晚完成時間）= min(所有後繼節點的 LS)，無後繼節點為專案完成時間
         # LS（最晚開始時間）= LF - duration
         ls_time: Dict[str, int] = {}
         lf_time: Dict[str, int] = {}
-
-        def compute_backward_pass(ticket_id: str) -> int:
-            """
-            遞迴計算某個 Ticket 的 LS（最晚開始時間）
-            使用備忘錄模式避免重複計算
-            """
-            # 如果已計算過，直接返回
-            if ticket_id in ls_time:
-                return ls_time[ticket_id]
-
-            # 計算後繼節點的最小 LS
+        for ticket_id in reversed(topo_order):
             successors = adjacency_list.get(ticket_id, [])
-
-            if not successors:
-                # 無後繼節點，LF = 專案完成時間
-                lf_time[ticket_id] = project_ef
-            else:
-                # LF = min(所有後繼節點的 LS)
-                min_successor_ls = min(
-                    compute_backward_pass(succ) for succ in successors
-                )
-                lf_time[ticket_id] = min_successor_ls
-
-            # LS = LF - duration
-            duration = get_duration(ticket_id)
-            ls_time[ticket_id] = lf_time[ticket_id] - duration
-
-            return ls_time[ticket_id]
-
-        # 對所有 Ticket 執行反向遍歷
-        for ticket_id in all_ticket_ids:
-            compute_backward_pass(ticket_id)
+            lf_time[ticket_id] = min((ls_time[succ] for succ in successors), default=project_ef)
+            ls_time[ticket_id] = lf_time[ticket_id] - get_duration(ticket_id)
 
         # 步驟 6：計算 Slack 並建立時程表
         ticket_schedule: Dict[str, Dict] = {}
         critical_tickets: Set[str] = set()
 
-        for ticket_id in all_ticket_ids:
+        for ticket_id in topo_order:
             slack = ls_time[ticket_id] - es_time[ticket_id]
             ticket_schedule[ticket_id] = {
                 "es": es_time[ticket_id],
@@ -296,23 +257,16 @@ class CriticalPathAnalyzer:
             if slack == 0:
                 critical_tickets.add(ticket_id)
 
-        # 步驟 7：識別所有關鍵路徑
-        # 關鍵路徑是從起點（無前置節點）到終點（無後繼節點）的路徑
-        # 且路徑上所有節點的 slack = 0
-        all_critical_paths = CriticalPathAnalyzer._find_all_critical_paths(
-            all_ticket_ids,
+        # 步驟 7：關鍵路徑計數（DP）與代表路徑列舉（至多 max_paths 條）
+        critical_path_count, all_critical_paths = CriticalPathAnalyzer._find_critical_paths(
+            topo_order,
             critical_tickets,
-            reverse_adjacency_list,
             adjacency_list,
+            es_time,
+            ef_time,
+            max_paths,
         )
 
-        # Guard Clause：無關鍵路徑（不應發生）
-        if not all_critical_paths:
-            # 若無關鍵路徑，返回最長路徑
-            all_critical_paths = CriticalPathAnalyzer._find_longest_paths(
-                all_ticket_ids, reverse_adjacency_list, adjacency_list, ef_time
-            )
-
         # 選擇第一條關鍵路徑作為主關鍵路徑
         primary_critical_path = all_critical_paths[0] if all_critical_paths else []
         critical_path_length = len(primary_critical_path)
@@ -324,141 +278,173 @@ class CriticalPathAnalyzer:
             is_valid=True,
             cycle_info=None,
             all_critical_paths=all_critical_paths,
+            critical_path_count=critical_path_count,
         )
 
     @staticmethod
-    def _find_all_critical_paths(
+    def _topological_order(
         all_ticket_ids: Set[str],
-        critical_tickets: Set[str],
-        reverse_adjacency_list: Dict[str, List[str]],
         adjacency_list: Dict[str, List[str]],
-    ) -> List[List[str]]:
+        reverse_adjacency_list: Dict[str, List[str]],
+    ) -> List[str]:
         """
-        找出所有關鍵路徑
+        Kahn 演算法拓撲排序
 
-        從所有起點（無前置節點且在關鍵路徑上）開始，
-        使用 DFS 回溯找出所有從起點到終點的關鍵路徑。
+        同層以 ID 排序確保結果穩定（主關鍵路徑不隨 set 迭代順序變動）。
+        存在環時，環上及其下游節點不會出現在回傳清單中。
 
         Args:
             all_ticket_ids: 所有 Ticket ID
-            critical_tickets: 在關鍵路徑上的 Ticket ID（slack = 0）
-            reverse_adjacency_list: 反向依賴圖
-            adjacency_list: 依賴圖
+            adjacency_list: 依賴圖（前置 → 後繼）
+            reverse_adjacency_list: 反向依賴圖（後繼 → 前置）
 
         Returns:
-            List[List[str]]: 所有關鍵路徑
+            List[str]: 拓撲序的 Ticket ID
         """
-        # Guard Clause
-        if not critical_tickets:
-            return []
-
-        # 找出所有起點（無前置節點且在關鍵路徑上）
-        start_nodes = [
-            tid
-            for tid in critical_tickets
-            if tid not in reverse_adjacency_list or not reverse_adjacency_list[tid]
-        ]
-
-        # Guard Clause
-        if not start_nodes:
-            return []
-
-        all_paths = []
-
-        def dfs_find_critical_paths(
-            current: str, path: List[str], visited: Set[str]
-        ) -> None:
-            """
-            DFS 回溯找出關鍵路徑
-
-            從當前節點開始，沿著關鍵節點遍歷到終點（無後繼節點）
-            """
-            # 是否為終點（無後繼節點或所有後繼都不在關鍵路徑上）
-            successors = [
-                succ
-                for succ in adjacency_list.get(current, [])
-                if succ in critical_tickets
-            ]
-
-            if not successors:
-                # 到達終點，記錄路徑
-                all_paths.append(path[:])
-                return
-
-            # DFS 遍歷所有後繼
-            for succ in successors:
-                if succ not in visited:
-                    path.append(succ)
-                    visited.add(succ)
-                    dfs_find_critical_paths(succ, path, visited)
-                    path.pop()
-                    visited.remove(succ)
-
-        # 從所有起點開始 DFS
-        for start in start_nodes:
-            dfs_find_critical_paths(start, [start], {start})
-
-        return all_paths
+        in_degree = {
+            ticket_id: len(reverse_adjacency_list.get(ticket_id, []))
+            for ticket_id in all_ticket_ids
+        }
+        ready = [ticket_id for ticket_id, degree in in_degree.items() if degree == 0]
+        heapq.heapify(ready)
+
+        order: List[str] = []
+        while ready:
+            ticket_id = heapq.heappop(ready)
+            order.append(ticket_id)
+            for succ in adjacency_list.get(ticket_id, []):
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    heapq.heappush(ready, succ)
+        return order
 
     @staticmethod
-    def _find_longest_paths(
-        all_ticket_ids: Set[str],
+    def _find_cycle(
+        tickets: List[Dict],
+        sorted_ids: Set[str],
         reverse_adjacency_list: Dict[str, List[str]],
-        adjacency_list: Dict[str, List[str]],
-        ef_time: Dict[str, int],
-    ) -> List[List[str]]:
+    ) -> Optional[List[str]]:
         """
-        找出最長路徑（備用方案，當無關鍵路徑時使用）
+        從拓撲排序剩餘的節點中找出一個環
+
+        剩餘節點的前置節點中必有剩餘節點（否則入度會歸零而被排入），
+        因此從第一個剩餘 Ticket 沿 blockedBy 逐步回溯必定繞回已走過的節點。
+        環路格式與 CycleDetector 相同：[A, B, C, A]（沿 blockedBy 方向）。
 
         Args:
-            all_ticket_ids: 所有 Ticket ID
+            tickets: 原始 Ticket 清單（決定起點順序）
+            sorted_ids: 已排入拓撲序的 Ticket ID
             reverse_adjacency_list: 反向依賴圖
-            adjacency_list: 依賴圖
-            ef_time: EF 時間映射
 
         Returns:
-            List[List[str]]: 最長路徑清單
+            Optional[List[str]]: 環路清單
         """
-        # 找出所有起點（無前置節點）
-        start_nodes = [
-            tid
-            for tid in all_ticket_ids
-            if tid not in reverse_adjacency_list or not reverse_adjacency_list[tid]
-        ]
-
-        if not start_nodes:
-            return []
+        start = next(
+            (t.get("id") for t in tickets if t.get("id") and t.get("id") not in sorted_ids),
+            None,
+        )
+        path: List[str] = []
+        position: Dict[str, int] = {}
+        current = start
+        while current is not None and current not in position:
+            position[current] = len(path)
+            path.append(current)
+            current = next(
+                (dep for dep in reverse_adjacency_list.get(current, []) if dep not in sorted_ids),
+                None,
+            )
+        if current is None:
+            return None
+        return path[position[current]:] + [current]
 
-        # 找出最大 EF
-        max_ef = max(ef_time.values()) if ef_time else 0
+    @staticmethod
+    def _find_critical_paths(
+        topo_order: List[str],
+        critical_tickets: Set[str],
+        adjacency_list: Dict[str, List[str]],
+        es_time: Dict[str, int],
+        ef_time: Dict[str, int],
+        max_paths: int,
+    ) -> Tuple[int, List[List[str]]]:
+        """
+        計算關鍵路徑總數並列舉至多 max_paths 條代表路徑
 
-        # 找出所有終點（EF = max_ef）
-        end_nodes = [tid for tid in all_ticket_ids if ef_time.get(tid, 0) == max_ef]
+        關鍵邊 = 兩端 slack 皆為 0 且 EF(前置) == ES(後繼) 的邊。slack = 0 的
+        節點若 ES > 0 必有關鍵前置、若 EF < 專案完成時間必有關鍵後繼，因此
+        關鍵子圖中「無關鍵前置」即起點、「無關鍵後繼」即終點，DFS 不會走入死路。
 
-        longest_paths = []
+        路徑數以拓撲序 DP 計算（起點為 1，其餘為各關鍵前置的路徑數總和），
+        不列舉即可得知總數；寬 wave 扇入形成的菱形 DAG 路徑數呈指數成長，
+        逐條列舉只做到 max_paths 條為止，成本為 O(V + E + max_paths × 路徑長)。
 
-        def dfs_find_longest(current: str, path: List[str]) -> None:
-            """DFS 找出最長路徑"""
-            if current in end_nodes:
-                longest_paths.append(path[:])
-                return
+        Args:
+            topo_order: 拓撲序
+            critical_tickets: slack = 0 的 Ticket ID
+            adjacency_list: 依賴圖
+            es_time: 最早開始時間
+            ef_time: 最早完成時間
+            max_paths: 列舉上限
 
-            successors = adjacency_list.get(current, [])
-            if not successors:
-                longest_paths.append(path[:])
-                return
+        Returns:
+            Tuple[int, List[List[str]]]: (關鍵路徑總數, 代表路徑清單)
+        """
+        # Guard Clause
+        if not critical_tickets:
+            return 0, []
 
+        # 關鍵邊（前置 → 後繼，後繼依 ID 排序使列舉結果穩定）
+        tight_successors: Dict[str, List[str]] = {}
+        tight_predecessors: Dict[str, List[str]] = defaultdict(list)
+        for ticket_id in topo_order:
+            if ticket_id not in critical_tickets:
+                continue
+            successors = sorted({
+                succ
+                for succ in adjacency_list.get(ticket_id, [])
+                if succ in critical_tickets and es_time[succ] == ef_time[ticket_id]
+            })
+            tight_successors[ticket_id] = successors
             for succ in successors:
-                if succ not in path:  # 避免環
-                    path.append(succ)
-                    dfs_find_longest(succ, path)
-                    path.pop()
+                tight_predecessors[succ].append(ticket_id)
+
+        # 路徑計數 DP（拓撲序）：起點 = 無關鍵前置，終點 = 無關鍵後繼
+        path_count: Dict[str, int] = {}
+        for ticket_id in tight_successors:
+            predecessors = tight_predecessors.get(ticket_id)
+            path_count[ticket_id] = (
+                sum(path_count[pred] for pred in predecessors) if predecessors else 1
+            )
+        total = sum(
+            path_count[ticket_id]
+            for ticket_id, successors in tight_successors.items()
+            if not successors
+        )
 
-        # 從所有起點開始 DFS
+        # 列舉代表路徑：迭代式 DFS，stack 存 (節點, 尚未走訪的關鍵後繼)
+        start_nodes = sorted(
+            ticket_id for ticket_id in tight_successors if ticket_id not in tight_predecessors
+        )
+        paths: List[List[str]] = []
         for start in start_nodes:
-            dfs_find_longest(start, [start])
+            path = [start]
+            stack = [iter(tight_successors[start])]
+            while stack and len(paths) < max_paths:
+                if not tight_successors[path[-1]]:
+                    paths.append(path[:])
+                    stack.pop()
+                    path.pop()
+                    continue
+                succ = next(stack[-1], None)
+                if succ is None:
+                    stack.pop()
+                    path.pop()
+                    continue
+                path.append(succ)
+                stack.append(iter(tight_successors[succ]))
+            if len(paths) >= max_paths:
+                break
 
-        return longest_paths
+        return total, paths
 
     @staticmethod
     def get_critical_path_summary(result: CriticalPathResult) -> str:
@@ -505,7 +491,10 @@ class CriticalPathAnalyzer:
 
         # 若有多條關鍵路徑
         if len(result.all_critical_paths) > 1:
-            summary += f"\n備選關鍵路徑（共 {len(result.all_critical_paths)} 條）：\n"
+            total = max(result.critical_path_count, len(result.all_critical_paths))
+            listed = len(result.all_critical_paths)
+            suffix = f"，列出前 {listed} 條" if total > listed else ""
+            summary += f"\n備選關鍵路徑（共 {total} 條{suffix}）：\n"
             for i, path in enumerate(result.all_critical_paths[1:], start=2):
                 summary += f"  {i}. {' → '.join(path)}\n"
 
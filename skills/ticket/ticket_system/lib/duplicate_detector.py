@@ -4,6 +4,11 @@ Ticket 重複偵測模組
 從 commands/create.py 提取的 duplicate detection 群組。
 負責 Jaccard 相似度計算、Tier 1 警告層、Tier 2 阻擋層、
 以及 in_progress group 偵測。
+
+候選票改由 duplicate_token_index（每版本持久化的 title + what token 倒排
+索引）取得：只比對與新票共享 token、且 Jaccard 上界達閾值的票，不再對版本
+內每張票逐一計算相似度。bulk-create 以同一份索引檢查整批，批次內已處理的
+票經 add_pending 登記，後續 target 同時比對既有票與批次內前序票。
 """
 if __name__ == "__main__":
     from .messages import print_not_executable_and_exit
@@ -20,6 +25,10 @@ from ticket_system.lib.ticket_loader import (
     get_ticket_path,
     list_tickets,
 )
+from ticket_system.lib.duplicate_token_index import (
+    DuplicateTokenIndex,
+    get_duplicate_index,
+)
 from ticket_system.lib.constants import (
     STATUS_PENDING,
     STATUS_IN_PROGRESS,
@@ -155,11 +164,24 @@ def _get_status_label(status: str) -> str:
     return ""
 
 
+def _excluded_ids(new_ticket_id: str) -> set:
+    """比對時排除的 ID：自身，子任務另排除父任務。
+
+    只檢查序號段（最後一個 - 之後）是否含 "."。
+    """
+    exclude_ids = {new_ticket_id}
+    seq_part = new_ticket_id.rsplit("-", 1)[-1]
+    if "." in seq_part:
+        exclude_ids.add(new_ticket_id.rsplit(".", 1)[0])
+    return exclude_ids
+
+
 def detect_duplicate_tickets(
     version: str,
     new_title: str,
     new_what: str,
     new_ticket_id: str,
+    index: Optional[DuplicateTokenIndex] = None,
 ) -> None:
     """
     偵測並警告同版本中可能重複的 Ticket。
@@ -175,6 +197,7 @@ def detect_duplicate_tickets(
         new_title: 即將建立的 Ticket 標題
         new_what: 即將建立的 Ticket 目標描述
         new_ticket_id: 即將建立的 Ticket ID（用於排除自身）
+        index: 已載入的重複偵測索引（bulk-create 整批共用）；None 時載入版本索引
 
     Returns:
         None（不返回偵測結果，以簽名方式消費 WARNING）
@@ -186,17 +209,10 @@ def detect_duplicate_tickets(
         if not new_title and not new_what:
             return
 
-        # 步驟 B：載入同版本 Ticket 並過濾候選範圍
-        all_tickets = list_tickets(version)
-
-        # 計算需排除的 ID 清單
-        exclude_ids = {new_ticket_id}
-        # 若是子任務，額外排除父任務 ID
-        # 只檢查序號段（最後一個 - 之後）是否含 "."
-        seq_part = new_ticket_id.rsplit("-", 1)[-1]
-        if "." in seq_part:
-            parent_id = new_ticket_id.rsplit(".", 1)[0]
-            exclude_ids.add(parent_id)
+        # 步驟 B：由 token 索引取得共享 token 的候選並過濾範圍
+        if index is None:
+            index = get_duplicate_index(version)
+        new_combined = f"{new_title} {new_what}"
 
         # 計算時間窗口（迴圈外一次計算）
         window_start = datetime.now() - timedelta(
@@ -206,17 +222,19 @@ def detect_duplicate_tickets(
         # 過濾候選 Ticket：pending + in_progress + 7 天內 completed
         candidate_tickets = [
             ticket
-            for ticket in all_tickets
-            if ticket.get("id") not in exclude_ids
-            and _is_in_detection_scope(ticket, window_start)
+            for ticket in index.candidates(
+                new_combined,
+                DUPLICATE_DETECTION_THRESHOLD,
+                _excluded_ids(new_ticket_id),
+            )
+            if _is_in_detection_scope(ticket, window_start)
         ]
 
         # 若無候選 Ticket，靜默通過
         if not candidate_tickets:
             return
 
-        # 步驟 C：相似度計算
-        new_combined = f"{new_title} {new_what}"
+        # 步驟 C：相似度計算（索引已過濾上界，此處逐一確認）
         similar_tickets = []
 
         for ticket in candidate_tickets:
@@ -338,23 +356,16 @@ def _find_blocking_duplicate(
         if not new_title and not new_what:
             return None
 
-        all_tickets = list_tickets(version)
-
-        exclude_ids = {new_ticket_id}
-        seq_part = new_ticket_id.rsplit("-", 1)[-1]
-        if "." in seq_part:
-            parent_id = new_ticket_id.rsplit(".", 1)[0]
-            exclude_ids.add(parent_id)
-
         window_start = datetime.now() - timedelta(
             minutes=DUPLICATE_BLOCK_WINDOW_MINUTES
         )
         new_combined = f"{new_title} {new_what}"
+        candidates = get_duplicate_index(version).candidates(
+            new_combined, DUPLICATE_BLOCK_THRESHOLD, _excluded_ids(new_ticket_id)
+        )
 
-        for ticket in all_tickets:
+        for ticket in candidates:
             ticket_id = ticket.get("id", "")
-            if ticket_id in exclude_ids:
-                continue
             # 條件 1：僅 pending / in_progress
             if ticket.get("status") not in (STATUS_PENDING, STATUS_IN_PROGRESS):
                 continue
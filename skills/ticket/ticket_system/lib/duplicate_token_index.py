@@ -0,0 +1,331 @@
+"""
+重複偵測 token 倒排索引模組
+
+duplicate_detector 原本每次 `ticket create` 都 list_tickets(version) 後對版本內
+每張候選票計算 Jaccard 相似度；`ticket bulk-create` 每個 target 各付一次同樣
+成本。實際命中通常只有少數幾張，絕大多數候選與新票連一個 token 都不共享。
+
+本模組為每個版本維護 title + what 的 token 倒排索引（token → 票檔名）：
+- 持久化於 {tickets_dir}/.index/duplicate-tokens.json（與 ticket_index 同目錄，
+  內附 `*` 的 .gitignore）
+- 每個 Ticket 檔一筆 entry：(mtime_ns, size) 戳記 + 偵測範圍判定所需欄位
+  （id / title / what / status / completed_at）+ token 清單
+- refresh() 只做 stat 掃描，戳記不符或新增的檔案才經 load_ticket 重新載入，
+  已消失的檔案剔除；掃描順序與去重規則同 list_tickets
+- save_ticket 寫檔成功後呼叫 note_ticket_saved()，同 process 已載入的索引
+  直接以寫入內容更新該檔 entry
+- candidates() 只走訪與新票共享 token 的 posting，以共享 token 數直接算出
+  Jaccard 上界並過濾，回傳量與版本票數無關
+
+token 化規則與 duplicate_detector._calculate_jaccard_similarity 相同（小寫後
+中文逐字、英文 \\w+），索引只負責縮小候選集合：呼叫端仍以原相似度函式對
+候選逐一確認。
+"""
+# 防止直接執行此模組
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .constants import STATUS_PENDING
+from .id_parser import extract_core_ticket_id
+from .paths import get_tickets_dir
+
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# 索引目錄與檔名（相對 tickets_dir，與 ticket_index 共用 .index/）
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "duplicate-tokens.json"
+
+# 索引格式版本（欄位或編碼方式變動時遞增，舊索引自動整份失效）
+INDEX_FORMAT_VERSION = 1
+
+# 索引目錄自我忽略（同 ticket_index）
+INDEX_GITIGNORE_CONTENT = "*\n"
+
+# 與 duplicate_detector._tokenize 相同的分詞規則
+_TOKEN_PATTERN = re.compile(r"[一-鿿]|\w+")
+
+
+# ============================================================================
+# token 化
+# ============================================================================
+
+def combined_text(ticket: Dict[str, Any]) -> str:
+    """重複偵測比對用文字（title + what，缺欄位以空字串代替）"""
+    return f"{ticket.get('title', '')} {ticket.get('what', '')}"
+
+
+def tokenize(text: str) -> Set[str]:
+    """小寫後分詞（與 Jaccard 相似度計算一致）"""
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _entry_from_ticket(ticket: Dict[str, Any]) -> Dict[str, Any]:
+    """擷取偵測所需欄位；completed_at 僅保留字串（非字串值原本即判定為範圍外）"""
+    ticket_id = ticket.get("id")
+    completed_at = ticket.get("completed_at")
+    return {
+        "id": ticket_id if isinstance(ticket_id, str) else "",
+        "title": ticket.get("title", ""),
+        "what": ticket.get("what", ""),
+        "status": ticket.get("status", ""),
+        "completed_at": completed_at if isinstance(completed_at, str) else None,
+        "tokens": sorted(tokenize(combined_text(ticket))),
+    }
+
+
+def _entry_sort_key(name: str) -> Tuple[bool, str]:
+    """list_tickets 的掃描順序：.md 在前、.yaml 在後，各自依檔名排序"""
+    return (not name.endswith(".md"), name)
+
+
+# ============================================================================
+# 索引
+# ============================================================================
+
+class DuplicateTokenIndex:
+    """
+    單一版本 Tickets 目錄的 title + what token 倒排索引
+
+    使用方式：
+        index = get_duplicate_index(version)          # 已 refresh
+        for entry in index.candidates(text, threshold, exclude_ids):
+            ...  # entry 含 id / title / what / status / completed_at
+        index.add_pending(ticket_id, title, what)      # 批次內尚未落盤的票
+    """
+
+    def __init__(self, version: str, tickets_dir: Optional[Path]) -> None:
+        self.version = version
+        self.tickets_dir = tickets_dir
+        self.index_path = (
+            tickets_dir / INDEX_DIRNAME / INDEX_FILENAME if tickets_dir is not None else None
+        )
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._postings: Optional[Dict[str, Set[str]]] = None
+        self._order: Optional[List[str]] = None
+        self._dirty = False
+
+    @classmethod
+    def from_tickets(cls, tickets: Iterable[Dict[str, Any]]) -> "DuplicateTokenIndex":
+        """由已載入的 Ticket 清單建立記憶體索引（不落盤，保留清單順序）"""
+        index = cls("", None)
+        for position, ticket in enumerate(tickets):
+            index._entries[f"{position:08d}.md"] = _entry_from_ticket(ticket)
+        return index
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self.index_path is None:
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _stamp(stat: os.stat_result) -> Tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    def _set_entry(self, name: str, entry: Dict[str, Any]) -> None:
+        self._entries[name] = entry
+        self._postings = None
+        self._order = None
+        self._dirty = True
+
+    def refresh(self) -> "DuplicateTokenIndex":
+        """stat 掃描 Tickets 目錄，只重新載入戳記不符或新增的檔案"""
+        if self.tickets_dir is None:
+            return self
+        # 函式內 import：ticket_loader 於模組層匯入 parser，parser.save_ticket
+        # 又回呼本模組的 note_ticket_saved
+        from .parser import load_ticket
+
+        present: Set[str] = set()
+        for pattern in ("*.md", "*.yaml"):
+            for ticket_path in self.tickets_dir.glob(pattern):
+                core_id = extract_core_ticket_id(ticket_path.stem)
+                if core_id is None:
+                    continue
+                try:
+                    stat = ticket_path.stat()
+                except OSError:
+                    continue
+                name = ticket_path.name
+                present.add(name)
+                entry = self._entries.get(name)
+                if entry is not None and (entry.get("mtime_ns"), entry.get("size")) == self._stamp(stat):
+                    continue
+                ticket = load_ticket(self.version, core_id)
+                new_entry = _entry_from_ticket(ticket) if ticket else {"id": "", "tokens": [], "failed": True}
+                new_entry["core_id"] = core_id
+                new_entry["mtime_ns"], new_entry["size"] = self._stamp(stat)
+                self._set_entry(name, new_entry)
+
+        for name in set(self._entries) - present:
+            del self._entries[name]
+            self._postings = None
+            self._order = None
+            self._dirty = True
+        return self
+
+    def note_saved(self, ticket_path: Path, ticket: Dict[str, Any]) -> None:
+        """以剛寫入的內容更新該檔 entry（save_ticket 寫檔成功後呼叫）"""
+        if self.tickets_dir is None or ticket_path.parent != self.tickets_dir:
+            return
+        core_id = extract_core_ticket_id(ticket_path.stem)
+        if core_id is None or ticket_path.suffix not in (".md", ".yaml"):
+            return
+        try:
+            stat = ticket_path.stat()
+        except OSError:
+            return
+        entry = _entry_from_ticket(ticket)
+        entry["core_id"] = core_id
+        entry["mtime_ns"], entry["size"] = self._stamp(stat)
+        self._set_entry(ticket_path.name, entry)
+
+    def add_pending(self, ticket_id: str, title: str, what: str) -> None:
+        """
+        登記批次內尚未落盤的 pending 票（bulk-create 預演或寫檔前）
+
+        entry 無戳記：正式寫檔後由 note_saved 以同檔名覆寫；預演未落盤者於
+        下次 refresh() 因檔案不存在而剔除。
+        """
+        entry = _entry_from_ticket(
+            {"id": ticket_id, "title": title, "what": what, "status": STATUS_PENDING}
+        )
+        entry["core_id"] = ticket_id
+        self._set_entry(f"{ticket_id}.md", entry)
+
+    def _ordered_names(self) -> List[str]:
+        """list_tickets 順序，同核心 ID 只保留第一個成功載入的檔案"""
+        if self._order is None:
+            order: List[str] = []
+            loaded: Set[str] = set()
+            for name in sorted(self._entries, key=_entry_sort_key):
+                entry = self._entries[name]
+                core_id = entry.get("core_id")
+                if entry.get("failed") or (core_id is not None and core_id in loaded):
+                    continue
+                if core_id is not None:
+                    loaded.add(core_id)
+                order.append(name)
+            self._order = order
+        return self._order
+
+    def _posting_map(self) -> Dict[str, Set[str]]:
+        if self._postings is None:
+            postings: Dict[str, Set[str]] = {}
+            for name in self._ordered_names():
+                for token in self._entries[name].get("tokens", []):
+                    postings.setdefault(token, set()).add(name)
+            self._postings = postings
+        return self._postings
+
+    def candidates(
+        self, text: str, threshold: float, exclude_ids: Iterable[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        查詢與 text 的 token Jaccard 相似度可能 >= threshold 的 Ticket
+
+        只走訪 text 各 token 的 posting；以共享 token 數 o 與雙方 token 數
+        算出 o / (|A| + |B| - o) 過濾（threshold <= 0 時退化為全部共享至少
+        一個 token 者）。
+
+        Returns:
+            List[Dict]: 候選 entry（id / title / what / status / completed_at），
+                        依 list_tickets 順序
+        """
+        query = tokenize(text)
+        if not query:
+            return []
+        excluded = set(exclude_ids)
+        postings = self._posting_map()
+        shared: Counter = Counter()
+        for token in query:
+            shared.update(postings.get(token, ()))
+
+        order = {name: position for position, name in enumerate(self._ordered_names())}
+        hits: List[Tuple[int, Dict[str, Any]]] = []
+        for name, overlap in shared.items():
+            entry = self._entries[name]
+            if entry["id"] in excluded:
+                continue
+            union = len(query) + len(entry.get("tokens", [])) - overlap
+            if overlap / union < threshold:
+                continue
+            hits.append((order[name], entry))
+        hits.sort(key=lambda hit: hit[0])
+        return [entry for _, entry in hits]
+
+    def save(self) -> None:
+        """有變動時寫回索引；寫入失敗靜默略過（索引僅為加速）"""
+        if not self._dirty or self.index_path is None or not self.tickets_dir.is_dir():
+            return
+        index_dir = self.index_path.parent
+        tmp_path = index_dir / f"{INDEX_FILENAME}.{os.getpid()}.tmp"
+        try:
+            index_dir.mkdir(exist_ok=True)
+            gitignore = index_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text(INDEX_GITIGNORE_CONTENT, encoding="utf-8")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": INDEX_FORMAT_VERSION, "entries": self._entries},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._dirty = False
+
+
+# ============================================================================
+# process 層級快取
+# ============================================================================
+
+# tickets_dir（字串）→ 已載入的索引；save_ticket 透過 note_ticket_saved 回報
+_loaded_indexes: Dict[str, DuplicateTokenIndex] = {}
+
+
+def get_duplicate_index(version: str) -> DuplicateTokenIndex:
+    """取得（必要時建立）版本的重複偵測索引，refresh 後寫回再回傳"""
+    tickets_dir = get_tickets_dir(version)
+    key = str(tickets_dir)
+    index = _loaded_indexes.get(key)
+    if index is None:
+        index = _loaded_indexes[key] = DuplicateTokenIndex(version, tickets_dir)
+    index.refresh().save()
+    return index
+
+
+def note_ticket_saved(ticket_path: Path, ticket: Dict[str, Any]) -> None:
+    """save_ticket 寫檔成功後呼叫：更新同 process 已載入、涵蓋該檔的索引"""
+    for index in _loaded_indexes.values():
+        index.note_saved(ticket_path, ticket)
+
+
+def clear_duplicate_index_cache() -> None:
+    """清除 process 層級快取（測試用）"""
+    _loaded_indexes.clear()
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
@@ -20,6 +20,9 @@ commit 超出宣告範圍，主導缺漏是「宣告實作檔、漏宣告伴生
      Phase 4 五視角審查效能組實測 `PurePosixPath` 建構為熱路徑瓶頸
      （139 票 1.28s、cProfile 318,400 次呼叫佔 16.8s），改手動 tuple
      切分 + `lru_cache` 快取（見 `_path_parts`），139 票優化後 <300ms。
+  3. 配對改由路徑前綴 trie 產出（見 `PathPrefixTrie`）：所有寫入路徑插入
+     同一棵 trie，單次走訪即得全部互為前綴的路徑對，不再逐對 ticket、
+     逐對路徑呼叫 `files_intersect`；判定結果與兩兩比對逐筆相同。
 """
 
 from __future__ import annotations
@@ -27,8 +30,9 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from functools import lru_cache
+from itertools import chain, combinations
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -155,6 +159,109 @@ def files_intersect(path_a: str, path_b: str) -> bool:
     return parts_a[:n] == parts_b[:n]
 
 
+# ---------------------------------------------------------------------------
+# 路徑前綴 trie（一次走訪產出衝突路徑對）
+#
+# 兩兩比對是 O(T²·F²)：每對 ticket、每對擴張後路徑都呼叫一次
+# `files_intersect`。「互為前綴」的路徑在 trie 上必為同一條根→葉路徑上的
+# 祖先 / 子孫節點，因此把所有寫入路徑依路徑段插入 trie 後，單次 DFS 只需
+# 將每個節點的路徑與「走訪路徑上的祖先節點路徑」及同節點路徑配對，成本
+# 為 O(總路徑段數 + 命中對數)，不再隨 ticket 數平方成長。
+# 路徑段切分由呼叫端決定（本模組用 `_path_parts`，track parallel-check /
+# ParallelAnalyzer 沿用各自的 PurePosixPath 語意），trie 只處理段 tuple。
+# ---------------------------------------------------------------------------
+
+
+class _TrieNode:
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        # (登記序, owner, payload)
+        self.items: List[Tuple[int, Any, Any]] = []
+
+
+class PathPrefixTrie:
+    """路徑段前綴 trie。
+
+    `add(owner, parts, payload)` 登記一條路徑（owner 通常為 ticket 在輸入
+    清單中的索引，payload 為原始路徑字串或呼叫端需要的附帶資訊）；
+    `overlapping_pairs()` 產出所有 owner 不同、路徑互為前綴（相等或一方為
+    另一方上層目錄）的 `((owner, payload), (owner, payload))` 配對，每對
+    恰好一次，祖先節點的項目在前、同節點依登記順序。
+
+    空 tuple（如空字串切分結果）落在根節點，對所有路徑皆為前綴——需要
+    「空路徑只與空路徑相交」語意的呼叫端（`files_intersect`）須自行分流。
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._count = 0
+
+    def add(self, owner: Any, parts: Sequence[str], payload: Any) -> None:
+        node = self._root
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _TrieNode()
+            node = child
+        node.items.append((self._count, owner, payload))
+        self._count += 1
+
+    def overlapping_pairs(
+        self, shared_depth: Optional[int] = None
+    ) -> Iterator[Tuple[Tuple[Any, Any], Tuple[Any, Any]]]:
+        """產出衝突路徑對。
+
+        Args:
+            shared_depth: 非 None 時，另將「前 shared_depth 段相同」的路徑
+                視為衝突（track parallel-check 的同模組弱衝突）。該深度的
+                子樹內任兩路徑皆衝突，子樹內每個 owner 只取最先登記的一項
+                參與配對——每個 owner 對仍至少產出一次，且保留登記順序最前
+                的配對（呼叫端依此取「第一個衝突路徑」描述）。
+        """
+        stack: List[Tuple[_TrieNode, int, List[Tuple[int, Any, Any]]]] = [(self._root, 0, [])]
+        while stack:
+            node, depth, ancestors = stack.pop()
+            if shared_depth is not None and depth == shared_depth:
+                yield from _pairs_with(ancestors, _first_item_per_owner(node))
+                continue
+            yield from _pairs_with(ancestors, node.items)
+            if node.items:
+                ancestors = ancestors + node.items
+            for child in node.children.values():
+                stack.append((child, depth + 1, ancestors))
+
+
+def _first_item_per_owner(node: _TrieNode) -> List[Tuple[int, Any, Any]]:
+    """子樹內每個 owner 登記序最小的一項（依登記序排列）。"""
+    first: Dict[Any, Tuple[int, Any, Any]] = {}
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for item in current.items:
+            kept = first.get(item[1])
+            if kept is None or item[0] < kept[0]:
+                first[item[1]] = item
+        stack.extend(current.children.values())
+    return sorted(first.values())
+
+
+def _pairs_with(
+    ancestors: List[Tuple[int, Any, Any]], items: List[Tuple[int, Any, Any]]
+) -> Iterator[Tuple[Tuple[Any, Any], Tuple[Any, Any]]]:
+    """祖先 × 本層、本層兩兩（略過同 owner）。"""
+    for index, (_, owner, payload) in enumerate(items):
+        for _, other_owner, other_payload in ancestors:
+            if other_owner != owner:
+                yield (other_owner, other_payload), (owner, payload)
+        for _, other_owner, other_payload in items[index + 1:]:
+            if other_owner != owner:
+                yield (owner, payload), (other_owner, other_payload)
+
+
 def find_nearest_tests_dir(file_path: str, project_root: Path) -> Optional[PurePosixPath]:
     """向上尋找最近的實際存在之 `tests/` 兄弟目錄（掃描真實檔案系統）。
 
@@ -264,29 +371,41 @@ def compute_pairwise_conflicts(
             continue
         entries.append((tid, declared, expand_files(declared, project_root)))
 
+    # 所有寫入路徑登記到同一棵 trie（owner = entries 索引），一次走訪取得
+    # 全部互為前綴的路徑對；空段路徑只與空段路徑相交（見 files_intersect），
+    # 不進 trie（否則落在根節點會與所有路徑配對）
+    trie = PathPrefixTrie()
+    empty_paths: List[Tuple[int, str]] = []
+    for index, (_, _, expanded) in enumerate(entries):
+        for f in expanded:
+            if _path_parts(f):
+                trie.add(index, _path_parts(f), f)
+            else:
+                empty_paths.append((index, f))
+    hits: Iterable[Tuple[Tuple[int, str], Tuple[int, str]]] = trie.overlapping_pairs()
+    if len(empty_paths) > 1:
+        hits = chain(hits, combinations(empty_paths, 2))
+
+    matched: Dict[Tuple[int, int], Set[str]] = {}
+    strong: Set[Tuple[int, int]] = set()
+    declared_sets = [set(declared) for _, declared, _ in entries]
+    for first, second in hits:
+        if first[0] == second[0]:
+            continue
+        # 配對方向依輸入順序（索引小者為 a），與原兩兩比對迴圈一致
+        (i, fa), (j, fb) = sorted((first, second), key=lambda item: item[0])
+        matched.setdefault((i, j), set()).add(fa if fa == fb else f"{fa} ~ {fb}")
+        if fa in declared_sets[i] and fb in declared_sets[j]:
+            strong.add((i, j))
+
     conflicts: List[Dict[str, Any]] = []
-    for i in range(len(entries)):
-        for j in range(i + 1, len(entries)):
-            id_a, declared_a, expanded_a = entries[i]
-            id_b, declared_b, expanded_b = entries[j]
-            matched_pairs: List[Tuple[str, str]] = []
-            heuristic_only = True
-            for fa in expanded_a:
-                for fb in expanded_b:
-                    if files_intersect(fa, fb):
-                        matched_pairs.append((fa, fb))
-                        if fa in declared_a and fb in declared_b:
-                            heuristic_only = False
-            if matched_pairs:
-                matched_display = sorted({
-                    fa if fa == fb else f"{fa} ~ {fb}" for fa, fb in matched_pairs
-                })
-                conflicts.append({
-                    "ticket_a": id_a,
-                    "ticket_b": id_b,
-                    "matched_files": matched_display,
-                    "heuristic_only": heuristic_only,
-                })
+    for (i, j), display in matched.items():
+        conflicts.append({
+            "ticket_a": entries[i][0],
+            "ticket_b": entries[j][0],
+            "matched_files": sorted(display),
+            "heuristic_only": (i, j) not in strong,
+        })
     conflicts.sort(key=lambda c: (c["ticket_a"], c["ticket_b"]))
     return conflicts
 
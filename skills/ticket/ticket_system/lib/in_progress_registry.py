@@ -0,0 +1,299 @@
+"""
+in_progress 票登錄檔模組
+
+hook 熱路徑（process-skip-guard 等）透過 `.claude/lib/hook_ticket.
+find_active_in_progress_ticket` 找「目前進行中的票」，原本每次都 glob
+`docs/work-logs/v*/**/tickets/*.md`、逐檔 stat 依 mtime 排序，再逐一解析
+frontmatter 直到遇到 in_progress。本模組由 ticket CLI 維護一份小型登錄檔，
+hook 端只需 stat 登錄的目錄與 in_progress 票檔（與票檔總數無關）：
+
+    {work_logs_root}/.index/in-progress.json（內附 `*` 的 .gitignore）
+    {
+      "version": 3,
+      "dirs": {                                      # 相對 work_logs_root
+        ".": [<mtime_ns>, <.md 檔數>],
+        "v0.1.0": [<mtime_ns>, <.md 檔數>],
+        "v0.1.0/tickets": [<mtime_ns>, <.md 檔數>]
+      },
+      "tickets": {
+        "<ticket_id>": {
+          "path": "v0.1.0/tickets/<ticket_id>.md",   # 相對 work_logs_root
+          "session": "<CLAUDE_CODE_SESSION_ID 或 null>",
+          "since": "<轉入 in_progress 的 UTC 時間或 null>",
+          "mtime_ns": <最後一次 CLI 寫入後的檔案 mtime>
+        }
+      }
+    }
+
+維護時機：save_ticket / ticket_write_batch 落盤後（parser.note_ticket_written）
+呼叫 note_ticket_saved，claim / release / complete 以及其他改寫狀態的命令
+一律經此更新；狀態為 in_progress 即登錄，否則移除。session 只在票轉入
+in_progress 時記錄（認領者），其後他人寫入同一張票不改歸屬。
+
+一致性：更新在登錄檔專用 file_lock 內 read-modify-write，以暫存檔 +
+os.replace 原子替換；登錄檔不存在或格式不符時整份重掃重建。
+
+dirs 記錄 work_logs_root 與 v* 之下全部目錄（排除 archive / backup）的
+mtime_ns。新增、刪除、改名票檔（git pull / checkout、編輯器以改名方式
+存檔）或新建目錄都會改變所在目錄的 mtime；hook 端逐一 stat 這些目錄
+（數量為目錄數，與票檔數無關），任一不符即回退全掃描，登錄檔（含空
+登錄）僅在 dirs 相符時採信。.md 檔數只供 CLI 端判斷：寫入時若 dirs 的
+變化超出本次寫入所能解釋的範圍（見 _explained_by_own_write），整份重掃。
+
+已知限制：就地覆寫既有票檔（不經改名）的手動編輯不改變目錄 mtime；已登錄
+的 in_progress 票另以檔案 mtime 驗證。
+"""
+# 防止直接執行此模組
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ticket_system.lib.constants import STATUS_IN_PROGRESS
+
+
+# ============================================================================
+# 常數定義（與 .claude/lib/hook_ticket.py 的讀取端一致）
+# ============================================================================
+
+# 登錄檔目錄與檔名（相對 work_logs_root，同 commit_activity_index）
+INDEX_DIRNAME = ".index"
+REGISTRY_FILENAME = "in-progress.json"
+
+# 格式版本（欄位變動時遞增，讀取端版本不符即回退全掃描）
+REGISTRY_FORMAT_VERSION = 3
+
+# 索引目錄自我忽略（同 ticket_index）
+INDEX_GITIGNORE_CONTENT = "*\n"
+
+# work-logs 根目錄（docs/work-logs）
+WORK_LOGS_DIRNAME = "work-logs"
+DOCS_DIRNAME = "docs"
+
+# 票檔範圍與排除片段（同 hook_ticket.find_active_in_progress_ticket 的掃描）
+TICKET_GLOB = "v*/**/tickets/*.md"
+EXCLUDED_PATH_SEGMENTS = ("archive", "archived", "backup", "backups")
+
+# 與 .claude/lib/hook_logging.py 的 ENV_SESSION_ID 一致
+ENV_SESSION_ID = "CLAUDE_CODE_SESSION_ID"
+
+
+def work_logs_root_for(ticket_path: Path) -> Optional[Path]:
+    """票檔所屬的 docs/work-logs 目錄；不在其下（如測試暫存檔）回傳 None"""
+    for parent in Path(ticket_path).parents:
+        if parent.name == WORK_LOGS_DIRNAME and parent.parent.name == DOCS_DIRNAME:
+            return parent
+    return None
+
+
+def registry_path(work_logs_root: Path) -> Path:
+    return Path(work_logs_root) / INDEX_DIRNAME / REGISTRY_FILENAME
+
+
+def _is_excluded(relative: Path) -> bool:
+    return any(part.lower() in EXCLUDED_PATH_SEGMENTS for part in relative.parts)
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def directory_stamps(work_logs_root: Path) -> Dict[str, List[int]]:
+    """work_logs_root 與 v* 之下各目錄的 [mtime_ns, .md 檔數]（排除 archive / backup）
+
+    hook 端（.claude/lib/hook_ticket._registry_dirs_match）只比對 mtime_ns。
+    """
+    root = Path(work_logs_root)
+    stamps: Dict[str, List[int]] = {".": [_mtime_ns(root) or 0, 0]}
+    try:
+        tops = sorted(p for p in root.iterdir() if p.name.startswith("v") and p.is_dir())
+    except OSError:
+        return stamps
+    for top in tops:
+        if _is_excluded(Path(top.name)):
+            continue
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d.lower() not in EXCLUDED_PATH_SEGMENTS]
+            directory = Path(dirpath)
+            stamps[directory.relative_to(root).as_posix()] = [
+                _mtime_ns(directory) or 0,
+                sum(1 for name in filenames if name.endswith(".md")),
+            ]
+    return stamps
+
+
+def _explained_by_own_write(previous: Any, current: Dict[str, List[int]], relative: Path) -> bool:
+    """dirs 由 previous 變為 current 是否僅來自本次對 relative 的寫入
+
+    本次寫入只可能改變所在目錄的 mtime（新建或原子替換）並使其 .md 檔數
+    加一；所在目錄為新建時，其上層目錄一併改變。其餘目錄必須完全不變。
+    """
+    if not isinstance(previous, dict):
+        return False
+    own_dir = relative.parent.as_posix()
+    allowed = {own_dir}
+    before = previous.get(own_dir)
+    if before is None:
+        allowed.update(parent.as_posix() for parent in relative.parent.parents)
+    elif not isinstance(before, list) or current.get(own_dir, [0, -1])[1] - before[1] not in (0, 1):
+        return False
+    return all(
+        previous.get(key) == current.get(key)
+        for key in (set(previous) | set(current)) - allowed
+    )
+
+
+def _load(path: Path) -> Optional[Tuple[Dict[str, Dict[str, Any]], Any]]:
+    """回傳 (tickets, dirs)；不存在或格式不符時為 None"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != REGISTRY_FORMAT_VERSION
+        or not isinstance(data.get("tickets"), dict)
+    ):
+        return None
+    return data["tickets"], data.get("dirs")
+
+
+def _save(
+    path: Path, tickets: Dict[str, Dict[str, Any]], dirs: Dict[str, List[int]]
+) -> None:
+    index_dir = path.parent
+    tmp_path = index_dir / f"{REGISTRY_FILENAME}.{os.getpid()}.tmp"
+    index_dir.mkdir(exist_ok=True)
+    gitignore = index_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text(INDEX_GITIGNORE_CONTENT, encoding="utf-8")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": REGISTRY_FORMAT_VERSION,
+                    "dirs": dirs,
+                    "tickets": tickets,
+                },
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def scan_in_progress(work_logs_root: Path) -> Dict[str, Dict[str, Any]]:
+    """整份重掃：work_logs_root 下全部 in_progress 票（session / since 未知）"""
+    from ticket_system.lib.parser import YAMLParseError, parse_frontmatter
+
+    root = Path(work_logs_root)
+    tickets: Dict[str, Dict[str, Any]] = {}
+    for path in root.glob(TICKET_GLOB):
+        relative = path.relative_to(root)
+        if _is_excluded(relative):
+            continue
+        try:
+            frontmatter, _body = parse_frontmatter(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, YAMLParseError):
+            continue
+        ticket_id = frontmatter.get("id") if isinstance(frontmatter, dict) else None
+        if not ticket_id or frontmatter.get("status") != STATUS_IN_PROGRESS:
+            continue
+        tickets[str(ticket_id)] = {
+            "path": relative.as_posix(),
+            "session": None,
+            "since": None,
+            "mtime_ns": _mtime_ns(path),
+        }
+    return tickets
+
+
+def _apply(
+    tickets: Dict[str, Dict[str, Any]],
+    ticket_id: str,
+    status: Any,
+    relative: str,
+    mtime_ns: Optional[int],
+) -> bool:
+    """依票面狀態更新登錄內容；回傳是否有變動"""
+    current = tickets.get(ticket_id)
+    if status != STATUS_IN_PROGRESS:
+        return tickets.pop(ticket_id, None) is not None
+    if current is None:
+        session = os.environ.get(ENV_SESSION_ID, "").strip() or None
+        tickets[ticket_id] = {
+            "path": relative,
+            "session": session,
+            "since": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "mtime_ns": mtime_ns,
+        }
+        return True
+    updated = dict(current, path=relative, mtime_ns=mtime_ns)
+    if updated == current:
+        return False
+    tickets[ticket_id] = updated
+    return True
+
+
+def note_ticket_saved(ticket_path: Path, ticket: Dict[str, Any]) -> None:
+    """
+    票檔落盤後呼叫：依票面 status 登錄或移除該票
+
+    票檔不在 docs/work-logs 之下、或位於 archive / backup 時略過。登錄檔
+    不存在 / 損毀，或上次登錄後有 CLI 以外的改動（dirs 變化無法由本次寫入
+    解釋）時以整份重掃重建（重掃結果已含本票當下狀態）。寫入失敗
+    靜默略過（hook 端會回退全掃描）。
+    """
+    ticket_id = ticket.get("id")
+    root = work_logs_root_for(ticket_path)
+    if not ticket_id or root is None:
+        return
+    try:
+        relative = Path(ticket_path).resolve().relative_to(root.resolve())
+    except (OSError, ValueError):
+        return
+    if _is_excluded(relative):
+        return
+
+    from ticket_system.lib.file_lock import file_lock
+
+    path = registry_path(root)
+    try:
+        with file_lock(path):
+            # file_lock 已建立 .index（其建立會改變根目錄 mtime），之後才取 dirs
+            dirs = directory_stamps(root)
+            loaded = _load(path)
+            if loaded is None:
+                _save(path, scan_in_progress(root), dirs)
+                return
+            tickets, previous = loaded
+            if not _explained_by_own_write(previous, dirs, relative):
+                _save(path, scan_in_progress(root), dirs)
+                return
+            changed = _apply(
+                tickets,
+                str(ticket_id),
+                ticket.get("status"),
+                relative.as_posix(),
+                _mtime_ns(Path(ticket_path)),
+            )
+            if changed or dirs != previous:
+                _save(path, tickets, dirs)
+    except OSError:
+        return
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+from .file_conflict import PathPrefixTrie
+
 
 @dataclass
 class ParallelAnalysisResult:
@@ -331,11 +333,12 @@ class ParallelAnalyzer:
         比較所有任務對的檔案集合，找出有重疊的任務。
 
         演算法:
-        1. 取得所有 task_id
-        2. 比較每一對任務
-        3. 對於每對任務的檔案集合，檢查是否有路徑重疊
-        4. 若有重疊，記錄衝突對
-        5. 使用索引避免重複比較
+        1. 非 glob 路徑依路徑段插入前綴 trie（PathPrefixTrie），一次走訪
+           取得所有「相同或互為父子目錄」的任務對，不再逐對任務、逐對
+           檔案呼叫 _paths_overlap
+        2. 含 * / ? 的 glob 路徑無法以前綴表示，改與其他任務的每個路徑
+           逐一以 _paths_overlap 判定（glob 通常只佔少數）
+        3. 衝突對依 file_map 鍵順序定向並排序，與逐對比較的輸出一致
 
         Args:
             file_map: task_id → 檔案集合的映射
@@ -356,32 +359,37 @@ class ParallelAnalyzer:
             >>> ("001", "002") in conflicts
             False
         """
-        conflicts: List[tuple] = []
         task_ids = list(file_map.keys())
-
-        # 比較所有任務對（避免重複）
-        for i in range(len(task_ids)):
-            for j in range(i + 1, len(task_ids)):
-                task_a = task_ids[i]
-                task_b = task_ids[j]
-
-                files_a = file_map[task_a]
-                files_b = file_map[task_b]
-
-                # 檢查任務 A 和任務 B 的檔案是否有重疊
-                has_overlap = False
-                for file_a in files_a:
-                    for file_b in files_b:
-                        if ParallelAnalyzer._paths_overlap(file_a, file_b):
-                            has_overlap = True
-                            break
-                    if has_overlap:
-                        break
-
-                # 若有重疊，記錄衝突
-                if has_overlap:
-                    conflicts.append((task_a, task_b))
-
+        trie = PathPrefixTrie()
+        globs: List[tuple] = []
+        for index, task_id in enumerate(task_ids):
+            for file_path in file_map[task_id]:
+                normalized = file_path.replace("\\", "/").rstrip("/")
+                if "*" in normalized or "?" in normalized:
+                    globs.append((index, file_path))
+                else:
+                    trie.add(index, Path(normalized).parts, file_path)
+
+        conflict_indexes: Set[tuple] = set()
+        for (index_a, _), (index_b, _) in trie.overlapping_pairs():
+            conflict_indexes.add((min(index_a, index_b), max(index_a, index_b)))
+
+        for glob_index, pattern in globs:
+            for index, task_id in enumerate(task_ids):
+                if index == glob_index:
+                    continue
+                pair = (min(index, glob_index), max(index, glob_index))
+                if pair in conflict_indexes:
+                    continue
+                if any(
+                    ParallelAnalyzer._paths_overlap(pattern, file_path)
+                    for file_path in file_map[task_id]
+                ):
+                    conflict_indexes.add(pair)
+
+        conflicts: List[tuple] = [
+            (task_ids[i], task_ids[j]) for i, j in sorted(conflict_indexes)
+        ]
         return conflicts
 
     @staticmethod
@@ -8,13 +8,17 @@ import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from ticket_system import constants as _enum_constants
+from .claude_lib_loader import load_claude_lib_file
 from .paths import get_ticket_path
 
+if TYPE_CHECKING:
+    from .ticket_index import TicketIndex
+
 
 # ============================================================================
 # 自訂異常
@@ -66,6 +70,42 @@ def _format_violation(field, old, new, valid, kind) -> str:
 _ticket_cache: Dict[str, Optional[Dict[str, Any]]] = {}
 
 
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def ticket_cache_stamps() -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    快取中各檔案目前的 (mtime_ns, size)
+
+    長駐 session（ticket shell / batch）於每個命令結束後記錄，下個命令
+    開始前交給 evict_changed_tickets() 比對，剔除期間被其他 process 改寫的項目。
+    """
+    return {key: _file_stamp(key) for key in _ticket_cache}
+
+
+def evict_changed_tickets(stamps: Dict[str, Optional[Tuple[int, int]]]) -> int:
+    """
+    剔除檔案自 stamps 記錄後已變動或消失的快取項目
+
+    未出現在 stamps 的快取項目（記錄之後才載入者）一併剔除，不冒險沿用。
+
+    Returns:
+        int: 剔除的項目數
+    """
+    stale = [
+        key for key in _ticket_cache
+        if key not in stamps or _file_stamp(key) != stamps[key]
+    ]
+    for key in stale:
+        del _ticket_cache[key]
+    return len(stale)
+
+
 # 特殊欄位常數
 SPECIAL_FIELDS = ["chain", "decision_tree_path", "created"]
 
@@ -76,6 +116,9 @@ SPECIAL_FIELDS = ["chain", "decision_tree_path", "created"]
 # 的 --- 子字串不受影響。
 _FRONTMATTER_BOUNDARY_RE = re.compile(r"^---[ \t]*(?:\r\n|\n|\Z)", re.MULTILINE)
 
+# Markdown body 欄位名（_ 前綴：僅存在於記憶體 dict，save 時剝除不序列化）
+BODY_FIELD = "_body"
+
 # 枚舉閘載入時快照欄位名（_ 前綴：僅存在於記憶體 dict，save 時剝除不序列化）
 ENUM_SNAPSHOT_FIELD = "_loaded_enum_snapshot"
 
@@ -207,6 +250,11 @@ def _enforce_enum_gate(
         raise EnumGateViolation(violations)
 
 
+def _same_stamp(before, after) -> bool:
+    """兩次 stat 的 mtime_ns / size 是否一致（讀檔期間未被改寫）"""
+    return (before.st_mtime_ns, before.st_size) == (after.st_mtime_ns, after.st_size)
+
+
 def _backup_special_fields(existing_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     備份現有 Ticket 的特殊欄位
@@ -264,6 +312,36 @@ def _restore_special_fields(
     return result
 
 
+def _split_frontmatter(content: str) -> Optional[Tuple[str, int]]:
+    """
+    定位 frontmatter 邊界
+
+    Args:
+        content: 完整檔案內容
+
+    Returns:
+        Optional[Tuple[str, int]]: (frontmatter YAML 文字, body 起始位置)；
+                                   內容不以 --- 開頭或找不到結尾邊界線時返回 None
+    """
+    # Guard Clause 1：內容不以 --- 開頭 → 無 frontmatter
+    if not content.startswith("---"):
+        return None
+
+    # 找開頭邊界線（必須從檔案第一行開始）
+    start_match = _FRONTMATTER_BOUNDARY_RE.match(content)
+    if start_match is None:
+        return None
+
+    # 找結尾邊界線（開頭邊界線之後第一條獨占一行的 ---）
+    end_match = _FRONTMATTER_BOUNDARY_RE.search(content, start_match.end())
+
+    # Guard Clause 2：找不到結尾邊界線 → 格式錯誤
+    if end_match is None:
+        return None
+
+    return content[start_match.end():end_match.start()], end_match.end()
+
+
 def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     """
     解析 Markdown frontmatter
@@ -298,35 +376,290 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
         >>> parse_frontmatter('No frontmatter')
         ({}, 'No frontmatter')
     """
-    # Guard Clause 1：內容不以 --- 開頭 → 無 frontmatter
-    if not content.startswith("---"):
-        return {}, content
+    bounds = _split_frontmatter(content)
 
-    # 找開頭邊界線（必須從檔案第一行開始）
-    start_match = _FRONTMATTER_BOUNDARY_RE.match(content)
-    if start_match is None:
+    # Guard Clause：無 frontmatter 或找不到結尾邊界線
+    if bounds is None:
         return {}, content
 
-    # 找結尾邊界線（開頭邊界線之後第一條獨占一行的 ---）
-    end_match = _FRONTMATTER_BOUNDARY_RE.search(content, start_match.end())
+    yaml_text, body_offset = bounds
+    return _load_frontmatter_yaml(yaml_text), content[body_offset:].strip()
 
-    # Guard Clause 2：找不到結尾邊界線 → 格式錯誤
-    if end_match is None:
-        return {}, content
 
+# .claude/lib/yaml_frontmatter 共用解析服務（首次使用時載入；None 表示不可用）
+_UNRESOLVED = object()
+_frontmatter_service: Any = _UNRESOLVED
+
+
+def _yaml_safe_load(yaml_text: str) -> Any:
+    """
+    frontmatter YAML 解析入口
+
+    優先使用 .claude/lib/yaml_frontmatter.load_yaml（扁平快速路徑 + libyaml
+    C 載入器，結果與 yaml.safe_load 相同）；服務不可用時退回 yaml.safe_load。
+    """
+    global _frontmatter_service
+    if _frontmatter_service is _UNRESOLVED:
+        try:
+            _frontmatter_service = load_claude_lib_file("yaml_frontmatter")
+        except Exception:
+            _frontmatter_service = None
+    if _frontmatter_service is None:
+        return yaml.safe_load(yaml_text)
+    return _frontmatter_service.load_yaml(yaml_text)
+
+
+def _load_frontmatter_yaml(yaml_text: str) -> Dict[str, Any]:
+    """
+    解析 frontmatter YAML 文字
+
+    Raises:
+        YAMLParseError: YAML 解析失敗時丟出
+    """
     try:
-        yaml_text = content[start_match.end():end_match.start()]
-        body = content[end_match.end():].strip()
-        frontmatter = yaml.safe_load(yaml_text)
-        # 如果 YAML 解析為 None，返回空字典，否則返回解析結果
-        return frontmatter or {}, body
+        frontmatter = _yaml_safe_load(yaml_text)
     except yaml.YAMLError as e:
         # YAML 解析失敗時，丟出 YAMLParseError 傳遞錯誤訊息
         error_msg = str(e).strip()
         raise YAMLParseError(error_msg)
+    # 如果 YAML 解析為 None，返回空字典，否則返回解析結果
+    return frontmatter or {}
 
 
-def load_ticket(version: str, ticket_id: str) -> Optional[Dict[str, Any]]:
+def _read_frontmatter_prefix(ticket_path: Path) -> Optional[Tuple[str, int]]:
+    """
+    逐行讀取檔案開頭，讀到結尾邊界線即停止（不讀取 body）
+
+    邊界判定與 _split_frontmatter 相同（逐行套用 _FRONTMATTER_BOUNDARY_RE）；
+    以文字模式逐行累計字元數，body 起始位置與整檔 read() 後的索引一致。
+
+    Returns:
+        Optional[Tuple[str, int]]: (frontmatter YAML 文字, body 起始位置)；
+                                   無 frontmatter 或找不到結尾邊界線時返回 None
+
+    Raises:
+        OSError: 讀取失敗
+    """
+    lines: List[str] = []
+    offset = 0
+    with open(ticket_path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f):
+            offset += len(line)
+            if _FRONTMATTER_BOUNDARY_RE.match(line):
+                if line_no == 0:
+                    continue
+                return "".join(lines), offset
+            if line_no == 0:
+                # 第一行不是邊界線 → 無 frontmatter
+                return None
+            lines.append(line)
+    return None
+
+
+def _read_body(ticket_path: Path) -> str:
+    """讀取 Ticket body（LazyTicket 首次存取 _body 時呼叫）；檔案已不存在時返回空字串"""
+    try:
+        with open(ticket_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (IOError, OSError):
+        return ""
+    bounds = _split_frontmatter(content)
+    return content[bounds[1]:].strip() if bounds else ""
+
+
+class LazyTicket(dict):
+    """
+    延遲載入 body 的 Ticket 記錄
+
+    載入時只解析 frontmatter；_body 於首次存取時才讀檔。list / board /
+    runqueue 等整版本掃描從不讀 body，省下大型 Ticket（長 Execution Log）
+    的 I/O 與常駐記憶體。
+
+    對外維持一般 dict 介面：
+    - 以鍵存取 _body（[] / get / in / pop / setdefault / del）觸發載入
+    - 整體檢視（迭代、items、values、keys、copy、==、repr、|）先載入再委派，
+      dict(ticket)、yaml.dump、json.dumps 皆得到含 _body 的完整內容
+    - len() / bool() 計入尚未載入的 _body，不觸發讀檔
+    - 未載入前先行指定 _body 時，以指定值為準，不再讀檔
+
+    body 於存取當下讀取檔案目前內容（與 save_ticket 寫回最新 body 的語意一致）。
+    """
+
+    def __init__(self, frontmatter: Dict[str, Any], ticket_path: Optional[Path] = None) -> None:
+        super().__init__(frontmatter)
+        self._pending_body_path = ticket_path
+
+    def _body_pending(self) -> bool:
+        return (
+            getattr(self, "_pending_body_path", None) is not None
+            and not dict.__contains__(self, BODY_FIELD)
+        )
+
+    def _materialize(self) -> None:
+        if self._body_pending():
+            dict.__setitem__(self, BODY_FIELD, _read_body(self._pending_body_path))
+        self._pending_body_path = None
+
+    # ----- 以鍵存取 -----
+
+    def __missing__(self, key: Any) -> Any:
+        if key == BODY_FIELD and self._body_pending():
+            self._materialize()
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key == BODY_FIELD:
+            self._materialize()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or (key == BODY_FIELD and self._body_pending())
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key == BODY_FIELD:
+            self._materialize()
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key == BODY_FIELD:
+            self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def __delitem__(self, key: Any) -> None:
+        if key == BODY_FIELD:
+            self._materialize()
+        dict.__delitem__(self, key)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + (1 if self._body_pending() else 0)
+
+    # ----- 整體檢視 -----
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def copy(self) -> Dict[str, Any]:
+        self._materialize()
+        return dict(dict.items(self))
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        if isinstance(other, LazyTicket):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Any) -> Any:
+        return self.copy() | other
+
+    def __ror__(self, other: Any) -> Any:
+        self._materialize()
+        return other | dict(dict.items(self))
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return dict.__repr__(self)
+
+
+def _represent_lazy_ticket(dumper: yaml.BaseDumper, data: LazyTicket) -> yaml.Node:
+    return dumper.represent_dict(data)
+
+
+# yaml.dump 依型別精確比對 representer：子類別須明確註冊，否則預設 Dumper
+# 會輸出 !!python/object 標籤、SafeDumper 直接拒絕
+yaml.add_representer(LazyTicket, _represent_lazy_ticket)
+yaml.add_representer(LazyTicket, _represent_lazy_ticket, Dumper=yaml.SafeDumper)
+if hasattr(yaml, "CSafeDumper"):
+    yaml.add_representer(LazyTicket, _represent_lazy_ticket, Dumper=yaml.CDumper)
+    yaml.add_representer(LazyTicket, _represent_lazy_ticket, Dumper=yaml.CSafeDumper)
+
+
+def _load_markdown_ticket(
+    ticket_id: str, ticket_path: Path, index: Optional["TicketIndex"]
+) -> Optional[Dict[str, Any]]:
+    """
+    載入 Markdown Ticket（frontmatter 前綴讀取 / 索引命中，body 延遲載入）
+
+    Returns:
+        Optional[Dict]: LazyTicket；YAML 解析失敗時為含 _yaml_error 的字典；
+                       無 frontmatter 或讀取失敗時返回 None
+    """
+    try:
+        stat = ticket_path.stat()
+    except OSError:
+        return None
+
+    # 索引命中：frontmatter 取自持久化索引，完全不需讀檔
+    indexed = index.lookup(ticket_path, stat) if index is not None else None
+    if indexed is not None:
+        frontmatter = indexed[0]
+    else:
+        try:
+            bounds = _read_frontmatter_prefix(ticket_path)
+        except (IOError, OSError):
+            return None
+
+        # Guard Clause：無 frontmatter 或找不到結尾邊界線
+        if bounds is None:
+            return None
+
+        yaml_text, body_offset = bounds
+        try:
+            frontmatter = _load_frontmatter_yaml(yaml_text)
+        except YAMLParseError as e:
+            # 若 YAML 解析失敗，返回包含錯誤訊息的字典
+            return {
+                "id": ticket_id,
+                "_path": str(ticket_path),
+                "_yaml_error": e.message
+            }
+
+        # Guard Clause：frontmatter 為空（無 frontmatter）或非映射
+        if not frontmatter or not isinstance(frontmatter, dict):
+            return None
+
+        # 記錄索引（須在附加執行期欄位之前；讀取期間檔案被改寫則不記錄）
+        if index is not None:
+            try:
+                if _same_stamp(stat, ticket_path.stat()):
+                    index.record(ticket_path, stat, frontmatter, body_offset)
+            except OSError:
+                pass
+
+    ticket = LazyTicket(frontmatter, ticket_path)
+    # 附加元資料：檔案路徑（_body 延遲載入）
+    ticket["_path"] = str(ticket_path)
+    # 枚舉閘載入時快照（save 時 changed-fields-only 比對基準）
+    ticket[ENUM_SNAPSHOT_FIELD] = _snapshot_enum_fields(ticket)
+    return ticket
+
+
+def load_ticket(
+    version: str, ticket_id: str, index: Optional["TicketIndex"] = None
+) -> Optional[Dict[str, Any]]:
     """
     載入 Ticket 資料
 
@@ -337,20 +670,25 @@ def load_ticket(version: str, ticket_id: str) -> Optional[Dict[str, Any]]:
     - _yaml_error: 若有 YAML 解析錯誤，包含錯誤訊息
 
     實作 process-scoped 記憶體快取，避免同一 process 內重複讀取相同 ticket。
+    .md Ticket 以 LazyTicket 返回：只讀取到 frontmatter 結尾邊界線為止，
+    _body 於首次存取時才讀檔。傳入 index（ticket_index.TicketIndex）時，
+    frontmatter 以 (mtime_ns, size) 驗證後直接取自持久化索引，免去讀檔與
+    YAML 解析。
 
     演算法:
     1. 取得 Ticket 檔案路徑
     2. 檢查快取（命中則直接返回）
     3. 檢查檔案是否存在
-    4. 讀取檔案內容（支援 UTF-8 編碼）
-    5. 根據副檔名選擇解析策略：
-       - .md: 解析 frontmatter（YAML）和 body，捕獲 YAMLParseError
-       - 其他: 直接解析為 YAML，捕獲 yaml.YAMLError
-    6. 附加元資料、更新快取並返回；若有解析錯誤則在字典中記錄
+    4. 根據副檔名選擇解析策略：
+       - .md: 索引命中或前綴讀取 frontmatter（YAML），捕獲 YAMLParseError；
+              body 交由 LazyTicket 延遲載入
+       - 其他: 讀取整檔並直接解析為 YAML，捕獲 yaml.YAMLError
+    5. 附加元資料、更新快取並返回；若有解析錯誤則在字典中記錄
 
     Args:
         version: 版本號（如 "0.31.0" 或 "v0.31.0"）
         ticket_id: Ticket ID（如 "0.31.0-W4-001"）
+        index: 持久化 frontmatter 索引（list_tickets 使用），None 表示不使用
 
     Returns:
         Optional[Dict]: 完整的 Ticket 資料字典。
@@ -381,6 +719,13 @@ def load_ticket(version: str, ticket_id: str) -> Optional[Dict[str, Any]]:
     if not ticket_path.exists():
         return None
 
+    # Markdown 格式：僅讀取 frontmatter 前綴，body 延遲載入（LazyTicket）
+    if ticket_path.suffix == ".md":
+        ticket = _load_markdown_ticket(ticket_id, ticket_path, index)
+        if ticket is not None:
+            _ticket_cache[cache_key] = ticket
+        return ticket
+
     # 嘗試讀取檔案內容（Guard Clause 2：讀取失敗）
     try:
         with open(ticket_path, "r", encoding="utf-8") as f:
@@ -388,100 +733,55 @@ def load_ticket(version: str, ticket_id: str) -> Optional[Dict[str, Any]]:
     except (IOError, OSError):
         return None
 
-    # 根據副檔名選擇解析策略
-    if ticket_path.suffix == ".md":
-        # Markdown 格式：含 YAML frontmatter 和 body
-        try:
-            frontmatter, body = parse_frontmatter(content)
-        except YAMLParseError as e:
-            # 若 YAML 解析失敗，返回包含錯誤訊息的字典（並快取）
-            result = {
-                "id": ticket_id,
-                "_path": str(ticket_path),
-                "_yaml_error": e.message
-            }
-            _ticket_cache[cache_key] = result
-            return result
+    # YAML 格式：純 YAML 或 { ticket: {...} } 包裝格式
+    try:
+        ticket_content = yaml.safe_load(content)
 
-        # Guard Clause 3：frontmatter 為空（無 frontmatter）
-        if not frontmatter:
+        # Guard Clause 4：YAML 解析為空
+        if not ticket_content:
             return None
 
-        # 附加元資料：body 內容和檔案路徑
-        frontmatter["_body"] = body
-        frontmatter["_path"] = str(ticket_path)
-        # 枚舉閘載入時快照（save 時 changed-fields-only 比對基準）
-        frontmatter[ENUM_SNAPSHOT_FIELD] = _snapshot_enum_fields(frontmatter)
-        # 更新快取
-        _ticket_cache[cache_key] = frontmatter
-        return frontmatter
-    else:
-        # YAML 格式：純 YAML 或 { ticket: {...} } 包裝格式
-        try:
-            ticket_content = yaml.safe_load(content)
-
-            # Guard Clause 4：YAML 解析為空
-            if not ticket_content:
-                return None
+        # 附加檔案路徑
+        ticket_content["_path"] = str(ticket_path)
 
-            # 附加檔案路徑
+        # 支援包裝格式：如果 YAML 頂層有 'ticket' 欄位，
+        # 則使用該欄位值作為實際 Ticket 資料
+        if "ticket" in ticket_content:
+            ticket_content = ticket_content["ticket"]
             ticket_content["_path"] = str(ticket_path)
 
-            # 支援包裝格式：如果 YAML 頂層有 'ticket' 欄位，
-            # 則使用該欄位值作為實際 Ticket 資料
-            if "ticket" in ticket_content:
-                ticket_content = ticket_content["ticket"]
-                ticket_content["_path"] = str(ticket_path)
-
-            # 枚舉閘載入時快照（save 時 changed-fields-only 比對基準）
-            ticket_content[ENUM_SNAPSHOT_FIELD] = _snapshot_enum_fields(ticket_content)
-
-            # 更新快取
-            _ticket_cache[cache_key] = ticket_content
-            return ticket_content
-        except yaml.YAMLError as e:
-            # YAML 解析失敗時，返回包含錯誤訊息的字典（並快取）
-            error_msg = str(e).strip()
-            result = {
-                "id": ticket_id,
-                "_path": str(ticket_path),
-                "_yaml_error": error_msg
-            }
-            _ticket_cache[cache_key] = result
-            return result
+        # 枚舉閘載入時快照（save 時 changed-fields-only 比對基準）
+        ticket_content[ENUM_SNAPSHOT_FIELD] = _snapshot_enum_fields(ticket_content)
 
+        # 更新快取
+        _ticket_cache[cache_key] = ticket_content
+        return ticket_content
+    except yaml.YAMLError as e:
+        # YAML 解析失敗時，返回包含錯誤訊息的字典（並快取）
+        error_msg = str(e).strip()
+        result = {
+            "id": ticket_id,
+            "_path": str(ticket_path),
+            "_yaml_error": error_msg
+        }
+        _ticket_cache[cache_key] = result
+        return result
 
-def save_ticket(ticket: Dict[str, Any], ticket_path: Path) -> None:
-    """
-    儲存 Ticket 資料
 
-    根據檔案副檔名自動決定格式（Markdown 或 YAML）。
-    自動備份和恢復特殊欄位（_body、_path、chain、decision_tree_path）
-    以保持傳入的 ticket 物件完整性。
-    寫入成功後失效快取以確保後續讀取取得最新資料。
+def render_ticket_content(ticket: Dict[str, Any], ticket_path: Path) -> str:
+    """
+    將 Ticket 序列化為待寫入的檔案內容（不寫檔）
 
-    演算法:
-    1. 備份元資料欄位（_body、_path）
-    2. 備份特殊欄位（chain、decision_tree_path、created）
-    3. 建立目標目錄
-    4. 根據副檔名選擇格式序列化
-    5. 寫入檔案
-    6. finally 區塊恢復所有備份欄位到 ticket 物件
-    7. 寫入成功後失效對應的快取 entry
+    save_ticket 與 ticket_write_batch 共用的序列化步驟：枚舉驗證閘 +
+    依副檔名選擇格式。特殊欄位（_body、_path、chain、decision_tree_path、
+    枚舉快照）在序列化期間暫時剝除，結束（含 raise）後恢復到 ticket 物件。
 
     Args:
         ticket: Ticket 資料字典（會被臨時修改但最終會恢復）
         ticket_path: 目標檔案路徑（副檔名決定格式）
 
-    Raises:
-        IOError: 檔案寫入失敗
-        OSError: 目錄建立或無寫入權限
-
-    Examples:
-        >>> ticket = {'id': 'test-001', 'status': 'pending', '_body': '# Content'}
-        >>> save_ticket(ticket, Path('/tmp/test.md'))
-        >>> ticket['_body']  # 已恢復
-        '# Content'
+    Returns:
+        str: 檔案內容（保證以單一換行結尾）
     """
     # 備份元資料欄位（Markdown 格式需要，YAML 格式不需要儲存）
     body = ticket.pop("_body", "")
@@ -493,9 +793,6 @@ def save_ticket(ticket: Dict[str, Any], ticket_path: Path) -> None:
     # 這些欄位代表 Ticket 的內部狀態，由系統自動管理
     special_fields_backup = _backup_special_fields(ticket)
 
-    # 建立目標目錄（父目錄），必要時遞迴建立
-    ticket_path.parent.mkdir(parents=True, exist_ok=True)
-
     try:
         # 枚舉驗證閘：置於 try 內使 deny 模式 raise 時 finally 仍恢復備份欄位
         _enforce_enum_gate(ticket, enum_snapshot, ticket_path)
@@ -534,14 +831,11 @@ def save_ticket(ticket: Dict[str, Any], ticket_path: Path) -> None:
         # 不動既有換行（避免改動帶尾換行的 body）。
         if not content.endswith("\n"):
             content += "\n"
-
-        # 寫入檔案（UTF-8 編碼）
-        with open(ticket_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        return content
 
     finally:
         # 必須恢復所有備份欄位，確保 ticket 物件完整性
-        # 即使寫入失敗也要恢復，保持傳入物件的狀態
+        # 即使序列化失敗也要恢復，保持傳入物件的狀態
         ticket.update(special_fields_backup)
         if body:
             ticket["_body"] = body
@@ -550,15 +844,78 @@ def save_ticket(ticket: Dict[str, Any], ticket_path: Path) -> None:
         if enum_snapshot is not None:
             ticket[ENUM_SNAPSHOT_FIELD] = enum_snapshot
 
+
+def note_ticket_written(ticket: Dict[str, Any], ticket_path: Path) -> None:
+    """
+    Ticket 落盤成功後的收尾：失效快取、更新同 process 索引、刷新枚舉快照
+
+    只能在寫入成功後呼叫（save_ticket 與 ticket_write_batch commit 後共用）。
+    """
     # 寫入成功後失效快取，確保後續讀取取得最新資料
-    # 注意：這行在 try-finally 後執行，只有寫入成功才到達
     _ticket_cache.pop(str(ticket_path), None)
 
+    # 同 process 已載入的反向引用索引 / 重複偵測索引以寫入內容更新該檔 entry，
+    # 查詢層欄式索引整張失效；in_progress 登錄檔依票面狀態登錄 / 移除
+    # （函式內 import：皆依賴本模組的 frontmatter 讀取或 load_ticket）
+    from .duplicate_token_index import note_ticket_saved as note_duplicate_index
+    from .in_progress_registry import note_ticket_saved as note_in_progress
+    from .reverse_ref_index import note_ticket_saved
+    from .ticket_query import note_ticket_saved as note_ticket_table
+    note_ticket_saved(ticket_path, ticket)
+    note_duplicate_index(ticket_path, ticket)
+    note_ticket_table()
+    note_in_progress(ticket_path, ticket)
+
     # 落盤成功後刷新快照為當前值：同一 dict 再次 save 時不對已持久化的
     # 變更重複告警（快照語意 = 「相對最後一次成功落盤」）
     ticket[ENUM_SNAPSHOT_FIELD] = _snapshot_enum_fields(ticket)
 
 
+def save_ticket(ticket: Dict[str, Any], ticket_path: Path) -> None:
+    """
+    儲存 Ticket 資料
+
+    根據檔案副檔名自動決定格式（Markdown 或 YAML）。
+    自動備份和恢復特殊欄位（_body、_path、chain、decision_tree_path）
+    以保持傳入的 ticket 物件完整性。
+    寫入成功後失效快取以確保後續讀取取得最新資料。
+
+    多張票一次寫入請改用 ticket_write_batch.save_tickets（整批取鎖、
+    暫存檔 + rename 提交、失敗整批回滾）。
+
+    演算法:
+    1. 建立目標目錄
+    2. render_ticket_content：備份特殊欄位、枚舉驗證閘、依副檔名序列化、
+       恢復備份欄位
+    3. 寫入檔案
+    4. note_ticket_written：寫入成功後失效快取與同 process 索引
+
+    Args:
+        ticket: Ticket 資料字典（會被臨時修改但最終會恢復）
+        ticket_path: 目標檔案路徑（副檔名決定格式）
+
+    Raises:
+        IOError: 檔案寫入失敗
+        OSError: 目錄建立或無寫入權限
+
+    Examples:
+        >>> ticket = {'id': 'test-001', 'status': 'pending', '_body': '# Content'}
+        >>> save_ticket(ticket, Path('/tmp/test.md'))
+        >>> ticket['_body']  # 已恢復
+        '# Content'
+    """
+    # 建立目標目錄（父目錄），必要時遞迴建立
+    ticket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    content = render_ticket_content(ticket, ticket_path)
+
+    # 寫入檔案（UTF-8 編碼）
+    with open(ticket_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+    note_ticket_written(ticket, ticket_path)
+
+
 if __name__ == "__main__":
     from ticket_system.lib.messages import print_not_executable_and_exit
     print_not_executable_and_exit()
@@ -0,0 +1,293 @@
+"""
+Ticket 反向引用索引模組
+
+Ticket 之間的引用（blockedBy / relatedTo / children / source_ticket /
+parent_id / spawned_tickets）只記錄在「引用方」的 frontmatter；要回答
+「誰引用了 X」只能掃描全部版本的全部 Ticket 並逐一解析 YAML。
+migrate 的交叉引用更新、version-shift 的跨版本引用更新都以此方式全掃，
+工作日誌累積數千張 Ticket 後成本隨之線性成長，但實際命中通常只有個位數。
+
+本模組維護 被引用 ID → (引用方檔案, 欄位) 的反向索引：
+- 持久化於 {work_logs_root}/.index/reverse-refs.json（內附 `*` 的 .gitignore）
+- 每個 Ticket 檔一筆 entry：(mtime_ns, size) 戳記 + 該檔對外的引用清單
+- refresh() 只做 stat 掃描，戳記不符或新增的檔案才重新解析 frontmatter，
+  已消失的檔案剔除
+- save_ticket 寫檔成功後呼叫 note_ticket_saved()，同 process 已載入的索引
+  直接以寫入內容更新該檔 entry（免重新解析）；未載入時由下次 refresh()
+  依戳記補上
+
+索引僅用來縮小候選集合：呼叫端仍須載入候選 Ticket 並比對實際欄位值，
+索引落後（例如外部編輯器改檔後尚未 refresh）只會影響效能不影響正確性。
+"""
+# 防止直接執行此模組
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .constants import TICKETS_DIR
+from .parser import YAMLParseError, _load_frontmatter_yaml, _read_frontmatter_prefix
+
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# 索引目錄與檔名（相對 work_logs_root）
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "reverse-refs.json"
+
+# 索引格式版本（欄位或編碼方式變動時遞增，舊索引自動整份失效）
+INDEX_FORMAT_VERSION = 1
+
+# 索引目錄自我忽略（同 ticket_index）
+INDEX_GITIGNORE_CONTENT = "*\n"
+
+# 納入索引的引用欄位（與 migrate._update_ticket_references 處理的欄位一致）
+REF_FIELDS = (
+    "blockedBy",
+    "relatedTo",
+    "children",
+    "source_ticket",
+    "parent_id",
+    "spawned_tickets",
+)
+
+# Tickets 目錄相對 work_logs_root 的 glob：flat 與三層階層式
+TICKET_GLOBS = (
+    f"v*/{TICKETS_DIR}/*.md",
+    f"v*/v*/v*/{TICKETS_DIR}/*.md",
+)
+
+
+# ============================================================================
+# 引用萃取
+# ============================================================================
+
+def extract_refs(ticket: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    萃取 Ticket 對外的引用
+
+    純量欄位取字串值；列表欄位取字串元素，children 另支援 {"id": ...} 形式。
+
+    Returns:
+        List[Tuple[str, str]]: (被引用 ID, 欄位名) 清單，依欄位順序、去重
+    """
+    refs: List[Tuple[str, str]] = []
+    seen: Set[Tuple[str, str]] = set()
+    for field in REF_FIELDS:
+        value = ticket.get(field)
+        items = value if isinstance(value, list) else [value]
+        for item in items:
+            if isinstance(item, dict):
+                item = item.get("id")
+            if not isinstance(item, str) or not item:
+                continue
+            ref = (item, field)
+            if ref not in seen:
+                seen.add(ref)
+                refs.append(ref)
+    return refs
+
+
+def _parse_refs(ticket_path: Path) -> Tuple[str, List[Tuple[str, str]]]:
+    """只讀 frontmatter 萃取引用；無 frontmatter 或 YAML 錯誤視為無引用"""
+    try:
+        bounds = _read_frontmatter_prefix(ticket_path)
+        frontmatter = _load_frontmatter_yaml(bounds[0]) if bounds else {}
+    except (OSError, UnicodeDecodeError, YAMLParseError):
+        return "", []
+    if not isinstance(frontmatter, dict):
+        return "", []
+    ticket_id = frontmatter.get("id")
+    return (ticket_id if isinstance(ticket_id, str) else ""), extract_refs(frontmatter)
+
+
+# ============================================================================
+# 索引
+# ============================================================================
+
+class ReverseRefIndex:
+    """
+    單一 work-logs 根目錄的反向引用索引
+
+    使用方式：
+        index = get_reverse_ref_index(work_logs_root)   # 已 refresh
+        for ticket_file in index.files_referencing(old_id):
+            ...  # 載入、比對、save_ticket（save_ticket 會回報索引）
+        index.save()
+    """
+
+    def __init__(self, work_logs_root: Path) -> None:
+        self.root = work_logs_root
+        self.index_path = work_logs_root / INDEX_DIRNAME / INDEX_FILENAME
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._targets: Optional[Dict[str, Set[str]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _stamp(stat: os.stat_result) -> Tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    def _relative(self, ticket_path: Path) -> Optional[str]:
+        try:
+            return ticket_path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def _set_entry(
+        self, rel: str, stat: os.stat_result, ticket_id: str, refs: List[Tuple[str, str]]
+    ) -> None:
+        mtime_ns, size = self._stamp(stat)
+        self._entries[rel] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "id": ticket_id,
+            "refs": [list(ref) for ref in refs],
+        }
+        self._targets = None
+        self._dirty = True
+
+    def refresh(self) -> "ReverseRefIndex":
+        """stat 掃描所有 Ticket 檔，只重新解析戳記不符或新增的檔案"""
+        present: Set[str] = set()
+        for pattern in TICKET_GLOBS:
+            for ticket_path in self.root.glob(pattern):
+                rel = ticket_path.relative_to(self.root).as_posix()
+                try:
+                    stat = ticket_path.stat()
+                except OSError:
+                    continue
+                present.add(rel)
+                entry = self._entries.get(rel)
+                if entry is not None and (entry.get("mtime_ns"), entry.get("size")) == self._stamp(stat):
+                    continue
+                ticket_id, refs = _parse_refs(ticket_path)
+                self._set_entry(rel, stat, ticket_id, refs)
+
+        for rel in set(self._entries) - present:
+            del self._entries[rel]
+            self._targets = None
+            self._dirty = True
+        return self
+
+    def note_saved(self, ticket_path: Path, ticket: Dict[str, Any]) -> None:
+        """以剛寫入的內容更新該檔 entry（save_ticket 寫檔成功後呼叫）"""
+        rel = self._relative(ticket_path)
+        if rel is None or ticket_path.suffix != ".md":
+            return
+        try:
+            stat = ticket_path.stat()
+        except OSError:
+            return
+        ticket_id = ticket.get("id")
+        self._set_entry(
+            rel, stat, ticket_id if isinstance(ticket_id, str) else "", extract_refs(ticket)
+        )
+
+    def _target_map(self) -> Dict[str, Set[str]]:
+        if self._targets is None:
+            targets: Dict[str, Set[str]] = {}
+            for rel, entry in self._entries.items():
+                for target, _field in entry.get("refs", []):
+                    targets.setdefault(target, set()).add(rel)
+            self._targets = targets
+        return self._targets
+
+    def references_to(self, ticket_id: str) -> List[Tuple[str, str, Path]]:
+        """
+        查詢引用 ticket_id 的 Ticket
+
+        Returns:
+            List[Tuple[str, str, Path]]: (引用方 ID, 欄位名, 引用方檔案)，依檔案路徑排序
+        """
+        result: List[Tuple[str, str, Path]] = []
+        for rel in sorted(self._target_map().get(ticket_id, ())):
+            entry = self._entries[rel]
+            for target, field in entry.get("refs", []):
+                if target == ticket_id:
+                    result.append((entry.get("id", ""), field, self.root / rel))
+        return result
+
+    def files_referencing(self, ticket_id: str) -> List[Path]:
+        """引用 ticket_id 的 Ticket 檔案（排序、去重）"""
+        return [self.root / rel for rel in sorted(self._target_map().get(ticket_id, ()))]
+
+    def files_referencing_prefix(self, prefix: str) -> List[Path]:
+        """引用任一以 prefix 開頭之 ID 的 Ticket 檔案（排序、去重）"""
+        rels: Set[str] = set()
+        for target, sources in self._target_map().items():
+            if target.startswith(prefix):
+                rels.update(sources)
+        return [self.root / rel for rel in sorted(rels)]
+
+    def save(self) -> None:
+        """有變動時寫回索引；寫入失敗靜默略過（索引僅為加速）"""
+        if not self._dirty or not self.root.is_dir():
+            return
+        index_dir = self.index_path.parent
+        tmp_path = index_dir / f"{INDEX_FILENAME}.{os.getpid()}.tmp"
+        try:
+            index_dir.mkdir(exist_ok=True)
+            gitignore = index_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text(INDEX_GITIGNORE_CONTENT, encoding="utf-8")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": INDEX_FORMAT_VERSION, "entries": self._entries},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._dirty = False
+
+
+# ============================================================================
+# process 層級快取
+# ============================================================================
+
+# work_logs_root（字串）→ 已載入的索引；save_ticket 透過 note_ticket_saved 回報
+_loaded_indexes: Dict[str, ReverseRefIndex] = {}
+
+
+def get_reverse_ref_index(work_logs_root: Path) -> ReverseRefIndex:
+    """取得（必要時建立）work_logs_root 的反向引用索引，回傳前先 refresh()"""
+    key = str(work_logs_root)
+    index = _loaded_indexes.get(key)
+    if index is None:
+        index = _loaded_indexes[key] = ReverseRefIndex(work_logs_root)
+    return index.refresh()
+
+
+def note_ticket_saved(ticket_path: Path, ticket: Dict[str, Any]) -> None:
+    """save_ticket 寫檔成功後呼叫：更新同 process 已載入、涵蓋該檔的索引"""
+    for index in _loaded_indexes.values():
+        index.note_saved(ticket_path, ticket)
+
+
+def clear_reverse_ref_cache() -> None:
+    """清除 process 層級快取（測試用）"""
+    _loaded_indexes.clear()
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
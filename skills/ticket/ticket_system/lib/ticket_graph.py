@@ -0,0 +1,210 @@
+"""
+Ticket 關係圖檢視模組
+
+ChainAnalyzer（handoff 方向判斷）、acceptance_auditor（run_audit 子任務 /
+spawned / 後續任務檢查）與 track complete 的前置檢查都沿著 children /
+spawned_tickets / chain.parent 走訪 Ticket，原本每個節點各自 load_ticket，
+同一次操作中同一張票經不同路徑被重複載入（父票在方向判斷與建議產生各載入
+一次、大型 epic 的孫任務在遞迴檢查中重複讀取）。
+
+TicketGraph 為單次操作範圍的共用檢視：
+
+- 節點記憶化：每張票最多載入一次（含「找不到」結果）；可預先以
+  list_tickets() 結果（經持久化 frontmatter 索引）整批灌入
+- 關係查詢：children / descendants / siblings / spawned / blockers / parent
+- 狀態彙總記憶化：subtree_terminal()（自身與全部後代皆 terminal）、
+  descendants() 等，共用子樹只計算一次
+
+不做跨命令快取：圖在操作開始時建立、結束即丟棄，Ticket 寫入後由呼叫端
+重新建立，避免狀態過期。
+"""
+# 防止直接執行此模組
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ticket_system.lib.constants import TERMINAL_STATUSES
+
+
+# 找不到 Ticket 時 non_terminal() 回報的狀態
+STATUS_NOT_FOUND = "not_found"
+
+TicketLoader = Callable[[str, str], Optional[Dict[str, Any]]]
+TicketLister = Callable[[str], List[Dict[str, Any]]]
+
+
+def _ref_ids(refs: Any) -> List[str]:
+    """children / spawned_tickets / blockedBy 欄位 → ID 列表（支援字串與字典引用）"""
+    if not refs or not isinstance(refs, list):
+        return []
+    # Lazy import：ticket_ops ↔ ticket_loader 互相引用，模組層 import 會在
+    # 本模組先於 ticket_loader 載入時失敗（同 spec_reference_checker 手法）
+    from ticket_system.lib.ticket_ops import resolve_id_from_ref
+
+    ids = []
+    for ref in refs:
+        ref_id = resolve_id_from_ref(ref)
+        if ref_id:
+            ids.append(ref_id)
+    return ids
+
+
+class TicketGraph:
+    """
+    單次操作範圍的 Ticket 關係圖
+
+    Args:
+        version: 版本號（傳給 loader / lister；None 時只查已知節點）
+        tickets: 預先灌入的 Ticket 列表（如 list_tickets() 結果）
+        loader: 未知節點的載入函式，簽名同 load_ticket(version, ticket_id)
+        lister: 列出整個版本 Ticket 的函式，簽名同 list_tickets(version)；
+                僅在需要全版本檢視（all_tickets / chain_members）時呼叫一次
+    """
+
+    def __init__(
+        self,
+        version: Optional[str] = None,
+        *,
+        tickets: Optional[Iterable[Dict[str, Any]]] = None,
+        loader: Optional[TicketLoader] = None,
+        lister: Optional[TicketLister] = None,
+    ) -> None:
+        self.version = version
+        self._loader = loader
+        self._lister = lister
+        self._nodes: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._listing: Optional[List[Dict[str, Any]]] = None
+        self._descendants: Dict[str, List[str]] = {}
+        self._subtree_terminal: Dict[str, bool] = {}
+        if tickets is not None:
+            self._listing = self._seed(tickets)
+
+    def _seed(self, tickets: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        seeded = []
+        for ticket in tickets:
+            ticket_id = ticket.get("id") if isinstance(ticket, dict) else None
+            if not isinstance(ticket_id, str) or not ticket_id:
+                continue
+            # 已單獨載入的節點保留原物件，呼叫端持有的參照維持一致
+            if self._nodes.get(ticket_id) is None:
+                self._nodes[ticket_id] = ticket
+            seeded.append(self._nodes[ticket_id])
+        return seeded
+
+    # ------------------------------------------------------------------
+    # 節點
+    # ------------------------------------------------------------------
+
+    def get(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        """取得 Ticket；找不到回傳 None（結果記憶化，同一 ID 只載入一次）"""
+        if ticket_id in self._nodes:
+            return self._nodes[ticket_id]
+        ticket = None
+        if ticket_id and self.version and self._loader is not None:
+            ticket = self._loader(self.version, ticket_id)
+        self._nodes[ticket_id] = ticket
+        return ticket
+
+    def all_tickets(self) -> List[Dict[str, Any]]:
+        """全版本 Ticket（第一次呼叫時經 lister 載入並灌入節點）"""
+        if self._listing is None:
+            listed = self._lister(self.version) if self._lister and self.version else []
+            self._listing = self._seed(listed)
+        return self._listing
+
+    def status(self, ticket_id: str) -> Optional[str]:
+        ticket = self.get(ticket_id)
+        return ticket.get("status") if ticket else None
+
+    def is_terminal(self, ticket_id: str) -> bool:
+        return self.status(ticket_id) in TERMINAL_STATUSES
+
+    # ------------------------------------------------------------------
+    # 關係
+    # ------------------------------------------------------------------
+
+    def children(self, ticket_id: str) -> List[str]:
+        ticket = self.get(ticket_id)
+        return _ref_ids(ticket.get("children")) if ticket else []
+
+    def spawned(self, ticket_id: str) -> List[str]:
+        ticket = self.get(ticket_id)
+        return _ref_ids(ticket.get("spawned_tickets")) if ticket else []
+
+    def blockers(self, ticket_id: str) -> List[str]:
+        ticket = self.get(ticket_id)
+        return _ref_ids(ticket.get("blockedBy")) if ticket else []
+
+    def parent(self, ticket_id: str) -> Optional[str]:
+        ticket = self.get(ticket_id)
+        if not ticket:
+            return None
+        chain = ticket.get("chain") or {}
+        return chain.get("parent") if isinstance(chain, dict) else None
+
+    def siblings(self, ticket_id: str) -> List[str]:
+        """同父任務下的其他子任務 ID（依父任務 children 順序，不含自己）"""
+        parent_id = self.parent(ticket_id)
+        if not parent_id:
+            return []
+        return [c for c in self.children(parent_id) if c != ticket_id]
+
+    def descendants(self, ticket_id: str) -> List[str]:
+        """
+        全部後代 ID（深度優先前序，不含自己；循環參照只走一次）
+
+        結果記憶化：同一子樹被多次查詢時只走訪一次。
+        """
+        cached = self._descendants.get(ticket_id)
+        if cached is not None:
+            return cached
+        result: List[str] = []
+        visited = {ticket_id}
+        stack = list(reversed(self.children(ticket_id)))
+        while stack:
+            node_id = stack.pop()
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+            result.append(node_id)
+            stack.extend(reversed(self.children(node_id)))
+        self._descendants[ticket_id] = result
+        return result
+
+    def chain_members(self, root_id: str) -> List[Dict[str, Any]]:
+        """ID 以 root_id 開頭的全部 Ticket（同任務鏈，依 ID 前綴判定）"""
+        return [
+            t for t in self.all_tickets()
+            if isinstance(t.get("id"), str) and t["id"].startswith(root_id)
+        ]
+
+    # ------------------------------------------------------------------
+    # 狀態彙總
+    # ------------------------------------------------------------------
+
+    def non_terminal(self, ticket_ids: Iterable[str]) -> List[Tuple[str, str]]:
+        """ID 清單中非 terminal 的項目 [(id, status)]；找不到者 status 為 not_found"""
+        result: List[Tuple[str, str]] = []
+        for ticket_id in ticket_ids:
+            ticket = self.get(ticket_id)
+            if ticket is None:
+                result.append((ticket_id, STATUS_NOT_FOUND))
+                continue
+            status = ticket.get("status", "unknown")
+            if status not in TERMINAL_STATUSES:
+                result.append((ticket_id, status))
+        return result
+
+    def subtree_terminal(self, ticket_id: str) -> bool:
+        """自身與全部後代皆存在且為 terminal（記憶化）"""
+        cached = self._subtree_terminal.get(ticket_id)
+        if cached is not None:
+            return cached
+        result = self.is_terminal(ticket_id) and all(
+            self.is_terminal(d) for d in self.descendants(ticket_id)
+        )
+        self._subtree_terminal[ticket_id] = result
+        return result
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
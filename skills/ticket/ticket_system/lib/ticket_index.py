@@ -0,0 +1,220 @@
+"""
+Ticket frontmatter 持久化索引模組
+
+list_tickets() 每次 CLI 呼叫都會重新讀取並 YAML 解析版本內所有 Ticket；
+parser._ticket_cache 與 ticket_loader._chain_index_cache 皆為 process-scoped，
+`ticket track dashboard / runqueue / board` 每次都從冷啟動開始，延遲主要
+耗在這段重掃。本模組將各 Ticket 的 frontmatter 解析結果持久化於 Tickets
+目錄下，以 (檔名, mtime_ns, size) 驗證，僅重新解析有變動的檔案。
+
+索引位置：{tickets_dir}/.index/frontmatter.json
+- .index/ 內附 `*` 內容的 .gitignore，索引檔不會進入版控
+- 僅索引 .md Ticket 的 frontmatter 與 body 起始位置；body 仍從檔案讀取
+  （索引保持精簡，body 變動同樣反映在 mtime / size）
+- YAML 解析失敗（_yaml_error）的 Ticket 不入索引，每次照常解析以保留錯誤訊息
+
+型別保真：YAML safe_load 可能產生 date / datetime，以 {"$date": ...} /
+{"$datetime": ...} 標記序列化；含其他型別（非字串 key、集合等）的
+frontmatter 無法 JSON 往返，直接不入索引（退回每次解析，行為不變）。
+
+寫入策略：有變動才寫，暫存檔 + os.replace 原子替換；寫入失敗（唯讀目錄等）
+靜默略過，索引僅為加速不影響正確性。
+"""
+# 防止直接執行此模組
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+
+# ============================================================================
+# 常數定義
+# ============================================================================
+
+# 索引目錄與檔名（相對 tickets_dir）
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "frontmatter.json"
+
+# 索引格式版本（欄位或編碼方式變動時遞增，舊索引自動整份失效）
+INDEX_FORMAT_VERSION = 1
+
+# 索引目錄自我忽略（同 .pytest_cache 作法）
+INDEX_GITIGNORE_CONTENT = "*\n"
+
+# date / datetime 序列化標記
+DATE_TAG = "$date"
+DATETIME_TAG = "$datetime"
+
+
+class _Unindexable(Exception):
+    """frontmatter 含無法 JSON 往返的值"""
+
+
+# ============================================================================
+# 型別編解碼
+# ============================================================================
+
+def _encode(value: Any) -> Any:
+    """轉為 JSON 相容結構；遇無法保真的型別丟出 _Unindexable"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    # datetime 為 date 子類別，須先判斷
+    if isinstance(value, datetime):
+        return {DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {DATE_TAG: value.isoformat()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        encoded = {}
+        for key, item in value.items():
+            # 非字串 key 經 JSON 會變字串；$ 開頭 key 與型別標記衝突
+            if not isinstance(key, str) or key.startswith("$"):
+                raise _Unindexable(key)
+            encoded[key] = _encode(item)
+        return encoded
+    raise _Unindexable(type(value).__name__)
+
+
+def _decode(value: Any) -> Any:
+    """_encode 的反向轉換；每次建立全新容器，呼叫端可自由修改"""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if DATETIME_TAG in value:
+                return datetime.fromisoformat(value[DATETIME_TAG])
+            if DATE_TAG in value:
+                return date.fromisoformat(value[DATE_TAG])
+        return {key: _decode(item) for key, item in value.items()}
+    return value
+
+
+# ============================================================================
+# 索引
+# ============================================================================
+
+class TicketIndex:
+    """
+    單一 Tickets 目錄的 frontmatter 索引
+
+    使用方式（list_tickets 內）：
+        index = TicketIndex(tickets_dir)
+        ticket = load_ticket(version, ticket_id, index=index)  # 命中即免解析
+        ...
+        index.save()  # 有變動才寫回，並剔除本輪未出現的檔案
+
+    load_ticket 透過 lookup() / record() 兩個方法使用本索引。
+    """
+
+    def __init__(self, tickets_dir: Path) -> None:
+        self.tickets_dir = tickets_dir
+        self.index_path = tickets_dir / INDEX_DIRNAME / INDEX_FILENAME
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._seen: Set[str] = set()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def _stamp(stat: os.stat_result) -> Tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    def lookup(
+        self, ticket_path: Path, stat: os.stat_result
+    ) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        查詢索引
+
+        Args:
+            ticket_path: Ticket 檔案路徑
+            stat: 讀檔前取得的 stat（與讀檔後 stat 一致才可使用）
+
+        Returns:
+            Optional[Tuple[Dict, int]]: (frontmatter 全新副本, body 起始位置)；
+                                        未命中或 mtime / size 不符時返回 None
+        """
+        name = ticket_path.name
+        self._seen.add(name)
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        if (entry.get("mtime_ns"), entry.get("size")) != self._stamp(stat):
+            return None
+        return _decode(entry["frontmatter"]), entry["body_offset"]
+
+    def record(
+        self,
+        ticket_path: Path,
+        stat: os.stat_result,
+        frontmatter: Dict[str, Any],
+        body_offset: int,
+    ) -> None:
+        """
+        寫入（或覆寫）一筆索引
+
+        須在附加 _body / _path 等執行期欄位之前呼叫，frontmatter 僅含檔案內容。
+        無法 JSON 往返的 frontmatter 直接略過。
+        """
+        name = ticket_path.name
+        self._seen.add(name)
+        try:
+            encoded = _encode(frontmatter)
+        except _Unindexable:
+            self._dirty |= self._entries.pop(name, None) is not None
+            return
+        mtime_ns, size = self._stamp(stat)
+        self._entries[name] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "body_offset": body_offset,
+            "frontmatter": encoded,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """剔除本輪未出現的檔案後寫回索引（無變動時不寫）"""
+        stale = set(self._entries) - self._seen
+        for name in stale:
+            del self._entries[name]
+        if not (self._dirty or stale):
+            return
+
+        index_dir = self.index_path.parent
+        tmp_path = index_dir / f"{INDEX_FILENAME}.{os.getpid()}.tmp"
+        try:
+            index_dir.mkdir(exist_ok=True)
+            gitignore = index_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text(INDEX_GITIGNORE_CONTENT, encoding="utf-8")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": INDEX_FORMAT_VERSION, "entries": self._entries},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # 索引僅為加速，寫入失敗不影響 list_tickets 結果
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._dirty = False
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
@@ -11,6 +11,10 @@ Ticket 載入和解析模組（統一入口）
 索引快取：
 為了避免每次 list_tickets() 都重新建立索引，使用模組層級的快取。
 快取以版本號為鍵，確保不同版本的索引隔離。
+
+持久化 frontmatter 索引：
+list_tickets() 另以 ticket_index.TicketIndex（{tickets_dir}/.index/）跨 CLI
+呼叫保存 frontmatter 解析結果，僅重新解析 mtime / size 有變動的檔案。
 """
 # 防止直接執行此模組
 # 匯入路徑管理功能
@@ -36,6 +40,7 @@ from .parser import (
 
 # 匯入索引管理
 from .ticket_chain_index import TicketChainIndex
+from .ticket_index import TicketIndex
 
 # 匯入 list_tickets 的實作（仍然在此模組中定義）
 from typing import Dict, Any
@@ -61,9 +66,10 @@ def list_tickets(version: str) -> list[Dict[str, Any]]:
     3. 掃描所有 .md 和 .yaml 檔案（按檔名排序）
     4. 對每個檔案提取核心 ID（去掉後綴）
     5. 使用 loaded_core_ids 集合去重，避免重複載入
-    6. 使用 load_ticket 載入每個檔案
+    6. 使用 load_ticket 載入每個檔案（經持久化 frontmatter 索引，未變動檔案免解析）
     7. 只加入成功載入的 Ticket
-    8. 建立任務鏈索引並快取
+    8. 寫回 frontmatter 索引（有變動才寫）
+    9. 建立任務鏈索引並快取
 
     去重設計：
     - 標準檔案優先載入（檔案掃描順序通常標準格式在前）
@@ -93,6 +99,7 @@ def list_tickets(version: str) -> list[Dict[str, Any]]:
 
     tickets = []
     loaded_core_ids = set()  # 去重追蹤集合
+    frontmatter_index = TicketIndex(tickets_dir)
 
     # 同時掃描 .md 和 .yaml 檔案，分別排序後合併
     # 這樣可以支援多種格式的 Ticket 檔案
@@ -110,12 +117,14 @@ def list_tickets(version: str) -> list[Dict[str, Any]]:
         if core_id in loaded_core_ids:
             continue
         # 載入 Ticket 資料（load_ticket 會安全處理不存在或格式錯誤的檔案）
-        ticket = load_ticket(version, core_id)
+        ticket = load_ticket(version, core_id, index=frontmatter_index)
         # 只加入成功載入的 Ticket，跳過失敗的檔案
         if ticket:
             tickets.append(ticket)
             loaded_core_ids.add(core_id)
 
+    frontmatter_index.save()
+
     # 建立並快取任務鏈索引
     index = TicketChainIndex()
     index.build_from_tickets(tickets)
@@ -0,0 +1,493 @@
+"""
+Ticket 查詢層：欄式索引 + --where 篩選運算式
+
+`track list / board / stale-list / dashboard / runqueue` 各自 list_tickets
+後以 Python 逐票過濾 status / wave / priority / parent / topic，同一 process
+內（如 dashboard 一次算 in_progress、ready、stale 三組）對同一份語料反覆
+全掃。本模組提供共用查詢層：
+
+- TicketTable：以 list_tickets 結果建立欄式索引。每個欄位一張
+  「值 → 列位元遮罩」表（Python int 當 bitset），首次查詢該欄位時建立，
+  之後同欄位的篩選只在相異值上運算，AND / OR / NOT 直接以位元運算組合
+- get_ticket_table()：process 層級快取，同版本、同載入函式、Tickets 目錄
+  mtime 未變且期間無 save_ticket 時重用同一張表
+- parse_where()：小型篩選運算式，例：
+    status=pending and wave>=3
+    priority<=P1 and (parent=0.18.0-W3-001 or assignee=thyme)
+    not status=completed,closed and title~hook
+
+運算式語法：
+    expr       := or_expr
+    or_expr    := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | "(" expr ")" | comparison
+    comparison := FIELD OP VALUE
+    OP         := "=" | "!=" | ">=" | "<=" | ">" | "<" | "~"
+VALUE 可用引號包住含空白的字串；`=` / `!=` 接受逗號分隔的多個值（任一
+相符）；`null` 代表欄位缺失或為空。`~` 為不分大小寫的子字串比對。數值
+字面值與整數欄位以數值比較（wave 另接受 W3 寫法），其餘以字串比較
+（priority P0 < P1、created 以 ISO 日期字串比較）。
+"""
+# 防止直接執行此模組
+import argparse
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .paths import get_tickets_dir
+
+
+# ============================================================================
+# 欄位定義
+# ============================================================================
+
+def _assignee(ticket: Dict[str, Any]) -> Any:
+    who = ticket.get("who")
+    return who.get("current") if isinstance(who, dict) else None
+
+
+# 衍生欄位：不直接對應 frontmatter key 者
+DERIVED_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "assignee": _assignee,
+}
+
+# 欄位別名（CLI 慣用名 → frontmatter key）
+FIELD_ALIASES = {
+    "parent": "parent_id",
+    "agent": "assignee",
+}
+
+# 運算子（長者在前，避免 ">=" 被切成 ">"）
+_OPERATORS = ("!=", ">=", "<=", "=", ">", "<", "~")
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<lparen>\()|(?P<rparen>\))|
+        (?P<op>!=|>=|<=|=|>|<|~)|
+        "(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|
+        (?P<word>[^\s()=!<>~"']+)
+    )""",
+    re.VERBOSE,
+)
+
+_INT_RE = re.compile(r"-?\d+$")
+_WAVE_LITERAL_RE = re.compile(r"[Ww](\d+)$")
+
+_NULL_LITERALS = ("null", "none")
+
+
+class WhereSyntaxError(ValueError):
+    """--where 運算式語法錯誤"""
+
+
+def canonical_field(name: str) -> str:
+    """套用欄位別名"""
+    return FIELD_ALIASES.get(name, name)
+
+
+def field_value(ticket: Dict[str, Any], field: str) -> Any:
+    """取出欄位原始值（衍生欄位經計算）"""
+    extractor = DERIVED_FIELDS.get(field)
+    if extractor is not None:
+        return extractor(ticket)
+    return ticket.get(field)
+
+
+def _column_keys(value: Any) -> List[Any]:
+    """欄位值 → 索引鍵：list 逐元素、date 轉 ISO 字串、空值歸 None"""
+    items = value if isinstance(value, list) else [value]
+    keys: List[Any] = []
+    for item in items:
+        if isinstance(item, date):
+            item = item.isoformat()
+        elif isinstance(item, dict):
+            item = item.get("id", str(item))
+        elif item == "" or item is None:
+            item = None
+        elif not isinstance(item, (str, int, float, bool)):
+            item = str(item)
+        keys.append(item)
+    return keys or [None]
+
+
+# ============================================================================
+# 運算式 AST
+# ============================================================================
+
+@dataclass(frozen=True)
+class Comparison:
+    field: str
+    op: str
+    values: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: "WhereExpr"
+
+
+@dataclass(frozen=True)
+class BoolOp:
+    op: str  # "and" | "or"
+    operands: Tuple["WhereExpr", ...]
+
+
+WhereExpr = Union[Comparison, Not, BoolOp]
+
+
+def _tokenize_where(text: str) -> List[Tuple[str, str]]:
+    tokens: List[Tuple[str, str]] = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if match is None or match.end() == position:
+            raise WhereSyntaxError(f"無法解析的字元：{text[position:]!r}")
+        position = match.end()
+        kind = match.lastgroup
+        if kind in ("dq", "sq"):
+            tokens.append(("value", match.group(kind)))
+        else:
+            tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.tokens = _tokenize_where(text)
+        self.position = 0
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise WhereSyntaxError("運算式不完整")
+        self.position += 1
+        return token
+
+    def _keyword(self, word: str) -> bool:
+        token = self._peek()
+        if token is not None and token[0] == "word" and token[1].lower() == word:
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> WhereExpr:
+        expr = self._or()
+        if self._peek() is not None:
+            raise WhereSyntaxError(f"多餘的內容：{self._peek()[1]!r}")
+        return expr
+
+    def _or(self) -> WhereExpr:
+        operands = [self._and()]
+        while self._keyword("or"):
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else BoolOp("or", tuple(operands))
+
+    def _and(self) -> WhereExpr:
+        operands = [self._not()]
+        while self._keyword("and"):
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else BoolOp("and", tuple(operands))
+
+    def _not(self) -> WhereExpr:
+        if self._keyword("not"):
+            return Not(self._not())
+        token = self._peek()
+        if token is not None and token[0] == "lparen":
+            self.position += 1
+            expr = self._or()
+            if self._next()[0] != "rparen":
+                raise WhereSyntaxError("缺少右括號")
+            return expr
+        return self._comparison()
+
+    def _comparison(self) -> Comparison:
+        kind, field = self._next()
+        if kind != "word":
+            raise WhereSyntaxError(f"預期欄位名稱，得到 {field!r}")
+        kind, op = self._next()
+        if kind != "op":
+            raise WhereSyntaxError(f"欄位 {field} 後預期運算子（{' '.join(_OPERATORS)}）")
+        kind, raw = self._next()
+        if kind not in ("word", "value"):
+            raise WhereSyntaxError(f"運算子 {op} 後預期值")
+        values = tuple(raw.split(",")) if op in ("=", "!=") and kind == "word" else (raw,)
+        return Comparison(canonical_field(field), op, values)
+
+
+def parse_where(text: str) -> WhereExpr:
+    """
+    解析 --where 運算式
+
+    Raises:
+        WhereSyntaxError: 語法錯誤（訊息指出位置或缺漏）
+    """
+    if not text or not text.strip():
+        raise WhereSyntaxError("運算式為空")
+    return _Parser(text).parse()
+
+
+def parse_where_arg(value: str) -> WhereExpr:
+    """argparse type：語法錯誤轉 ArgumentTypeError（argparse 自動轉 exit 2）"""
+    try:
+        return parse_where(value)
+    except WhereSyntaxError as e:
+        raise argparse.ArgumentTypeError(f"--where: {e}")
+
+
+def where_from_args(args: argparse.Namespace) -> Optional[WhereExpr]:
+    """
+    取出 args.where：已解析的運算式原樣回傳，字串（程式化組裝的 Namespace）
+    即時解析，其餘（未註冊 --where 的命令）視為未指定
+    """
+    value = getattr(args, "where", None)
+    if isinstance(value, str):
+        return parse_where(value)
+    if isinstance(value, (Comparison, Not, BoolOp)):
+        return value
+    return None
+
+
+def add_where_argument(parser: argparse.ArgumentParser) -> None:
+    """view 命令共用的 --where 參數"""
+    parser.add_argument(
+        "--where",
+        type=parse_where_arg,
+        default=None,
+        help=(
+            "篩選運算式，例：'status=pending and wave>=3'；"
+            "欄位含 status / wave / priority / parent / assignee / type 等 frontmatter key，"
+            "運算子 = != >= <= > < ~（子字串），可用 and / or / not / 括號"
+        ),
+    )
+
+
+# ============================================================================
+# 值比較
+# ============================================================================
+
+def _literal_matches(key: Any, literal: str, field: str) -> bool:
+    """`=` 比較：null 對應缺值；整數欄位接受數值字面值（wave 另接受 W3）"""
+    if literal.lower() in _NULL_LITERALS:
+        return key is None
+    if key is None:
+        return False
+    if isinstance(key, bool):
+        return str(key).lower() == literal.lower()
+    if isinstance(key, (int, float)):
+        number = _numeric_literal(literal, field)
+        return number is not None and key == number
+    return str(key) == literal
+
+
+def _numeric_literal(literal: str, field: str) -> Optional[int]:
+    if _INT_RE.match(literal):
+        return int(literal)
+    if field == "wave":
+        match = _WAVE_LITERAL_RE.match(literal)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def _ordered_matches(key: Any, op: str, literal: str, field: str) -> bool:
+    """大小比較：數值字面值只比整數鍵，其餘只比字串鍵；型別不符不命中"""
+    if key is None or isinstance(key, bool):
+        return False
+    number = _numeric_literal(literal, field)
+    if number is not None and isinstance(key, (int, float)):
+        left, right = key, number
+    elif isinstance(key, str) and number is None:
+        left, right = key, literal
+    elif isinstance(key, str) and _INT_RE.match(key) and number is not None:
+        left, right = int(key), number
+    else:
+        return False
+    if op == ">=":
+        return left >= right
+    if op == "<=":
+        return left <= right
+    if op == ">":
+        return left > right
+    return left < right
+
+
+def _key_matches(key: Any, comparison: Comparison) -> bool:
+    op = comparison.op
+    if op in ("=", "!="):
+        return any(_literal_matches(key, v, comparison.field) for v in comparison.values)
+    if op == "~":
+        return key is not None and comparison.values[0].lower() in str(key).lower()
+    return _ordered_matches(key, op, comparison.values[0], comparison.field)
+
+
+# ============================================================================
+# 欄式索引
+# ============================================================================
+
+class TicketTable:
+    """
+    一份 Ticket 語料的欄式索引
+
+    列順序與傳入清單相同；select() 回傳原 dict 物件（不複製），呼叫端後續
+    的排序 / 截斷 / 渲染邏輯不受影響。
+    """
+
+    def __init__(self, tickets: Sequence[Dict[str, Any]]) -> None:
+        self.rows: List[Dict[str, Any]] = list(tickets)
+        self.all_mask = (1 << len(self.rows)) - 1
+        self._columns: Dict[str, Dict[Any, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, field: str) -> Dict[Any, int]:
+        """欄位的 值 → 列遮罩 表（首次存取時建立）"""
+        field = canonical_field(field)
+        column = self._columns.get(field)
+        if column is None:
+            column = {}
+            for position, ticket in enumerate(self.rows):
+                bit = 1 << position
+                for key in _column_keys(field_value(ticket, field)):
+                    column[key] = column.get(key, 0) | bit
+            self._columns[field] = column
+        return column
+
+    def values(self, field: str) -> List[Any]:
+        """欄位的相異值（不含缺值）"""
+        return [key for key in self.column(field) if key is not None]
+
+    def mask(self, expr: WhereExpr) -> int:
+        """運算式 → 列遮罩"""
+        if isinstance(expr, Comparison):
+            matched = 0
+            column = self.column(expr.field)
+            positive = expr if expr.op != "!=" else Comparison(expr.field, "=", expr.values)
+            for key, bits in column.items():
+                if _key_matches(key, positive):
+                    matched |= bits
+            return self.all_mask & ~matched if expr.op == "!=" else matched
+        if isinstance(expr, Not):
+            return self.all_mask & ~self.mask(expr.operand)
+        if expr.op == "and":
+            result = self.all_mask
+            for operand in expr.operands:
+                result &= self.mask(operand)
+                if not result:
+                    break
+            return result
+        result = 0
+        for operand in expr.operands:
+            result |= self.mask(operand)
+        return result
+
+    def equals_mask(self, field: str, values: Iterable[Any]) -> int:
+        """欄位值屬於 values 的列（精確相等，不經字面值轉換）"""
+        column = self.column(field)
+        result = 0
+        for value in values:
+            result |= column.get(value, 0)
+        return result
+
+    def rows_for(self, mask: int) -> List[Dict[str, Any]]:
+        """遮罩 → Ticket 清單（保持列順序）"""
+        rows: List[Dict[str, Any]] = []
+        while mask:
+            low = mask & -mask
+            rows.append(self.rows[low.bit_length() - 1])
+            mask ^= low
+        return rows
+
+    def select(
+        self,
+        where: Optional[WhereExpr] = None,
+        *,
+        status: Optional[Iterable[str]] = None,
+        wave: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        依條件篩選（各條件 AND）
+
+        Args:
+            where: 已解析的 --where 運算式
+            status: 狀態集合（空集合 / None 不篩選，同既有 --status 語意）
+            wave: wave 精確相等（None 不篩選）
+        """
+        mask = self.all_mask
+        if status:
+            mask &= self.equals_mask("status", status)
+        if wave is not None:
+            mask &= self.equals_mask("wave", [wave])
+        if where is not None:
+            mask &= self.mask(where)
+        return self.rows_for(mask)
+
+
+# ============================================================================
+# process 層級快取
+# ============================================================================
+
+# (version, tickets_dir) → (載入函式, 目錄 mtime_ns, save 世代, 表)
+_tables: Dict[Tuple[str, str], Tuple[Callable, Optional[int], int, TicketTable]] = {}
+
+# save_ticket 每次寫入遞增；快取的表只在世代相同時重用
+_save_generation = 0
+
+
+def _dir_stamp(tickets_dir) -> Optional[int]:
+    try:
+        return tickets_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_ticket_table(
+    version: str, loader: Optional[Callable[[str], List[Dict[str, Any]]]] = None
+) -> TicketTable:
+    """
+    取得版本語料的欄式索引（同 process 內重用）
+
+    重用條件：同一載入函式、Tickets 目錄 mtime 未變（新增 / 刪除 / 原子
+    替換檔案皆會改變）、期間無 save_ticket。就地修改檔案而不經 save_ticket
+    的變動與 parser._ticket_cache 的既有語意相同，同 process 內不可見。
+
+    Args:
+        version: 版本號
+        loader: 載入函式（預設 ticket_loader.list_tickets；view 命令傳入各自
+            模組層的 list_tickets，以維持既有 patch 點）
+    """
+    if loader is None:
+        from . import ticket_loader
+        loader = ticket_loader.list_tickets
+    tickets_dir = get_tickets_dir(version)
+    key = (version, str(tickets_dir))
+    stamp = _dir_stamp(tickets_dir)
+    cached = _tables.get(key)
+    if cached is not None:
+        cached_loader, cached_stamp, generation, table = cached
+        if cached_loader is loader and cached_stamp == stamp and generation == _save_generation:
+            return table
+    table = TicketTable(loader(version) or [])
+    _tables[key] = (loader, stamp, _save_generation, table)
+    return table
+
+
+def note_ticket_saved() -> None:
+    """save_ticket 寫檔成功後呼叫：已快取的表全部失效"""
+    global _save_generation
+    _save_generation += 1
+
+
+def clear_ticket_table_cache() -> None:
+    """清除 process 層級快取（測試用）"""
+    _tables.clear()
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
@@ -0,0 +1,180 @@
+"""
+多張 Ticket 交易式寫入模組
+
+track batch-claim / batch-complete、bulk_create 與 version-shift 原本逐票呼叫
+save_ticket：每張票各自序列化、直接覆寫目標檔並失效快取，中途失敗會留下
+「前半批已寫、後半批未寫」的狀態。本模組提供整批寫入：
+
+1. 暫存：stage(ticket, path) 只登記，不動檔案（同一路徑以最後一次為準）
+2. 取鎖：依解析後路徑排序，對每個目標檔取一次 file_lock（固定順序，
+   兩個並行批次不會交叉等待）
+3. 序列化：全部票先經 render_ticket_content（含枚舉驗證閘）；任一張失敗
+   即中止，此時尚未寫入任何檔案
+4. 寫入：內容寫到同目錄暫存檔，再逐一 os.replace 到目標路徑
+5. 提交：每個涉及的目錄 fsync 一次（同版本批次即單一 tickets 目錄）
+6. 回滾：寫入 / 替換途中失敗時，已替換的檔案還原為原內容（原本不存在
+   者刪除），暫存檔全數清除後重新拋出原例外
+7. 收尾：全部成功後才逐票 note_ticket_written（快取與同 process 索引）
+
+耐久性與 save_ticket 一致：不對個別檔案 fsync，目錄 fsync 確保 rename
+本身落盤。
+
+注意：file_lock 不可巢狀，呼叫端在 commit 期間不得已持有同一目標檔的鎖。
+"""
+# 防止直接執行此模組
+import os
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ticket_system.lib.file_lock import file_lock
+from ticket_system.lib.parser import note_ticket_written, render_ticket_content
+
+
+# 暫存檔尾綴（同目錄 + pid，list_tickets 的 *.md glob 不會撿到）
+TMP_SUFFIX_FORMAT = ".{pid}.tmp"
+
+
+def _fsync_dir(directory: Path) -> None:
+    """fsync 目錄使 rename 落盤；平台不支援（Windows）時略過"""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+class TicketWriteBatch:
+    """
+    多張 Ticket 的交易式寫入批次
+
+    使用方式::
+
+        batch = TicketWriteBatch()
+        for ticket, path in changed:
+            batch.stage(ticket, path)
+        batch.commit()  # 全部寫入或全部不寫入
+    """
+
+    def __init__(self) -> None:
+        # 解析後路徑 → (ticket, 原始路徑)；保留原始路徑供快取 key 使用
+        self._staged: Dict[str, Tuple[Dict[str, Any], Path]] = {}
+
+    def __len__(self) -> int:
+        return len(self._staged)
+
+    def stage(self, ticket: Dict[str, Any], ticket_path: Path) -> None:
+        """登記待寫入的 Ticket（不動檔案；同一路徑重複登記以最後一次為準）"""
+        ticket_path = Path(ticket_path)
+        self._staged[str(ticket_path.resolve())] = (ticket, ticket_path)
+
+    def _ordered(self) -> List[Tuple[Dict[str, Any], Path]]:
+        return [self._staged[key] for key in sorted(self._staged)]
+
+    def commit(self) -> None:
+        """
+        整批寫入已登記的 Ticket
+
+        Raises:
+            OSError: 寫入或替換失敗（已回滾，目標檔維持原內容）
+            Exception: 序列化 / 枚舉驗證閘失敗（未寫入任何檔案）
+        """
+        entries = self._ordered()
+        if not entries:
+            return
+
+        with ExitStack() as locks:
+            for _ticket, path in entries:
+                locks.enter_context(file_lock(path))
+
+            rendered = []
+            for ticket, path in entries:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                rendered.append((path, render_ticket_content(ticket, path)))
+
+            self._write_all(rendered)
+
+        self._staged = {}
+        for ticket, path in entries:
+            note_ticket_written(ticket, path)
+
+    @staticmethod
+    def _write_all(rendered: List[Tuple[Path, str]]) -> None:
+        """暫存檔寫入 → 逐一替換 → 目錄 fsync；失敗時回滾已替換的檔案"""
+        suffix = TMP_SUFFIX_FORMAT.format(pid=os.getpid())
+        tmp_paths: List[Path] = []
+        # 已替換的目標 → 原內容（None 表示原本不存在）
+        replaced: List[Tuple[Path, Optional[bytes]]] = []
+        try:
+            for path, content in rendered:
+                tmp_path = path.with_name(path.name + suffix)
+                tmp_paths.append(tmp_path)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(content)
+
+            for (path, _content), tmp_path in zip(rendered, tmp_paths):
+                try:
+                    original: Optional[bytes] = path.read_bytes()
+                except FileNotFoundError:
+                    original = None
+                os.replace(tmp_path, path)
+                replaced.append((path, original))
+
+            for directory in sorted({path.parent for path, _content in rendered}):
+                _fsync_dir(directory)
+        except BaseException:
+            for tmp_path in tmp_paths:
+                _unlink_quietly(tmp_path)
+            TicketWriteBatch._rollback(replaced, suffix)
+            raise
+
+    @staticmethod
+    def _rollback(replaced: List[Tuple[Path, Optional[bytes]]], suffix: str) -> None:
+        """將已替換的檔案還原為原內容（盡力而為，還原失敗不遮蔽原例外）"""
+        for path, original in reversed(replaced):
+            if original is None:
+                _unlink_quietly(path)
+                continue
+            tmp_path = path.with_name(path.name + suffix)
+            try:
+                tmp_path.write_bytes(original)
+                os.replace(tmp_path, path)
+            except OSError:
+                _unlink_quietly(tmp_path)
+        for directory in sorted({path.parent for path, _original in replaced}):
+            _fsync_dir(directory)
+
+
+def save_tickets(entries: Iterable[Tuple[Dict[str, Any], Path]]) -> None:
+    """
+    一次寫入多張 Ticket（全部成功或全部不寫入）
+
+    Args:
+        entries: (ticket, ticket_path) 序列；語意同逐張呼叫 save_ticket
+
+    Raises:
+        同 TicketWriteBatch.commit
+    """
+    batch = TicketWriteBatch()
+    for ticket, ticket_path in entries:
+        batch.stage(ticket, ticket_path)
+    batch.commit()
+
+
+if __name__ == "__main__":
+    from ticket_system.lib.messages import print_not_executable_and_exit
+    print_not_executable_and_exit()
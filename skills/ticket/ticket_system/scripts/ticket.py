@@ -7,6 +7,8 @@
 統一 Ticket 系統入口腳本
 
 提供統一的命令入口，整合 create、track、handoff、resume、migrate 五個子命令。
+連續多個命令可經 `ticket batch`（stdin / 檔案）或 `ticket shell`（互動）在同一
+process 內執行，共用已載入的命令樹、Ticket 快取與專案根目錄解析。
 
 支援兩種使用方式：
 1. 全局安裝（推薦）:
@@ -27,6 +29,7 @@ import shutil
 import argparse
 import os
 from pathlib import Path
+from typing import List, Optional
 
 from ticket_system.lib.ui_constants import SEPARATOR_PRIMARY
 
@@ -41,6 +44,7 @@ try:
         generate_register,
         batch_create_register,
         show_register,
+        session_register,
     )
     from ticket_system.commands.version_shift import register as version_shift_register
 except ModuleNotFoundError:
@@ -120,11 +124,8 @@ def check_installation() -> None:
         print()
 
 
-def main() -> int:
-    """主程式入口"""
-    # 檢查安裝狀態並提示（如果未全局安裝且不在正確目錄）
-    check_installation()
-
+def build_parser() -> argparse.ArgumentParser:
+    """建立頂層 parser 並註冊所有子命令（batch / shell 逐行分派亦重用）"""
     parser = argparse.ArgumentParser(
         description="統一 Ticket 系統 - 整合建立、追蹤、交接、恢復、遷移功能",
         epilog="查詢子命令詳細用法：ticket <command> -h\n"
@@ -149,16 +150,25 @@ def main() -> int:
     batch_create_register(subparsers)
     version_shift_register(subparsers)
     show_register(subparsers)
+    session_register(subparsers)
+    return parser
 
-    # 解析命令行參數
-    args = parser.parse_args()
 
-    # 執行對應的命令
+def dispatch(parser: argparse.ArgumentParser, argv: Optional[List[str]] = None) -> int:
+    """解析 argv 並執行對應命令，回傳命令的 exit code"""
+    args = parser.parse_args(argv)
     if hasattr(args, "func"):
-        rc = args.func(args)
-    else:
-        parser.print_help()
-        return 1
+        return args.func(args)
+    parser.print_help()
+    return 1
+
+
+def main() -> int:
+    """主程式入口"""
+    # 檢查安裝狀態並提示（如果未全局安裝且不在正確目錄）
+    check_installation()
+
+    rc = dispatch(build_parser())
 
     # CLI 安全收尾：非阻塞收割殘留 stale *.md.lock（W8-017）
     # active lock 永不被誤刪（reap_stale_locks 用 LOCK_NB 試鎖判定 stale）。
@@ -0,0 +1,160 @@
+"""commit_activity_index 模組測試（track activity 的整批 git commit 源）。
+
+驗證重點：
+1. TicketIdMatcher 與逐票 `_commit_references_ticket` 判定一致（固定 seed
+   隨機 subject，含父子票字首重疊）
+2. HEAD 未變時直接讀索引，不再呼叫 git log
+3. HEAD 前進時只掃 `舊HEAD..新HEAD`；歷史改寫時整份重建
+4. 新出現的 ticket ID 以一趟完整掃描補上
+5. execute_activity 以整批結果取代逐票 `git log --grep`
+
+git 行為以 tmp_path 內的真實臨時 repo 驗證，不觸碰專案 `.git/`。
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ticket_system.commands import track_activity
+from ticket_system.lib.commit_activity_index import (
+    INDEX_DIRNAME,
+    INDEX_FILENAME,
+    CommitActivityIndex,
+    TicketIdMatcher,
+)
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _commit(repo: Path, subject: str, when: str) -> None:
+    (repo / "log.txt").write_text(subject, encoding="utf-8")
+    _git(repo, "add", "log.txt")
+    subprocess.run(
+        ["git", "commit", "-q", "-m", subject],
+        cwd=repo, check=True, capture_output=True,
+        env={
+            "GIT_AUTHOR_DATE": when, "GIT_COMMITTER_DATE": when,
+            "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@local",
+            "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@local",
+            "PATH": "/usr/bin:/bin:/usr/local/bin",
+        },
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "docs" / "work-logs").mkdir(parents=True)
+    return tmp_path
+
+
+class _Runner:
+    """記錄呼叫的 git 執行器（實際執行真實 git）"""
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def __call__(self, args, cwd=None):
+        self.calls.append(list(args))
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+        return result.returncode == 0, result.stdout.rstrip("\n")
+
+    def logs(self) -> List[List[str]]:
+        return [c for c in self.calls if c[0] == "log"]
+
+
+def _index(repo: Path, runner: _Runner) -> CommitActivityIndex:
+    return CommitActivityIndex(repo / "docs" / "work-logs", runner, cwd=str(repo), since="20.years.ago")
+
+
+class TestTicketIdMatcher:
+    def test_matches_per_ticket_reference_check(self):
+        rng = random.Random(5)
+        ids = [f"0.1.0-W1-{n:03d}" for n in (1, 2, 10, 100)]
+        ids += [f"{i}.{k}" for i in ids[:2] for k in (1, 2)] + ["0.1.0-W1-001.1.3"]
+        matcher = TicketIdMatcher(ids)
+        fragments = ids + ["feat(", "): ", ".", ".x", "9", " ", "W1-"]
+        for _ in range(500):
+            subject = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 6)))
+            expected = {t for t in ids if track_activity._commit_references_ticket(subject, t)}
+            assert matcher.find(subject) == expected, subject
+
+
+class TestCommitActivityIndex:
+    def test_head_keyed_reuse_and_incremental_scan(self, repo):
+        _commit(repo, "feat(0.1.0-W1-001): start", "2026-01-01T10:00:00+00:00")
+        _commit(repo, "feat(0.1.0-W1-001.1): child", "2026-01-02T10:00:00+00:00")
+        runner = _Runner()
+        index = _index(repo, runner)
+        times = index.last_commit_times(["0.1.0-W1-001", "0.1.0-W1-002"])
+        index.save()
+        assert times["0.1.0-W1-001"].isoformat() == "2026-01-01T10:00:00+00:00"
+        assert "0.1.0-W1-002" not in times
+        assert (repo / "docs" / "work-logs" / INDEX_DIRNAME / INDEX_FILENAME).is_file()
+
+        runner = _Runner()
+        assert _index(repo, runner).last_commit_times(["0.1.0-W1-001", "0.1.0-W1-002"]) == times
+        assert runner.logs() == []
+
+        old_head = _git(repo, "rev-parse", "HEAD")
+        _commit(repo, "fix(0.1.0-W1-002): follow-up", "2026-01-03T10:00:00+00:00")
+        runner = _Runner()
+        index = _index(repo, runner)
+        times = index.last_commit_times(["0.1.0-W1-001", "0.1.0-W1-002"])
+        assert times["0.1.0-W1-002"].isoformat() == "2026-01-03T10:00:00+00:00"
+        assert [c[-1] for c in runner.logs()] == [f"{old_head}..{_git(repo, 'rev-parse', 'HEAD')}"]
+
+    def test_new_ticket_scans_full_history(self, repo):
+        _commit(repo, "feat(0.1.0-W1-001): a", "2026-01-01T10:00:00+00:00")
+        _commit(repo, "feat(0.1.0-W1-003): b", "2026-01-02T10:00:00+00:00")
+        index = _index(repo, _Runner())
+        index.last_commit_times(["0.1.0-W1-001"])
+        index.save()
+
+        runner = _Runner()
+        times = _index(repo, runner).last_commit_times(["0.1.0-W1-001", "0.1.0-W1-003"])
+        assert sorted(times) == ["0.1.0-W1-001", "0.1.0-W1-003"]
+        assert len(runner.logs()) == 1
+
+    def test_rewritten_history_rebuilds(self, repo):
+        _commit(repo, "feat(0.1.0-W1-001): a", "2026-01-01T10:00:00+00:00")
+        _commit(repo, "feat(0.1.0-W1-001): amend me", "2026-01-02T10:00:00+00:00")
+        index = _index(repo, _Runner())
+        index.last_commit_times(["0.1.0-W1-001"])
+        index.save()
+
+        _git(repo, "reset", "-q", "--hard", "HEAD~1")
+        _commit(repo, "chore: unrelated", "2026-01-03T10:00:00+00:00")
+        times = _index(repo, _Runner()).last_commit_times(["0.1.0-W1-001"])
+        assert times["0.1.0-W1-001"].isoformat() == "2026-01-01T10:00:00+00:00"
+
+    def test_not_a_repository(self, tmp_path):
+        assert _index(tmp_path, _Runner()).last_commit_times(["0.1.0-W1-001"]) == {}
+
+
+class TestExecuteActivityBatch:
+    def test_single_git_log_for_all_tickets(self, repo, capsys, monkeypatch):
+        _commit(repo, "feat(0.1.0-W1-001): a", "2026-01-01T10:00:00+00:00")
+        tickets = [
+            {"id": f"0.1.0-W1-00{n}", "status": "in_progress", "where": {"files": []}}
+            for n in (1, 2, 3)
+        ]
+        runner = _Runner()
+        monkeypatch.setattr(track_activity, "run_git_command", runner)
+        monkeypatch.setattr(track_activity, "_gather_in_progress_tickets", lambda v: tickets)
+        monkeypatch.setattr(track_activity, "get_project_root", lambda: repo)
+
+        args = type("Args", (), {"format": "json", "version": None, "since": "20.years.ago"})()
+        assert track_activity.execute_activity(args) == 0
+        assert len(runner.logs()) == 1
+        assert "--grep" not in runner.logs()[0]
+        assert '"source": "git_commit"' in capsys.readouterr().out
@@ -412,6 +412,128 @@ class TestComputePairwiseConflictsPerformance:
         assert conflicts  # 合成資料應產生非零衝突對，確保測的是真實工作量非早退空路徑
 
 
+# ---------------------------------------------------------------------------
+# 路徑前綴 trie：三個呼叫端與原兩兩比對逐筆等價
+# ---------------------------------------------------------------------------
+
+
+def _random_paths(rng, count: int) -> List[str]:
+    """含相同路徑、上層目錄、同名前綴（lib/a vs lib/ab）與空字串的隨機路徑。"""
+    segments = ["lib", "a", "ab", "tests", "x.py", "x.py.bak", "hooks"]
+    paths = []
+    for _ in range(count):
+        depth = rng.randint(0, 5)
+        path = "/".join(rng.choice(segments) for _ in range(depth))
+        if rng.random() < 0.2:
+            path += "/"
+        paths.append(path)
+    return paths
+
+
+class TestPathPrefixTrieEquivalence:
+    """trie 配對結果與逐對 predicate 兩兩比對完全一致（固定 seed 多輪）。"""
+
+    @staticmethod
+    def _brute_force_pairwise(tickets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        entries = [
+            (t["id"], file_conflict.write_files(t)) for t in tickets
+            if t.get("id") and file_conflict.write_files(t)
+        ]
+        result = []
+        for i in range(len(entries)):
+            for j in range(i + 1, len(entries)):
+                (id_a, files_a), (id_b, files_b) = entries[i], entries[j]
+                pairs = [
+                    (fa, fb) for fa in files_a for fb in files_b
+                    if file_conflict.files_intersect(fa, fb)
+                ]
+                if pairs:
+                    result.append({
+                        "ticket_a": id_a,
+                        "ticket_b": id_b,
+                        "matched_files": sorted({fa if fa == fb else f"{fa} ~ {fb}" for fa, fb in pairs}),
+                        "heuristic_only": False,
+                    })
+        result.sort(key=lambda c: (c["ticket_a"], c["ticket_b"]))
+        return result
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_compute_pairwise_conflicts_matches_brute_force(self, seed):
+        import random
+
+        rng = random.Random(seed)
+        tickets = [
+            _ticket(f"T-{rng.randint(0, 99):03d}-{i}", "pending", _random_paths(rng, rng.randint(1, 4)))
+            for i in range(12)
+        ]
+        assert file_conflict.compute_pairwise_conflicts(tickets) == self._brute_force_pairwise(tickets)
+
+    def test_heuristic_only_when_only_derived_candidates_match(self, tmp_path):
+        (tmp_path / "pkg" / "tests").mkdir(parents=True)
+        tickets = [
+            _ticket("A", "pending", ["pkg/mod.py"]),
+            _ticket("B", "pending", ["pkg/tests/test_mod.py"]),
+            _ticket("C", "pending", ["pkg/mod.py", "pkg/tests/test_mod.py"]),
+        ]
+        conflicts = file_conflict.compute_pairwise_conflicts(tickets, tmp_path)
+        by_pair = {(c["ticket_a"], c["ticket_b"]): c["heuristic_only"] for c in conflicts}
+        assert by_pair == {("A", "B"): True, ("A", "C"): False, ("B", "C"): False}
+
+    def test_empty_path_only_matches_empty(self):
+        tickets = [
+            _ticket("A", "pending", [""]),
+            _ticket("B", "pending", ["lib/a.py"]),
+            _ticket("C", "pending", ["/"]),
+        ]
+        conflicts = file_conflict.compute_pairwise_conflicts(tickets)
+        assert [(c["ticket_a"], c["ticket_b"]) for c in conflicts] == [("A", "C")]
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_parallel_analyzer_matches_brute_force(self, seed):
+        import random
+
+        from ticket_system.lib.parallel_analyzer import ParallelAnalyzer
+
+        rng = random.Random(seed)
+        file_map = {}
+        for i in range(10):
+            files = set(_random_paths(rng, rng.randint(1, 3)))
+            if rng.random() < 0.2:
+                files.add(rng.choice(["lib/**/x.py", "hooks/*", "a/?b"]))
+            file_map[f"T{i}"] = files
+        task_ids = list(file_map)
+        expected = [
+            (task_ids[i], task_ids[j])
+            for i in range(len(task_ids)) for j in range(i + 1, len(task_ids))
+            if any(
+                ParallelAnalyzer._paths_overlap(fa, fb)  # noqa: SLF001
+                for fa in file_map[task_ids[i]] for fb in file_map[task_ids[j]]
+            )
+        ]
+        assert ParallelAnalyzer._check_file_conflicts(file_map) == expected  # noqa: SLF001
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_parallel_check_first_reason_matches_brute_force(self, seed):
+        import random
+
+        from ticket_system.commands import track_parallel_check as pc
+
+        rng = random.Random(seed)
+        ids = [f"T{i}" for i in range(10)]
+        files_map = {tid: _random_paths(rng, rng.randint(1, 4)) for tid in ids}
+        expected = {}
+        for i in range(len(ids)):
+            for j in range(i + 1, len(ids)):
+                reason = pc._tickets_conflict(files_map[ids[i]], files_map[ids[j]])  # noqa: SLF001
+                if reason:
+                    expected[(i, j)] = reason
+        actual = {
+            pair: f"{fa} <-> {fb}"
+            for pair, ((_, fa), (_, fb)) in pc._first_conflicts(ids, files_map).items()  # noqa: SLF001
+        }
+        assert actual == expected
+
+
 # ---------------------------------------------------------------------------
 # where.files 讀寫意圖解析（0.2.1-W3-781）
 # ---------------------------------------------------------------------------
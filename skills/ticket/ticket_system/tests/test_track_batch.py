@@ -46,7 +46,7 @@ class TestBatchClaimLeaseWiring:
             lambda version, ticket_id, auto_print_error=False: (tickets[ticket_id], None),
         )
         monkeypatch.setattr(track_batch, "resolve_ticket_path", lambda t, v, tid: f"/tmp/{tid}.md")
-        monkeypatch.setattr(track_batch, "save_ticket", lambda t, p: None)
+        monkeypatch.setattr(track_batch, "save_tickets", lambda entries: None)
 
         rc = track_batch.execute_batch_claim(
             _args("0.0.0-W1-001,0.0.0-W1-002"), "0.0.0"
@@ -74,7 +74,7 @@ class TestBatchClaimLeaseWiring:
             lambda version, ticket_id, auto_print_error=False: (tickets[ticket_id], None),
         )
         monkeypatch.setattr(track_batch, "resolve_ticket_path", lambda t, v, tid: f"/tmp/{tid}.md")
-        monkeypatch.setattr(track_batch, "save_ticket", lambda t, p: None)
+        monkeypatch.setattr(track_batch, "save_tickets", lambda entries: None)
 
         rc = track_batch.execute_batch_claim(
             _args("0.0.0-W1-001,0.0.0-W1-002"), "0.0.0"
@@ -104,7 +104,7 @@ class TestBatchClaimLeaseWiring:
             lambda version, ticket_id, auto_print_error=False: (tickets[ticket_id], None),
         )
         monkeypatch.setattr(track_batch, "resolve_ticket_path", lambda t, v, tid: f"/tmp/{tid}.md")
-        monkeypatch.setattr(track_batch, "save_ticket", lambda t, p: None)
+        monkeypatch.setattr(track_batch, "save_tickets", lambda entries: None)
 
         rc = track_batch.execute_batch_claim(
             _args("0.0.0-W1-001,0.0.0-W1-002"), "0.0.0"
@@ -135,7 +135,7 @@ class TestBatchCompleteLeaseWiring:
             lambda version, ticket_id, auto_print_error=False: (tickets[ticket_id], None),
         )
         monkeypatch.setattr(track_batch, "resolve_ticket_path", lambda t, v, tid: f"/tmp/{tid}.md")
-        monkeypatch.setattr(track_batch, "save_ticket", lambda t, p: None)
+        monkeypatch.setattr(track_batch, "save_tickets", lambda entries: None)
         monkeypatch.setattr(track_batch, "append_worklog_progress", lambda v, tid, title: None)
 
         rc = track_batch.execute_batch_complete(
@@ -166,7 +166,7 @@ class TestBatchCompleteLeaseWiring:
             lambda version, ticket_id, auto_print_error=False: (tickets[ticket_id], None),
         )
         monkeypatch.setattr(track_batch, "resolve_ticket_path", lambda t, v, tid: f"/tmp/{tid}.md")
-        monkeypatch.setattr(track_batch, "save_ticket", lambda t, p: None)
+        monkeypatch.setattr(track_batch, "save_tickets", lambda entries: None)
         monkeypatch.setattr(track_batch, "append_worklog_progress", lambda v, tid, title: None)
 
         rc = track_batch.execute_batch_complete(_args("0.0.0-W1-001"), "0.0.0")
@@ -191,7 +191,7 @@ class TestBatchCompleteLeaseWiring:
             lambda version, ticket_id, auto_print_error=False: (tickets[ticket_id], None),
         )
         monkeypatch.setattr(track_batch, "resolve_ticket_path", lambda t, v, tid: f"/tmp/{tid}.md")
-        monkeypatch.setattr(track_batch, "save_ticket", lambda t, p: None)
+        monkeypatch.setattr(track_batch, "save_tickets", lambda entries: None)
         monkeypatch.setattr(track_batch, "append_worklog_progress", lambda v, tid, title: None)
 
         rc = track_batch.execute_batch_complete(
@@ -221,7 +221,7 @@ class TestBatchCompleteLeaseWiring:
             lambda version, ticket_id, auto_print_error=False: (tickets[ticket_id], None),
         )
         monkeypatch.setattr(track_batch, "resolve_ticket_path", lambda t, v, tid: f"/tmp/{tid}.md")
-        monkeypatch.setattr(track_batch, "save_ticket", lambda t, p: None)
+        monkeypatch.setattr(track_batch, "save_tickets", lambda entries: None)
         monkeypatch.setattr(track_batch, "append_worklog_progress", lambda v, tid, title: None)
 
         rc = track_batch.execute_batch_complete(